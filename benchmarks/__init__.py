@@ -0,0 +1,3 @@
+"""
+Performance benchmarks of ORA, run against synthetic course data.
+"""
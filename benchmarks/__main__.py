@@ -0,0 +1,323 @@
+"""
+Run the ORA benchmarks, or compare the results of two runs.
+
+Usage:
+    python -m benchmarks run [--scale=1k] [--scenarios=peer_pick,grade_render] [--output=results.json]
+    python -m benchmarks compare <base.json> <new.json> [--threshold=10]
+    python -m benchmarks load [--learners=50] [--mode=thread] [--duration=60] [--output=results.json]
+    python -m benchmarks imports [--modules=openassessment.workflow.api] [--repeat=5] [--fail-on-regression]
+
+`run` generates the data of an ORA block with a peer and a staff step for the
+given number of learners (1k, 10k, 100k or any number) in a temporary test
+database, runs the scenarios and writes their latency percentiles and query
+counts as JSON. `compare` prints the change of each measure between two
+results, e.g. from two commits, and flags the changes above the threshold.
+`load` simulates learners submitting and grading their peers concurrently, and
+reports the throughput, pick latency, error rates and fairness of the grading.
+`imports` times the import of the XBlock and the assessment APIs in new
+processes, and flags the modules slower to import than their budget.
+
+The benchmarks run against a temporary test database (settings.test by default,
+set DJANGO_SETTINGS_MODULE to benchmark another database).
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+
+# This is a bit of a hack to ensure that the root repo directory
+# is in the front of the Python path, so Django can find the settings module.
+sys.path.insert(1, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'settings.test')
+
+import django  # pylint: disable=wrong-import-position
+
+RESULTS_VERSION = 1
+
+
+def _git_commit():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'], cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.DEVNULL, text=True,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args):
+    """
+    Generate the data, run the scenarios and write the results.
+    """
+    django.setup()
+    warnings.simplefilter('ignore')
+    # The workbench logs each block it can't patch for other XBlocks
+    logging.getLogger('workbench.runtime').setLevel(logging.CRITICAL)
+
+    # pylint: disable=import-outside-toplevel
+    from django.db import connection
+
+    from benchmarks.datagen import generate_course_data, parse_scale
+    from benchmarks.environment import BenchmarkEnvironment
+    from benchmarks.scenarios import SCENARIOS, run_scenario
+    from openassessment.xblock.data_conversion import create_rubric_dict
+
+    scenario_names = args.scenarios.split(',') if args.scenarios else list(SCENARIOS)
+    unknown = set(scenario_names) - set(SCENARIOS)
+    if unknown:
+        raise SystemExit(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+    num_learners = parse_scale(args.scale)
+
+    with BenchmarkEnvironment(scenario_path=args.block) as env:
+        block = env.get_block()
+        peer_requirements = block.workflow_requirements()['peer']
+        start = time.perf_counter()
+        course = generate_course_data(
+            env.course_id,
+            env.item_id,
+            create_rubric_dict(block.prompts, block.rubric_criteria_with_labels),
+            num_learners,
+            peer_requirements['must_grade'],
+            peer_requirements['must_be_graded_by'],
+            num_prompts=len(block.prompts),
+            seed=args.seed,
+        )
+        generation_time = time.perf_counter() - start
+        print(f"Generated data for {num_learners} learners in {generation_time:.1f} s", file=sys.stderr)
+
+        rng = random.Random(args.seed)
+        results = {}
+        for name in scenario_names:
+            results[name] = run_scenario(name, env, course, rng, iterations=args.iterations, warmup=args.warmup)
+            latency = results[name]['latency_ms']
+            print(
+                f"{name}: p50 {latency['p50']:.1f} ms, p95 {latency['p95']:.1f} ms, "
+                f"{results[name]['queries']['mean']:.1f} queries",
+                file=sys.stderr,
+            )
+        database_vendor = connection.vendor
+
+    output = {
+        'version': RESULTS_VERSION,
+        'meta': {
+            'commit': _git_commit(),
+            'scale': args.scale,
+            'learners': num_learners,
+            'seed': args.seed,
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'database': database_vendor,
+            'generation_time_s': generation_time,
+        },
+        'data': course.counts,
+        'scenarios': results,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            json.dump(output, output_file, indent=2, sort_keys=True)
+    else:
+        json.dump(output, sys.stdout, indent=2, sort_keys=True)
+
+
+def load(args):
+    """
+    Simulate concurrent peer grading and write the report.
+    """
+    django.setup()
+    warnings.simplefilter('ignore')
+    # The errors of the learners are counted in the report rather than logged
+    logging.disable(logging.ERROR)
+
+    # pylint: disable=import-outside-toplevel
+    from django.db import connection
+
+    from benchmarks.datagen import generate_course_data
+    from benchmarks.environment import BenchmarkEnvironment
+    from benchmarks.peer_load import LoadConfig, format_report, run_load
+    from openassessment.xblock.data_conversion import create_rubric_dict
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        if connection.vendor == 'sqlite':
+            # In-memory databases are not shared between processes, and lock whole
+            # tables between threads, so the learners share a database file
+            connection.settings_dict['TEST']['NAME'] = os.path.join(work_dir, 'benchmarks.sqlite3')
+            connection.settings_dict['OPTIONS']['timeout'] = 30
+
+        with BenchmarkEnvironment(scenario_path=args.block) as env:
+            block = env.get_block()
+            requirements = block.workflow_requirements()
+            rubric_dict = create_rubric_dict(block.prompts, block.rubric_criteria_with_labels)
+            if args.backlog:
+                generate_course_data(
+                    env.course_id,
+                    env.item_id,
+                    rubric_dict,
+                    args.backlog,
+                    requirements['peer']['must_grade'],
+                    requirements['peer']['must_be_graded_by'],
+                    num_prompts=len(block.prompts),
+                    seed=args.seed,
+                )
+            config = LoadConfig(
+                env.course_id,
+                env.item_id,
+                rubric_dict,
+                requirements['peer']['must_grade'],
+                requirements['peer']['must_be_graded_by'],
+                list(requirements),
+                duration=args.duration,
+                think_time=args.think_time,
+                arrival_window=args.arrival_window,
+                seed=args.seed,
+            )
+            report = run_load(config, args.learners, mode=args.mode)
+            database_vendor = connection.vendor
+    print(format_report(report), file=sys.stderr)
+
+    output = {
+        'version': RESULTS_VERSION,
+        'meta': {
+            'commit': _git_commit(),
+            'learners': args.learners,
+            'mode': args.mode,
+            'duration_s': args.duration,
+            'think_time_s': args.think_time,
+            'arrival_window_s': args.arrival_window,
+            'backlog': args.backlog,
+            'seed': args.seed,
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'database': database_vendor,
+        },
+        'load': report,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            json.dump(output, output_file, indent=2, sort_keys=True)
+    else:
+        json.dump(output, sys.stdout, indent=2, sort_keys=True)
+
+
+def compare(args):
+    """
+    Print the change of each measure between two results.
+    """
+    with open(args.base, encoding='utf-8') as base_file, open(args.new, encoding='utf-8') as new_file:
+        base, new = json.load(base_file), json.load(new_file)
+
+    if base['meta']['learners'] != new['meta']['learners']:
+        print(
+            f"Warning: comparing runs with {base['meta']['learners']} and {new['meta']['learners']} learners",
+            file=sys.stderr,
+        )
+    print(f"base: {base['meta']['commit']}\nnew:  {new['meta']['commit']}\n")
+    print(f"{'scenario':<14}{'measure':<16}{'base':>12}{'new':>12}{'change':>10}")
+
+    regressions = 0
+    for name in sorted(set(base['scenarios']) & set(new['scenarios'])):
+        for measure, stat in (('latency_ms', 'p50'), ('latency_ms', 'p95'), ('queries', 'mean')):
+            base_value = base['scenarios'][name][measure][stat]
+            new_value = new['scenarios'][name][measure][stat]
+            change = (new_value - base_value) * 100 / base_value if base_value else 0.0
+            flag = ""
+            if change > args.threshold:
+                flag = " !"
+                regressions += 1
+            print(f"{name:<14}{measure + ' ' + stat:<16}{base_value:>12.1f}{new_value:>12.1f}{change:>+9.1f}%{flag}")
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+def imports(args):
+    """
+    Time the imports of the XBlock and the assessment APIs against their budgets.
+    """
+    # pylint: disable=import-outside-toplevel
+    from benchmarks.import_time import measure_import_times
+
+    module_names = args.modules.split(',') if args.modules else None
+    results = measure_import_times(module_names, repeat=args.repeat)
+
+    over_budget = 0
+    for module_name, result in results.items():
+        flag = ""
+        if result['budget'] is not None and result['seconds'] > result['budget']:
+            flag = f" ! (budget {result['budget']:.2f} s)"
+            over_budget += 1
+        print(f"{module_name}: {result['seconds'] * 1000:.1f} ms{flag}", file=sys.stderr)
+    json.dump({'commit': _git_commit(), 'imports': results}, sys.stdout, indent=2, sort_keys=True)
+    return 1 if over_budget and args.fail_on_regression else 0
+
+
+def main():
+    # pylint: disable=import-outside-toplevel
+    from benchmarks.environment import DEFAULT_SCENARIO
+    from benchmarks.peer_load import PROCESS_MODE, THREAD_MODE
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help="Run the benchmarks")
+    run_parser.add_argument('--scale', default='1k', help="Number of learners: 1k, 10k, 100k or a number")
+    run_parser.add_argument('--scenarios', help="Comma-separated scenarios to run (default: all)")
+    run_parser.add_argument('--iterations', type=int, help="Timed runs of each scenario (default: per scenario)")
+    run_parser.add_argument('--warmup', type=int, default=1, help="Untimed runs before the timed runs")
+    run_parser.add_argument('--seed', type=int, default=0, help="Seed of the generated data")
+    run_parser.add_argument('--block', default=DEFAULT_SCENARIO, help="Path to the XML definition of the block")
+    run_parser.add_argument('--output', help="Path of the JSON results (default: standard output)")
+    run_parser.set_defaults(func=run)
+
+    compare_parser = subparsers.add_parser('compare', help="Compare the results of two runs")
+    compare_parser.add_argument('base', help="JSON results of the base run")
+    compare_parser.add_argument('new', help="JSON results of the new run")
+    compare_parser.add_argument(
+        '--threshold', type=float, default=10, help="Percentage above which an increase is flagged"
+    )
+    compare_parser.add_argument(
+        '--fail-on-regression', action='store_true', help="Exit with an error if an increase is flagged"
+    )
+    compare_parser.set_defaults(func=compare)
+
+    load_parser = subparsers.add_parser('load', help="Simulate concurrent peer grading")
+    load_parser.add_argument('--learners', type=int, default=50, help="Number of learners grading at the same time")
+    load_parser.add_argument(
+        '--mode', choices=[THREAD_MODE, PROCESS_MODE], default=THREAD_MODE,
+        help="Run the learners as threads or processes",
+    )
+    load_parser.add_argument('--duration', type=float, default=60, help="Duration of the simulation, in seconds")
+    load_parser.add_argument(
+        '--think-time', type=float, default=2.0, help="Mean time to assess a submission, in seconds"
+    )
+    load_parser.add_argument(
+        '--arrival-window', type=float, default=10, help="The learners submit during this window, in seconds"
+    )
+    load_parser.add_argument(
+        '--backlog', type=int, default=0, help="Number of older submissions generated before the simulation"
+    )
+    load_parser.add_argument('--seed', type=int, default=0, help="Seed of the random choices")
+    load_parser.add_argument('--block', default=DEFAULT_SCENARIO, help="Path to the XML definition of the block")
+    load_parser.add_argument('--output', help="Path of the JSON report (default: standard output)")
+    load_parser.set_defaults(func=load)
+
+    imports_parser = subparsers.add_parser('imports', help="Time the imports of the XBlock and the APIs")
+    imports_parser.add_argument('--modules', help="Comma-separated modules to import (default: all)")
+    imports_parser.add_argument(
+        '--repeat', type=int, default=5, help="Imports of each module, the fastest being kept"
+    )
+    imports_parser.add_argument(
+        '--fail-on-regression', action='store_true', help="Exit with an error if a module is over its budget"
+    )
+    imports_parser.set_defaults(func=imports)
+
+    args = parser.parse_args()
+    sys.exit(args.func(args))
+
+
+if __name__ == '__main__':
+    main()
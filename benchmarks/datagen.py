@@ -0,0 +1,449 @@
+"""
+Bulk generator of synthetic ORA data.
+
+The `create_oa_submissions` command creates its data through the public APIs,
+with several queries per submission and assessment. This generator computes
+all the rows of an ORA block in memory instead, and inserts each table with
+`bulk_create`, so that data at the scale of a large course can be created in
+minutes.
+
+For a given seed and number of learners, the data is the same on every run
+(except the timestamps of the staff grading locks, which must be recent to be
+active). The learners are in a mix of states:
+
+* most learners have graded the required number of peers, some have graded
+  fewer and some have not graded at all;
+* some learners have a peer submission open for assessment;
+* the learners who completed the peer step are waiting for a staff grade, or
+  have been graded by staff;
+* some of the submissions waiting for a staff grade are locked by a staff member.
+"""
+import random
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+import pytz
+from django.db import transaction
+from django.db.models import Max
+from django.utils.timezone import now
+from submissions.models import Score, ScoreSummary, StudentItem, Submission
+
+from openassessment.assessment.models import (
+    Assessment,
+    AssessmentPart,
+    PeerWorkflow,
+    PeerWorkflowItem,
+    StaffWorkflow,
+)
+from openassessment.assessment.score_type_constants import PEER_TYPE, STAFF_TYPE
+from openassessment.assessment.serializers import rubric_from_dict
+from openassessment.staffgrader.models.submission_lock import SubmissionGradingLock
+from openassessment.workflow.models import AssessmentWorkflow, AssessmentWorkflowStep
+
+SCALES = {
+    '1k': 1000,
+    '10k': 10000,
+    '100k': 100000,
+}
+
+BATCH_SIZE = 2000
+
+# The learners submit over the week following this date
+BASE_TIME = datetime(2023, 1, 2, tzinfo=pytz.utc)
+
+# Share of the learners who graded the required number of peers, and who graded
+# some but not all of them. The other learners have not graded any peer.
+PEER_COMPLETE_RATE = 0.7
+PEER_PARTIAL_RATE = 0.2
+
+# Share of the learners with a peer submission open for assessment, among those
+# who have not graded the required number of peers
+OPEN_ITEM_RATE = 0.3
+
+# Share of the learners who completed the peer step and were graded by staff
+STAFF_GRADED_RATE = 0.3
+
+# Share of the submissions waiting for a staff grade which are locked by a staff member
+STAFF_LOCKED_RATE = 0.05
+
+WORDS = (
+    "assessment rubric criterion option peer staff learner response prompt grade score "
+    "feedback essay argument evidence analysis example structure clarity conclusion source"
+).split()
+
+
+def parse_scale(value):
+    """
+    Return the number of learners of a scale, either a named scale ("1k") or a number.
+    """
+    if value in SCALES:
+        return SCALES[value]
+    return int(value)
+
+
+class SyntheticCourse:
+    """
+    Summary of the data generated for an ORA block.
+    """
+
+    def __init__(self, course_id, item_id, staff_ids):
+        self.course_id = course_id
+        self.item_id = item_id
+        self.staff_ids = list(staff_ids)
+        self.student_ids = []
+        # Submission uuid of each learner
+        self.submission_uuids = {}
+        # Workflow status of each submission
+        self.statuses = {}
+        # Number of rows created in each table
+        self.counts = {}
+        self._students_by_status = {}
+
+    def students_with_status(self, status):
+        """
+        Return the ids of the learners whose workflow has the given status.
+        """
+        if status not in self._students_by_status:
+            self._students_by_status[status] = [
+                student_id for student_id in self.student_ids
+                if self.statuses[self.submission_uuids[student_id]] == status
+            ]
+        return self._students_by_status[status]
+
+
+def _bulk_insert(model, rows, key):
+    """
+    Insert rows of a model, and return the ids of the created rows by key.
+
+    Not all databases return the ids of the rows created by `bulk_create`, so the
+    rows created after the previous highest id are read back.
+
+    Args:
+        model (Model): The model of the rows.
+        rows (list): Unsaved instances of the model.
+        key (callable): Returns the key of an instance.
+
+    Returns:
+        dict: The ids of the created rows, by key.
+    """
+    last_id = model.objects.aggregate(last_id=Max('id'))['last_id'] or 0
+    model.objects.bulk_create(rows, batch_size=BATCH_SIZE)
+    return {key(row): row.id for row in model.objects.filter(id__gt=last_id).iterator()}
+
+
+def _random_uuid(rng):
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def _random_text(rng, num_words):
+    return " ".join(rng.choice(WORDS) for _ in range(num_words)).capitalize() + "."
+
+
+def _plan_peer_grading(rng, num_learners, must_grade):
+    """
+    Choose how many peers each learner graded, and whether a peer submission is open.
+
+    Learner i grades the submissions of learners i+1, i+2, ... so that each
+    submission is graded about as many times as its author graded peers.
+    """
+    graded_counts, has_open_item = [], []
+    for _ in range(num_learners):
+        draw = rng.random()
+        if draw < PEER_COMPLETE_RATE:
+            graded = must_grade
+        elif draw < PEER_COMPLETE_RATE + PEER_PARTIAL_RATE:
+            graded = rng.randint(1, max(must_grade - 1, 1))
+        else:
+            graded = 0
+        graded_counts.append(graded)
+        has_open_item.append(graded < must_grade and rng.random() < OPEN_ITEM_RATE)
+    return graded_counts, has_open_item
+
+
+@transaction.atomic
+def generate_course_data(
+        course_id, item_id, rubric_dict, num_learners, must_grade, must_be_graded_by,
+        num_prompts=1, seed=0, staff_ids=('staff-0', 'staff-1', 'staff-2')
+):
+    """
+    Create the submissions, workflows and assessments of the learners of an ORA
+    block with a required peer step followed by a required staff step.
+
+    Args:
+        course_id (str): The course of the block.
+        item_id (str): The usage id of the block.
+        rubric_dict (dict): The rubric of the block, as created by `create_rubric_dict`.
+        num_learners (int): The number of learners who submitted a response.
+        must_grade (int): The number of peers each learner must grade.
+        must_be_graded_by (int): The number of peers who must grade each submission.
+
+    Kwargs:
+        num_prompts (int): The number of prompts of the block.
+        seed (int): The seed of the random choices.
+        staff_ids (tuple): The anonymous ids of the staff members who grade.
+
+    Returns:
+        SyntheticCourse
+    """
+    if num_learners <= must_grade + 1:
+        raise ValueError(f"At least {must_grade + 2} learners are needed to grade {must_grade} peers each")
+
+    rng = random.Random(seed)
+    course = SyntheticCourse(course_id, item_id, staff_ids)
+
+    rubric = rubric_from_dict(rubric_dict)
+    criteria = [
+        (criterion.id, [(option.id, option.points) for option in criterion.options.all()])
+        for criterion in rubric.criteria.prefetch_related('options')
+    ]
+
+    course.student_ids = [f"{rng.getrandbits(128):032x}" for _ in range(num_learners)]
+    submission_uuids = [_random_uuid(rng) for _ in range(num_learners)]
+    submitted_at = [BASE_TIME + timedelta(minutes=rng.randrange(7 * 24 * 60)) for _ in range(num_learners)]
+    graded_counts, has_open_item = _plan_peer_grading(rng, num_learners, must_grade)
+
+    # The submissions graded by each learner, and the graders of each submission
+    graded_authors = [
+        [(scorer + offset) % num_learners for offset in range(1, graded_counts[scorer] + 1)]
+        for scorer in range(num_learners)
+    ]
+    received_counts = [0] * num_learners
+    for authors in graded_authors:
+        for author in authors:
+            received_counts[author] += 1
+
+    statuses, staff_graders, lock_owners = [], {}, {}
+    for learner in range(num_learners):
+        if graded_counts[learner] < must_grade:
+            statuses.append(AssessmentWorkflow.STATUS.peer)
+        elif rng.random() < STAFF_GRADED_RATE:
+            statuses.append(AssessmentWorkflow.STATUS.done)
+            staff_graders[learner] = rng.choice(course.staff_ids)
+        else:
+            statuses.append(AssessmentWorkflow.STATUS.waiting)
+        if learner not in staff_graders and rng.random() < STAFF_LOCKED_RATE:
+            lock_owners[learner] = rng.choice(course.staff_ids)
+
+    for learner, student_id in enumerate(course.student_ids):
+        course.submission_uuids[student_id] = str(submission_uuids[learner])
+        course.statuses[str(submission_uuids[learner])] = statuses[learner]
+
+    # Submissions
+    student_item_ids = _bulk_insert(
+        StudentItem,
+        [
+            StudentItem(student_id=student_id, course_id=course_id, item_id=item_id, item_type='openassessment')
+            for student_id in course.student_ids
+        ],
+        key=lambda row: (row.course_id, row.item_id, row.student_id),
+    )
+    student_item_ids = [student_item_ids[(course_id, item_id, student_id)] for student_id in course.student_ids]
+    submission_ids = _bulk_insert(
+        Submission,
+        [
+            Submission(
+                uuid=submission_uuids[learner],
+                student_item_id=student_item_ids[learner],
+                attempt_number=1,
+                submitted_at=submitted_at[learner],
+                created_at=submitted_at[learner],
+                answer={'parts': [{'text': _random_text(rng, 60)} for _ in range(num_prompts)]},
+            )
+            for learner in range(num_learners)
+        ],
+        key=lambda row: row.uuid,
+    )
+
+    # Assessments: the peer assessments of the submissions graded by each
+    # learner, and the staff assessments of the graded submissions
+    assessments = []
+    for scorer, authors in enumerate(graded_authors):
+        for rank, author in enumerate(authors, start=1):
+            assessments.append(Assessment(
+                submission_uuid=str(submission_uuids[author]),
+                rubric=rubric,
+                scored_at=submitted_at[scorer] + timedelta(hours=rank),
+                scorer_id=course.student_ids[scorer],
+                score_type=PEER_TYPE,
+                feedback=_random_text(rng, 12),
+            ))
+    for learner, staff_id in staff_graders.items():
+        assessments.append(Assessment(
+            submission_uuid=str(submission_uuids[learner]),
+            rubric=rubric,
+            scored_at=submitted_at[learner] + timedelta(days=7),
+            scorer_id=staff_id,
+            score_type=STAFF_TYPE,
+        ))
+    assessment_ids = _bulk_insert(
+        Assessment, assessments, key=lambda row: (row.submission_uuid, row.scorer_id, row.score_type)
+    )
+
+    parts, points_earned = [], defaultdict(int)
+    for assessment in assessments:
+        assessment_id = assessment_ids[(assessment.submission_uuid, assessment.scorer_id, assessment.score_type)]
+        for criterion_id, options in criteria:
+            option_id, points = rng.choice(options) if options else (None, 0)
+            parts.append(AssessmentPart(assessment_id=assessment_id, criterion_id=criterion_id, option_id=option_id))
+            if assessment.score_type == STAFF_TYPE:
+                points_earned[assessment.submission_uuid] += points
+    AssessmentPart.objects.bulk_create(parts, batch_size=BATCH_SIZE)
+
+    # Scores of the graded submissions
+    points_possible = sum(max((points for _, points in options), default=0) for _, options in criteria)
+    score_ids = _bulk_insert(
+        Score,
+        [
+            Score(
+                student_item_id=student_item_ids[learner],
+                submission_id=submission_ids[submission_uuids[learner]],
+                points_earned=points_earned[str(submission_uuids[learner])],
+                points_possible=points_possible,
+                created_at=submitted_at[learner] + timedelta(days=7),
+            )
+            for learner in staff_graders
+        ],
+        key=lambda row: row.student_item_id,
+    )
+    ScoreSummary.objects.bulk_create(
+        [
+            ScoreSummary(student_item_id=student_item_id, highest_id=score_id, latest_id=score_id)
+            for student_item_id, score_id in score_ids.items()
+        ],
+        batch_size=BATCH_SIZE,
+    )
+
+    # Assessment workflows
+    workflow_ids = _bulk_insert(
+        AssessmentWorkflow,
+        [
+            AssessmentWorkflow(
+                submission_uuid=str(submission_uuids[learner]),
+                uuid=_random_uuid(rng),
+                course_id=course_id,
+                item_id=item_id,
+                status=statuses[learner],
+                status_changed=submitted_at[learner],
+                created=submitted_at[learner],
+                modified=submitted_at[learner],
+            )
+            for learner in range(num_learners)
+        ],
+        key=lambda row: row.submission_uuid,
+    )
+    steps = []
+    for learner in range(num_learners):
+        workflow_id = workflow_ids[str(submission_uuids[learner])]
+        peer_done = graded_counts[learner] >= must_grade
+        steps.append(AssessmentWorkflowStep(
+            workflow_id=workflow_id,
+            name='peer',
+            order_num=0,
+            submitter_completed_at=submitted_at[learner] + timedelta(hours=must_grade) if peer_done else None,
+            assessment_completed_at=(
+                submitted_at[learner] + timedelta(days=2) if received_counts[learner] >= must_be_graded_by else None
+            ),
+        ))
+        steps.append(AssessmentWorkflowStep(
+            workflow_id=workflow_id,
+            name='staff',
+            order_num=1,
+            submitter_completed_at=submitted_at[learner],
+            assessment_completed_at=submitted_at[learner] + timedelta(days=7) if learner in staff_graders else None,
+        ))
+    AssessmentWorkflowStep.objects.bulk_create(steps, batch_size=BATCH_SIZE)
+
+    # Peer workflows and the peer submissions graded by each learner
+    peer_workflow_ids = _bulk_insert(
+        PeerWorkflow,
+        [
+            PeerWorkflow(
+                student_id=course.student_ids[learner],
+                item_id=item_id,
+                course_id=course_id,
+                submission_uuid=str(submission_uuids[learner]),
+                created_at=submitted_at[learner],
+                completed_at=(
+                    submitted_at[learner] + timedelta(hours=must_grade)
+                    if graded_counts[learner] >= must_grade else None
+                ),
+                grading_completed_at=(
+                    submitted_at[learner] + timedelta(days=2)
+                    if received_counts[learner] >= must_be_graded_by else None
+                ),
+                completed_graded_by_count=received_counts[learner],
+            )
+            for learner in range(num_learners)
+        ],
+        key=lambda row: row.submission_uuid,
+    )
+    peer_workflow_ids = [peer_workflow_ids[str(submission_uuid)] for submission_uuid in submission_uuids]
+    items, scored_counts = [], [0] * num_learners
+    for scorer, authors in enumerate(graded_authors):
+        for rank, author in enumerate(authors, start=1):
+            author_uuid = str(submission_uuids[author])
+            # The first grades received are the ones which count towards the peer score
+            scored = received_counts[author] >= must_be_graded_by and scored_counts[author] < must_be_graded_by
+            scored_counts[author] += int(scored)
+            items.append(PeerWorkflowItem(
+                scorer_id=peer_workflow_ids[scorer],
+                author_id=peer_workflow_ids[author],
+                submission_uuid=author_uuid,
+                started_at=submitted_at[scorer] + timedelta(hours=rank) - timedelta(minutes=20),
+                assessment_id=assessment_ids[(author_uuid, course.student_ids[scorer], PEER_TYPE)],
+                scored=scored,
+            ))
+        if has_open_item[scorer]:
+            author = (scorer + len(authors) + 1) % num_learners
+            items.append(PeerWorkflowItem(
+                scorer_id=peer_workflow_ids[scorer],
+                author_id=peer_workflow_ids[author],
+                submission_uuid=str(submission_uuids[author]),
+                started_at=submitted_at[scorer] + timedelta(hours=len(authors) + 1),
+            ))
+    PeerWorkflowItem.objects.bulk_create(items, batch_size=BATCH_SIZE)
+
+    # Staff workflows, and the grading locks of the staff members
+    locked_at = now()
+    StaffWorkflow.objects.bulk_create(
+        [
+            StaffWorkflow(
+                scorer_id=staff_graders.get(learner) or lock_owners.get(learner, ''),
+                course_id=course_id,
+                item_id=item_id,
+                submission_uuid=str(submission_uuids[learner]),
+                created_at=submitted_at[learner],
+                grading_started_at=locked_at if learner in lock_owners else None,
+                grading_completed_at=submitted_at[learner] + timedelta(days=7) if learner in staff_graders else None,
+                assessment=(
+                    str(assessment_ids[(str(submission_uuids[learner]), staff_graders[learner], STAFF_TYPE)])
+                    if learner in staff_graders else None
+                ),
+            )
+            for learner in range(num_learners)
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    SubmissionGradingLock.objects.bulk_create(
+        [
+            SubmissionGradingLock(
+                submission_uuid=str(submission_uuids[learner]), owner_id=owner_id, created_at=locked_at
+            )
+            for learner, owner_id in lock_owners.items()
+        ],
+        batch_size=BATCH_SIZE,
+    )
+
+    course.counts = {
+        'submissions': num_learners,
+        'assessment_workflows': num_learners,
+        'peer_workflows': num_learners,
+        'peer_workflow_items': len(items),
+        'assessments': len(assessments),
+        'assessment_parts': len(parts),
+        'staff_workflows': num_learners,
+        'scores': len(score_ids),
+        'grading_locks': len(lock_owners),
+    }
+    return course
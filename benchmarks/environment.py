@@ -0,0 +1,122 @@
+"""
+The environment the benchmarks run in: a temporary test database, an ORA block
+loaded in the XBlock workbench, and stand-ins for the parts of the platform
+which are not available outside of it.
+"""
+import os
+from contextlib import ExitStack
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+DEFAULT_SCENARIO = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'peer_staff.xml')
+COURSE_ID = 'course-v1:edX+Benchmark+2023'
+
+
+def _usernames(anonymous_ids):
+    """
+    Stand-in for the lookup of usernames, which reads the user tables of the platform.
+    """
+    return {anonymous_id: f"user-{anonymous_id[:12]}" for anonymous_id in anonymous_ids}
+
+
+class BenchmarkEnvironment:
+    """
+    Context manager setting up the environment of the benchmarks.
+
+    Usage:
+        with BenchmarkEnvironment() as env:
+            block = env.get_block(student_id)
+    """
+
+    def __init__(self, scenario_path=DEFAULT_SCENARIO, course_id=COURSE_ID, create_db=True):
+        self.scenario_path = scenario_path
+        self.course_id = course_id
+        self.create_db = create_db
+        self.runtime = None
+        self.block_id = None
+        self._exit_stack = None
+        self._old_database_name = None
+
+    def __enter__(self):
+        # pylint: disable=import-outside-toplevel
+        from workbench.runtime import WorkbenchRuntime
+
+        with ExitStack() as stack:
+            if self.create_db:
+                setup_test_environment()
+                stack.callback(teardown_test_environment)
+                self._old_database_name = connection.creation.create_test_db(verbosity=0)
+                stack.callback(connection.creation.destroy_test_db, self._old_database_name, verbosity=0)
+            for patcher in self._platform_patchers():
+                stack.enter_context(patcher)
+
+            self.runtime = WorkbenchRuntime()
+            self.runtime.user_id = 'benchmark'
+            with open(self.scenario_path, encoding='utf-8') as scenario_file:
+                self.block_id = self.runtime.parse_xml_string(scenario_file.read(), self.runtime.id_generator)
+            self._exit_stack = stack.pop_all()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._exit_stack.close()
+
+    def _platform_patchers(self):
+        """
+        Patch the lookups of the platform with stand-ins.
+        """
+        # pylint: disable=import-outside-toplevel
+        from openassessment.data import OraAggregateData, OraDownloadData
+
+        def ora_path_info(course_id):  # pylint: disable=unused-argument
+            return {
+                self.item_id: {
+                    'section_index': 1,
+                    'section_name': 'Section',
+                    'sub_section_index': 1,
+                    'sub_section_name': 'Subsection',
+                    'unit_index': 1,
+                    'unit_name': 'Unit',
+                    'ora_index': 1,
+                    'ora_name': 'Benchmark',
+                }
+            }
+
+        def display_names(course_id):  # pylint: disable=unused-argument
+            return {self.item_id: 'Benchmark'}
+
+        def path_ids(all_submission_information):
+            return _usernames([student['student_id'] for student, _, _ in all_submission_information])
+
+        return [
+            patch('openassessment.data.map_anonymized_ids_to_usernames', _usernames),
+            patch('openassessment.staffgrader.staff_grader_mixin.map_anonymized_ids_to_usernames', _usernames),
+            patch.object(OraAggregateData, '_map_block_usage_keys_to_display_names', display_names),
+            patch.object(OraDownloadData, '_map_ora_usage_keys_to_path_info', ora_path_info),
+            patch.object(OraDownloadData, '_map_student_ids_to_path_ids', path_ids),
+        ]
+
+    def get_block(self, student_id='benchmark', submission_uuid=None, is_staff=False):
+        """
+        Return a new instance of the block, as the LMS creates for each request.
+
+        Args:
+            student_id (str): The anonymous id of the user viewing the block.
+            submission_uuid (str): The submission of the user, kept in the user state of the block.
+            is_staff (bool): Whether the user is course staff.
+        """
+        block = self.runtime.get_block(self.block_id)
+        block.xmodule_runtime = SimpleNamespace(
+            course_id=self.course_id,
+            anonymous_student_id=student_id,
+            user_is_staff=is_staff,
+        )
+        if submission_uuid:
+            block.submission_uuid = submission_uuid
+        return block
+
+    @property
+    def item_id(self):
+        return str(self.runtime.get_block(self.block_id).scope_ids.usage_id)
@@ -0,0 +1,57 @@
+"""
+The time it takes to import the XBlock and the assessment APIs.
+
+Each module is imported in a new Python process, once Django is set up, as
+the LMS does when it loads the XBlock, and its import time is compared to the
+budget enforced by the unit tests (`openassessment/tests/test_import_time.py`).
+"""
+import os
+import subprocess
+import sys
+
+from openassessment.tests.test_import_time import IMPORT_TIME_BUDGETS
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_SCRIPT = """
+import importlib, sys, time
+import django
+django.setup()
+start = time.perf_counter()
+importlib.import_module(sys.argv[1])
+print(time.perf_counter() - start)
+"""
+
+
+def time_import(module_name):
+    """
+    Return the time it takes to import a module in a new Python process, in seconds.
+    """
+    env = dict(os.environ)
+    env.setdefault('DJANGO_SETTINGS_MODULE', 'settings.test')
+    output = subprocess.check_output(
+        [sys.executable, '-c', IMPORT_SCRIPT, module_name],
+        cwd=REPO_ROOT, env=env, stderr=subprocess.DEVNULL,
+    )
+    return float(output.decode('utf-8').strip().splitlines()[-1])
+
+
+def measure_import_times(module_names=None, repeat=5):
+    """
+    Measure the import time of modules against their budgets.
+
+    Args:
+        module_names (list): The modules to import (default: the modules with a budget).
+        repeat (int): The number of imports of each module, the fastest being kept.
+
+    Returns:
+        dict: For each module, the 'seconds' it took to import and its 'budget' in seconds.
+    """
+    module_names = module_names or sorted(IMPORT_TIME_BUDGETS)
+    return {
+        module_name: {
+            'seconds': min(time_import(module_name) for _ in range(repeat)),
+            'budget': IMPORT_TIME_BUDGETS.get(module_name),
+        }
+        for module_name in module_names
+    }
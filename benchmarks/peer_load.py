@@ -0,0 +1,307 @@
+"""
+Load simulation of peer grading.
+
+Simulated learners run concurrently, as threads or processes, against a local
+database. Each learner arrives at a random time, submits a response, then
+repeatedly asks for a peer submission to assess (`get_submission_to_assess`),
+thinks, and assesses it, until it has assessed the required number of peers or
+the simulation ends. The failures which only appear under concurrency are
+counted: errors of each operation (e.g. integrity errors when creating peer
+workflows or items), submissions picked twice by the same learner, and
+submissions graded more than needed while others are not graded.
+
+The report gives the throughput of the assessments, the latency of the picks,
+the error rates, and the spread of the number of grades received by the
+submissions. Old submissions can be created first with the bulk generator
+(`backlog`), to check whether they are starved by the new ones.
+"""
+import random
+import statistics
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import get_context
+
+from django.db import connections
+from django.db.models import Count, Q
+
+from benchmarks.scenarios import summarize
+
+THREAD_MODE = 'thread'
+PROCESS_MODE = 'process'
+
+
+class LoadConfig:
+    """
+    Parameters of a simulation, shared by all the learners.
+    """
+
+    def __init__(
+            self, course_id, item_id, rubric_dict, must_grade, must_be_graded_by, steps,
+            duration=60, think_time=2.0, arrival_window=10, seed=0
+    ):
+        self.course_id = course_id
+        self.item_id = item_id
+        self.rubric_dict = rubric_dict
+        self.must_grade = must_grade
+        self.must_be_graded_by = must_be_graded_by
+        self.steps = steps
+        # Wall time after which the learners stop, in seconds
+        self.duration = duration
+        # Mean time spent reading a submission before assessing it, in seconds
+        self.think_time = think_time
+        # The learners submit at random times during this window, in seconds
+        self.arrival_window = arrival_window
+        self.seed = seed
+
+
+def _error_name(error):
+    """
+    Name an error, with the error it was raised from, e.g. "PeerAssessmentInternalError(IntegrityError)".
+    """
+    cause = error.__cause__ or error.__context__
+    if cause is None:
+        return type(error).__name__
+    return f"{type(error).__name__}({type(cause).__name__})"
+
+
+def simulate_learner(index, config, start_time):
+    """
+    Simulate a learner, and return what happened as a dict of measures.
+
+    Args:
+        index (int): The number of the learner, which makes its id and random choices.
+        config (LoadConfig): The parameters of the simulation.
+        start_time (float): The `time.time()` at which the simulation started.
+    """
+    # pylint: disable=import-outside-toplevel
+    from submissions import api as sub_api
+
+    from openassessment.assessment.api import peer as peer_api
+    from openassessment.workflow import api as workflow_api
+
+    rng = random.Random(config.seed * 1000003 + index)
+    student_id = f"load-learner-{index:05d}"
+    deadline = start_time + config.duration
+    result = {
+        'operations': Counter(),
+        'errors': defaultdict(Counter),
+        'pick_latencies': [],
+        'assess_latencies': [],
+        'empty_picks': 0,
+        'duplicate_picks': 0,
+        'assessments': 0,
+    }
+
+    def call(operation, func, *args, **kwargs):
+        """ Call an operation, returning whether it succeeded and its result. """
+        result['operations'][operation] += 1
+        try:
+            return True, func(*args, **kwargs)
+        except Exception as ex:  # pylint: disable=broad-except
+            result['errors'][operation][_error_name(ex)] += 1
+            return False, None
+
+    def think(mean):
+        time.sleep(min(rng.expovariate(1 / mean) if mean else 0, max(deadline - time.time(), 0)))
+
+    time.sleep(rng.uniform(0, config.arrival_window))
+    student_item = {
+        'student_id': student_id,
+        'course_id': config.course_id,
+        'item_id': config.item_id,
+        'item_type': 'openassessment',
+    }
+
+    def submit():
+        submission = sub_api.create_submission(student_item, {'parts': [{'text': f"Response of {student_id}"}]})
+        workflow_api.create_workflow(submission['uuid'], config.steps)
+        return submission['uuid']
+
+    submitted, submission_uuid = call('submit', submit)
+    if not submitted:
+        return result
+
+    assessed = set()
+    while len(assessed) < config.must_grade and time.time() < deadline:
+        start = time.perf_counter()
+        picked, peer_submission = call(
+            'pick', peer_api.get_submission_to_assess, submission_uuid, config.must_be_graded_by
+        )
+        result['pick_latencies'].append((time.perf_counter() - start) * 1000)
+        if not picked:
+            think(config.think_time)
+            continue
+        if peer_submission is None:
+            # Nothing to assess yet: come back later
+            result['empty_picks'] += 1
+            think(config.think_time)
+            continue
+        if peer_submission['uuid'] in assessed or peer_submission['uuid'] == submission_uuid:
+            result['duplicate_picks'] += 1
+
+        think(config.think_time)
+        options_selected = {
+            criterion['name']: rng.choice(criterion['options'])['name']
+            for criterion in config.rubric_dict['criteria'] if criterion['options']
+        }
+        start = time.perf_counter()
+        assessed_ok, _ = call(
+            'assess', peer_api.create_assessment, submission_uuid, student_id, options_selected,
+            {}, "", config.rubric_dict, config.must_be_graded_by,
+        )
+        result['assess_latencies'].append((time.perf_counter() - start) * 1000)
+        if assessed_ok:
+            assessed.add(peer_submission['uuid'])
+            result['assessments'] += 1
+    return result
+
+
+def _run_learner(index, config, start_time):
+    """
+    Simulate a learner in a thread or process of its own, closing its database connections at the end.
+    """
+    try:
+        return simulate_learner(index, config, start_time)
+    finally:
+        connections.close_all()
+
+
+def _merge(results):
+    """
+    Combine the measures of the learners.
+    """
+    merged = {
+        'operations': Counter(),
+        'errors': defaultdict(Counter),
+        'pick_latencies': [],
+        'assess_latencies': [],
+        'empty_picks': 0,
+        'duplicate_picks': 0,
+        'assessments': 0,
+    }
+    for result in results:
+        merged['operations'].update(result['operations'])
+        for operation, errors in result['errors'].items():
+            merged['errors'][operation].update(errors)
+        for key in ('pick_latencies', 'assess_latencies'):
+            merged[key].extend(result[key])
+        for key in ('empty_picks', 'duplicate_picks', 'assessments'):
+            merged[key] += result[key]
+    return merged
+
+
+def grade_distribution(course_id, item_id, must_be_graded_by):
+    """
+    Return the spread of the number of peer grades received by the submissions of an item.
+
+    The grades are counted from the assessed peer workflow items, rather than from the
+    counts kept on the peer workflows, so that errors in those counts do not hide
+    unfair distributions.
+    """
+    # pylint: disable=import-outside-toplevel
+    from openassessment.assessment.models import PeerWorkflow
+
+    workflows = list(
+        PeerWorkflow.objects.filter(course_id=course_id, item_id=item_id)
+        .annotate(num_graded_by=Count('graded_by', filter=Q(graded_by__assessment__isnull=False)))
+        .order_by('created_at', 'id')
+        .values_list('num_graded_by', flat=True)
+    )
+    if not workflows:
+        return None
+    quartile = max(len(workflows) // 4, 1)
+    return {
+        'submissions': len(workflows),
+        'graded_by': summarize(workflows),
+        'graded_by_stdev': statistics.pstdev(workflows),
+        'fully_graded': sum(1 for count in workflows if count >= must_be_graded_by),
+        'over_graded': sum(1 for count in workflows if count > must_be_graded_by),
+        'ungraded': sum(1 for count in workflows if count == 0),
+        # Old submissions are starved when they are graded less than the new ones
+        'oldest_quartile_mean': statistics.mean(workflows[:quartile]),
+        'newest_quartile_mean': statistics.mean(workflows[-quartile:]),
+    }
+
+
+def run_load(config, num_learners, mode=THREAD_MODE):
+    """
+    Run the simulated learners concurrently, and return the report of the simulation.
+
+    Args:
+        config (LoadConfig): The parameters of the simulation.
+        num_learners (int): The number of learners, all running at the same time.
+        mode (str): Whether the learners are threads or processes. Processes need a
+            database which is not in memory.
+
+    Returns:
+        dict
+    """
+    if mode == PROCESS_MODE:
+        # The children open their own connections
+        connections.close_all()
+        executor = ProcessPoolExecutor(max_workers=num_learners, mp_context=get_context('fork'))
+    else:
+        executor = ThreadPoolExecutor(max_workers=num_learners)
+
+    start_time = time.time()
+    with executor:
+        futures = [executor.submit(_run_learner, index, config, start_time) for index in range(num_learners)]
+        merged = _merge(future.result() for future in futures)
+    elapsed = time.time() - start_time
+
+    operations = merged['operations']
+    return {
+        'elapsed_s': elapsed,
+        'throughput': {
+            'assessments': merged['assessments'],
+            'assessments_per_s': merged['assessments'] / elapsed,
+            'picks': operations['pick'],
+            'picks_per_s': operations['pick'] / elapsed,
+        },
+        'pick_latency_ms': summarize(merged['pick_latencies']) if merged['pick_latencies'] else None,
+        'assess_latency_ms': summarize(merged['assess_latencies']) if merged['assess_latencies'] else None,
+        'picks': {
+            'total': operations['pick'],
+            'empty': merged['empty_picks'],
+            'duplicate': merged['duplicate_picks'],
+        },
+        'errors': {
+            operation: {
+                'count': sum(merged['errors'][operation].values()),
+                'rate': sum(merged['errors'][operation].values()) / operations[operation],
+                'types': dict(merged['errors'][operation]),
+            }
+            for operation in sorted(operations)
+        },
+        'fairness': grade_distribution(config.course_id, config.item_id, config.must_be_graded_by),
+    }
+
+
+def format_report(report):
+    """
+    Return a short summary of a report, to print.
+    """
+    throughput, picks = report['throughput'], report['picks']
+    lines = [
+        f"{throughput['assessments']} assessments in {report['elapsed_s']:.1f} s "
+        f"({throughput['assessments_per_s']:.2f}/s), {picks['total']} picks "
+        f"({picks['empty']} empty, {picks['duplicate']} duplicate)",
+    ]
+    if report['pick_latency_ms']:
+        latency = report['pick_latency_ms']
+        lines.append(
+            f"pick latency: p50 {latency['p50']:.1f} ms, p95 {latency['p95']:.1f} ms, max {latency['max']:.1f} ms"
+        )
+    for operation, errors in report['errors'].items():
+        types = ", ".join(f"{name}: {count}" for name, count in sorted(errors['types'].items()))
+        lines.append(f"{operation} errors: {errors['count']} ({errors['rate']:.1%}){' - ' + types if types else ''}")
+    fairness = report['fairness']
+    if fairness:
+        lines.append(
+            f"graded by: min {fairness['graded_by']['min']}, max {fairness['graded_by']['max']}, "
+            f"stdev {fairness['graded_by_stdev']:.2f}; {fairness['fully_graded']}/{fairness['submissions']} "
+            f"fully graded, {fairness['over_graded']} over graded, {fairness['ungraded']} ungraded; "
+            f"oldest/newest quartile mean {fairness['oldest_quartile_mean']:.2f}/{fairness['newest_quartile_mean']:.2f}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,236 @@
+"""
+The scenarios of the benchmarks, and the measurement of their runs.
+
+A scenario prepares a call made by the LMS or by a report, e.g. a learner
+opening the grade step, and the call is timed. Each run of a scenario is made
+in a transaction which is rolled back, so that the runs start from the same
+data, and its database queries are counted.
+"""
+import csv
+import json
+import time
+from contextlib import ExitStack, contextmanager
+from tempfile import TemporaryFile
+from unittest.mock import patch
+
+from django.db import connections, transaction
+from webob import Request
+
+SCENARIOS = {}
+
+
+def scenario(name, iterations):
+    """
+    Register a scenario.
+
+    The decorated function receives the `BenchmarkEnvironment`, the
+    `SyntheticCourse` and a random generator, and returns the call to time.
+
+    Args:
+        name (str): The name of the scenario in the results.
+        iterations (int): The default number of timed runs.
+    """
+    def decorator(func):
+        func.iterations = iterations
+        SCENARIOS[name] = func
+        return func
+    return decorator
+
+
+def _json_request(data):
+    return Request.blank('/', method='POST', body=json.dumps(data).encode('utf-8'))
+
+
+@scenario('peer_pick', iterations=50)
+def peer_pick(env, course, rng):
+    """
+    A learner who has not graded enough peers is given a submission to assess.
+    """
+    # pylint: disable=import-outside-toplevel
+    from openassessment.assessment.api import peer as peer_api
+
+    student_id = rng.choice(course.students_with_status('peer'))
+    must_be_graded_by = env.get_block().workflow_requirements()['peer']['must_be_graded_by']
+    return lambda: peer_api.get_submission_to_assess(course.submission_uuids[student_id], must_be_graded_by)
+
+
+@scenario('grade_render', iterations=50)
+def grade_render(env, course, rng):
+    """
+    A learner who has been graded by staff opens the grade step.
+    """
+    student_id = rng.choice(course.students_with_status('done'))
+
+    def render():
+        response = env.get_block(student_id, course.submission_uuids[student_id]).render_grade(Request.blank('/'))
+        assert response.status_code == 200, response.status
+    return render
+
+
+def _render_student_view(env, course, rng):
+    student_id = rng.choice(course.students_with_status('peer'))
+    block = env.get_block(student_id, course.submission_uuids[student_id])
+    return lambda: env.runtime.render(block, 'student_view')
+
+
+@scenario('student_view', iterations=50)
+def student_view(env, course, rng):
+    """
+    A learner in the peer step opens the block, with the compiled configuration shared between block instances.
+    """
+    return _render_student_view(env, course, rng)
+
+
+@scenario('student_view_uncompiled', iterations=50)
+def student_view_uncompiled(env, course, rng):
+    """
+    A learner in the peer step opens the block, compiling the configuration each time it is read.
+    """
+    # pylint: disable=import-outside-toplevel
+    from openassessment.xblock.openassessmentblock import OpenAssessmentBlock
+
+    render = _render_student_view(env, course, rng)
+
+    def render_uncompiled():
+        with patch.object(OpenAssessmentBlock, 'CACHE_COMPILED_CONFIG', False):
+            render()
+    return render_uncompiled
+
+
+@scenario('staff_list', iterations=20)
+def staff_list(env, course, rng):
+    """
+    A staff member opens the list of the submissions of the staff grader.
+    """
+    staff_id = rng.choice(course.staff_ids)
+
+    def list_workflows():
+        response = env.get_block(staff_id, is_staff=True).list_staff_workflows(_json_request({}))
+        assert response.status_code == 200, response.status
+    return list_workflows
+
+
+@scenario('waiting_step', iterations=20)
+def waiting_step(env, course, rng):
+    """
+    A staff member opens the list of the learners waiting for peer grades.
+    """
+    staff_id = rng.choice(course.staff_ids)
+
+    def waiting_step_data():
+        response = env.get_block(staff_id, is_staff=True).waiting_step_data(Request.blank('/'))
+        assert response.status_code == 200, response.status
+    return waiting_step_data
+
+
+@scenario('csv_export', iterations=3)
+def csv_export(env, course, rng):  # pylint: disable=unused-argument
+    """
+    The ORA data report of the course is written as CSV.
+    """
+    # pylint: disable=import-outside-toplevel
+    from openassessment.data import OraAggregateData
+
+    def export():
+        header, rows = OraAggregateData.collect_ora2_data(course.course_id)
+        with TemporaryFile('w+', newline='', encoding='utf-8') as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(header)
+            writer.writerows(rows)
+    return export
+
+
+@scenario('zip_export', iterations=3)
+def zip_export(env, course, rng):  # pylint: disable=unused-argument
+    """
+    The responses of the learners of the course are downloaded as a zip archive.
+    """
+    # pylint: disable=import-outside-toplevel
+    from openassessment.data import OraDownloadData
+
+    def export():
+        with TemporaryFile() as zip_file:
+            OraDownloadData.create_zip_with_attachments(
+                zip_file, OraDownloadData.collect_ora2_submission_files(course.course_id)
+            )
+    return export
+
+
+def percentile(values, percent):
+    """
+    Return the percentile of the values, interpolated between the closest ranks.
+    """
+    values = sorted(values)
+    rank = (len(values) - 1) * percent / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (rank - lower)
+
+
+def summarize(values):
+    """
+    Return the distribution of a list of measures.
+    """
+    return {
+        'min': min(values),
+        'p50': percentile(values, 50),
+        'p90': percentile(values, 90),
+        'p95': percentile(values, 95),
+        'p99': percentile(values, 99),
+        'max': max(values),
+        'mean': sum(values) / len(values),
+    }
+
+
+@contextmanager
+def _count_queries():
+    """
+    Count the queries made on all the database connections.
+    """
+    counter = {'queries': 0}
+
+    def wrapper(execute, sql, params, many, context):
+        counter['queries'] += 1
+        return execute(sql, params, many, context)
+
+    with transaction.atomic(), ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(wrapper))
+        yield counter
+        transaction.set_rollback(True)
+
+
+def run_scenario(name, env, course, rng, iterations=None, warmup=1):
+    """
+    Time the runs of a scenario.
+
+    Args:
+        name (str): The name of the scenario.
+        env (BenchmarkEnvironment): The environment of the benchmark.
+        course (SyntheticCourse): The generated data.
+        rng (random.Random): The random generator choosing the users of the runs.
+
+    Kwargs:
+        iterations (int): The number of timed runs, by default the one of the scenario.
+        warmup (int): The number of runs made before the timed runs, to fill the caches.
+
+    Returns:
+        dict: The latency of the runs, in milliseconds, and their number of queries.
+    """
+    func = SCENARIOS[name]
+    iterations = iterations or func.iterations
+    latencies, queries = [], []
+    for index in range(warmup + iterations):
+        call = func(env, course, rng)
+        with _count_queries() as counter:
+            start = time.perf_counter()
+            call()
+            elapsed = time.perf_counter() - start
+        if index >= warmup:
+            latencies.append(elapsed * 1000)
+            queries.append(counter['queries'])
+    return {
+        'iterations': iterations,
+        'latency_ms': summarize(latencies),
+        'queries': summarize(queries),
+    }
@@ -0,0 +1,93 @@
+"""
+Tests for the benchmark data generator and scenarios.
+"""
+import random
+
+import ddt
+from django.db.models import Count, Q
+
+from benchmarks.datagen import SCALES, generate_course_data, parse_scale
+from benchmarks.environment import BenchmarkEnvironment
+from benchmarks.scenarios import SCENARIOS, percentile, run_scenario
+from openassessment.assessment.api import peer as peer_api
+from openassessment.assessment.models import Assessment, PeerWorkflow, PeerWorkflowItem, StaffWorkflow
+from openassessment.staffgrader.models.submission_lock import SubmissionGradingLock
+from openassessment.test_utils import CacheResetTest
+from openassessment.workflow.models import AssessmentWorkflow
+from openassessment.xblock.data_conversion import create_rubric_dict
+
+NUM_LEARNERS = 40
+
+
+@ddt.ddt
+class BenchmarksTest(CacheResetTest):
+    """
+    Generate the data of a small course, and run the scenarios against it.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.env = BenchmarkEnvironment(create_db=False).__enter__()  # pylint: disable=unnecessary-dunder-call
+        self.addCleanup(self.env.__exit__, None, None, None)
+        block = self.env.get_block()
+        self.course = generate_course_data(
+            self.env.course_id,
+            self.env.item_id,
+            create_rubric_dict(block.prompts, block.rubric_criteria_with_labels),
+            NUM_LEARNERS,
+            must_grade=3,
+            must_be_graded_by=3,
+            num_prompts=len(block.prompts),
+            seed=1,
+        )
+
+    def test_generated_data(self):
+        counts = self.course.counts
+        self.assertEqual(AssessmentWorkflow.objects.filter(course_id=self.env.course_id).count(), NUM_LEARNERS)
+        self.assertEqual(StaffWorkflow.objects.filter(course_id=self.env.course_id).count(), NUM_LEARNERS)
+        self.assertEqual(PeerWorkflowItem.objects.count(), counts['peer_workflow_items'])
+        self.assertEqual(Assessment.objects.count(), counts['assessments'])
+        self.assertEqual(SubmissionGradingLock.objects.count(), counts['grading_locks'])
+
+        # The learners are in each state of the workflow
+        for status in ('peer', 'waiting', 'done'):
+            self.assertTrue(self.course.students_with_status(status))
+            self.assertEqual(
+                AssessmentWorkflow.objects.filter(status=status).count(),
+                len(self.course.students_with_status(status)),
+            )
+
+        # The denormalized count of grades matches the peer assessments
+        for workflow in PeerWorkflow.objects.annotate(
+            num_assessed=Count('graded_by', filter=Q(graded_by__assessment__isnull=False))
+        ):
+            self.assertEqual(workflow.completed_graded_by_count, workflow.num_assessed)
+
+        # The generated data is consistent with the requirements of the peer step
+        student_id = self.course.students_with_status('peer')[0]
+        self.assertIsNotNone(peer_api.get_submission_to_assess(self.course.submission_uuids[student_id], 3))
+
+    def test_too_few_learners(self):
+        with self.assertRaises(ValueError):
+            generate_course_data(self.env.course_id, 'other-item', {}, 4, must_grade=3, must_be_graded_by=3)
+
+    @ddt.data(*SCENARIOS)
+    def test_run_scenario(self, name):
+        num_items = PeerWorkflowItem.objects.count()
+
+        result = run_scenario(name, self.env, self.course, random.Random(0), iterations=2, warmup=0)
+
+        self.assertEqual(result['iterations'], 2)
+        self.assertGreater(result['queries']['min'], 0)
+        self.assertLessEqual(result['latency_ms']['p50'], result['latency_ms']['max'])
+        # The runs are rolled back
+        self.assertEqual(PeerWorkflowItem.objects.count(), num_items)
+
+    def test_percentile(self):
+        self.assertEqual(percentile([3, 1, 2], 50), 2)
+        self.assertEqual(percentile([1, 2], 50), 1.5)
+        self.assertEqual(percentile([5], 99), 5)
+
+    def test_parse_scale(self):
+        self.assertEqual(parse_scale('10k'), SCALES['10k'])
+        self.assertEqual(parse_scale('250'), 250)
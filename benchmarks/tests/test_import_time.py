@@ -0,0 +1,21 @@
+"""
+Tests for the measure of the import times.
+"""
+from unittest import TestCase
+
+from benchmarks.import_time import IMPORT_TIME_BUDGETS, measure_import_times
+
+
+class ImportTimeTest(TestCase):
+    """
+    Import a module in a new process, without checking the time against its budget.
+    """
+
+    def test_measure_import_times(self):
+        results = measure_import_times(['openassessment.workflow.api'], repeat=1)
+
+        self.assertEqual(list(results), ['openassessment.workflow.api'])
+        self.assertGreater(results['openassessment.workflow.api']['seconds'], 0)
+        self.assertEqual(
+            results['openassessment.workflow.api']['budget'], IMPORT_TIME_BUDGETS['openassessment.workflow.api']
+        )
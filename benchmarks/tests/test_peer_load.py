@@ -0,0 +1,85 @@
+"""
+Tests for the load simulation of peer grading.
+"""
+import time
+from unittest.mock import patch
+
+from django.db import DatabaseError
+
+from benchmarks.datagen import generate_course_data
+from benchmarks.environment import BenchmarkEnvironment
+from benchmarks.peer_load import LoadConfig, _error_name, _merge, format_report, grade_distribution, simulate_learner
+from openassessment.assessment.errors import PeerAssessmentInternalError
+from openassessment.test_utils import CacheResetTest
+from openassessment.xblock.data_conversion import create_rubric_dict
+
+
+class PeerLoadTest(CacheResetTest):
+    """
+    Simulate learners one after the other, against submissions made by the data generator.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.env = BenchmarkEnvironment(create_db=False).__enter__()  # pylint: disable=unnecessary-dunder-call
+        self.addCleanup(self.env.__exit__, None, None, None)
+        block = self.env.get_block()
+        rubric_dict = create_rubric_dict(block.prompts, block.rubric_criteria_with_labels)
+        generate_course_data(self.env.course_id, self.env.item_id, rubric_dict, 10, 3, 3)
+        self.config = LoadConfig(
+            self.env.course_id, self.env.item_id, rubric_dict, 3, 3, ['peer', 'staff'],
+            duration=5, think_time=0, arrival_window=0,
+        )
+
+    def test_simulate_learner(self):
+        before = grade_distribution(self.env.course_id, self.env.item_id, 3)
+
+        result = simulate_learner(0, self.config, time.time())
+
+        self.assertEqual(result['assessments'], 3)
+        self.assertEqual(result['operations']['submit'], 1)
+        self.assertEqual(result['operations']['pick'], 3)
+        self.assertEqual(len(result['pick_latencies']), 3)
+        self.assertEqual(result['duplicate_picks'], 0)
+        self.assertFalse(result['errors'])
+
+        after = grade_distribution(self.env.course_id, self.env.item_id, 3)
+        self.assertEqual(after['submissions'], before['submissions'] + 1)
+        self.assertAlmostEqual(
+            after['graded_by']['mean'] * after['submissions'],
+            before['graded_by']['mean'] * before['submissions'] + 3,
+        )
+
+    @patch('openassessment.assessment.api.peer.create_assessment')
+    def test_errors_are_counted(self, mock_create_assessment):
+        error = PeerAssessmentInternalError("Error")
+        error.__cause__ = DatabaseError()
+        mock_create_assessment.side_effect = error
+        self.config.duration = 0.2
+
+        result = simulate_learner(0, self.config, time.time())
+
+        self.assertEqual(result['assessments'], 0)
+        self.assertGreater(result['errors']['assess']['PeerAssessmentInternalError(DatabaseError)'], 0)
+        self.assertEqual(sum(result['errors']['assess'].values()), result['operations']['assess'])
+
+    def test_report(self):
+        merged = _merge([simulate_learner(index, self.config, time.time()) for index in range(2)])
+        self.assertEqual(merged['assessments'], 6)
+        self.assertEqual(merged['operations']['submit'], 2)
+
+        report = {
+            'elapsed_s': 1.0,
+            'throughput': {'assessments': 6, 'assessments_per_s': 6.0, 'picks': 6, 'picks_per_s': 6.0},
+            'pick_latency_ms': None,
+            'picks': {'total': 6, 'empty': 0, 'duplicate': 0},
+            'errors': {'pick': {'count': 0, 'rate': 0.0, 'types': {}}},
+            'fairness': grade_distribution(self.env.course_id, self.env.item_id, 3),
+        }
+        self.assertIn("6 assessments in 1.0 s", format_report(report))
+
+    def test_error_name(self):
+        self.assertEqual(_error_name(ValueError()), 'ValueError')
+
+    def test_no_submissions(self):
+        self.assertIsNone(grade_distribution(self.env.course_id, 'other-item', 3))
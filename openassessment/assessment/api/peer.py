@@ -275,7 +275,8 @@ def create_assessment(
     Creates an assessment on the given submission.
 
     Assessments are created based on feedback associated with a particular
-    rubric.
+    rubric. The assessment is recorded in a single transaction, which locks the
+    scorer's workflow item for the submission before anything else.
 
     Args:
         scorer_submission_uuid (str): The submission uuid for the Scorer's
@@ -408,7 +409,21 @@ def _complete_assessment(
     Returns:
         The Assessment model
 
+    Raises:
+        PeerAssessmentWorkflowError: The workflow item was closed meanwhile,
+            by a concurrent request.
+
     """
+    # Lock the workflow item first, so that concurrent requests to assess the
+    # same submission are serialized and only the first one is recorded.
+    peer_workflow_item = scorer_workflow.get_item_for_update(peer_submission_uuid)
+    if peer_workflow_item.assessment_id is not None:
+        raise PeerAssessmentWorkflowError(
+            "The assessment of submission UUID {} by learner {} was already recorded.".format(
+                peer_submission_uuid, scorer_workflow.student_id
+            )
+        )
+
     # Get or create the rubric
     rubric = rubric_from_dict(rubric_dict)
 
@@ -428,7 +443,9 @@ def _complete_assessment(
     AssessmentPart.create_from_option_names(assessment, options_selected, feedback=criterion_feedback)
 
     # Close the active assessment
-    scorer_workflow.close_active_assessment(peer_submission_uuid, assessment, num_required_grades)
+    scorer_workflow.close_active_assessment(
+        peer_submission_uuid, assessment, num_required_grades, item=peer_workflow_item
+    )
     return assessment
 
 
@@ -999,6 +1016,29 @@ def on_cancel(submission_uuid):
         raise PeerAssessmentInternalError(error_message) from ex
 
 
+def on_cancel_many(submission_uuids):
+    """Cancel the peer workflows of many submissions at once.
+
+    Sets the cancelled_at field of each peer workflow, with a single update.
+
+    Args:
+        submission_uuids (list of str): The submission UUIDs associated with the workflows.
+
+    Returns:
+        None
+
+    """
+    try:
+        PeerWorkflow.objects.filter(submission_uuid__in=submission_uuids).update(cancelled_at=timezone.now())
+    except DatabaseError as ex:
+        error_message = (
+            "An internal error occurred while cancelling the peer "
+            "workflows for {} submissions".format(len(submission_uuids))
+        )
+        logger.exception(error_message)
+        raise PeerAssessmentInternalError(error_message) from ex
+
+
 def get_waiting_step_details(
     course_id,
     item_id,
@@ -1031,6 +1071,22 @@ def get_waiting_step_details(
     )
 
 
+def get_bulk_graded_counts(submission_uuids):
+    """
+    Proxy method to `get_bulk_graded_counts` model method.
+    Retrieves, for many submissions at once, how many peers each submitter has
+    graded and how many peer grades each submission has received.
+
+    Args:
+        submission_uuids (list): The submission UUIDs to retrieve counts for.
+
+    Returns:
+        dict: Maps submission UUID to a (peers_graded_count, graded_by_count) tuple.
+              Submissions without a peer workflow are omitted.
+    """
+    return PeerWorkflow.get_bulk_graded_counts(submission_uuids)
+
+
 def get_bulk_scored_assessments(submission_uuids):
     """
     Given a list of submission uuids, return a set of assessments that
@@ -127,6 +127,30 @@ def on_cancel(submission_uuid):
         raise StaffAssessmentInternalError(error_message) from ex
 
 
+def on_cancel_many(submission_uuids):
+    """
+    Cancel the staff workflows of many submissions at once.
+
+    Sets the cancelled_at field of each staff workflow, with a single update.
+
+    Args:
+        submission_uuids (list of str): The submission UUIDs associated with the workflows.
+
+    Returns:
+        None
+
+    """
+    try:
+        StaffWorkflow.objects.filter(submission_uuid__in=submission_uuids).update(cancelled_at=now())
+    except DatabaseError as ex:
+        error_message = (
+            "An internal error occurred while cancelling the staff "
+            "workflows for {} submissions".format(len(submission_uuids))
+        )
+        logger.exception(error_message)
+        raise StaffAssessmentInternalError(error_message) from ex
+
+
 def get_score(submission_uuid, staff_requirements):  # pylint: disable=unused-argument
     """
     Generate a score based on a completed assessment for the given submission.
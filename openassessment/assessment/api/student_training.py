@@ -8,8 +8,13 @@ Public interface for student training:
 """
 
 
+import hashlib
+import json
 import logging
+from collections import OrderedDict, namedtuple
+from threading import Lock
 
+from django.core.cache import cache
 from django.db import DatabaseError
 from django.utils.translation import gettext as _
 
@@ -23,6 +28,17 @@ from openassessment.assessment.serializers import (InvalidRubric, InvalidTrainin
 logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
 
 
+# The training examples of a block, validated against its rubric and deserialized to models.
+# `errors` is the list of validation errors; when it is not empty, `examples` is None.
+TrainingSet = namedtuple('TrainingSet', ['errors', 'examples'])
+
+# Training sets never change for a given rubric and list of examples,
+# so the most recently used ones are also kept in memory to save the cache round trip.
+TRAINING_SET_CACHE_SIZE = 256
+_TRAINING_SETS = OrderedDict()
+_TRAINING_SETS_LOCK = Lock()
+
+
 def submitter_is_finished(submission_uuid, training_requirements):
     """
     Check whether the student has correctly assessed
@@ -282,6 +298,37 @@ def get_num_completed(submission_uuid):
         raise StudentTrainingInternalError(msg) from ex
 
 
+def get_bulk_num_completed(submission_uuids):
+    """
+    Get the number of training examples that each student has assessed successfully.
+
+    Args:
+        submission_uuids (list): The UUIDs of the students' submissions.
+
+    Returns:
+        dict: Maps each submission UUID to its number of completed training examples
+            (0 for submissions without a learner training workflow).
+
+    Raises:
+        StudentTrainingInternalError
+
+    Example usage:
+        >>> get_bulk_num_completed(["5443ebbbe2297b30f503736e26be84f6c7303c57", "no-workflow"])
+        {"5443ebbbe2297b30f503736e26be84f6c7303c57": 2, "no-workflow": 0}
+
+    """
+    try:
+        num_completed = StudentTrainingWorkflow.get_bulk_num_completed(submission_uuids)
+    except DatabaseError as ex:
+        msg = "An unexpected error occurred while retrieving learner training workflow statuses"
+        logger.exception(msg)
+        raise StudentTrainingInternalError(msg) from ex
+    return {
+        submission_uuid: num_completed.get(submission_uuid, 0)
+        for submission_uuid in submission_uuids
+    }
+
+
 def get_training_example(submission_uuid, rubric, examples):
     """
     Retrieve a training example for the student to assess.
@@ -367,12 +414,12 @@ def get_training_example(submission_uuid, rubric, examples):
 
     """
     try:
-        # Validate the training examples
-        errors = validate_training_examples(rubric, examples)
-        if errors:
+        # Validate and deserialize the training examples, or use the result of a previous request
+        training_set = get_training_set(rubric, examples)
+        if training_set.errors:
             msg = (
                 "Training examples do not match the rubric (submission UUID is {uuid}): {errors}"
-            ).format(uuid=submission_uuid, errors="\n".join(errors))
+            ).format(uuid=submission_uuid, errors="\n".join(training_set.errors))
             raise StudentTrainingRequestError(msg)
 
         # Get or create the workflow
@@ -382,12 +429,9 @@ def get_training_example(submission_uuid, rubric, examples):
                 f"No learner training workflow found for submission {submission_uuid}"
             )
 
-        # Get or create the training examples
-        examples = deserialize_training_examples(examples, rubric)
-
         # Pick a training example that the student has not yet completed
         # If the student already started a training example, then return that instead.
-        next_example = workflow.next_training_example(examples)
+        next_example = workflow.next_training_example(training_set.examples)
         return None if next_example is None else serialize_training_example(next_example)
     except (InvalidRubric, InvalidRubricSelection, InvalidTrainingExample) as ex:
         logger.exception("Could not deserialize training examples for submission UUID %s", submission_uuid)
@@ -464,3 +508,62 @@ def assess_training_example(submission_uuid, options_selected, update_workflow=T
         ).format(submission_uuid)
         logger.exception(msg)
         raise StudentTrainingInternalError(msg) from ex
+
+
+def get_training_set(rubric, examples):
+    """
+    Validate the training examples against the rubric and get or create the
+    corresponding training example models.
+
+    The result is cached by the content of the rubric and examples, first in
+    memory (for the `TRAINING_SET_CACHE_SIZE` most recently used training sets)
+    and then in the Django cache, so that the examples of a block are only
+    validated and deserialized once.
+
+    Args:
+        rubric (dict): Serialized rubric model.
+        examples (list): List of serialized training examples.
+
+    Returns:
+        TrainingSet
+
+    Raises:
+        InvalidRubric
+        InvalidRubricSelection
+        InvalidTrainingExample
+        DatabaseError
+
+    """
+    content_hash = hashlib.sha1(
+        json.dumps([rubric, examples], sort_keys=True, default=str).encode('utf-8')
+    ).hexdigest()
+    cache_key = f"student_training.training_set.{content_hash}"
+
+    with _TRAINING_SETS_LOCK:
+        training_set = _TRAINING_SETS.get(cache_key)
+        if training_set is not None:
+            _TRAINING_SETS.move_to_end(cache_key)
+            return training_set
+
+    training_set = cache.get(cache_key)
+    if training_set is None:
+        errors = validate_training_examples(rubric, examples)
+        if errors:
+            training_set = TrainingSet(errors=errors, examples=None)
+        else:
+            training_set = TrainingSet(errors=[], examples=deserialize_training_examples(examples, rubric))
+        cache.set(cache_key, training_set)
+
+    with _TRAINING_SETS_LOCK:
+        _TRAINING_SETS[cache_key] = training_set
+        while len(_TRAINING_SETS) > TRAINING_SET_CACHE_SIZE:
+            _TRAINING_SETS.popitem(last=False)
+    return training_set
+
+
+def clear_training_set_cache():
+    """
+    Forget the training sets kept in memory by `get_training_set`.
+    """
+    with _TRAINING_SETS_LOCK:
+        _TRAINING_SETS.clear()
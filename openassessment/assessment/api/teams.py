@@ -97,6 +97,48 @@ def on_init(team_submission_uuid):
         raise StaffAssessmentInternalError(error_message) from ex
 
 
+def on_init_many(team_submissions):
+    """
+    Create team staff workflows for many team submissions at once.
+
+    Like `on_init`, team submissions which already have a workflow are left unchanged.
+
+    Args:
+        team_submissions (list of dict): The serialized team submissions, with at least
+            the keys "team_submission_uuid", "course_id", "item_id" and "submission_uuids".
+
+    Returns:
+        None
+
+    Raises:
+        StaffAssessmentInternalError: Raised when there is an internal error
+            creating the Workflows.
+    """
+    team_submission_uuids = [team_submission['team_submission_uuid'] for team_submission in team_submissions]
+    try:
+        existing_uuids = set(
+            TeamStaffWorkflow.objects.filter(
+                team_submission_uuid__in=team_submission_uuids
+            ).values_list('team_submission_uuid', flat=True)
+        )
+        for team_submission in team_submissions:
+            if team_submission['team_submission_uuid'] in existing_uuids:
+                continue
+            # Staff workflows use multi-table inheritance, so they can't be bulk created
+            TeamStaffWorkflow.objects.create(
+                course_id=team_submission['course_id'],
+                item_id=team_submission['item_id'],
+                team_submission_uuid=team_submission['team_submission_uuid'],
+                submission_uuid=team_submission['submission_uuids'][0],
+            )
+    except DatabaseError as ex:
+        error_message = (
+            "An internal error occurred while creating new team staff workflows for team submissions {}"
+        ).format(team_submission_uuids)
+        logger.exception(error_message)
+        raise StaffAssessmentInternalError(error_message) from ex
+
+
 def on_cancel(team_submission_uuid):
     """
     Cancel the team staff workflow for submission.
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assessment', '0007_staff_workflow_blank'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='sharedfileupload',
+            index=models.Index(fields=['team_id', 'course_id', 'item_id'], name='assessment__team_id_347976_idx'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def backfill_completed_graded_by_count(apps, schema_editor):  # pylint: disable=unused-argument
+    """
+    Count the completed peer assessments of the existing workflows.
+    """
+    PeerWorkflow = apps.get_model('assessment', 'PeerWorkflow')
+    PeerWorkflowItem = apps.get_model('assessment', 'PeerWorkflowItem')
+    completed_items = PeerWorkflowItem.objects.filter(
+        author_id=models.OuterRef('pk'), assessment__isnull=False
+    ).order_by().values('author_id').annotate(count=models.Count('pk')).values('count')
+    PeerWorkflow.objects.update(
+        completed_graded_by_count=Coalesce(models.Subquery(completed_items), 0)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assessment', '0008_sharedfileupload_team_course_item_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='peerworkflow',
+            name='completed_graded_by_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_completed_graded_by_count, migrations.RunPython.noop),
+    ]
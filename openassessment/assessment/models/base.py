@@ -660,6 +660,29 @@ class AssessmentPart(models.Model):
             InvalidRubricSelection
             DatabaseError
 
+        """
+        return cls.objects.bulk_create(cls.build_from_option_names(assessment, selected, feedback=feedback))
+
+    @classmethod
+    def build_from_option_names(cls, assessment, selected, feedback=None):
+        """
+        Build the assessment parts of an assessment, without saving them,
+        so that the parts of many assessments can be created at once.
+
+        Args:
+            assessment (Assessment): The assessment we're adding parts to.
+            selected (dict): A dictionary mapping criterion names to option names.
+
+        Keyword Arguments:
+            feedback (dict): A dictionary mapping criterion names to written
+                feedback for the criterion.
+
+        Returns:
+            list of unsaved `AssessmentPart`s
+
+        Raises:
+            InvalidRubricSelection
+
         """
         # Use the rubric index so we can retrieve options/criteria
         # without repeatedly hitting the database.
@@ -701,10 +724,10 @@ class AssessmentPart(models.Model):
                     'feedback': feedback_text[0:cls.MAX_FEEDBACK_SIZE]
                 })
 
-        # Create assessment parts for each criterion and associate them with the assessment
+        # Build assessment parts for each criterion and associate them with the assessment
         # We use the dictionary we created earlier, which may have null options
         # for feedback-only assessment parts.
-        return cls.objects.bulk_create([
+        return [
             cls(
                 assessment=assessment,
                 criterion=assessment_part['criterion'],
@@ -712,7 +735,7 @@ class AssessmentPart(models.Model):
                 feedback=assessment_part['feedback']
             )
             for assessment_part in assessment_parts
-        ])
+        ]
 
     @classmethod
     def create_from_option_points(cls, assessment, selected):
@@ -842,6 +865,12 @@ class SharedFileUpload(TimeStampedModel):
     size = models.BigIntegerField(default=0, blank=True)
     name = models.CharField(max_length=255, default="")
 
+    class Meta:
+        app_label = "assessment"
+        indexes = [
+            models.Index(fields=['team_id', 'course_id', 'item_id']),
+        ]
+
     def __str__(self):
         return f"SharedFileUpload {self.file_key}"
 
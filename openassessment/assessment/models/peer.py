@@ -118,6 +118,9 @@ class PeerWorkflow(models.Model):
     completed_at = models.DateTimeField(null=True, db_index=True)
     grading_completed_at = models.DateTimeField(null=True, db_index=True)
     cancelled_at = models.DateTimeField(null=True, db_index=True)
+    # Number of completed peer assessments of this submission, kept up to date
+    # by `close_active_assessment` so that it does not have to count them.
+    completed_graded_by_count = models.PositiveIntegerField(default=0)
 
     class Meta:
         ordering = ["created_at", "id"]
@@ -290,6 +293,45 @@ class PeerWorkflow(models.Model):
             } for item in waiting
         ]
 
+    @classmethod
+    def get_bulk_graded_counts(cls, submission_uuids):
+        """
+        Retrieves peer grading counts for many submissions with a single query.
+
+        Args:
+            submission_uuids (list): The submission UUIDs to retrieve counts for.
+
+        Returns:
+            dict: Maps the submission UUID of each peer workflow found to a tuple of
+                (number of peers the submitter has graded, number of peer grades
+                the submission has received). Submissions without a peer workflow
+                are omitted.
+        """
+        workflows = cls.objects.filter(
+            submission_uuid__in=submission_uuids,
+        ).annotate(
+            graded_count=models.Count(
+                'graded',
+                distinct=True,
+                # From PeerWorkflow.num_peers_graded
+                filter=models.Q(graded__assessment__isnull=False)
+            ),
+            graded_by_count=models.Count(
+                'graded_by',
+                distinct=True,
+                # From peer_api.get_graded_by_count
+                filter=models.Q(
+                    graded_by__assessment__submission_uuid=models.F('submission_uuid'),
+                    graded_by__assessment__score_type=PEER_TYPE
+                )
+            )
+        ).values('submission_uuid', 'graded_count', 'graded_by_count')
+
+        return {
+            workflow['submission_uuid']: (workflow['graded_count'], workflow['graded_by_count'])
+            for workflow in workflows
+        }
+
     def find_active_assessments(self):
         """Given a student item, return an active assessment if one is found.
 
@@ -440,41 +482,80 @@ class PeerWorkflow(models.Model):
             logger.exception(error_message)
             raise PeerAssessmentInternalError(error_message) from ex
 
-    def close_active_assessment(self, submission_uuid, assessment, num_required_grades):
+    def get_item_for_update(self, submission_uuid):
+        """
+        Retrieve and lock the latest workflow item of the student for the given
+        submission, until the end of the current transaction.
+
+        Args:
+            submission_uuid (str): The submission the scorer is grading.
+
+        Returns:
+            PeerWorkflowItem
+
+        Raises:
+            PeerAssessmentWorkflowError: No workflow item was found for the submission.
+
+        """
+        items = list(
+            PeerWorkflowItem.objects.select_for_update().filter(
+                scorer_id=self.id, submission_uuid=submission_uuid
+            ).order_by("-started_at", "-id")[:1]
+        )
+        if not items:
+            msg = (
+                "No open assessment was found for learner {} while assessing "
+                "submission UUID {}."
+            ).format(self.student_id, submission_uuid)
+            raise PeerAssessmentWorkflowError(msg)
+        return items[0]
+
+    def close_active_assessment(self, submission_uuid, assessment, num_required_grades, item=None):
         """
         Updates a workflow item on the student's workflow with the associated
         assessment. When a workflow item has an assessment, it is considered
         finished.
 
+        The number of completed assessments of the author is updated, and the
+        author's grading is completed once it reaches the required number of
+        grades, in a single query which does not load the author's workflow.
+
         Args:
             submission_uuid (str): The submission the scorer is grading.
             assessment (PeerAssessment): The associate assessment for this action.
-            graded_by (int): The required number of grades the peer workflow
+            num_required_grades (int): The required number of grades the peer workflow
                 requires to be considered complete.
 
+        Keyword Args:
+            item (PeerWorkflowItem): The workflow item to close, when it was already
+                retrieved with `get_item_for_update`.
+
         Returns:
             None
 
         """
         try:
-            item_query = self.graded.filter(
-                submission_uuid=submission_uuid
-            ).order_by("-started_at", "-id")
-            items = list(item_query[:1])
-            if not items:
-                msg = (
-                    "No open assessment was found for learner {} while assessing "
-                    "submission UUID {}."
-                ).format(self.student_id, submission_uuid)
-                raise PeerAssessmentWorkflowError(msg)
-            item = items[0]
+            if item is None:
+                item = self.get_item_for_update(submission_uuid)
+            was_open = item.assessment_id is None
             item.assessment = assessment
-            item.save()
-
-            if not item.author.grading_completed_at:
-                if item.author.graded_by.filter(assessment__isnull=False).count() >= num_required_grades:
-                    item.author.grading_completed_at = now()
-                    item.author.save()
+            item.save(update_fields=["assessment"])
+
+            if was_open:
+                # The grading completion is set before the count is incremented, so that
+                # it compares the count before the update on every database backend.
+                PeerWorkflow.objects.filter(pk=item.author_id).update(
+                    grading_completed_at=models.Case(
+                        models.When(
+                            grading_completed_at__isnull=True,
+                            completed_graded_by_count__gte=num_required_grades - 1,
+                            then=models.Value(now()),
+                        ),
+                        default=models.F("grading_completed_at"),
+                        output_field=models.DateTimeField(),
+                    ),
+                    completed_graded_by_count=models.F("completed_graded_by_count") + 1,
+                )
 
         except (DatabaseError, PeerWorkflowItem.DoesNotExist) as ex:
             error_message = (
@@ -95,6 +95,27 @@ class StudentTrainingWorkflow(models.Model):
         """
         return self.items.filter(completed_at__isnull=False).count()
 
+    @classmethod
+    def get_bulk_num_completed(cls, submission_uuids):
+        """
+        Return the number of training examples that each student
+        successfully assessed, with a single query.
+
+        Args:
+            submission_uuids (list): The submission UUIDs of the students being trained.
+
+        Returns:
+            dict: Maps the submission UUID of each workflow found to its number of
+                completed training examples. Submissions without a workflow are omitted.
+
+        """
+        workflows = cls.objects.filter(
+            submission_uuid__in=submission_uuids
+        ).annotate(
+            num_completed=models.Count('items', filter=models.Q(items__completed_at__isnull=False))
+        ).values_list('submission_uuid', 'num_completed')
+        return dict(workflows)
+
     def next_training_example(self, examples):
         """
         Return the next training example for the student to assess.
@@ -109,26 +130,30 @@ class StudentTrainingWorkflow(models.Model):
             TrainingExample or None
 
         """
-        # Fetch all the items for this workflow from the database
-        # Since Django's `select_related` does not follow reverse keys
-        # we perform the filter ourselves.
-        items = StudentTrainingWorkflowItem.objects.select_related(
-            'training_example'
-        ).filter(workflow=self)
+        # Fetch the example IDs of all the items for this workflow from the database.
+        # The examples themselves are only loaded if the student is working on
+        # an example that isn't in the list (for example, if the rubric has changed).
+        items = list(
+            StudentTrainingWorkflowItem.objects.filter(workflow=self).values_list(
+                'training_example_id', 'completed_at'
+            )
+        )
+        examples_by_id = {example.id: example for example in examples}
 
         # If we're already working on an item, then return that item
-        incomplete_items = [item for item in items if not item.is_complete]
-        if incomplete_items:
-            return incomplete_items[0].training_example
+        incomplete_example_ids = [example_id for example_id, completed_at in items if completed_at is None]
+        if incomplete_example_ids:
+            example_id = incomplete_example_ids[0]
+            if example_id in examples_by_id:
+                return examples_by_id[example_id]
+            return TrainingExample.objects.get(pk=example_id)
 
         # Otherwise, pick an item that we have not completed
         # from the list of examples.
-        completed_examples = [
-            item.training_example for item in items
-        ]
+        completed_example_ids = {example_id for example_id, __ in items}
         available_examples = [
             available for available in examples
-            if available not in completed_examples
+            if available.id not in completed_example_ids
         ]
 
         # If there are no more items available, return None
@@ -10,6 +10,8 @@ from rest_framework import serializers
 from rest_framework.fields import DateTimeField, IntegerField
 
 from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import prefetch_related_objects
 
 from openassessment.assessment.models import Assessment, AssessmentPart, Criterion, CriterionOption, Rubric
 
@@ -95,7 +97,9 @@ class RubricSerializer(serializers.ModelSerializer):
             local_cache[rubric.content_hash] = rubric_dict
             return rubric_dict
 
-        # Grab it from the database
+        # Grab it from the database, loading the criteria and their options
+        # in two queries instead of one query per criterion.
+        prefetch_related_objects([rubric], 'criteria__options')
         rubric_dict = RubricSerializer(rubric).data
         cache.set(rubric_dict_cache_key, rubric_dict)
         local_cache[rubric.content_hash] = rubric_dict
@@ -292,6 +296,11 @@ def rubric_from_dict(rubric_dict):
         rubric_serializer = RubricSerializer(data=rubric_dict)
         if not rubric_serializer.is_valid():
             raise InvalidRubric(rubric_serializer.errors) from ex
-        rubric = rubric_serializer.save()
+        try:
+            with transaction.atomic():
+                rubric = rubric_serializer.save()
+        except IntegrityError:
+            # The rubric was created meanwhile by a concurrent request
+            rubric = Rubric.objects.get(content_hash=content_hash)
 
     return rubric
@@ -166,7 +166,10 @@ class TestPeerApi(CacheResetTest):
     Tests for the peer assessment API functions.
     """
 
-    CREATE_ASSESSMENT_NUM_QUERIES = 38
+    # Creating the rubric and serializing it for the first time account for 14 of these queries
+    CREATE_ASSESSMENT_NUM_QUERIES = 27
+    # The rubric exists and its serialization is cached
+    CREATE_ASSESSMENT_WITH_RUBRIC_NUM_QUERIES = 13
 
     def test_create_assessment_points(self):
         self._create_student_and_submission("Tim", "Tim's answer")
@@ -210,6 +213,70 @@ class TestPeerApi(CacheResetTest):
             expected_feedback = ASSESSMENT_DICT['criterion_feedback'].get(criterion_name, "")
             self.assertEqual(part['feedback'], expected_feedback)
 
+    def test_create_assessment_with_existing_rubric(self):
+        tim_sub, tim = self._create_student_and_submission("Tim", "Tim's answer")
+        bob_sub, bob = self._create_student_and_submission("Bob", "Bob's answer")
+        peer_api.get_submission_to_assess(bob_sub['uuid'], 1)
+        peer_api.create_assessment(
+            bob_sub["uuid"], bob["student_id"],
+            ASSESSMENT_DICT['options_selected'], {}, "",
+            RUBRIC_DICT,
+            REQUIRED_GRADED_BY,
+        )
+        peer_api.get_submission_to_assess(tim_sub['uuid'], 1)
+
+        with self.assertNumQueries(self.CREATE_ASSESSMENT_WITH_RUBRIC_NUM_QUERIES):
+            assessment = peer_api.create_assessment(
+                tim_sub["uuid"], tim["student_id"],
+                ASSESSMENT_DICT['options_selected'], {}, "",
+                RUBRIC_DICT,
+                REQUIRED_GRADED_BY,
+            )
+        self.assertEqual(assessment["points_earned"], 6)
+
+    def test_create_assessment_updates_author_workflow(self):
+        tim_sub, _ = self._create_student_and_submission("Tim", "Tim's answer")
+        for scorer in ["Bob", "Sally"]:
+            scorer_sub, _ = self._create_student_and_submission(scorer, f"{scorer}'s answer")
+            peer_api.get_submission_to_assess(scorer_sub['uuid'], 2)
+            peer_api.create_assessment(
+                scorer_sub["uuid"], scorer,
+                ASSESSMENT_DICT['options_selected'], {}, "",
+                RUBRIC_DICT,
+                2,
+            )
+            tim_workflow = PeerWorkflow.objects.get(submission_uuid=tim_sub['uuid'])
+            if scorer == "Bob":
+                self.assertEqual(tim_workflow.completed_graded_by_count, 1)
+                self.assertIsNone(tim_workflow.grading_completed_at)
+
+        self.assertEqual(tim_workflow.completed_graded_by_count, 2)
+        self.assertIsNotNone(tim_workflow.grading_completed_at)
+
+    def test_create_assessment_already_recorded(self):
+        self._create_student_and_submission("Tim", "Tim's answer")
+        bob_sub, bob = self._create_student_and_submission("Bob", "Bob's answer")
+        peer_api.get_submission_to_assess(bob_sub['uuid'], 1)
+        open_item = PeerWorkflow.get_by_submission_uuid(bob_sub['uuid']).find_active_assessments()
+
+        # Simulate a concurrent request recording the assessment after this one found the open item
+        with patch.object(PeerWorkflow, 'find_active_assessments', return_value=open_item):
+            peer_api.create_assessment(
+                bob_sub["uuid"], bob["student_id"],
+                ASSESSMENT_DICT['options_selected'], {}, "",
+                RUBRIC_DICT,
+                REQUIRED_GRADED_BY,
+            )
+            with self.assertRaises(peer_api.PeerAssessmentWorkflowError):
+                peer_api.create_assessment(
+                    bob_sub["uuid"], bob["student_id"],
+                    ASSESSMENT_DICT['options_selected'], {}, "",
+                    RUBRIC_DICT,
+                    REQUIRED_GRADED_BY,
+                )
+
+        self.assertEqual(Assessment.objects.filter(scorer_id=bob["student_id"]).count(), 1)
+
     def test_get_waiting_step_details(self):
         """
         Test that the waiting step details API returns data for students
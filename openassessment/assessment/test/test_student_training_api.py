@@ -104,16 +104,15 @@ class StudentTrainingAssessmentTest(CacheResetTest):
         self._warm_cache(RUBRIC, EXAMPLES)
 
         # First training example
-        # This will need to create the student training workflow and the first item
-        # NOTE: we *could* cache the rubric model to reduce the number of queries here,
-        # but we're selecting it by content hash, which is indexed and should be plenty fast.
-        with self.assertNumQueries(8):
+        # This will need to create the first item, but the validated and
+        # deserialized training examples are retrieved from the cache.
+        with self.assertNumQueries(5):
             training_api.get_training_example(self.submission_uuid, RUBRIC, EXAMPLES)
 
         # Without assessing the first training example, try to retrieve a training example.
-        # This should return the same example as before, so we won't need to create
-        # any workflows or workflow items.
-        with self.assertNumQueries(5):
+        # This should return the same example as before, so we only need to load
+        # the workflow and its items.
+        with self.assertNumQueries(2):
             training_api.get_training_example(self.submission_uuid, RUBRIC, EXAMPLES)
 
         # Assess the current training example
@@ -121,9 +120,38 @@ class StudentTrainingAssessmentTest(CacheResetTest):
 
         # Retrieve the next training example, which requires us to create
         # a new workflow item (but not a new workflow).
-        with self.assertNumQueries(8):
+        with self.assertNumQueries(5):
             training_api.get_training_example(self.submission_uuid, RUBRIC, EXAMPLES)
 
+    def test_get_training_set_cached(self):
+        training_set = training_api.get_training_set(RUBRIC, EXAMPLES)
+        self.assertEqual(training_set.errors, [])
+        self.assertEqual(len(training_set.examples), len(EXAMPLES))
+
+        # The training set is kept in memory, so it is not even retrieved from the cache again
+        with patch.object(training_api, 'cache') as mock_cache:
+            with self.assertNumQueries(0):
+                self.assertIs(training_api.get_training_set(RUBRIC, EXAMPLES), training_set)
+            mock_cache.get.assert_not_called()
+
+        # Other processes retrieve it from the cache
+        training_api.clear_training_set_cache()
+        with self.assertNumQueries(0):
+            self.assertEqual(training_api.get_training_set(RUBRIC, EXAMPLES), training_set)
+
+    @patch.object(training_api, 'TRAINING_SET_CACHE_SIZE', 1)
+    def test_get_training_set_cache_size(self):
+        invalid_examples = copy.deepcopy(EXAMPLES)
+        invalid_examples[0]['options_selected']['vocabulary'] = 'Not an option'
+        training_set = training_api.get_training_set(RUBRIC, EXAMPLES)
+        self.assertTrue(training_api.get_training_set(RUBRIC, invalid_examples).errors)
+
+        # The least recently used training set was evicted from memory
+        with patch.object(training_api, 'cache') as mock_cache:
+            mock_cache.get.return_value = training_set
+            training_api.get_training_set(RUBRIC, EXAMPLES)
+            mock_cache.get.assert_called_once()
+
     def test_submitter_is_finished_num_queries(self):
         # Complete the first training example
         training_api.on_start(self.submission_uuid)
@@ -144,6 +172,14 @@ class StudentTrainingAssessmentTest(CacheResetTest):
         with self.assertNumQueries(2):
             training_api.get_num_completed(self.submission_uuid)
 
+    def test_get_bulk_num_completed(self):
+        training_api.get_training_example(self.submission_uuid, RUBRIC, EXAMPLES)
+        training_api.assess_training_example(self.submission_uuid, EXAMPLES[0]['options_selected'])
+
+        with self.assertNumQueries(1):
+            num_completed = training_api.get_bulk_num_completed([self.submission_uuid, 'no-workflow'])
+        self.assertEqual(num_completed, {self.submission_uuid: 1, 'no-workflow': 0})
+
     def test_assess_training_example_num_queries(self):
         # Populate the cache with training examples and rubrics
         self._warm_cache(RUBRIC, EXAMPLES)
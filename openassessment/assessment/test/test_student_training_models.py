@@ -9,9 +9,10 @@ from django.db import IntegrityError
 
 from submissions import api as sub_api
 from openassessment.assessment.models import StudentTrainingWorkflow, StudentTrainingWorkflowItem
+from openassessment.assessment.serializers import deserialize_training_examples
 from openassessment.test_utils import CacheResetTest
 
-from .constants import ANSWER, EXAMPLES, STUDENT_ITEM
+from .constants import ANSWER, EXAMPLES, RUBRIC, STUDENT_ITEM
 
 
 class StudentTrainingWorkflowTest(CacheResetTest):
@@ -52,4 +53,47 @@ class StudentTrainingWorkflowTest(CacheResetTest):
         mock_create.side_effect = IntegrityError
 
         # Expect that we retry and retrieve the workflow item created by someone else
-        self.assertEqual(workflow.next_training_example(EXAMPLES), EXAMPLES[0])
+        examples = deserialize_training_examples(EXAMPLES, RUBRIC)
+        self.assertEqual(workflow.next_training_example(examples), examples[0])
+
+    def test_next_training_example_queries(self):
+        submission = sub_api.create_submission(STUDENT_ITEM, ANSWER)
+        workflow = StudentTrainingWorkflow.create_workflow(submission['uuid'])
+        examples = deserialize_training_examples(EXAMPLES, RUBRIC)
+        first_example = workflow.next_training_example(examples)
+        self.assertEqual(first_example, examples[0])
+
+        # The current example is found among the examples by ID,
+        # so only the example IDs of the items are loaded
+        with self.assertNumQueries(1):
+            self.assertIs(workflow.next_training_example(examples), first_example)
+
+        # Once completed, the next example is picked
+        workflow.current_item.mark_complete()
+        self.assertEqual(workflow.next_training_example(examples), examples[1])
+
+        # An example which is no longer in the list (the rubric changed) is still returned
+        self.assertEqual(workflow.next_training_example(examples[:1]), examples[1])
+
+    def test_get_bulk_num_completed(self):
+        examples = deserialize_training_examples(EXAMPLES, RUBRIC)
+        workflows = []
+        for student_id in ['a', 'b', 'c']:
+            submission = sub_api.create_submission(dict(STUDENT_ITEM, student_id=student_id), ANSWER)
+            workflows.append(StudentTrainingWorkflow.create_workflow(submission['uuid']))
+
+        # The first student completed both examples, the second one is working on the first one
+        for __ in examples:
+            workflows[0].next_training_example(examples)
+            workflows[0].current_item.mark_complete()
+        workflows[1].next_training_example(examples)
+
+        with self.assertNumQueries(1):
+            num_completed = StudentTrainingWorkflow.get_bulk_num_completed(
+                [workflow.submission_uuid for workflow in workflows] + ['no-workflow']
+            )
+        self.assertEqual(num_completed, {
+            workflows[0].submission_uuid: 2,
+            workflows[1].submission_uuid: 0,
+            workflows[2].submission_uuid: 0,
+        })
@@ -3,30 +3,35 @@ Aggregate data for openassessment.
 """
 
 from collections import OrderedDict, defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 import csv
-from io import StringIO
-from itertools import chain
+from io import TextIOWrapper
+from itertools import chain, islice
 import json
 import logging
 import os
+import shutil
+from tempfile import TemporaryFile
+from threading import Lock
 from urllib.parse import urljoin
 from zipfile import ZipFile
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.db import connections
 from django.db.models import CharField, F, OuterRef, Subquery
 from django.db.models.functions import Coalesce
 from django.utils.translation import gettext as _
 import requests
 
 from submissions import api as sub_api
-from submissions.errors import SubmissionNotFoundError
+from submissions.models import Score
 from openassessment.runtime_imports.classes import import_block_structure_transformers, import_external_id
 from openassessment.runtime_imports.functions import get_course_blocks, modulestore
 from openassessment.assessment.api import peer as peer_api
 from openassessment.assessment.models import Assessment, AssessmentFeedback, AssessmentPart
 from openassessment.fileupload.api import get_download_url
-from openassessment.workflow.models import AssessmentWorkflow, TeamAssessmentWorkflow
+from openassessment.workflow.models import AssessmentWorkflow, AssessmentWorkflowStep, TeamAssessmentWorkflow
 
 logger = logging.getLogger(__name__)
 
@@ -174,7 +179,7 @@ class CsvWriter:
         }
         self._progress_callback = progress_callback
 
-    def write_to_csv(self, course_id):
+    def write_to_csv(self, course_id, workflow_id_range=None, write_headers=True):
         """
         Write assessment and submission data for a course to CSV files.
 
@@ -186,15 +191,22 @@ class CsvWriter:
         Args:
             course_id (unicode): The course ID from which to pull data.
 
+        Keyword Arguments:
+            workflow_id_range (tuple): Only write data for the workflows whose
+                primary key falls in this inclusive (first, last) range.  Either
+                bound may be None to leave that end of the range open.
+            write_headers (bool): Whether to write the header row of each output.
+
         Returns:
             None
 
         """
-        self._write_csv_headers()
+        if write_headers:
+            self._write_csv_headers()
 
         rubric_points_cache = {}
         feedback_option_set = set()
-        for submission_uuid in self._submission_uuids(course_id):
+        for submission_uuid in self._submission_uuids(course_id, workflow_id_range):
             self._write_submission_to_csv(submission_uuid)
 
             # Django 1.4 doesn't follow reverse relations when using select_related,
@@ -225,7 +237,7 @@ class CsvWriter:
         # since they're not (currently) user-defined.
         self._write_feedback_options_to_csv(feedback_option_set)
 
-    def _submission_uuids(self, course_id):
+    def _submission_uuids(self, course_id, workflow_id_range=None):
         """
         Iterate over submission uuids.
         Makes database calls every N submissions to avoid loading
@@ -233,16 +245,24 @@ class CsvWriter:
 
         Args:
             course_id (unicode): The ID of the course to retrieve submissions from.
+            workflow_id_range (tuple): Optional inclusive (first, last) range of
+                workflow primary keys to restrict the submissions to.
 
         Yields:
             submission_uuid (unicode)
 
         """
+        workflows = AssessmentWorkflow.objects.filter(course_id=course_id)
+        if workflow_id_range is not None:
+            first_id, last_id = workflow_id_range
+            if first_id is not None:
+                workflows = workflows.filter(id__gte=first_id)
+            if last_id is not None:
+                workflows = workflows.filter(id__lte=last_id)
+
         num_results = 0
         start = 0
-        total_results = _use_read_replica(
-            AssessmentWorkflow.objects.filter(course_id=course_id)
-        ).count()
+        total_results = _use_read_replica(workflows).count()
 
         while num_results < total_results:
             # Load a subset of the submission UUIDs
@@ -251,9 +271,7 @@ class CsvWriter:
             # there should be >= N for us to process.
             end = start + self.QUERY_INTERVAL
             query = _use_read_replica(
-                AssessmentWorkflow.objects
-                .filter(course_id=course_id)
-                .order_by('created')
+                workflows.order_by('created')
             ).values('submission_uuid')[start:end]
 
             for workflow_dict in query:
@@ -407,11 +425,346 @@ class CsvWriter:
             writer.writerow(encoded_row)
 
 
+class ParquetWriter(CsvWriter):
+    """
+    Dump openassessment data to Parquet files.
+
+    The tables are the same as the ones written by `CsvWriter`, but numbers and
+    timestamps are stored in typed columns, which makes the files much smaller
+    and faster to load into analytics tools.  Rows are buffered and written out
+    as a row group every `ROW_GROUP_SIZE` rows.
+
+    Requires the `pyarrow` package, which is not installed by default.
+    """
+
+    # Type of each column of each model, in the same order as `CsvWriter.HEADERS`.
+    COLUMN_TYPES = {
+        'assessment': [
+            'int', 'string', 'timestamp',
+            'string', 'string',
+            'int', 'string',
+        ],
+        'assessment_part': [
+            'int', 'int',
+            'string', 'string',
+            'string', 'string', 'string'
+        ],
+        'assessment_feedback': [
+            'string', 'string', 'string'
+        ],
+        'assessment_feedback_option': [
+            'int', 'string'
+        ],
+        'submission': [
+            'string', 'string', 'string',
+            'timestamp', 'timestamp', 'string'
+        ],
+        'score': [
+            'string',
+            'int', 'int',
+            'timestamp',
+        ]
+    }
+
+    # Number of rows to buffer before writing a row group.
+    ROW_GROUP_SIZE = 10000
+
+    def __init__(self, output_streams, progress_callback=None):  # pylint: disable=super-init-not-called
+        """
+        Configure where the writer will write data.
+
+        Args:
+            output_streams (dictionary): Provide the binary file handles
+                to write Parquet data to, keyed by model name (see `CsvWriter.MODELS`).
+
+        Keyword Arguments:
+            progress_callback (callable): Callable that accepts
+                no arguments.  Called once per submission loaded
+                from the database.
+
+        Raises:
+            ImportError: pyarrow is not installed.
+
+        """
+        # pyarrow is a large, optional dependency, so it is only imported when it is needed
+        import pyarrow  # pylint: disable=import-outside-toplevel
+        import pyarrow.parquet  # pylint: disable=import-outside-toplevel
+
+        self._pyarrow = pyarrow
+        column_types = {
+            'int': pyarrow.int64(),
+            'string': pyarrow.string(),
+            'timestamp': pyarrow.timestamp('us', tz='UTC'),
+        }
+        self.schemas = {
+            key: pyarrow.schema([
+                (column, column_types[column_type])
+                for column, column_type in zip(self.HEADERS[key], self.COLUMN_TYPES[key])
+            ])
+            for key in output_streams
+            if key in self.MODELS
+        }
+        self.writers = {
+            key: pyarrow.parquet.ParquetWriter(output_streams[key], schema)
+            for key, schema in self.schemas.items()
+        }
+        self._rows = {key: [] for key in self.writers}
+        self._progress_callback = progress_callback
+
+    def write_to_csv(self, course_id, workflow_id_range=None, write_headers=True):
+        """
+        Write assessment and submission data for a course to Parquet files,
+        then finish the files.  Named for compatibility with `CsvWriter`.
+
+        Args:
+            course_id (unicode): The course ID from which to pull data.
+
+        Keyword Arguments:
+            workflow_id_range (tuple): See `CsvWriter.write_to_csv`.
+            write_headers (bool): Ignored, since the column names are part of the schema.
+
+        Returns:
+            None
+
+        """
+        super().write_to_csv(course_id, workflow_id_range=workflow_id_range, write_headers=False)
+        for output_name, writer in self.writers.items():
+            self._write_row_group(output_name)
+            writer.close()
+
+    def _write_unicode(self, output_name, row):
+        """
+        Buffer a row, writing a row group once enough rows have been buffered.
+
+        Args:
+            output_name (str): The name of the output stream to write to.
+            row (list): List of fields, in the order of the output's schema.
+
+        Returns:
+            None
+
+        """
+        rows = self._rows.get(output_name)
+        if rows is not None:
+            rows.append(row)
+            if len(rows) >= self.ROW_GROUP_SIZE:
+                self._write_row_group(output_name)
+
+    def _write_row_group(self, output_name):
+        """
+        Write the buffered rows of an output stream as a row group.
+        """
+        rows = self._rows[output_name]
+        if not rows:
+            return
+        schema = self.schemas[output_name]
+        columns = [
+            self._pyarrow.array([row[index] for row in rows], type=field.type)
+            for index, field in enumerate(schema)
+        ]
+        self.writers[output_name].write_table(self._pyarrow.Table.from_arrays(columns, schema=schema))
+        self._rows[output_name] = []
+
+
+class ChunkedCsvExport:
+    """
+    Dump openassessment data for a course to CSV files in resumable chunks.
+
+    The course's workflows are split into chunks by ranges of primary keys.
+    Each chunk is written by a `CsvWriter` to its own directory, and its
+    completion is recorded in a checkpoint file in the working directory.
+    If an export is interrupted, running it again with the same working
+    directory only writes the chunks that were not completed.  Once every
+    chunk is complete, the chunks are concatenated into one CSV file per model.
+    """
+
+    CHECKPOINT_FILE_NAME = 'checkpoint.json'
+
+    # Number of workflows written by each chunk.
+    CHUNK_SIZE = 1000
+
+    def __init__(self, course_id, work_dir, chunk_size=None, max_workers=1, progress_callback=None):
+        """
+        Configure the export.
+
+        Args:
+            course_id (unicode): The course ID from which to pull data.
+            work_dir (unicode): The absolute path to the directory in which to
+                keep the checkpoint, the chunks and the resulting CSV files.
+
+        Keyword Arguments:
+            chunk_size (int): Number of workflows written by each chunk.
+            max_workers (int): Number of chunks to write in parallel.
+            progress_callback (callable): Passed through to `CsvWriter`.
+
+        """
+        self.course_id = course_id
+        self.work_dir = work_dir
+        self.chunk_size = chunk_size or self.CHUNK_SIZE
+        self.max_workers = max_workers
+        self._progress_callback = progress_callback
+        self._checkpoint_lock = Lock()
+        self._checkpoint = None
+
+    @property
+    def checkpoint_path(self):
+        return os.path.join(self.work_dir, self.CHECKPOINT_FILE_NAME)
+
+    def output_path(self, model):
+        """
+        Returns the path of the concatenated CSV file for a model.
+        """
+        return os.path.join(self.work_dir, f"{model}.csv")
+
+    def _chunk_dir(self, index):
+        return os.path.join(self.work_dir, f"chunk_{index:05d}")
+
+    def export(self):
+        """
+        Write every incomplete chunk, then concatenate all chunks.
+
+        Returns:
+            dict: map of model names to the paths of the resulting CSV files.
+
+        """
+        self._checkpoint = self._load_checkpoint()
+        pending = [
+            index for index in range(len(self._checkpoint['chunks']))
+            if index not in self._checkpoint['completed']
+        ]
+        logger.info(
+            "[%s] Exporting %d of %d chunks",
+            self.course_id, len(pending), len(self._checkpoint['chunks'])
+        )
+
+        if self.max_workers > 1 and len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                # Consume the results so that errors from the workers are raised here
+                list(executor.map(self._write_chunk_in_thread, pending))
+        else:
+            for index in pending:
+                self._write_chunk(index)
+
+        return self._concatenate_chunks()
+
+    def _load_checkpoint(self):
+        """
+        Load the checkpoint of a previous run of this export, or plan the chunks
+        of a new export.
+
+        The chunk ranges are part of the checkpoint, so that a resumed export
+        writes exactly the chunks that were planned, even if workflows have been
+        created since.  The last chunk is open-ended.
+        """
+        if os.path.exists(self.checkpoint_path):
+            with open(self.checkpoint_path) as checkpoint_file:
+                checkpoint = json.load(checkpoint_file)
+            if checkpoint['course_id'] == self.course_id:
+                checkpoint['completed'] = set(checkpoint['completed'])
+                return checkpoint
+
+        os.makedirs(self.work_dir, exist_ok=True)
+        workflow_ids = _use_read_replica(
+            AssessmentWorkflow.objects.filter(course_id=self.course_id).order_by('id')
+        ).values_list('id', flat=True)
+
+        chunks = []
+        for position, workflow_id in enumerate(workflow_ids.iterator()):
+            if position % self.chunk_size == 0:
+                chunks.append([workflow_id, None])
+                if len(chunks) > 1:
+                    chunks[-2][1] = workflow_id - 1
+        if chunks:
+            chunks[0][0] = None
+        else:
+            chunks.append([None, None])
+
+        checkpoint = {'course_id': self.course_id, 'chunks': chunks, 'completed': set()}
+        self._save_checkpoint(checkpoint)
+        return checkpoint
+
+    def _save_checkpoint(self, checkpoint):
+        """
+        Atomically replace the checkpoint file.
+        """
+        temp_path = f"{self.checkpoint_path}.tmp"
+        with open(temp_path, 'w') as checkpoint_file:
+            json.dump({**checkpoint, 'completed': sorted(checkpoint['completed'])}, checkpoint_file)
+        os.replace(temp_path, self.checkpoint_path)
+
+    def _write_chunk_in_thread(self, index):
+        """
+        Write a chunk from a worker thread, releasing the thread's database connections afterwards.
+        """
+        try:
+            self._write_chunk(index)
+        finally:
+            connections.close_all()
+
+    def _write_chunk(self, index):
+        """
+        Write the CSV files of a chunk, then record it as complete.
+        """
+        chunk_dir = self._chunk_dir(index)
+        os.makedirs(chunk_dir, exist_ok=True)
+
+        output_streams = {
+            model: open(  # pylint: disable=consider-using-with
+                os.path.join(chunk_dir, f"{model}.csv"), 'w', encoding='utf-8', newline=''
+            )
+            for model in CsvWriter.MODELS
+        }
+        try:
+            CsvWriter(output_streams, self._progress_callback).write_to_csv(
+                self.course_id,
+                workflow_id_range=self._checkpoint['chunks'][index],
+                write_headers=False,
+            )
+        finally:
+            for output_stream in output_streams.values():
+                output_stream.close()
+
+        with self._checkpoint_lock:
+            self._checkpoint['completed'].add(index)
+            self._save_checkpoint(self._checkpoint)
+
+    def _concatenate_chunks(self):
+        """
+        Concatenate the chunks into one CSV file per model, in chunk order.
+
+        Feedback options are written by every chunk that uses them,
+        so duplicates are dropped.
+        """
+        output_paths = {}
+        for model in CsvWriter.MODELS:
+            output_path = self.output_path(model)
+            seen_rows = set()
+            with open(output_path, 'w', encoding='utf-8', newline='') as output_file:
+                csv.writer(output_file).writerow(CsvWriter.HEADERS[model])
+                for index in range(len(self._checkpoint['chunks'])):
+                    chunk_path = os.path.join(self._chunk_dir(index), f"{model}.csv")
+                    with open(chunk_path, encoding='utf-8', newline='') as chunk_file:
+                        if model == 'assessment_feedback_option':
+                            writer = csv.writer(output_file)
+                            for row in csv.reader(chunk_file):
+                                if tuple(row) not in seen_rows:
+                                    seen_rows.add(tuple(row))
+                                    writer.writerow(row)
+                        else:
+                            shutil.copyfileobj(chunk_file, output_file)
+            output_paths[model] = output_path
+        return output_paths
+
+
 class OraAggregateData:
     """
     Aggregate all the ORA data into a single table-like data structure.
     """
 
+    # Number of workflows to retrieve at a time from the database
+    # when building the summary report.
+    SUMMARY_QUERY_INTERVAL = 500
+
     @classmethod
     def _map_students_and_scorers_ids_to_usernames(cls, all_submission_information):
         """
@@ -693,15 +1046,19 @@ class OraAggregateData:
         """
         Query database for aggregated ora2 summary data.
 
+        Workflows are loaded in batches of `SUMMARY_QUERY_INTERVAL`, and the
+        steps, students, peer counts and scores for each batch are fetched in
+        bulk, so the number of queries does not grow with the number of rows.
+
         Args:
             course_id (string) - the course id of the course whose data we would like to return
 
         Returns:
-            A tuple containing two lists: headers and data.
+            A tuple containing headers and data.
 
             headers is a list containing strings corresponding to the column headers of the data.
-            data is a list of lists, where each sub-list corresponds to a row in the table of all the data
-                for this course.
+            data is a generator of lists, where each list corresponds to a row in the table of all the data
+                for this course. Rows are only loaded from the database as the generator is consumed.
 
             Headers details:
 
@@ -724,73 +1081,10 @@ class OraAggregateData:
                 final grade. will be empty if no final grade
         """
 
-        items = AssessmentWorkflow.objects.filter(course_id=course_id)
-
         # need the workflow steps set and sorted here so the data columns line
         # up with the headers
         steps = sorted(AssessmentWorkflow.STEPS)
 
-        rows = []
-        for aw in items:
-            statuses = aw.status_details()
-            try:
-                submission_dict = sub_api.get_submission_and_student(aw.submission_uuid)
-            except SubmissionNotFoundError:
-                continue
-
-            steps_statuses = []
-            peers_graded = 0
-            graded_by_count = 0
-            for step in steps:
-                if not statuses.get(step):
-                    # if no status for step, then the 'complete' and 'graded'
-                    # statuses should be empty.
-                    steps_statuses.append('')
-                    steps_statuses.append('')
-                    continue
-
-                # if we get to here, then a status exists for `step`
-
-                if statuses[step]['complete']:
-                    steps_statuses.append(1)
-                else:
-                    steps_statuses.append(0)
-
-                if statuses[step]['graded']:
-                    steps_statuses.append(1)
-                else:
-                    steps_statuses.append(0)
-
-                # the peer step is special and has extra metadata
-                if step == 'peer':
-                    peers_graded = statuses[step]['peers_graded_count'] or 0
-                    graded_by_count = statuses[step]['graded_by_count'] or 0
-
-            is_staff_grade_received = 1 if aw.staff_score_exists() else 0
-            is_final_grade_received = 1 if aw.status == AssessmentWorkflow.STATUS.done else 0
-
-            score = aw.score
-            if score is not None:
-                final_grade_points_earned = score['points_earned']
-                final_grade_points_possible = score['points_possible']
-            else:
-                final_grade_points_earned = ''
-                final_grade_points_possible = ''
-
-            row = [
-                aw.item_id,
-                submission_dict['student_item']['student_id'],
-                aw.status,
-            ] + steps_statuses + [
-                peers_graded,
-                graded_by_count,
-                is_staff_grade_received,
-                is_final_grade_received,
-                final_grade_points_earned,
-                final_grade_points_possible,
-            ]
-            rows.append(row)
-
         steps_headers = list(chain.from_iterable(
             (
                 f"is_{step}_complete",
@@ -812,7 +1106,148 @@ class OraAggregateData:
             'final_grade_points_possible',
         ]
 
-        return header, rows
+        return header, cls._summary_rows(course_id, steps)
+
+    @classmethod
+    def _summary_rows(cls, course_id, steps):
+        """
+        Generator, that yields a summary row for every assessment workflow in the course.
+
+        Args:
+            course_id (string) - the course id of the course whose data we would like to return
+            steps (list) - sorted names of the steps reported for each workflow
+        """
+        workflows = _use_read_replica(
+            AssessmentWorkflow.objects
+            .filter(course_id=course_id)
+            .order_by('-created', '-id')
+            .prefetch_related('steps')
+        )
+
+        # AssessmentWorkflow.staff_score_exists only reports a staff score when
+        # the configured staff API can look up the latest assessment.
+        staff_api = AssessmentWorkflowStep(name=AssessmentWorkflow.STAFF_STEP_NAME).api()
+        get_latest_staff_assessment = getattr(staff_api, 'get_latest_assessment', None)
+
+        start = 0
+        while True:
+            batch = list(workflows[start:start + cls.SUMMARY_QUERY_INTERVAL])
+            if not batch:
+                return
+
+            submission_uuids = [aw.submission_uuid for aw in batch]
+            student_ids = sub_api.get_student_ids_by_submission_uuid(course_id, submission_uuids)
+            peer_counts = peer_api.get_bulk_graded_counts(submission_uuids)
+            scores = cls._map_submission_uuids_to_latest_scores([
+                aw.submission_uuid for aw in batch if aw.status == AssessmentWorkflow.STATUS.done
+            ])
+
+            for aw in batch:
+                if aw.submission_uuid not in student_ids:
+                    continue
+
+                statuses = cls._summary_step_statuses(aw)
+
+                steps_statuses = []
+                peers_graded = 0
+                graded_by_count = 0
+                for step in steps:
+                    if step not in statuses:
+                        # if no status for step, then the 'complete' and 'graded'
+                        # statuses should be empty.
+                        steps_statuses.append('')
+                        steps_statuses.append('')
+                        continue
+
+                    complete, graded = statuses[step]
+                    steps_statuses.append(1 if complete else 0)
+                    steps_statuses.append(1 if graded else 0)
+
+                    # the peer step is special and has extra metadata
+                    if step == 'peer':
+                        peers_graded, graded_by_count = peer_counts.get(aw.submission_uuid, (0, 0))
+
+                is_staff_grade_received = 0
+                if get_latest_staff_assessment is not None:
+                    if get_latest_staff_assessment(aw.submission_uuid) is not None:
+                        is_staff_grade_received = 1
+                is_final_grade_received = 1 if aw.status == AssessmentWorkflow.STATUS.done else 0
+
+                score = scores.get(aw.submission_uuid)
+                if score is not None:
+                    final_grade_points_earned = score['points_earned']
+                    final_grade_points_possible = score['points_possible']
+                else:
+                    final_grade_points_earned = ''
+                    final_grade_points_possible = ''
+
+                yield [
+                    aw.item_id,
+                    student_ids[aw.submission_uuid],
+                    aw.status,
+                ] + steps_statuses + [
+                    peers_graded,
+                    graded_by_count,
+                    is_staff_grade_received,
+                    is_final_grade_received,
+                    final_grade_points_earned,
+                    final_grade_points_possible,
+                ]
+
+            if len(batch) < cls.SUMMARY_QUERY_INTERVAL:
+                return
+            start += cls.SUMMARY_QUERY_INTERVAL
+
+    @classmethod
+    def _summary_step_statuses(cls, workflow):
+        """
+        Read-only equivalent of `AssessmentWorkflow.status_details` that works from
+        the prefetched steps of a workflow.
+
+        Args:
+            workflow (AssessmentWorkflow) - workflow with its steps prefetched.
+        Returns:
+            dictionary, that maps step names to (complete, graded) tuples.
+        """
+        statuses = {
+            step.name: (step.is_submitter_complete(), step.is_assessment_complete())
+            for step in workflow.steps.all()
+            if step.name in AssessmentWorkflow.STEPS
+        }
+        # `AssessmentWorkflow._get_steps` adds a staff step to workflows which
+        # are missing one. Such a step has been graded but not completed.
+        statuses.setdefault(AssessmentWorkflow.STAFF_STEP_NAME, (False, True))
+        return statuses
+
+    @classmethod
+    def _map_submission_uuids_to_latest_scores(cls, submission_uuids):
+        """
+        Args:
+            submission_uuids - list of submission uuids.
+        Returns:
+            dictionary, that maps each submission uuid to the points of its latest
+            score, as returned by submissions api's `get_latest_score_for_submission`.
+            Submissions without a visible score are omitted.
+        """
+        if not submission_uuids:
+            return {}
+
+        scores = _use_read_replica(
+            Score.objects.filter(submission__uuid__in=submission_uuids)
+            .order_by('-id')
+            .values('submission__uuid', 'points_earned', 'points_possible')
+        )
+
+        latest_scores = {}
+        for score in scores:
+            latest_scores.setdefault(str(score['submission__uuid']), score)
+
+        # By convention, a score of 0/0 is hidden by the submissions api.
+        return {
+            submission_uuid: score
+            for submission_uuid, score in latest_scores.items()
+            if score['points_possible'] != 0
+        }
 
     @classmethod
     def collect_ora2_responses(cls, course_id, desired_statuses=None):
@@ -952,6 +1387,9 @@ class OraDownloadData:
     )
     MAX_FILE_NAME_LENGTH = 255
 
+    # Number of submissions to process at a time when collecting submission files.
+    SUBMISSIONS_BATCH_SIZE = 1000
+
     @classmethod
     def _download_file_by_key(cls, key):
         url = get_download_url(key)
@@ -1154,6 +1592,10 @@ class OraDownloadData:
         Files that cannot be found in the backend will not be included in the zip. It will be listed as file_found=False
         in the csv file.
 
+        Attachments are written to the archive one at a time and the csv is spooled to
+        a temporary file, so when `file` is a temporary file rather than an in-memory
+        buffer, memory usage is bounded by the size of the largest attachment.
+
         Example of result zip file structure:
         ```
         .
@@ -1172,12 +1614,13 @@ class OraDownloadData:
         └── submissions.csv
         ```
         """
-        csv_output_buffer = StringIO()
-
-        csvwriter = csv.DictWriter(csv_output_buffer, cls.SUBMISSIONS_CSV_HEADER, extrasaction='ignore')
-        csvwriter.writeheader()
+        # The list of downloads is spooled to a temporary file rather than kept in
+        # memory, since it has a row for every attachment and answer in the course.
+        with TemporaryFile() as csv_output_file, ZipFile(file, 'w') as zip_file:
+            csv_output_buffer = TextIOWrapper(csv_output_file, encoding='utf-8', newline='')
+            csvwriter = csv.DictWriter(csv_output_buffer, cls.SUBMISSIONS_CSV_HEADER, extrasaction='ignore')
+            csvwriter.writeheader()
 
-        with ZipFile(file, 'w') as zip_file:
             for file_data in submission_files_data:
                 key = file_data['key']
                 file_path = file_data['file_path']
@@ -1217,10 +1660,11 @@ class OraDownloadData:
                 finally:
                     csvwriter.writerow({**file_data, 'file_found': file_found})
 
-            zip_file.writestr(
-                'submissions.csv',
-                csv_output_buffer.getvalue().encode('utf-8')
-            )
+            csv_output_buffer.flush()
+            csv_output_buffer.detach()
+            csv_output_file.seek(0)
+            with zip_file.open('submissions.csv', 'w') as zipped_csv_file:
+                shutil.copyfileobj(csv_output_file, zipped_csv_file)
 
         file.seek(0)
         return True
@@ -1230,15 +1674,33 @@ class OraDownloadData:
         """
         Generator, that yields dictionaries with information about submission
         attachment or answer text.
+
+        Submissions are read from the submissions API as a stream and processed
+        in batches of `SUBMISSIONS_BATCH_SIZE`, so memory usage does not grow
+        with the number of submissions in the course.
         """
-        all_submission_information = list(sub_api.get_all_course_submission_information(course_id, 'openassessment'))
-        logger.info(
-            "[%s] Submission information loaded from submission API (len=%d)",
-            course_id,
-            len(all_submission_information)
-        )
         all_ora_path_information = cls._map_ora_usage_keys_to_path_info(course_id)
         logger.info("[%s] Loaded ORA path info (len=%d)", course_id, len(all_ora_path_information))
+
+        all_submission_information = sub_api.get_all_course_submission_information(course_id, 'openassessment')
+        num_submissions = 0
+        while True:
+            submission_information = list(islice(all_submission_information, cls.SUBMISSIONS_BATCH_SIZE))
+            if not submission_information:
+                break
+            num_submissions += len(submission_information)
+            yield from cls._collect_submission_files(
+                course_id, submission_information, all_ora_path_information
+            )
+
+        logger.info("[%s] Submission information loaded from submission API (len=%d)", course_id, num_submissions)
+
+    @classmethod
+    def _collect_submission_files(cls, course_id, all_submission_information, all_ora_path_information):
+        """
+        Generator, that yields dictionaries with information about the attachments
+        and answer texts of a batch of submissions.
+        """
         student_identifiers_map = cls._map_student_ids_to_path_ids(all_submission_information)
         logger.info("[%s] Loaded student identifiers (len=%d)", course_id, len(student_identifiers_map))
 
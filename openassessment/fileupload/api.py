@@ -5,10 +5,14 @@ URLs of existing files, and delete files.
 """
 
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait
+import contextvars
 import json
 import logging
+import threading
 
-from django.db import IntegrityError
+from django.conf import settings
+from django.db import IntegrityError, transaction
 from django.utils.functional import cached_property
 
 from openassessment.assessment.models.base import SharedFileUpload
@@ -21,6 +25,13 @@ logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
 
 KEY_SEPARATOR = '/'
 
+# Number of threads retrieving file urls concurrently (see `get_download_urls`),
+# overridden by the ORA2_FILE_URL_WORKERS setting
+DEFAULT_FILE_URL_WORKERS = 8
+
+_file_url_executors = {}
+_file_url_executors_lock = threading.Lock()
+
 
 def get_upload_url(key, content_type):
     """
@@ -39,6 +50,80 @@ def get_download_url(key):
     return url
 
 
+def get_download_urls(keys, timeout=None):
+    """
+    Returns the url of the file that corresponds to each key, in the same order,
+    retrieving the urls concurrently in a pool of threads shared by the process.
+
+    An empty key, or a key whose url can't be retrieved because of a FileUploadError,
+    gets an empty url. So does a key whose url is not retrieved within the timeout,
+    so that a slow storage degrades the page instead of stalling it. Other errors are
+    raised, as by `get_download_url`.
+
+    Args:
+        keys (list of str): The keys of the files.
+        timeout (float): Seconds to wait for all the urls. Defaults to the
+            ORA2_FILE_URL_TIMEOUT setting; no limit if that is not set either.
+
+    Returns:
+        list of str
+    """
+    unique_keys = list(dict.fromkeys(key for key in keys if key))
+    max_workers = getattr(settings, 'ORA2_FILE_URL_WORKERS', DEFAULT_FILE_URL_WORKERS)
+    if timeout is None:
+        timeout = getattr(settings, 'ORA2_FILE_URL_TIMEOUT', None)
+
+    if max_workers <= 1 or len(unique_keys) <= 1:
+        urls_by_key = {key: _get_download_url_or_empty(key) for key in unique_keys}
+    else:
+        executor = _get_file_url_executor(max_workers)
+        # Run each retrieval in a copy of the current context, so that it is counted
+        # by the instrumentation of the calling handler
+        futures = {
+            key: executor.submit(contextvars.copy_context().run, _get_download_url_or_empty, key)
+            for key in unique_keys
+        }
+        done, not_done = wait(futures.values(), timeout=timeout)
+        for future in not_done:
+            future.cancel()
+        urls_by_key = {}
+        for key, future in futures.items():
+            if future in done:
+                urls_by_key[key] = future.result()
+            else:
+                logger.warning('FileUploadError: URL retrieval timed out after %s seconds for key %s', timeout, key)
+                urls_by_key[key] = ''
+    return [urls_by_key.get(key, '') for key in keys]
+
+
+def _get_download_url_or_empty(key):
+    """
+    Returns the url of the file that corresponds to the key, or an empty url if it can't be retrieved.
+    """
+    try:
+        return get_download_url(key)
+    except FileUploadError as exc:
+        logger.exception(
+            'FileUploadError: URL retrieval failed for key %s with error %s',
+            key,
+            exc,
+            exc_info=True,
+        )
+        return ''
+
+
+def _get_file_url_executor(max_workers):
+    """
+    Returns the pool of threads retrieving file urls, created once per process and size.
+    """
+    with _file_url_executors_lock:
+        if max_workers not in _file_url_executors:
+            _file_url_executors[max_workers] = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix='ora2-file-urls'
+            )
+        return _file_url_executors[max_workers]
+
+
 def remove_file(key):
     """
     Remove file from the storage
@@ -46,6 +131,78 @@ def remove_file(key):
     return backends.get_backend().remove_file(key)
 
 
+def remove_files(keys):
+    """
+    Remove many files from the storage
+    """
+    return backends.get_backend().remove_files(keys)
+
+
+def generate_download_url(key):
+    """
+    Returns the url at which a file known to exist can be downloaded, without checking the storage.
+    """
+    return backends.get_backend().generate_download_url(key)
+
+
+def get_stored_file_keys(student_item_dict, max_files_count):
+    """
+    Returns the keys of the files a learner uploaded for an item and which are still in the storage,
+    in the order of their indices, with a single listing request to the storage.
+
+    Args:
+        student_item_dict: A dictionary containing keys ('student_id', 'course_id', 'item_id').
+        max_files_count (int): The number of file indices to look for.
+
+    Returns:
+        list of str, or None if the storage backend can't list files.
+
+    Raises:
+        FileUploadError: An error occurred while listing the files.
+    """
+    candidate_keys = [get_student_file_key(student_item_dict, index) for index in range(max_files_count)]
+    try:
+        # All the keys of a learner's files for an item start with the key of the first file
+        stored_keys = set(backends.get_backend().list_keys(candidate_keys[0]))
+    except NotImplementedError:
+        return None
+    return [key for key in candidate_keys if key in stored_keys]
+
+
+def get_stored_file_keys_for_students(student_item_dicts, max_files_count, max_workers=None):
+    """
+    Returns the keys of the files still in the storage for many learners (see `get_stored_file_keys`),
+    listing the files of several learners in parallel.
+
+    Args:
+        student_item_dicts (list of dict): The student items of the learners.
+        max_files_count (int): The number of file indices to look for.
+        max_workers (int): The number of learners whose files are listed at the same time.
+            Defaults to the ORA2_FILE_URL_WORKERS setting.
+
+    Returns:
+        dict of student_id to list of str (or None if the storage backend can't list files).
+
+    Raises:
+        FileUploadError: An error occurred while listing the files.
+    """
+    if max_workers is None:
+        max_workers = getattr(settings, 'ORA2_FILE_URL_WORKERS', DEFAULT_FILE_URL_WORKERS)
+
+    def get_keys(student_item_dict):
+        return get_stored_file_keys(student_item_dict, max_files_count)
+
+    if max_workers > 1 and len(student_item_dicts) > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            stored_keys = list(executor.map(get_keys, student_item_dicts))
+    else:
+        stored_keys = [get_keys(student_item_dict) for student_item_dict in student_item_dicts]
+    return {
+        student_item_dict['student_id']: keys
+        for student_item_dict, keys in zip(student_item_dicts, stored_keys)
+    }
+
+
 def get_student_file_key(student_item_dict, index=0):
     """
     Args:
@@ -108,9 +265,8 @@ def delete_shared_files_for_team(course_id, item_id, team_id):
     """
     uploads = SharedFileUpload.by_team_course_item(team_id, course_id, item_id)
 
-    for upload in uploads:
-        remove_file(upload.file_key)
-        upload.delete()
+    remove_files([upload.file_key for upload in uploads])
+    uploads.delete()
 
 
 def _safe_load_json_list(field, log_error=False):
@@ -293,14 +449,12 @@ class FileUploadManager:
         Returns a list of FileUpload objects owned by other members of the given team.
         Does not include FileUploads of the current user.
         """
-        shared_uploads_from_other_users = sorted(
-            [
-                shared_upload
-                for shared_upload in self.shared_uploads_for_team_by_key(team_id).values()
-                if shared_upload.owner_id != self.student_item_dict['student_id']
-            ],
-            key=lambda upload: upload.file_key,
-        )
+        # The shared uploads are already ordered by file key
+        shared_uploads_from_other_users = [
+            shared_upload
+            for shared_upload in self.shared_uploads_for_team_by_key(team_id).values()
+            if shared_upload.owner_id != self.student_item_dict['student_id']
+        ]
 
         return [
             FileUpload(
@@ -326,7 +480,9 @@ class FileUploadManager:
 
         descriptors = []
 
-        for upload in self.get_uploads(team_id=team_id, include_deleted=include_deleted):
+        uploads = self.get_uploads(team_id=team_id, include_deleted=include_deleted)
+        download_urls = get_download_urls([upload.key if upload.exists else None for upload in uploads])
+        for upload, download_url in zip(uploads, download_urls):
             show_delete_button = bool(upload.exists)
 
             if upload.exists and self.block.is_team_assignment():
@@ -340,7 +496,7 @@ class FileUploadManager:
                 )
 
             descriptors.append(FileDescriptor(
-                download_url=upload.download_url,
+                download_url=download_url if upload.exists else None,
                 description=upload.description,
                 name=upload.name,
                 size=upload.size,
@@ -354,15 +510,17 @@ class FileUploadManager:
         Returns the list of TeamFileDescriptors owned by other team members
         shown to a user when self.block is a team assignment.
         """
+        uploads = self.get_team_uploads(team_id=team_id)
+        download_urls = get_download_urls([upload.key if upload.exists else None for upload in uploads])
         return [
             TeamFileDescriptor(
-                download_url=upload.download_url,
+                download_url=download_url if upload.exists else None,
                 description=upload.description,
                 name=upload.name,
                 size=upload.size,
                 uploaded_by=self.block.get_username(upload.student_id)
             )._asdict()
-            for upload in self.get_team_uploads(team_id=team_id)
+            for upload, download_url in zip(uploads, download_urls)
         ]
 
     @cached_property
@@ -377,7 +535,7 @@ class FileUploadManager:
     def shared_uploads_for_team_by_key(self, team_id):
         """
         Returns **and caches** all of the SharedFileUpload records
-        for this student/course/item and team.
+        for this student/course/item and team, ordered by file key.
 
         Realistically, only one team_id will ever be requested, but this is a simple enough pattern
         """
@@ -386,7 +544,7 @@ class FileUploadManager:
                 team_id=team_id,
                 course_id=self.student_item_dict['course_id'],
                 item_id=self.student_item_dict['item_id'],
-            )
+            ).order_by('file_key')
             shared_uploads_for_team_by_key = {
                 shared_upload.file_key: shared_upload for shared_upload in shared_uploads
             }
@@ -451,25 +609,45 @@ class FileUploadManager:
                 )
             }
 
-            for new_file_upload in new_file_uploads:
-                if new_file_upload.key not in existing_file_upload_key_set:
-                    self.create_shared_upload(new_file_upload)
+            self.create_shared_uploads([
+                new_file_upload for new_file_upload in new_file_uploads
+                if new_file_upload.key not in existing_file_upload_key_set
+            ])
 
         self.invalidate_cached_shared_file_dicts()
         return new_file_uploads
 
     def create_shared_upload(self, fileupload):
+        self.create_shared_uploads([fileupload])
+
+    def create_shared_uploads(self, fileuploads):
+        """
+        Share the given FileUploads with the user's team, inserting
+        the SharedFileUploads and their history records in bulk.
+        """
+        if not fileuploads:
+            return
+        team_id = self.block.team.team_id
         try:
-            SharedFileUpload.objects.create(
-                team_id=self.block.team.team_id,
-                owner_id=fileupload.student_id,
-                course_id=fileupload.course_id,
-                item_id=fileupload.item_id,
-                file_key=fileupload.key,
-                description=fileupload.description,
-                size=fileupload.size,
-                name=fileupload.name,
-            )
+            with transaction.atomic():
+                SharedFileUpload.objects.bulk_create([
+                    SharedFileUpload(
+                        team_id=team_id,
+                        owner_id=fileupload.student_id,
+                        course_id=fileupload.course_id,
+                        item_id=fileupload.item_id,
+                        file_key=fileupload.key,
+                        description=fileupload.description,
+                        size=fileupload.size,
+                        name=fileupload.name,
+                    )
+                    for fileupload in fileuploads
+                ])
+                # Not every database returns the IDs of bulk created rows, which the history records need.
+                # `history` is replaced by a HistoryManager when the model is prepared, which pylint can't see.
+                SharedFileUpload.history.bulk_history_create(list(  # pylint: disable=no-member
+                    SharedFileUpload.objects.filter(file_key__in=[fileupload.key for fileupload in fileuploads])
+                ))
         except IntegrityError as e:
             logger.error("Unable to create shared upload. %s", str(e))
             raise e
@@ -1,26 +1,34 @@
 """ File Upload backends. """
 
 
+from importlib import import_module
+
 from django.conf import settings
 
-from . import django_storage, gcs, filesystem, s3, swift
+from openassessment.instrumentation import record_storage_call
+
+# The module and class of each backend. Backends are imported when they are
+# first used, so that the storage client libraries of the backends which are
+# not configured (boto3, google-cloud-storage, swiftclient) are never loaded.
+BACKENDS = {
+    "s3": ("s3", "Backend"),
+    "filesystem": ("filesystem", "Backend"),
+    "swift": ("swift", "Backend"),
+    "django": ("django_storage", "Backend"),
+    "gcs": ("gcs", "GCSBackend"),
+}
 
 
 def get_backend():
     # .. setting_name: ORA2_FILEUPLOAD_BACKEND
     # .. setting_default: 's3'
     # .. setting_description: The backend used to upload the ora2 submissions attachments.
-    #     The supported values are: 's3', 'filesystem', 'swift' and 'django'.
+    #     The supported values are: 's3', 'filesystem', 'swift', 'django' and 'gcs'.
     backend_setting = getattr(settings, "ORA2_FILEUPLOAD_BACKEND", "s3")
-    if backend_setting == "s3":
-        return s3.Backend()
-    elif backend_setting == "filesystem":
-        return filesystem.Backend()
-    elif backend_setting == "swift":
-        return swift.Backend()
-    elif backend_setting == "django":
-        return django_storage.Backend()
-    elif backend_setting == "gcs":
-        return gcs.GCSBackend()
-    else:
+    if backend_setting not in BACKENDS:
         raise ValueError("Invalid ORA2_FILEUPLOAD_BACKEND setting value: %s" % backend_setting)
+    # Each call to the backend starts by getting it
+    record_storage_call()
+    module_name, class_name = BACKENDS[backend_setting]
+    backend_class = getattr(import_module(f"{__name__}.{module_name}"), class_name)
+    return backend_class()
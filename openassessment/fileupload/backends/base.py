@@ -123,6 +123,57 @@ class BaseBackend(metaclass=abc.ABCMeta):
         """
         raise NotImplementedError
 
+    def remove_files(self, keys):
+        """
+        Remove many files from the storage.
+
+        Backends which can delete many objects with one request should override this;
+        by default, the files are removed one at a time.
+
+        Args:
+            keys (list of str): The unique identifiers of the files to remove.
+
+        Returns:
+            None
+        """
+        for key in keys:
+            self.remove_file(key)
+
+    def list_keys(self, prefix):
+        """
+        List the files in the storage whose key starts with the given prefix.
+
+        This lets callers find which files exist with a single request, instead of
+        asking for a download URL for every key that could exist.
+
+        Args:
+            prefix (str): The beginning of the keys of the files to list.
+
+        Returns:
+            list of str: The keys of the files, without the storage prefix.
+
+        Raises:
+            NotImplementedError: The backend can't list files.
+            FileUploadInternalError: An error occurred while listing the files.
+        """
+        raise NotImplementedError
+
+    def generate_download_url(self, key):
+        """
+        Generate a URL to download a file which is known to exist, e.g. because
+        its key was returned by `list_keys`.
+
+        Backends which check that a file exists before generating its URL in
+        `get_download_url` should override this to skip the check.
+
+        Args:
+            key (str): The unique identifier of the file.
+
+        Returns:
+            A URL (str) to use for downloading the file.
+        """
+        return self.get_download_url(key)
+
     def _retrieve_parameters(self, key):
         """
         Simple utility function to validate settings and arguments before compiling
@@ -159,3 +210,9 @@ class BaseBackend(metaclass=abc.ABCMeta):
             prefix=Settings.get_prefix(),
             key=key
         )
+
+    def _get_key_from_key_name(self, key_name):
+        """
+        Return the key of a file from its key name, i.e. without the configured prefix.
+        """
+        return key_name[len(Settings.get_prefix()) + 1:]
@@ -30,13 +30,23 @@ class Backend(BaseBackend):
         """
         path = self._get_file_path(key)
         if default_storage.exists(path):
-            storage_path = default_storage.url(path)
-
-            # Return a fully-qualified URL
-            lms_url = getattr(settings, 'LMS_ROOT_URL', '')
-            return urljoin(lms_url, storage_path)
+            return self._get_url(path)
         return None
 
+    def generate_download_url(self, key):
+        """
+        Return the django storage download URL for the given key, without checking whether the file exists.
+        """
+        return self._get_url(self._get_file_path(key))
+
+    def list_keys(self, prefix):
+        """
+        The files are stored under flat names, in which path separators are replaced
+        (see `_get_file_name`), so they can only be filtered by prefix after listing
+        every file of the storage. The files are checked one by one instead.
+        """
+        raise NotImplementedError
+
     def upload_file(self, key, content):
         """
         Upload the given file content to the keyed location.
@@ -58,6 +68,14 @@ class Backend(BaseBackend):
             return True
         return False
 
+    def _get_url(self, path):
+        """
+        Returns the fully-qualified URL of the file at the given path.
+        """
+        storage_path = default_storage.url(path)
+        lms_url = getattr(settings, 'LMS_ROOT_URL', '')
+        return urljoin(lms_url, storage_path)
+
     def _get_file_name(self, key):
         """
         Returns the name of the keyed file.
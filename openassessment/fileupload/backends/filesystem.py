@@ -1,6 +1,7 @@
 """ Filesystem backend for file upload. """
 
 
+import os
 from pathlib import Path
 
 from django.conf import settings
@@ -53,6 +54,31 @@ class Backend(BaseBackend):
         from openassessment.fileupload.views_filesystem import get_file_path, safe_remove
         return safe_remove(get_file_path(self._get_key_name(key)))
 
+    def generate_download_url(self, key):
+        make_download_url_available(self._get_key_name(key), self.DOWNLOAD_URL_TIMEOUT)
+        return self._get_url(key)
+
+    def list_keys(self, prefix):
+        """
+        List the files whose key starts with the prefix.
+
+        Each file is stored in a directory named after its key, so this looks for
+        the directories which contain a file, next to and under the prefix.
+        """
+        from openassessment.fileupload.views_filesystem import get_bucket_path, get_data_path, get_file_path
+
+        prefix_name = self._get_key_name(prefix)
+        bucket_path = get_bucket_path()
+        # The keys of the files are relative paths of their directories in the bucket
+        prefix_path = os.path.relpath(get_data_path(prefix_name), bucket_path)
+        search_path = os.path.dirname(get_data_path(prefix_name))
+        keys = []
+        for dir_path, __, __ in os.walk(search_path):
+            key_name = os.path.relpath(dir_path, bucket_path)
+            if key_name.startswith(prefix_path) and os.path.isfile(get_file_path(key_name)):
+                keys.append(self._get_key_from_key_name(key_name.replace(os.sep, '/')))
+        return keys
+
     def _get_url(self, key):
         key_name = self._get_key_name(key)
         url = reverse("openassessment-filesystem-storage", kwargs={'key': key_name})
@@ -48,6 +48,25 @@ class GCSBackend(BaseBackend):
         blob = get_blob_object(bucket_name, key_name)
         if not blob.exists():
             return ""
+        return self._generate_signed_download_url(blob)
+
+    @catch_broad_exception
+    def generate_download_url(self, key):
+        """Get a signed URL for downloading a file from GCS, without checking first whether it exists"""
+        bucket_name, key_name = self._retrieve_parameters(key)
+        return self._generate_signed_download_url(get_blob_object(bucket_name, key_name))
+
+    @catch_broad_exception
+    def list_keys(self, prefix):
+        """List the files whose key starts with the prefix"""
+        bucket_name, prefix_name = self._retrieve_parameters(prefix)
+        return [
+            self._get_key_from_key_name(blob.name)
+            for blob in storage.Client().list_blobs(bucket_name, prefix=prefix_name)
+        ]
+
+    def _generate_signed_download_url(self, blob):
+        """Get a signed URL for downloading a blob"""
         return blob.generate_signed_url(
             version="v4",
             expiration=self.DOWNLOAD_URL_TIMEOUT,
@@ -64,6 +83,19 @@ class GCSBackend(BaseBackend):
             return True
         return False
 
+    @catch_broad_exception
+    def remove_files(self, keys):
+        """Remove many files from GCS, without checking first whether each file exists"""
+        if not keys:
+            return
+        bucket_name = self._retrieve_parameters(keys[0])[0]
+        bucket = storage.Client().bucket(bucket_name)
+        bucket.delete_blobs(
+            [bucket.blob(self._retrieve_parameters(key)[1]) for key in keys],
+            # Files which don't exist are ignored, like in `remove_file`
+            on_error=lambda blob: None,
+        )
+
 
 def get_blob_object(bucket_name, key_name):
     """Get a blob object from GCS"""
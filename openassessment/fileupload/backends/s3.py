@@ -2,6 +2,7 @@
 
 
 import logging
+import threading
 
 from django.conf import settings
 
@@ -15,10 +16,15 @@ log = logging.getLogger(
     "openassessment.fileupload.api"
 )  # pylint: disable=invalid-name
 
+_client_lock = threading.Lock()
+
 
 class Backend(BaseBackend):
     """ S3 Bucked File Upload Backend. """
 
+    # Maximum number of keys in a DeleteObjects request
+    DELETE_OBJECTS_BATCH_SIZE = 1000
+
     def get_upload_url(self, key, content_type):
         bucket_name, key_name = self._retrieve_parameters(key)
         try:
@@ -44,17 +50,44 @@ class Backend(BaseBackend):
             conn = _connect_to_s3()
             if not object_exists(conn, bucket_name, key_name):
                 return ""
-            return conn.generate_presigned_url(
-                "get_object",
-                Params={"Bucket": bucket_name, "Key": key_name},
-                ExpiresIn=self.DOWNLOAD_URL_TIMEOUT,
+            return _generate_download_url(conn, bucket_name, key_name, self.DOWNLOAD_URL_TIMEOUT)
+        except Exception as ex:
+            log.exception(
+                "An internal exception occurred while generating a download URL."
             )
+            raise FileUploadInternalError(ex) from ex
+
+    def generate_download_url(self, key):
+        """
+        Sign a download URL, without checking first whether the file exists.
+        """
+        bucket_name, key_name = self._retrieve_parameters(key)
+        try:
+            return _generate_download_url(_connect_to_s3(), bucket_name, key_name, self.DOWNLOAD_URL_TIMEOUT)
         except Exception as ex:
             log.exception(
                 "An internal exception occurred while generating a download URL."
             )
             raise FileUploadInternalError(ex) from ex
 
+    def list_keys(self, prefix):
+        """
+        List the files whose key starts with the prefix, with ListObjectsV2 requests.
+        """
+        bucket_name, prefix_name = self._retrieve_parameters(prefix)
+        try:
+            paginator = _connect_to_s3().get_paginator("list_objects_v2")
+            return [
+                self._get_key_from_key_name(obj["Key"])
+                for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix_name)
+                for obj in page.get("Contents", [])
+            ]
+        except Exception as ex:
+            log.exception(
+                "An internal exception occurred while listing files."
+            )
+            raise FileUploadInternalError(ex) from ex
+
     def remove_file(self, key):
         bucket_name, key_name = self._retrieve_parameters(key)
         conn = _connect_to_s3()
@@ -63,6 +96,32 @@ class Backend(BaseBackend):
             return True
         return False
 
+    def remove_files(self, keys):
+        """
+        Remove many files with multi-object delete requests,
+        without checking first whether each file exists.
+        """
+        keys_names = [self._retrieve_parameters(key)[1] for key in keys]
+        if not keys_names:
+            return
+        bucket_name = self._retrieve_parameters(keys[0])[0]
+        conn = _connect_to_s3()
+        for start in range(0, len(keys_names), self.DELETE_OBJECTS_BATCH_SIZE):
+            response = conn.delete_objects(
+                Bucket=bucket_name,
+                Delete={
+                    "Objects": [
+                        {"Key": key_name}
+                        for key_name in keys_names[start:start + self.DELETE_OBJECTS_BATCH_SIZE]
+                    ],
+                    "Quiet": True,
+                },
+            )
+            errors = response.get("Errors")
+            if errors:
+                log.error("Could not remove files from S3: %s", errors)
+                raise FileUploadInternalError(f"Could not remove {len(errors)} files")
+
 
 def _connect_to_s3():
     """Connect to s3
@@ -76,11 +135,25 @@ def _connect_to_s3():
     aws_secret_access_key = getattr(settings, "AWS_SECRET_ACCESS_KEY", None)
     endpoint_url = getattr(settings, "AWS_S3_ENDPOINT_URL", None)
 
-    return boto3.client(
-        "s3",
-        aws_access_key_id=aws_access_key_id,
-        aws_secret_access_key=aws_secret_access_key,
-        endpoint_url=endpoint_url,
+    # Creating clients from the default boto3 session is not thread-safe,
+    # and download URLs are retrieved from several threads at once
+    with _client_lock:
+        return boto3.client(
+            "s3",
+            aws_access_key_id=aws_access_key_id,
+            aws_secret_access_key=aws_secret_access_key,
+            endpoint_url=endpoint_url,
+        )
+
+
+def _generate_download_url(conn, bucket_name, key_name, expires_in):
+    """
+    Sign a URL to download an object from the given S3 bucket.
+    """
+    return conn.generate_presigned_url(
+        "get_object",
+        Params={"Bucket": bucket_name, "Key": key_name},
+        ExpiresIn=expires_in,
     )
 
 
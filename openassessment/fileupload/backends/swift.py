@@ -52,16 +52,8 @@ class Backend(BaseBackend):
             raise FileUploadInternalError(ex) from ex
 
     def get_download_url(self, key):
-        bucket_name, key_name = self._retrieve_parameters(key)
-        key, url = get_settings()
         try:
-            temp_url = swiftclient.utils.generate_temp_url(
-                path=f'/v{SWIFT_BACKEND_VERSION}{url.path}/{bucket_name}/{key_name}',
-                key=key,
-                method='GET',
-                seconds=self.DOWNLOAD_URL_TIMEOUT
-            )
-            download_url = f'{url.scheme}://{url.netloc}{temp_url}'
+            download_url = self._generate_download_url(key)
             response = requests.get(download_url)
             return download_url if response.status_code == 200 else ""
         except Exception as ex:
@@ -70,6 +62,57 @@ class Backend(BaseBackend):
             )
             raise FileUploadInternalError(ex) from ex
 
+    def generate_download_url(self, key):
+        try:
+            return self._generate_download_url(key)
+        except Exception as ex:
+            logger.exception(
+                "An internal exception occurred while generating a download URL."
+            )
+            raise FileUploadInternalError(ex) from ex
+
+    def list_keys(self, prefix):
+        """
+        List the files whose key starts with the prefix.
+
+        Temporary URLs can't list a container, so this needs the container to
+        allow listings (".rlistings" in its read ACL). If it doesn't, this
+        raises NotImplementedError, like backends which can't list files.
+        """
+        bucket_name, prefix_name = self._retrieve_parameters(prefix)
+        __, url = get_settings()
+        try:
+            response = requests.get(
+                f'{url.scheme}://{url.netloc}/v{SWIFT_BACKEND_VERSION}{url.path}/{bucket_name}',
+                params={'prefix': prefix_name, 'format': 'json'},
+            )
+        except Exception as ex:
+            logger.exception(
+                "An internal exception occurred while listing objects on swift storage."
+            )
+            raise FileUploadInternalError(ex) from ex
+        if response.status_code in (401, 403):
+            raise NotImplementedError("Listing the swift container is not allowed")
+        if response.status_code == 204:
+            return []
+        if response.status_code != 200:
+            raise FileUploadInternalError(f"Could not list objects on swift storage: {response.status_code}")
+        return [self._get_key_from_key_name(obj['name']) for obj in response.json()]
+
+    def _generate_download_url(self, key):
+        """
+        Generate a temporary URL to download the file, without checking whether it exists.
+        """
+        bucket_name, key_name = self._retrieve_parameters(key)
+        key, url = get_settings()
+        temp_url = swiftclient.utils.generate_temp_url(
+            path=f'/v{SWIFT_BACKEND_VERSION}{url.path}/{bucket_name}/{key_name}',
+            key=key,
+            method='GET',
+            seconds=self.DOWNLOAD_URL_TIMEOUT
+        )
+        return f'{url.scheme}://{url.netloc}{temp_url}'
+
     def remove_file(self, key):
         bucket_name, key_name = self._retrieve_parameters(key)
         key, url = get_settings()
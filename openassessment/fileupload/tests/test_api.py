@@ -74,6 +74,69 @@ class TestFileUploadService(TestCase):
         result = api.remove_file("foo")
         self.assertFalse(result)
 
+    @mock_s3
+    @override_settings(
+        AWS_ACCESS_KEY_ID="foobar",
+        AWS_SECRET_ACCESS_KEY="bizbaz",
+        FILE_UPLOAD_STORAGE_BUCKET_NAME="mybucket",
+    )
+    @patch("openassessment.fileupload.backends.s3.Backend.DELETE_OBJECTS_BATCH_SIZE", 2)
+    def test_remove_files(self):
+        conn = boto3.client("s3")
+        conn.create_bucket(Bucket="mybucket")
+        for key in ["foo", "bar", "baz", "qux"]:
+            conn.put_object(
+                Bucket="mybucket",
+                Key=f"submissions_attachments/{key}",
+                Body=b"Test"
+            )
+
+        # Files which don't exist are ignored
+        api.remove_files(["foo", "bar", "baz", "does-not-exist"])
+
+        remaining = [obj["Key"] for obj in conn.list_objects(Bucket="mybucket")["Contents"]]
+        self.assertEqual(remaining, ["submissions_attachments/qux"])
+
+    @mock_s3
+    @override_settings(
+        AWS_ACCESS_KEY_ID="foobar",
+        AWS_SECRET_ACCESS_KEY="bizbaz",
+        FILE_UPLOAD_STORAGE_BUCKET_NAME="mybucket",
+    )
+    def test_get_stored_file_keys(self):
+        conn = boto3.client("s3")
+        conn.create_bucket(Bucket="mybucket")
+        keys = ["bob/course/item", "bob/course/item/2", "bob/course/item/30", "bob/course/item2", "alice/course/item"]
+        for key in keys:
+            conn.put_object(
+                Bucket="mybucket",
+                Key=f"submissions_attachments/{key}",
+                Body=b"Test"
+            )
+        student_item = {"student_id": "bob", "course_id": "course", "item_id": "item"}
+
+        self.assertCountEqual(
+            api.backends.get_backend().list_keys("bob/course/item"),
+            ["bob/course/item", "bob/course/item/2", "bob/course/item/30", "bob/course/item2"]
+        )
+        # Only the keys of the learner's files are kept, in the order of their indices
+        self.assertEqual(api.get_stored_file_keys(student_item, 20), ["bob/course/item", "bob/course/item/2"])
+        self.assertEqual(
+            api.get_stored_file_keys_for_students(
+                [student_item, dict(student_item, student_id="alice"), dict(student_item, student_id="carol")],
+                20,
+                max_workers=2,
+            ),
+            {"bob": ["bob/course/item", "bob/course/item/2"], "alice": ["alice/course/item"], "carol": []}
+        )
+        self.assertIn("/submissions_attachments/bob/course/item/2", api.generate_download_url("bob/course/item/2"))
+
+    @patch("openassessment.fileupload.backends.s3.Backend.list_keys")
+    def test_get_stored_file_keys_not_implemented(self, mock_list_keys):
+        mock_list_keys.side_effect = NotImplementedError
+        student_item = {"student_id": "bob", "course_id": "course", "item_id": "item"}
+        self.assertIsNone(api.get_stored_file_keys(student_item, 20))
+
     def test_get_upload_url_no_bucket(self):
         with raises(exceptions.FileUploadInternalError):
             api.get_upload_url("foo", "bar")
@@ -220,6 +283,20 @@ class TestFileUploadServiceWithFilesystemBackend(TestCase):
             exceptions.FileUploadInternalError, views.save_to_file, self.key, "content"
         )
 
+    def test_list_keys(self):
+        for key in ["bob/course/item", "bob/course/item/2", "bob/course/item2", "bob/other/item"]:
+            views.save_to_file(os.path.join(FileUploadSettings.get_prefix(), key), "content")
+            self.addCleanup(self.delete_data, os.path.join(FileUploadSettings.get_prefix(), key))
+
+        self.assertCountEqual(
+            self.backend.list_keys("bob/course/item"),
+            ["bob/course/item", "bob/course/item/2", "bob/course/item2"]
+        )
+        self.assertEqual(self.backend.list_keys("carol/course/item"), [])
+
+        download_url = self.backend.generate_download_url("bob/course/item/2")
+        self.assertEqual(200, self.client.get(download_url).status_code)
+
     def test_post_is_405(self):
         upload_url = self.backend.get_upload_url(self.key, "bar")
         response = self.client.post(upload_url, data={"attachment": self.content})
@@ -397,6 +474,37 @@ class TestSwiftBackend(TestCase):
         url = self.backend.get_download_url("foo")
         self.assertEqual(url, "")
 
+    @patch("openassessment.fileupload.backends.swift.requests.get")
+    def test_list_keys(self, requests_get_mock):
+        """
+        Verify the files are listed from the container.
+        """
+        requests_get_mock.return_value = Mock(status_code=200)
+        requests_get_mock.return_value.json.return_value = [
+            {"name": "submissions_attachments/foo"},
+            {"name": "submissions_attachments/foo/1"},
+        ]
+        self.assertEqual(self.backend.list_keys("foo"), ["foo", "foo/1"])
+        requests_get_mock.assert_called_once_with(
+            "http://www.example.com:12345/v1/bucket_name",
+            params={"prefix": "submissions_attachments/foo", "format": "json"},
+        )
+
+    @patch("openassessment.fileupload.backends.swift.requests.get")
+    def test_list_keys_not_allowed(self, requests_get_mock):
+        """
+        Verify the backend can't list files when the container doesn't allow listings.
+        """
+        requests_get_mock.return_value = Mock(status_code=403)
+        with self.assertRaises(NotImplementedError):
+            self.backend.list_keys("foo")
+
+    def test_generate_download_url(self):
+        """
+        Verify the download URL is generated without checking the storage.
+        """
+        self._verify_url(self.backend.generate_download_url("foo"))
+
 
 @override_settings(
     ORA2_FILEUPLOAD_BACKEND="django",
@@ -499,3 +607,15 @@ class TestFileUploadServiceWithDjangoStorageBackend(TestCase):
         # File no longer exists
         download_url = self.backend.get_download_url(self.key)
         self.assertIsNone(download_url)
+
+    def test_list_keys_not_implemented(self):
+        """
+        Test that files aren't listed, as their flat names can only be
+        filtered by listing every file of the storage.
+        """
+        with self.assertRaises(NotImplementedError):
+            self.backend.list_keys("bob/course/item")
+        self.assertEqual(
+            f"{self.base_url}/submissions/bob_course_item_2",
+            self.backend.generate_download_url("bob/course/item/2").lstrip('/')
+        )
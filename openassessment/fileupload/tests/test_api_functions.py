@@ -3,6 +3,7 @@ Tests for other functions related to the management of file uploads, without tes
 anything related to backends.
 """
 import json
+import threading
 
 from unittest import mock
 import pytest
@@ -138,8 +139,8 @@ def test_cannot_delete_file_if_user_ids_do_not_match(shared_file_upload_fixture)
 
 
 @pytest.mark.django_db
-@mock.patch('openassessment.fileupload.api.remove_file', autospec=True)
-def test_delete_shared_files_for_team(mock_remove_file, shared_file_upload_fixture, mock_block):
+@mock.patch('openassessment.fileupload.api.remove_files', autospec=True)
+def test_delete_shared_files_for_team(mock_remove_files, shared_file_upload_fixture, mock_block):
     # Given some shared files for a team, among other similar files
     files_to_delete = [{'file_key': 'key-1'}, {'file_key': 'key-2'}, {'file_key': 'key-3'}]
     same_team_different_block = [{'file_key': 'key-4', 'item_id': 'not the item you\'re looking for'}]
@@ -155,8 +156,9 @@ def test_delete_shared_files_for_team(mock_remove_file, shared_file_upload_fixtu
     # When I ask to delete the files
     api.delete_shared_files_for_team(DEFAULT_COURSE_ID, DEFAULT_ITEM_ID, DEFAULT_TEAM_ID)
 
-    # Each file is removed from the backend and the models are deleted
-    assert mock_remove_file.call_count == len(files_to_delete)
+    # The files are removed from the backend at once and the models are deleted
+    mock_remove_files.assert_called_once()
+    assert sorted(mock_remove_files.call_args[0][0]) == [file_info['file_key'] for file_info in files_to_delete]
     assert SharedFileUpload.objects.all().count() == len(all_files) - len(files_to_delete)
 
 
@@ -348,3 +350,52 @@ def test_team_files_metadata(mock_get_download_url, shared_file_upload_fixture,
         mock.call(key_beta),
         mock.call(key_delta),
     ])
+
+
+@mock.patch('openassessment.fileupload.api.get_download_url', autospec=True)
+def test_get_download_urls(mock_get_download_url):
+    def get_download_url(key):
+        if key == 'broken':
+            raise api.FileUploadError('Oh no')
+        return f'https://example.com/{key}'
+    mock_get_download_url.side_effect = get_download_url
+
+    urls = api.get_download_urls(['a', '', 'broken', 'b', None, 'a'])
+
+    # The urls are in the order of the keys, and missing or broken files have empty urls
+    assert urls == ['https://example.com/a', '', '', 'https://example.com/b', '', 'https://example.com/a']
+    # Each key is only resolved once
+    assert sorted(call.args[0] for call in mock_get_download_url.call_args_list) == ['a', 'b', 'broken']
+
+
+@mock.patch('openassessment.fileupload.api.get_download_url', autospec=True)
+def test_get_download_urls_other_errors_raised(mock_get_download_url):
+    mock_get_download_url.side_effect = ValueError('Oh no')
+    with pytest.raises(ValueError):
+        api.get_download_urls(['a', 'b'])
+
+
+@mock.patch('openassessment.fileupload.api.get_download_url', autospec=True)
+def test_get_download_urls_timeout(mock_get_download_url, settings):
+    settings.ORA2_FILE_URL_TIMEOUT = 0.2
+    slow_storage = threading.Event()
+
+    def get_download_url(key):
+        if key == 'slow':
+            slow_storage.wait(5)
+        return f'https://example.com/{key}'
+    mock_get_download_url.side_effect = get_download_url
+
+    try:
+        # A slow storage degrades the urls instead of stalling the page
+        assert api.get_download_urls(['a', 'slow', 'b']) == ['https://example.com/a', '', 'https://example.com/b']
+    finally:
+        slow_storage.set()
+
+
+@mock.patch('openassessment.fileupload.api.get_download_url', autospec=True)
+def test_get_download_urls_without_threads(mock_get_download_url, settings):
+    settings.ORA2_FILE_URL_WORKERS = 1
+    mock_get_download_url.side_effect = lambda key: threading.current_thread().name
+
+    assert api.get_download_urls(['a', 'b']) == [threading.current_thread().name] * 2
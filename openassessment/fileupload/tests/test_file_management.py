@@ -2,9 +2,9 @@ import json
 from unittest import mock
 from urllib.parse import urljoin
 
-from django.db import IntegrityError
+from django.db import IntegrityError, connection
 from django.test import TestCase
-from django.test.utils import override_settings
+from django.test.utils import CaptureQueriesContext, override_settings
 from moto import mock_s3
 
 from openassessment.assessment.models.base import SharedFileUpload
@@ -198,6 +198,22 @@ class FileUploadManagerTests(TestCase):
             for index, upload in enumerate(actual_file_uploads):
                 self.assertEqual(index, upload.index)
 
+    def test_shared_uploads_created_in_bulk(self):
+        uploads = [upload_dict(f'name{index}', f'desc{index}', 100) for index in range(5)]
+
+        with mock.patch.object(SharedFileUpload.objects, 'create') as mock_create:
+            with CaptureQueriesContext(connection) as queries:
+                self.team_manager.append_uploads(*uploads)
+        mock_create.assert_not_called()
+
+        # One insert for the shared uploads and one for their history
+        inserts = [query['sql'] for query in queries.captured_queries if query['sql'].startswith('INSERT')]
+        self.assertEqual(2, len(inserts))
+
+        shared_uploads = self._get_shared_uploads(self.team_manager)
+        self.assertEqual(5, len(shared_uploads))
+        self.assertEqual(5, SharedFileUpload.history.filter(history_type='+').count())
+
     def test_integrity_error(self):
         self.team_manager.append_uploads(
             upload_dict('name1', 'desc1', 100),
@@ -0,0 +1,294 @@
+"""
+Opt-in instrumentation of the handlers of the ORA XBlock.
+
+When enabled, a sample of the handler calls is measured: wall time, number
+and duration of the database queries, hits and misses of the default Django
+cache, and calls to the file upload backend. The measures of each call are
+emitted through the sink configured by ORA2_HANDLER_INSTRUMENTATION_SINK:
+
+* "logging" (default): log a line per call.
+* "monitoring": set custom attributes on the monitoring transaction.
+* "statsd": send statsd metrics over UDP, to the address configured by
+  ORA2_HANDLER_INSTRUMENTATION_STATSD_ADDRESS (default ("localhost", 8125)).
+* "memory": keep the measures in memory, in the `records` of the sink. Only meant for tests.
+* the dotted path of a class with an `emit(metrics)` method.
+
+ORA2_HANDLER_INSTRUMENTATION_SAMPLE_RATE sets the fraction of the calls which
+are measured, between 0 (the default, which disables the instrumentation) and 1.
+Calls which are not sampled only cost a random number.
+
+Only the queries made by the thread handling the request are counted.
+"""
+import contextvars
+import logging
+import random
+import socket
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections
+from django.utils.module_loading import import_string
+from edx_django_utils.monitoring import set_custom_attribute
+
+logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
+
+DEFAULT_STATSD_ADDRESS = ('localhost', 8125)
+STATSD_PREFIX = 'ora2.handler'
+
+_current_metrics = contextvars.ContextVar('ora2_handler_metrics', default=None)
+
+
+class HandlerMetrics:
+    """
+    The measures of a handler call.
+    """
+
+    def __init__(self, handler_name):
+        self.handler_name = handler_name
+        self.wall_time = 0.0
+        self.queries = 0
+        self.query_time = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.storage_calls = 0
+        # Storage calls can be made by the threads retrieving file urls
+        self._lock = threading.Lock()
+
+    def query_wrapper(self, execute, sql, params, many, context):
+        """
+        Database execute wrapper measuring the queries.
+        """
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.query_time += time.perf_counter() - start
+
+    def record_cache_lookup(self, hits, misses):
+        self.cache_hits += hits
+        self.cache_misses += misses
+
+    def record_storage_call(self):
+        with self._lock:
+            self.storage_calls += 1
+
+    def as_dict(self):
+        return {
+            'handler': self.handler_name,
+            'wall_time': self.wall_time,
+            'queries': self.queries,
+            'query_time': self.query_time,
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+            'storage_calls': self.storage_calls,
+        }
+
+
+class LoggingSink:
+    """
+    Log the measures of each call.
+    """
+    name = 'logging'
+
+    def emit(self, metrics):
+        logger.info(
+            "ORA handler %s: %.1f ms, %d queries in %.1f ms, %d cache hits, %d cache misses, %d storage calls",
+            metrics.handler_name,
+            metrics.wall_time * 1000,
+            metrics.queries,
+            metrics.query_time * 1000,
+            metrics.cache_hits,
+            metrics.cache_misses,
+            metrics.storage_calls,
+        )
+
+
+class MonitoringSink:
+    """
+    Set the measures of each call as custom attributes of the monitoring transaction.
+    """
+    name = 'monitoring'
+
+    def emit(self, metrics):
+        for key, value in metrics.as_dict().items():
+            set_custom_attribute(f'ora2_handler_{key}', round(value, 4) if isinstance(value, float) else value)
+
+
+class StatsdSink:
+    """
+    Send the measures of each call as statsd metrics, over UDP.
+    """
+    name = 'statsd'
+
+    def __init__(self):
+        # .. setting_name: ORA2_HANDLER_INSTRUMENTATION_STATSD_ADDRESS
+        # .. setting_default: ('localhost', 8125)
+        # .. setting_description: The (host, port) address of the statsd server
+        #     the handler measures are sent to by the "statsd" sink.
+        self.address = tuple(getattr(settings, 'ORA2_HANDLER_INSTRUMENTATION_STATSD_ADDRESS', DEFAULT_STATSD_ADDRESS))
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.setblocking(False)
+
+    def emit(self, metrics):
+        prefix = f"{STATSD_PREFIX}.{metrics.handler_name}"
+        lines = [
+            f"{prefix}.wall_time:{metrics.wall_time * 1000:.3f}|ms",
+            f"{prefix}.query_time:{metrics.query_time * 1000:.3f}|ms",
+            f"{prefix}.queries:{metrics.queries}|c",
+            f"{prefix}.cache_hits:{metrics.cache_hits}|c",
+            f"{prefix}.cache_misses:{metrics.cache_misses}|c",
+            f"{prefix}.storage_calls:{metrics.storage_calls}|c",
+        ]
+        try:
+            self._socket.sendto("\n".join(lines).encode('utf-8'), self.address)
+        except OSError:
+            logger.debug("Could not send the measures of handler %s to statsd", metrics.handler_name, exc_info=True)
+
+
+class MemorySink:
+    """
+    Keep the measures of each call in memory.
+    """
+    name = 'memory'
+
+    def __init__(self):
+        self.records = []
+
+    def emit(self, metrics):
+        self.records.append(metrics.as_dict())
+
+
+INSTRUMENTATION_SINKS = {
+    LoggingSink.name: LoggingSink,
+    MonitoringSink.name: MonitoringSink,
+    StatsdSink.name: StatsdSink,
+    MemorySink.name: MemorySink,
+}
+
+_sinks = {}
+_sinks_lock = threading.Lock()
+
+
+def get_sink():
+    """
+    Return the sink configured by the ORA2_HANDLER_INSTRUMENTATION_SINK setting.
+
+    Sinks are created once per process, so that the "memory" sink keeps its records between calls.
+    """
+    # .. setting_name: ORA2_HANDLER_INSTRUMENTATION_SINK
+    # .. setting_default: 'logging'
+    # .. setting_description: Where the measures of the ORA handlers are emitted. The supported values
+    #     are: 'logging', 'monitoring', 'statsd', 'memory', or the dotted path of a sink class.
+    sink_setting = getattr(settings, 'ORA2_HANDLER_INSTRUMENTATION_SINK', LoggingSink.name)
+    with _sinks_lock:
+        if sink_setting not in _sinks:
+            sink_class = INSTRUMENTATION_SINKS.get(sink_setting) or import_string(sink_setting)
+            _sinks[sink_setting] = sink_class()
+        return _sinks[sink_setting]
+
+
+def clear_sinks():
+    """
+    Drop the sinks and the measures they keep in memory (for tests).
+    """
+    with _sinks_lock:
+        _sinks.clear()
+
+
+def _sample_rate():
+    # .. setting_name: ORA2_HANDLER_INSTRUMENTATION_SAMPLE_RATE
+    # .. setting_default: 0
+    # .. setting_description: The fraction of the ORA handler calls which are measured, between 0 and 1.
+    #     0 disables the instrumentation.
+    return getattr(settings, 'ORA2_HANDLER_INSTRUMENTATION_SAMPLE_RATE', 0)
+
+
+@contextmanager
+def _count_cache_lookups(metrics):
+    """
+    Count the hits and misses of the default cache.
+
+    The cache objects are specific to each thread, so the lookup methods of the
+    cache of this thread are replaced for the duration of the call.
+    """
+    cache = caches['default']
+    overridden = {name: vars(cache)[name] for name in ('get', 'get_many') if name in vars(cache)}
+    original_get, original_get_many = cache.get, cache.get_many
+
+    # Some backends implement get_many with get, whose lookups are then already counted
+    in_get_many = False
+
+    def get(key, default=None, version=None):
+        value = original_get(key, default=default, version=version)
+        if not in_get_many:
+            hit = value is not default
+            metrics.record_cache_lookup(int(hit), int(not hit))
+        return value
+
+    def get_many(keys, version=None):
+        nonlocal in_get_many
+        keys = list(keys)
+        in_get_many = True
+        try:
+            values = original_get_many(keys, version=version)
+        finally:
+            in_get_many = False
+        metrics.record_cache_lookup(len(values), len(keys) - len(values))
+        return values
+
+    cache.get, cache.get_many = get, get_many
+    try:
+        yield
+    finally:
+        for name in ('get', 'get_many'):
+            if name in overridden:
+                setattr(cache, name, overridden[name])
+            else:
+                delattr(cache, name)
+
+
+def instrument_handler(handler_name, handler, *args, **kwargs):
+    """
+    Call a handler, measuring the call if it is sampled.
+
+    Args:
+        handler_name (str): The name the measures are reported under.
+        handler (callable): Called with the other arguments.
+
+    Returns:
+        The result of the handler.
+    """
+    sample_rate = _sample_rate()
+    # Nested calls are measured as part of the outer call
+    if not sample_rate or random.random() >= sample_rate or _current_metrics.get() is not None:
+        return handler(*args, **kwargs)
+
+    metrics = HandlerMetrics(handler_name)
+    token = _current_metrics.set(metrics)
+    start = time.perf_counter()
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(metrics.query_wrapper))
+            stack.enter_context(_count_cache_lookups(metrics))
+            return handler(*args, **kwargs)
+    finally:
+        metrics.wall_time = time.perf_counter() - start
+        _current_metrics.reset(token)
+        try:
+            get_sink().emit(metrics)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Could not emit the measures of handler %s", handler_name)
+
+
+def record_storage_call():
+    """
+    Count a call to the file upload backend in the measures of the current handler call, if any.
+    """
+    metrics = _current_metrics.get()
+    if metrics is not None:
+        metrics.record_storage_call()
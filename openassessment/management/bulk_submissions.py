@@ -0,0 +1,325 @@
+"""
+Bulk creation of submissions, workflows and assessments, for the commands which create test data.
+
+Creating a submission through the APIs takes several queries for the submission,
+its workflow and each of its steps, and as many for each assessment. In bulk, the
+first submission is still created through the APIs, and the state of its workflow
+is copied to the other submissions, which are inserted with `bulk_create` along
+with their workflows, steps, peer and staff workflows and assessments.
+
+Not all databases return the ids of the rows created by `bulk_create`, so the
+rows are read back by their natural keys (e.g. the submission uuid), which also
+holds when several processes insert rows at the same time.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from uuid import uuid4
+
+from django.db import connections, models
+from django.db.models import Max
+from django.utils.timezone import now
+from submissions.models import StudentItem, Submission
+
+from openassessment.assessment.models import Assessment, AssessmentPart, PeerWorkflow, PeerWorkflowItem, StaffWorkflow
+from openassessment.workflow.models import AssessmentWorkflow, AssessmentWorkflowStep
+
+DEFAULT_BATCH_SIZE = 500
+
+
+class WorkflowTemplate:
+    """
+    The state of the workflow of a submission created through the APIs, copied
+    to the submissions created in bulk.
+    """
+
+    def __init__(self, status, steps, has_peer_workflow, has_staff_workflow):
+        self.status = status
+        # One dict per step, with the name, order_num and skipped fields of the step,
+        # and whether the submitter and assessment completion times are set
+        self.steps = steps
+        self.has_peer_workflow = has_peer_workflow
+        self.has_staff_workflow = has_staff_workflow
+
+    @classmethod
+    def from_submission(cls, submission_uuid):
+        """
+        Read the template from the workflow of a submission.
+
+        Args:
+            submission_uuid (str): The submission, with a workflow created through the APIs.
+
+        Returns:
+            WorkflowTemplate
+        """
+        workflow = AssessmentWorkflow.objects.get(submission_uuid=submission_uuid)
+        steps = [
+            {
+                'name': step.name,
+                'order_num': step.order_num,
+                'skipped': step.skipped,
+                'submitter_completed': step.submitter_completed_at is not None,
+                'assessment_completed': step.assessment_completed_at is not None,
+            }
+            for step in workflow.steps.all()
+        ]
+        return cls(
+            workflow.status,
+            steps,
+            PeerWorkflow.objects.filter(submission_uuid=submission_uuid).exists(),
+            StaffWorkflow.objects.filter(submission_uuid=submission_uuid).exists(),
+        )
+
+
+def get_student_item_ids(course_id, item_id, student_ids, item_type='openassessment'):
+    """
+    Return the ids of the student items of the students for an item, creating the missing ones.
+
+    Returns:
+        dict: The student item ids, by student id.
+    """
+    def existing_ids():
+        return dict(
+            StudentItem.objects.filter(
+                course_id=course_id, item_id=item_id, student_id__in=student_ids
+            ).values_list('student_id', 'id')
+        )
+
+    student_item_ids = existing_ids()
+    missing = set(student_ids) - set(student_item_ids)
+    if missing:
+        StudentItem.objects.bulk_create([
+            StudentItem(student_id=student_id, course_id=course_id, item_id=item_id, item_type=item_type)
+            for student_id in missing
+        ])
+        student_item_ids = existing_ids()
+    return student_item_ids
+
+
+def get_latest_attempt_numbers(student_item_ids):
+    """
+    Return the attempt numbers of the latest submissions of student items.
+
+    Returns:
+        dict: The latest attempt numbers, by student item id, for the student items with submissions.
+    """
+    return dict(
+        Submission.objects.filter(student_item_id__in=student_item_ids)
+        .values('student_item_id')
+        .annotate(latest_attempt_number=Max('attempt_number'))
+        .values_list('student_item_id', 'latest_attempt_number')
+    )
+
+
+def bulk_create_submissions(course_id, item_id, submissions, template):
+    """
+    Create submissions and their workflows, in the state of the template.
+
+    Args:
+        course_id (str): The course of the submissions.
+        item_id (str): The item of the submissions.
+        submissions (list): A dict for each submission, with the 'student_id' and
+            'answer' of the submission, and its 'attempt_number', by default the
+            one after the latest attempt of the student.
+        template (WorkflowTemplate): The state of the created workflows.
+
+    Returns:
+        list: The uuids of the created submissions, in order.
+    """
+    timestamp = now()
+    student_item_ids = get_student_item_ids(course_id, item_id, {sub['student_id'] for sub in submissions})
+    attempt_numbers = get_latest_attempt_numbers(student_item_ids.values())
+    submission_uuids = [str(uuid4()) for _ in submissions]
+    rows = []
+    for submission_uuid, submission in zip(submission_uuids, submissions):
+        student_item_id = student_item_ids[submission['student_id']]
+        attempt_number = submission.get('attempt_number')
+        if attempt_number is None:
+            attempt_number = attempt_numbers.get(student_item_id, 0) + 1
+            attempt_numbers[student_item_id] = attempt_number
+        rows.append(Submission(
+            uuid=submission_uuid,
+            student_item_id=student_item_id,
+            attempt_number=attempt_number,
+            answer=submission['answer'],
+            submitted_at=timestamp,
+            created_at=timestamp,
+        ))
+    Submission.objects.bulk_create(rows)
+
+    AssessmentWorkflow.objects.bulk_create([
+        AssessmentWorkflow(
+            submission_uuid=submission_uuid,
+            course_id=course_id,
+            item_id=item_id,
+            status=template.status,
+        )
+        for submission_uuid in submission_uuids
+    ])
+    workflow_ids = AssessmentWorkflow.objects.filter(
+        submission_uuid__in=submission_uuids
+    ).values_list('id', flat=True)
+    AssessmentWorkflowStep.objects.bulk_create([
+        AssessmentWorkflowStep(
+            workflow_id=workflow_id,
+            name=step['name'],
+            order_num=step['order_num'],
+            skipped=step['skipped'],
+            submitter_completed_at=timestamp if step['submitter_completed'] else None,
+            assessment_completed_at=timestamp if step['assessment_completed'] else None,
+        )
+        for workflow_id in workflow_ids
+        for step in template.steps
+    ])
+
+    if template.has_peer_workflow:
+        PeerWorkflow.objects.bulk_create([
+            PeerWorkflow(
+                student_id=submission['student_id'],
+                course_id=course_id,
+                item_id=item_id,
+                submission_uuid=submission_uuid,
+            )
+            for submission_uuid, submission in zip(submission_uuids, submissions)
+        ])
+    if template.has_staff_workflow:
+        StaffWorkflow.objects.bulk_create([
+            StaffWorkflow(course_id=course_id, item_id=item_id, submission_uuid=submission_uuid)
+            for submission_uuid in submission_uuids
+        ])
+    return submission_uuids
+
+
+def bulk_create_assessments(rubric, assessments):
+    """
+    Create assessments and their parts.
+
+    Args:
+        rubric (Rubric): The rubric of the assessments.
+        assessments (list): A dict for each assessment, with the 'submission_uuid',
+            'scorer_id', 'score_type', 'options_selected', 'criterion_feedback' and
+            'overall_feedback' of the assessment. A scorer assesses a submission
+            at most once for each score type.
+
+    Returns:
+        dict: The ids of the created assessments, by (submission_uuid, scorer_id, score_type).
+
+    Raises:
+        InvalidRubricSelection
+    """
+    timestamp = now()
+    Assessment.objects.bulk_create([
+        Assessment(
+            rubric=rubric,
+            scorer_id=assessment['scorer_id'],
+            submission_uuid=assessment['submission_uuid'],
+            score_type=assessment['score_type'],
+            scored_at=timestamp,
+            feedback=assessment['overall_feedback'][0:Assessment.MAX_FEEDBACK_SIZE],
+        )
+        for assessment in assessments
+    ])
+    assessment_ids = {
+        (submission_uuid, scorer_id, score_type): assessment_id
+        for assessment_id, submission_uuid, scorer_id, score_type in Assessment.objects.filter(
+            submission_uuid__in={assessment['submission_uuid'] for assessment in assessments},
+            scored_at=timestamp,
+        ).values_list('id', 'submission_uuid', 'scorer_id', 'score_type')
+    }
+
+    parts = []
+    for assessment in assessments:
+        key = (assessment['submission_uuid'], assessment['scorer_id'], assessment['score_type'])
+        parts.extend(AssessmentPart.build_from_option_names(
+            Assessment(id=assessment_ids[key], rubric=rubric),
+            assessment['options_selected'],
+            feedback=assessment['criterion_feedback'],
+        ))
+    AssessmentPart.objects.bulk_create(parts)
+    return assessment_ids
+
+
+def bulk_create_peer_workflow_items(items, num_required_grades):
+    """
+    Create the peer workflow items of scorers assessing submissions, and update
+    the grades received by the authors as closing the items one by one does.
+
+    Args:
+        items (list): A dict for each item, with the 'scorer_submission_uuid', the
+            'submission_uuid' assessed, and the 'assessment_id' if it was assessed.
+        num_required_grades (int): The number of grades a submission requires.
+    """
+    timestamp = now()
+    peer_workflow_ids = dict(
+        PeerWorkflow.objects.filter(
+            submission_uuid__in={
+                submission_uuid
+                for item in items
+                for submission_uuid in (item['scorer_submission_uuid'], item['submission_uuid'])
+            }
+        ).values_list('submission_uuid', 'id')
+    )
+    PeerWorkflowItem.objects.bulk_create([
+        PeerWorkflowItem(
+            scorer_id=peer_workflow_ids[item['scorer_submission_uuid']],
+            author_id=peer_workflow_ids[item['submission_uuid']],
+            submission_uuid=item['submission_uuid'],
+            started_at=timestamp,
+            assessment_id=item.get('assessment_id'),
+        )
+        for item in items
+    ])
+
+    grades_received = {}
+    for item in items:
+        if item.get('assessment_id') is not None:
+            author_id = peer_workflow_ids[item['submission_uuid']]
+            grades_received[author_id] = grades_received.get(author_id, 0) + 1
+    authors_by_grades = {}
+    for author_id, num_grades in grades_received.items():
+        authors_by_grades.setdefault(num_grades, []).append(author_id)
+    for num_grades, author_ids in authors_by_grades.items():
+        PeerWorkflow.objects.filter(id__in=author_ids).update(
+            grading_completed_at=models.Case(
+                models.When(
+                    grading_completed_at__isnull=True,
+                    completed_graded_by_count__gte=num_required_grades - num_grades,
+                    then=models.Value(timestamp),
+                ),
+                default=models.F('grading_completed_at'),
+                output_field=models.DateTimeField(),
+            ),
+            completed_graded_by_count=models.F('completed_graded_by_count') + num_grades,
+        )
+
+
+def run_batches(func, batches, processes=1):
+    """
+    Run a function on each batch, in this process or across a pool of processes.
+
+    Each process opens its own database connection, so processes need a database
+    server rather than an in-memory database.
+
+    Args:
+        func (callable): A function of a batch, which can be pickled.
+        batches (list): The batches.
+
+    Keyword Args:
+        processes (int): The number of processes.
+
+    Returns:
+        list: The results of the function, in the order of the batches.
+    """
+    if processes <= 1:
+        return [func(batch) for batch in batches]
+
+    # The children open their own connections
+    connections.close_all()
+    with ProcessPoolExecutor(max_workers=processes, mp_context=get_context('fork')) as executor:
+        return list(executor.map(func, batches))
+
+
+def split_batches(values, batch_size):
+    """
+    Split a list into batches of at most `batch_size` values.
+    """
+    return [values[start:start + batch_size] for start in range(0, len(values), batch_size)]
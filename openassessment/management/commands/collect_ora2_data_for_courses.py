@@ -0,0 +1,194 @@
+"""
+Command to retrieve all ORA2 data for many courses, one .csv file per course.
+
+This command runs the same export as collect_ora2_data for each course,
+spreading the courses over a pool of worker processes so that platform-wide
+reports don't need one Django process per course.
+
+A manifest.json file is written next to the .csv files, listing for each
+course the file name, the number of rows, the time it took and, for courses
+that could not be exported, the error.
+"""
+
+
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from openassessment.data import OraAggregateData
+from openassessment.management.commands.collect_ora2_data import _encode_row
+
+
+class Command(BaseCommand):
+    """
+    Query aggregated open assessment data for several courses, write to one .csv per course
+    """
+
+    help = ("Usage: collect_ora2_data_for_courses [<course_id> ...] [--course-ids-file=<file>] "
+            "--output-dir=<output_dir> [--workers=<workers>]")
+
+    MANIFEST_FILE_NAME = 'manifest.json'
+
+    def add_arguments(self, parser):
+        parser.add_argument('course_ids', nargs='*', type=str)
+        parser.add_argument(
+            '-f',
+            '--course-ids-file',
+            action='store',
+            dest='course_ids_file',
+            default=None,
+            help="Read course IDs from a file, one per line"
+        )
+        parser.add_argument(
+            '-o',
+            '--output-dir',
+            action='store',
+            dest='output_dir',
+            required=True,
+            help="Directory in which to write the .csv files and the manifest"
+        )
+        parser.add_argument(
+            '-w',
+            '--workers',
+            action='store',
+            dest='workers',
+            type=int,
+            default=1,
+            help="Number of courses to export in parallel"
+        )
+
+    def handle(self, *args, **options):
+        """
+        Run the command.
+
+        Raises:
+            CommandError: if no course ID was given, or if any course could not be exported.
+        """
+        course_ids = list(options['course_ids'])
+        if options['course_ids_file']:
+            course_ids.extend(_read_course_ids(options['course_ids_file']))
+        # Drop duplicates, keeping the order in which the courses were given
+        course_ids = list(dict.fromkeys(course_ids))
+
+        if not course_ids:
+            raise CommandError("Course ID must be specified to fetch data")
+
+        output_dir = options['output_dir']
+        os.makedirs(output_dir, exist_ok=True)
+
+        results = self._export_courses(course_ids, output_dir, max(options['workers'], 1))
+
+        manifest = {
+            'courses': [results[course_id] for course_id in course_ids],
+        }
+        with open(os.path.join(output_dir, self.MANIFEST_FILE_NAME), 'w', encoding='utf-8') as manifest_file:
+            json.dump(manifest, manifest_file, indent=2)
+
+        failures = [result for result in manifest['courses'] if result['error']]
+        for result in manifest['courses']:
+            if not result['error']:
+                self.stdout.write(
+                    f"{result['course_id']}: {result['rows']} rows in {result['seconds']:.2f}s "
+                    f"-> {result['file_name']}"
+                )
+        for result in failures:
+            self.stderr.write(f"{result['course_id']}: FAILED: {result['error']}")
+
+        if failures:
+            raise CommandError(
+                f"{len(failures)} of {len(course_ids)} courses could not be exported, "
+                f"see {self.MANIFEST_FILE_NAME} for details"
+            )
+
+    def _export_courses(self, course_ids, output_dir, workers):
+        """
+        Export each course, in this process or in a pool of worker processes.
+
+        Args:
+            course_ids (list): The IDs of the courses to export.
+            output_dir (unicode): The directory in which to write the .csv files.
+            workers (int): The number of worker processes.
+
+        Returns:
+            dict: The result of each export (see `export_course`), keyed by course ID.
+        """
+        if workers == 1:
+            return {course_id: export_course(course_id, output_dir) for course_id in course_ids}
+
+        # Database connections can't be shared with the worker processes, so close them
+        # before forking: each process opens its own connection when it runs its first query.
+        connections.close_all()
+        results = {}
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(export_course, course_id, output_dir): course_id
+                for course_id in course_ids
+            }
+            for future in as_completed(futures):
+                course_id = futures[future]
+                try:
+                    results[course_id] = future.result()
+                except Exception as ex:  # pylint: disable=broad-except
+                    # The worker process itself failed, e.g. it was killed
+                    results[course_id] = _result(course_id, None, 0, 0, ex)
+        return results
+
+
+def export_course(course_id, output_dir):
+    """
+    Write the ORA2 data of a course to a .csv file.
+
+    Errors are caught so that one course does not stop the export of the others.
+
+    Args:
+        course_id (unicode): The ID of the course.
+        output_dir (unicode): The directory in which to write the .csv file.
+
+    Returns:
+        dict with keys 'course_id', 'file_name', 'rows', 'seconds' and 'error'.
+    """
+    file_name = ("%s-ora2.csv" % course_id).replace("/", "-")
+    start = time.monotonic()
+    row_count = 0
+    try:
+        with open(os.path.join(output_dir, file_name), 'w', encoding='utf-8', newline='') as csv_file:
+            writer = csv.writer(csv_file, dialect='excel', quotechar='"', quoting=csv.QUOTE_ALL)
+
+            header, rows = OraAggregateData.collect_ora2_data(course_id)
+
+            writer.writerow(header)
+            for row in rows:
+                writer.writerow(_encode_row(row))
+                row_count += 1
+    except Exception as ex:  # pylint: disable=broad-except
+        return _result(course_id, file_name, row_count, time.monotonic() - start, ex)
+    return _result(course_id, file_name, row_count, time.monotonic() - start)
+
+
+def _result(course_id, file_name, rows, seconds, error=None):
+    """
+    Summarize the export of a course for the manifest.
+    """
+    return {
+        'course_id': course_id,
+        'file_name': file_name,
+        'rows': rows,
+        'seconds': round(seconds, 3),
+        'error': repr(error) if error is not None else None,
+    }
+
+
+def _read_course_ids(file_path):
+    """
+    Read course IDs from a file, one per line, skipping blank lines and # comments.
+    """
+    with open(file_path, encoding='utf-8') as course_ids_file:
+        return [
+            line.strip() for line in course_ids_file
+            if line.strip() and not line.strip().startswith('#')
+        ]
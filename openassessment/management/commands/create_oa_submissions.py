@@ -4,14 +4,29 @@ Create dummy submissions and assessments for testing.
 
 
 import copy
+from functools import partial
 from uuid import uuid4
 
 from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
 
 import loremipsum
 from submissions import api as sub_api
 from openassessment.assessment.api import peer as peer_api
 from openassessment.assessment.api import self as self_api
+from openassessment.assessment.score_type_constants import PEER_TYPE, SELF_TYPE
+from openassessment.assessment.serializers import rubric_from_dict
+from openassessment.management.bulk_submissions import (
+    DEFAULT_BATCH_SIZE,
+    WorkflowTemplate,
+    bulk_create_assessments,
+    bulk_create_peer_workflow_items,
+    bulk_create_submissions,
+    get_latest_attempt_numbers,
+    get_student_item_ids,
+    run_batches,
+    split_batches,
+)
 from openassessment.workflow import api as workflow_api
 
 STEPS = ['peer', 'self']
@@ -43,6 +58,29 @@ class Command(BaseCommand):
         super().__init__(*args, **kwargs)
         self._student_items = []
 
+    def add_arguments(self, parser):
+        parser.add_argument('args', nargs='*', help=self.args)
+        parser.add_argument(
+            '--bulk',
+            action='store_true',
+            help=(
+                'Create the submissions, workflows and assessments with bulk inserts, in batched transactions, '
+                'instead of through the APIs.'
+            )
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help='Number of submissions created in each transaction, with --bulk.'
+        )
+        parser.add_argument(
+            '--processes',
+            type=int,
+            default=1,
+            help='Number of processes creating the batches, with --bulk. Requires a database server.'
+        )
+
     def handle(self, *args, **options):
         """
         Execute the command.
@@ -52,6 +90,11 @@ class Command(BaseCommand):
             item_id (unicode): The ID of the item in the course to create submissions for.
             num_submissions (int): Number of submissions to create.
             percentage (int or float): Percentage for assessments to be made against submissions.
+
+        Keyword Args:
+            bulk (bool): Create the data with bulk inserts, in the same state as through the APIs.
+            batch_size (int): Number of submissions created in each transaction, in bulk.
+            processes (int): Number of processes creating the batches, in bulk.
         """
         if len(args) < 4:
             raise CommandError('Usage: create_oa_submissions <COURSE_ID> <ITEM_ID> <NUM_SUBMISSIONS> <PERCENTAGE>')
@@ -74,6 +117,20 @@ class Command(BaseCommand):
             num=num_submissions, item=item_id, course=course_id
         ))
 
+        if options.get('processes', 1) > 1 and connection.vendor == 'sqlite':
+            raise CommandError('Creating submissions in several processes requires a database server')
+
+        if options.get('bulk'):
+            self._create_in_bulk(
+                course_id,
+                item_id,
+                num_submissions,
+                assessments_to_create,
+                options.get('batch_size') or DEFAULT_BATCH_SIZE,
+                options.get('processes') or 1,
+            )
+            return
+
         assessments_created = 0
 
         for sub_num in range(num_submissions):
@@ -140,6 +197,61 @@ class Command(BaseCommand):
         """
         return self._student_items
 
+    def _create_in_bulk(self, course_id, item_id, num_submissions, assessments_to_create, batch_size, processes):
+        """
+        Create the same submissions and assessments as one by one, with bulk inserts.
+
+        The first submission is created through the APIs, and the state of its
+        workflow is copied to the other submissions. The submissions of the
+        scorers, the peer workflow items and the assessments of all the
+        submissions are then inserted in batches.
+        """
+        if num_submissions <= 0:
+            return
+        rubric_dict, options_selected = self._dummy_rubric()
+        first_student_item = {
+            'student_id': uuid4().hex[0:10],
+            'course_id': course_id,
+            'item_id': item_id,
+            'item_type': 'openassessment'
+        }
+        first_submission_uuid = self._create_dummy_submission(first_student_item)
+        template = WorkflowTemplate.from_submission(first_submission_uuid)
+        # The student items of the scorers and the rubric are shared by the batches,
+        # so they are created before them
+        scorer_item_ids = get_student_item_ids(
+            course_id, item_id, [f'test_{num}' for num in range(self.NUM_PEER_ASSESSMENTS)]
+        )
+        latest_attempt_numbers = get_latest_attempt_numbers(scorer_item_ids.values())
+        scorer_attempt_numbers = {
+            scorer_id: latest_attempt_numbers.get(student_item_id, 0)
+            for scorer_id, student_item_id in scorer_item_ids.items()
+        }
+        rubric_from_dict(rubric_dict)
+
+        create_batch = partial(
+            _create_batch,
+            course_id=course_id,
+            item_id=item_id,
+            template=template,
+            rubric_dict=rubric_dict,
+            options_selected=options_selected,
+            assessments_to_create=assessments_to_create,
+            num_peer_assessments=self.NUM_PEER_ASSESSMENTS,
+            self_assessment_required=self.self_assessment_required,
+            first_student_item=first_student_item,
+            first_submission_uuid=first_submission_uuid,
+            scorer_attempt_numbers=scorer_attempt_numbers,
+        )
+        assessments_created = 0
+        for student_items, num_assessments in run_batches(
+                create_batch, split_batches(list(range(num_submissions)), batch_size), processes=processes
+        ):
+            self._student_items.extend(student_items)
+            assessments_created += num_assessments
+            print(f"Created {len(self._student_items)} submissions")
+        print(f"{assessments_created} assessments being completed for {num_submissions} submissions")
+
     def _create_dummy_submission(self, student_item):
         """
         Create a dummy submission for a student.
@@ -190,3 +302,88 @@ class Command(BaseCommand):
             options_selected[criterion['name']] = criterion['options'][0]['name']
 
         return rubric, options_selected
+
+
+@transaction.atomic
+def _create_batch(
+        sub_nums, course_id, item_id, template, rubric_dict, options_selected, assessments_to_create,
+        num_peer_assessments, self_assessment_required, first_student_item, first_submission_uuid,
+        scorer_attempt_numbers
+):
+    """
+    Create a batch of submissions with their scorers and assessments, with bulk inserts.
+
+    Submission number 0 was already created through the APIs, as `first_submission_uuid`
+    of `first_student_item`. The scorers had made `scorer_attempt_numbers` submissions before
+    submission number 0.
+
+    Returns:
+        tuple: The student items of the submissions of the batch, and the number of assessments created.
+    """
+    rubric = rubric_from_dict(rubric_dict)
+    student_items = [
+        first_student_item if sub_num == 0 else dict(first_student_item, student_id=uuid4().hex[0:10])
+        for sub_num in sub_nums
+    ]
+    # The scorer of each peer assessment makes a new submission before assessing, as when they are created one by one
+    submissions = [
+        {
+            'student_id': student_item['student_id'],
+            'answer': {'text': "  ".join(loremipsum.get_paragraphs(5))},
+        }
+        for sub_num, student_item in zip(sub_nums, student_items) if sub_num != 0
+    ] + [
+        {
+            'student_id': f'test_{num}',
+            'answer': {'text': "  ".join(loremipsum.get_paragraphs(5))},
+            'attempt_number': scorer_attempt_numbers[f'test_{num}'] + sub_num + 1,
+        }
+        for sub_num in sub_nums
+        for num in range(num_peer_assessments)
+    ]
+    submission_uuids = iter(bulk_create_submissions(course_id, item_id, submissions, template))
+    author_uuids = [
+        first_submission_uuid if sub_num == 0 else next(submission_uuids) for sub_num in sub_nums
+    ]
+    scorer_uuids = {
+        (sub_num, num): next(submission_uuids) for sub_num in sub_nums for num in range(num_peer_assessments)
+    }
+
+    assessments = []
+    for sub_num, author_uuid, student_item in zip(sub_nums, author_uuids, student_items):
+        if sub_num < assessments_to_create:
+            assessments.extend(
+                {
+                    'submission_uuid': author_uuid,
+                    'scorer_id': f'test_{num}',
+                    'score_type': PEER_TYPE,
+                    'options_selected': options_selected,
+                    'criterion_feedback': {},
+                    'overall_feedback': "  ".join(loremipsum.get_paragraphs(2)),
+                }
+                for num in range(num_peer_assessments)
+            )
+        if self_assessment_required:
+            assessments.append({
+                'submission_uuid': author_uuid,
+                'scorer_id': student_item['student_id'],
+                'score_type': SELF_TYPE,
+                'options_selected': options_selected,
+                'criterion_feedback': {},
+                'overall_feedback': "  ".join(loremipsum.get_paragraphs(2)),
+            })
+    assessment_ids = bulk_create_assessments(rubric, assessments)
+
+    bulk_create_peer_workflow_items(
+        [
+            {
+                'scorer_submission_uuid': scorer_uuids[(sub_num, num)],
+                'submission_uuid': author_uuid,
+                'assessment_id': assessment_ids.get((author_uuid, f'test_{num}', PEER_TYPE)),
+            }
+            for sub_num, author_uuid in zip(sub_nums, author_uuids)
+            for num in range(num_peer_assessments)
+        ],
+        num_peer_assessments,
+    )
+    return student_items, len(assessment_ids)
@@ -3,17 +3,31 @@ Management command to create submissions, assessments, and locks to make testing
 """
 import logging
 import json
+from functools import partial
 from os.path import exists, join
 
 from django.contrib.auth import get_user_model
 from django.core.management.base import BaseCommand, CommandError
 from django.core.management import call_command
+from django.db import connection, transaction
+from django.utils.timezone import now
 
 from opaque_keys.edx.keys import CourseKey
 
 import loremipsum
 from submissions import api as sub_api
 from openassessment.assessment.api import staff as staff_api
+from openassessment.assessment.models import StaffWorkflow
+from openassessment.assessment.score_type_constants import STAFF_TYPE
+from openassessment.assessment.serializers import rubric_from_dict
+from openassessment.management.bulk_submissions import (
+    DEFAULT_BATCH_SIZE,
+    WorkflowTemplate,
+    bulk_create_assessments,
+    bulk_create_submissions,
+    run_batches,
+    split_batches,
+)
 from openassessment.runtime_imports.functions import anonymous_id_for_user, modulestore
 from openassessment.workflow import api as workflow_api
 from openassessment.xblock.data_conversion import create_rubric_dict
@@ -126,6 +140,26 @@ class Command(BaseCommand):
             action='store_true',
             help='Create submissions, assessments, and locks.'
         )
+        parser.add_argument(
+            '--bulk',
+            action='store_true',
+            help=(
+                'Create the submissions, workflows, assessments and locks with bulk inserts, in batched '
+                'transactions, instead of through the APIs.'
+            )
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help='Number of submissions created in each transaction, with --bulk.'
+        )
+        parser.add_argument(
+            '--processes',
+            type=int,
+            default=1,
+            help='Number of processes creating the batches, with --bulk. Requires a database server.'
+        )
         parser.epilog = EPILOG
 
     def handle(self, *args, **options):
@@ -134,6 +168,8 @@ class Command(BaseCommand):
         do up-front loading, and then do either init, reset, or submit.
         """
         course_id = options['course_id']
+        if options.get('processes', 1) > 1 and connection.vendor == 'sqlite':
+            raise CommandError('Creating submissions in several processes requires a database server')
         submissions_config = self.read_config_file(options['submissions_config_file_path'])
         if options['init']:
             self.init_ora_test_data(course_id, submissions_config)
@@ -145,7 +181,12 @@ class Command(BaseCommand):
         if options['reset']:
             self.reset_ora_test_data(course_id, submissions_config)
         elif options['submit'] or options['init']:
-            self.submit_ora_test_data(course_id, submissions_config)
+            if options.get('bulk'):
+                self.submit_ora_test_data_in_bulk(
+                    course_id, submissions_config, options['batch_size'], options['processes']
+                )
+            else:
+                self.submit_ora_test_data(course_id, submissions_config)
 
     def read_config_file(self, file_path):
         """
@@ -300,21 +341,16 @@ class Command(BaseCommand):
                     course_id,
                     ora_config['displayName']
                 )
-                # Submissions consist of username, a line break, and then some lorem
-                text_response = submission_config['username'] + '\n' + generate_lorem_sentences()
-                submission = sub_api.create_submission(student_item, {'parts': [{'text': text_response}]})
-                workflow_api.create_workflow(submission['uuid'], ['staff'])
-                workflow_api.update_from_assessments(submission['uuid'], None)
-                log.info("Created submission %s for user %s", submission['uuid'], submission_config['username'])
+                submission_uuid = self.create_submission(student_item, submission_config['username'])
 
                 if submission_config['lockOwner']:
                     log.info(
                         "Creating lock on submission %s owned by %s",
-                        submission['uuid'],
+                        submission_uuid,
                         submission_config['lockOwner']
                     )
                     SubmissionGradingLock.claim_submission_lock(
-                        submission['uuid'],
+                        submission_uuid,
                         self.username_to_anonymous_user_id[submission_config['lockOwner']]
                     )
 
@@ -323,20 +359,89 @@ class Command(BaseCommand):
                     log.info(
                         "Creating assessment from user %s for submission %s",
                         grade_data['gradedBy'],
-                        submission['uuid']
+                        submission_uuid
                     )
                     block = self.display_name_to_block[ora_config['displayName']]
                     rubric_dict = create_rubric_dict(block.prompts, block.rubric_criteria_with_labels)
                     options_selected, criterion_feedback = self.api_format_criteria(grade_data['criteria'], rubric_dict)
                     staff_api.create_assessment(
-                        submission['uuid'],
+                        submission_uuid,
                         self.username_to_anonymous_user_id[grade_data['gradedBy']],
                         options_selected,
                         criterion_feedback,
                         grade_data['overallFeedback'],
                         rubric_dict,
                     )
-                    workflow_api.update_from_assessments(submission['uuid'], None)
+                    workflow_api.update_from_assessments(submission_uuid, None)
+
+    def submit_ora_test_data_in_bulk(self, course_id, submissions_config, batch_size=DEFAULT_BATCH_SIZE, processes=1):
+        """
+        Run the submit action with bulk inserts, leaving the same state as `submit_ora_test_data`.
+
+        The first submission of each ORA is created through the APIs, and the state of its
+        workflow is copied to the other submissions. The submissions, locks and assessments
+        are then inserted in batches, and the workflows of the graded submissions are updated
+        through the API, which sets their scores.
+        """
+        for ora_config in submissions_config:
+            log.info('Creating test submissions in bulk for course %s', course_id)
+            if not ora_config['submissions']:
+                continue
+            block = self.display_name_to_block[ora_config['displayName']]
+            rubric_dict = create_rubric_dict(block.prompts, block.rubric_criteria_with_labels)
+
+            entries = []
+            for submission_config in ora_config['submissions']:
+                entry = {
+                    'username': submission_config['username'],
+                    'student_id': self.username_to_anonymous_user_id[submission_config['username']],
+                    'lock_owner_id': None,
+                    'grade': None,
+                }
+                if submission_config['lockOwner']:
+                    entry['lock_owner_id'] = self.username_to_anonymous_user_id[submission_config['lockOwner']]
+                if submission_config['gradeData']:
+                    grade_data = submission_config['gradeData']
+                    options_selected, criterion_feedback = self.api_format_criteria(grade_data['criteria'], rubric_dict)
+                    entry['grade'] = {
+                        'scorer_id': self.username_to_anonymous_user_id[grade_data['gradedBy']],
+                        'options_selected': options_selected,
+                        'criterion_feedback': criterion_feedback,
+                        'overall_feedback': grade_data['overallFeedback'],
+                    }
+                entries.append(entry)
+
+            first_student_item = self.student_item(entries[0]['username'], course_id, ora_config['displayName'])
+            entries[0]['submission_uuid'] = self.create_submission(first_student_item, entries[0]['username'])
+            # The rubric is shared by the batches, so it is created before them
+            rubric_from_dict(rubric_dict)
+
+            submit_batch = partial(
+                _submit_batch,
+                course_id=first_student_item['course_id'],
+                item_id=first_student_item['item_id'],
+                template=WorkflowTemplate.from_submission(entries[0]['submission_uuid']),
+                rubric_dict=rubric_dict,
+            )
+            num_created = 0
+            for batch_size_created in run_batches(submit_batch, split_batches(entries, batch_size), processes):
+                num_created += batch_size_created
+                log.info("Created %d of %d submissions", num_created, len(entries))
+
+    def create_submission(self, student_item, username):
+        """
+        Create a submission of a user, and its workflow with a staff step.
+
+        Returns:
+            str: submission UUID
+        """
+        # Submissions consist of username, a line break, and then some lorem
+        text_response = username + '\n' + generate_lorem_sentences()
+        submission = sub_api.create_submission(student_item, {'parts': [{'text': text_response}]})
+        workflow_api.create_workflow(submission['uuid'], ['staff'])
+        workflow_api.update_from_assessments(submission['uuid'], None)
+        log.info("Created submission %s for user %s", submission['uuid'], username)
+        return submission['uuid']
 
     def student_item(self, username, course_id, ora_display_name):
         """Helper for creating student item dicts"""
@@ -398,3 +503,59 @@ class Command(BaseCommand):
                     str(block.location),
                     self.username_to_anonymous_user_id[SUPERUSER_USERNAME],
                 )
+
+
+@transaction.atomic
+def _submit_batch(entries, course_id, item_id, template, rubric_dict):
+    """
+    Create a batch of submissions with their locks and staff assessments, with bulk inserts.
+
+    The entries already created through the APIs have a 'submission_uuid'.
+
+    Returns:
+        int: The number of submissions of the batch.
+    """
+    new_entries = [entry for entry in entries if 'submission_uuid' not in entry]
+    submission_uuids = bulk_create_submissions(
+        course_id,
+        item_id,
+        [
+            {
+                'student_id': entry['student_id'],
+                # Submissions consist of username, a line break, and then some lorem
+                'answer': {'parts': [{'text': entry['username'] + '\n' + generate_lorem_sentences()}]},
+            }
+            for entry in new_entries
+        ],
+        template,
+    )
+    for entry, submission_uuid in zip(new_entries, submission_uuids):
+        entry['submission_uuid'] = submission_uuid
+
+    SubmissionGradingLock.objects.bulk_create([
+        SubmissionGradingLock(submission_uuid=entry['submission_uuid'], owner_id=entry['lock_owner_id'])
+        for entry in entries if entry['lock_owner_id']
+    ])
+
+    graded_entries = [entry for entry in entries if entry['grade']]
+    assessment_ids = bulk_create_assessments(
+        rubric_from_dict(rubric_dict),
+        [
+            dict(entry['grade'], submission_uuid=entry['submission_uuid'], score_type=STAFF_TYPE)
+            for entry in graded_entries
+        ],
+    )
+    grades = {entry['submission_uuid']: entry['grade'] for entry in graded_entries}
+    staff_workflows = list(StaffWorkflow.objects.filter(submission_uuid__in=grades))
+    timestamp = now()
+    for staff_workflow in staff_workflows:
+        scorer_id = grades[staff_workflow.submission_uuid]['scorer_id']
+        staff_workflow.assessment = str(assessment_ids[(staff_workflow.submission_uuid, scorer_id, STAFF_TYPE)])
+        staff_workflow.scorer_id = scorer_id
+        staff_workflow.grading_completed_at = timestamp
+    StaffWorkflow.objects.bulk_update(staff_workflows, ['assessment', 'scorer_id', 'grading_completed_at'])
+
+    # The workflows compute and set the scores of the graded submissions
+    for submission_uuid in grades:
+        workflow_api.update_from_assessments(submission_uuid, None)
+    return len(entries)
@@ -0,0 +1,76 @@
+"""
+Command to create the rubrics and training examples of the ORA blocks in courses.
+
+The rubric and training example models of a block are created when the block is
+saved in Studio, or else by the first learners who assess. Run this command
+before launching a course, e.g. after importing it, so that learners do not race
+to create them when a deadline opens.
+"""
+
+
+import logging
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError
+
+from opaque_keys import InvalidKeyError
+from opaque_keys.edx.keys import CourseKey
+
+from openassessment.assessment.models import InvalidRubricSelection
+from openassessment.assessment.serializers import InvalidRubric, InvalidTrainingExample
+from openassessment.runtime_imports.functions import modulestore
+
+log = logging.getLogger('materialize_ora_assessment_data')
+
+
+class Command(BaseCommand):
+    """
+    Create the rubric and training example models of all the ORA blocks in the given courses.
+    """
+
+    help = "Usage: materialize_ora_assessment_data <course_id> [<course_id> ...]"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'course_ids',
+            nargs='+',
+            help='The ids of the courses whose ORA blocks to materialize'
+        )
+
+    def handle(self, *args, **options):
+        try:
+            course_keys = [CourseKey.from_string(course_id) for course_id in options['course_ids']]
+        except InvalidKeyError as ex:
+            raise CommandError(f"Invalid course id: {ex}") from ex
+
+        num_blocks = num_rubrics = num_examples = num_failed = 0
+        for course_key in course_keys:
+            for block in self._load_ora_blocks_from_modulestore(course_key):
+                try:
+                    materialized = block.materialize_assessment_data()
+                except (InvalidRubric, InvalidRubricSelection, InvalidTrainingExample, DatabaseError):
+                    log.exception("Could not materialize the rubric and training examples of %s", block.location)
+                    num_failed += 1
+                    continue
+                num_blocks += 1
+                num_rubrics += len(materialized['rubrics'])
+                num_examples += materialized['training_examples']
+
+        self.stdout.write(
+            f"Materialized {num_rubrics} rubrics and {num_examples} training examples "
+            f"for {num_blocks} ORA blocks; {num_failed} blocks failed"
+        )
+
+    def _load_ora_blocks_from_modulestore(self, course_key):
+        """
+        Look up openassessment blocks for the course from the modulestore
+        """
+        try:
+            return modulestore().get_items(
+                course_key, qualifiers={'category': 'openassessment'}
+            )
+        except ModuleNotFoundError as e:
+            raise CommandError((
+                "Cannot import xmodule.modulestore.django.modulestore. "
+                "This management command must be run from the LMS or Studio shell."
+            )) from e
@@ -0,0 +1,58 @@
+"""
+Command to process the deferred updates of assessment workflows.
+
+With ORA2_WORKFLOW_UPDATE_BACKEND set to "outbox" (or to "deferred" without
+Celery), the workflow updates requested when assessments are complete are
+stored in a table. Run this command periodically, e.g. every minute from
+cron, to process them in batches.
+"""
+
+
+from django.core.management.base import BaseCommand
+
+from openassessment.workflow.deferred import DEFAULT_BATCH_SIZE, get_update_backend
+
+
+class Command(BaseCommand):
+    """
+    Process the pending workflow updates, in batches.
+    """
+
+    help = "Usage: process_workflow_updates [--batch-size=<batch_size>] [--max-batches=<max_batches>]"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '-b',
+            '--batch-size',
+            action='store',
+            dest='batch_size',
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Number of workflows to update in each batch"
+        )
+        parser.add_argument(
+            '-m',
+            '--max-batches',
+            action='store',
+            dest='max_batches',
+            type=int,
+            default=None,
+            help="Stop after this number of batches, even if updates are still pending"
+        )
+
+    def handle(self, *args, **options):
+        backend = get_update_backend()
+        updated = 0
+        batches = 0
+        while options['max_batches'] is None or batches < options['max_batches']:
+            processed = backend.process(batch_size=options['batch_size'])
+            if not processed:
+                break
+            updated += processed
+            batches += 1
+
+        stats = backend.stats()
+        self.stdout.write(
+            f"Updated {updated} workflows in {batches} batches ({backend.name} backend); "
+            f"{stats['depth']} updates pending, oldest {stats['lag']} seconds ago"
+        )
@@ -0,0 +1,115 @@
+"""
+Command to reset the state of many learners for an ORA problem.
+
+This does for a list of learners (or every learner who submitted a response)
+what "Reset student state" does for a single learner in the instructor
+dashboard: the workflows are cancelled, the uploaded files are deleted and
+the submissions are orphaned, so that the learners can submit again.
+"""
+
+
+from django.core.management.base import BaseCommand, CommandError
+
+from openassessment.student_state import StudentStateReset
+
+
+class Command(BaseCommand):
+    """
+    Reset the state of many learners for an ORA problem.
+    """
+
+    help = ("Usage: reset_ora_student_state <course_id> <item_id> [<student_id> ...] "
+            "[--student-ids-file=<file>] [--all] --requesting-user-id=<anonymous_user_id> "
+            "[--workers=<workers>] [--batch-size=<batch_size>]")
+
+    def add_arguments(self, parser):
+        parser.add_argument('course_id', type=str)
+        parser.add_argument('item_id', type=str)
+        parser.add_argument('student_ids', nargs='*', type=str)
+        parser.add_argument(
+            '-f',
+            '--student-ids-file',
+            action='store',
+            dest='student_ids_file',
+            default=None,
+            help="Read anonymous student IDs from a file, one per line"
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            dest='all_students',
+            default=False,
+            help="Reset every learner who submitted a response to the problem"
+        )
+        parser.add_argument(
+            '-u',
+            '--requesting-user-id',
+            action='store',
+            dest='requesting_user_id',
+            required=True,
+            help="Anonymous ID of the staff member on whose behalf the state is reset"
+        )
+        parser.add_argument(
+            '-w',
+            '--workers',
+            action='store',
+            dest='workers',
+            type=int,
+            default=1,
+            help="Number of batches of learners to reset in parallel"
+        )
+        parser.add_argument(
+            '-b',
+            '--batch-size',
+            action='store',
+            dest='batch_size',
+            type=int,
+            default=StudentStateReset.BATCH_SIZE,
+            help="Number of learners to reset together"
+        )
+
+    def handle(self, *args, **options):
+        """
+        Run the command.
+
+        Raises:
+            CommandError: if no learner was given, or if learners were given together with --all.
+        """
+        student_ids = list(options['student_ids'])
+        if options['student_ids_file']:
+            student_ids.extend(_read_student_ids(options['student_ids_file']))
+
+        if options['all_students']:
+            if student_ids:
+                raise CommandError("Student IDs can't be given together with --all")
+            student_ids = None
+        elif not student_ids:
+            raise CommandError("Student IDs must be specified, or --all to reset every learner")
+
+        summary = StudentStateReset(
+            options['course_id'],
+            options['item_id'],
+            options['requesting_user_id'],
+            batch_size=options['batch_size'],
+            max_workers=options['workers'],
+            progress_callback=self._report_progress,
+        ).reset(student_ids)
+
+        self.stdout.write(
+            "Reset {students} learners: {submissions} submissions, {workflows_cancelled} workflows cancelled, "
+            "{files_removed} files removed, {team_submissions} team submissions".format(**summary)
+        )
+
+    def _report_progress(self, students_reset, total):
+        self.stdout.write(f"{students_reset}/{total} learners reset")
+
+
+def _read_student_ids(file_path):
+    """
+    Read student IDs from a file, one per line, skipping blank lines and # comments.
+    """
+    with open(file_path, encoding='utf-8') as student_ids_file:
+        return [
+            line.strip() for line in student_ids_file
+            if line.strip() and not line.strip().startswith('#')
+        ]
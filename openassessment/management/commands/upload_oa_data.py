@@ -1,11 +1,12 @@
 """
-Generate CSV files for submission and assessment data, then upload to S3.
+Generate CSV (or Parquet) files for submission and assessment data, then upload to S3.
 """
 
 
 import datetime
 import os
 import os.path
+import re
 import shutil
 import sys
 import tarfile
@@ -13,7 +14,7 @@ import tempfile
 
 from django.core.management.base import BaseCommand, CommandError
 
-from openassessment.data import CsvWriter
+from openassessment.data import ChunkedCsvExport, CsvWriter, ParquetWriter
 from openassessment.fileupload.backends.s3 import _connect_to_s3
 
 
@@ -30,6 +31,11 @@ class Command(BaseCommand):
         for output_name in CsvWriter.MODELS
     }
 
+    OUTPUT_PARQUET_PATHS = {
+        output_name: f"{output_name}.parquet"
+        for output_name in ParquetWriter.MODELS
+    }
+
     URL_EXPIRATION_HOURS = 24
     PROGRESS_INTERVAL = 10
 
@@ -38,6 +44,47 @@ class Command(BaseCommand):
         self._history = []
         self._submission_counter = 0
 
+    def add_arguments(self, parser):
+        parser.add_argument('args', nargs='*')
+        parser.add_argument(
+            '--work-dir',
+            action='store',
+            dest='work_dir',
+            default=None,
+            help=(
+                "Directory in which to generate the CSV files, in a subdirectory for the course "
+                "which is removed once the upload succeeds. If an upload fails, running the "
+                "command again with the same directory resumes the export where it stopped."
+            )
+        )
+        parser.add_argument(
+            '--workers',
+            action='store',
+            dest='workers',
+            type=int,
+            default=1,
+            help="Number of chunks of the course to export in parallel"
+        )
+        parser.add_argument(
+            '--chunk-size',
+            action='store',
+            dest='chunk_size',
+            type=int,
+            default=ChunkedCsvExport.CHUNK_SIZE,
+            help="Number of submissions in each chunk of the export"
+        )
+        parser.add_argument(
+            '--format',
+            action='store',
+            dest='format',
+            choices=['csv', 'parquet'],
+            default='csv',
+            help=(
+                "Format of the generated files. Parquet files have typed columns, "
+                "but require the pyarrow package and are not exported in chunks."
+            )
+        )
+
     @property
     def history(self):
         """
@@ -57,6 +104,14 @@ class Command(BaseCommand):
             course_id (unicode): The ID of the course to use.
             s3_bucket_name (unicode): The name of the S3 bucket to upload to.
 
+        Keyword Arguments:
+            work_dir (unicode): Directory in which to generate the CSV files, in a
+                subdirectory for the course. The subdirectory is kept if the command
+                fails, so the export can be resumed.
+            workers (int): Number of chunks to export in parallel.
+            chunk_size (int): Number of submissions in each chunk.
+            format (unicode): Either 'csv' or 'parquet'.
+
         Raises:
             CommandError
 
@@ -69,46 +124,108 @@ class Command(BaseCommand):
             course_id = course_id.decode('utf-8')
         if isinstance(s3_bucket, bytes):
             s3_bucket = s3_bucket.decode('utf-8')
-        csv_dir = tempfile.mkdtemp()
-
+        work_dir = options.get('work_dir')
+        if work_dir:
+            # The files are generated in a subdirectory, so that cleaning up never removes
+            # the other files of the work directory. Its name only depends on the course,
+            # so that running the command again resumes the export.
+            csv_dir = os.path.join(work_dir, self._work_subdir_name(course_id))
+            os.makedirs(csv_dir, exist_ok=True)
+        else:
+            csv_dir = tempfile.mkdtemp()
+
+        upload_succeeded = False
         try:
-            print(f"Generating CSV files for course '{course_id}'")
-            self._dump_to_csv(course_id, csv_dir)
-            print(f"Creating archive of CSV files in {csv_dir}")
-            archive_path = self._create_archive(csv_dir)
+            if options.get('format') == 'parquet':
+                print(f"Generating Parquet files for course '{course_id}'")
+                self._dump_to_parquet(course_id, csv_dir)
+                output_paths = self.OUTPUT_PARQUET_PATHS
+            else:
+                print(f"Generating CSV files for course '{course_id}'")
+                self._dump_to_csv(
+                    course_id, csv_dir,
+                    max_workers=options.get('workers', 1),
+                    chunk_size=options.get('chunk_size'),
+                )
+                output_paths = self.OUTPUT_CSV_PATHS
+            print(f"Creating archive of files in {csv_dir}")
+            archive_path = self._create_archive(csv_dir, output_paths)
             print(f"Uploading {archive_path} to {s3_bucket}/{course_id}")
             url = self._upload(course_id, archive_path, s3_bucket)
+            upload_succeeded = True
             print("== Upload successful ==")
             print(f"Download URL (expires in {self.URL_EXPIRATION_HOURS} hours):\n{url}")
         finally:
             # Assume that the archive was created in the directory,
             # so to clean up we just need to delete the directory.
-            shutil.rmtree(csv_dir)
+            # The subdirectory of a work directory given by the user is
+            # kept after a failure, so that the export can be resumed.
+            if upload_succeeded or not work_dir:
+                shutil.rmtree(csv_dir)
+
+    @staticmethod
+    def _work_subdir_name(course_id):
+        """
+        Return the name of the subdirectory of the work directory in which the files of a course are generated.
+        """
+        return "upload_oa_data-{}".format(re.sub(r'[^\w.-]+', '_', course_id))
 
-    def _dump_to_csv(self, course_id, csv_dir):
+    def _dump_to_csv(self, course_id, csv_dir, max_workers=1, chunk_size=None):
         """
         Create CSV files for submission/assessment data in a directory.
 
+        Chunks of the course that were exported by a previous, interrupted
+        run in the same directory are not exported again.
+
         Args:
             course_id (unicode): The ID of the course to dump data from.
             csv_dir (unicode): The absolute path to the directory in which to create CSV files.
 
+        Keyword Arguments:
+            max_workers (int): Number of chunks to export in parallel.
+            chunk_size (int): Number of submissions in each chunk.
+
+        Returns:
+            None
+        """
+        export = ChunkedCsvExport(
+            course_id,
+            csv_dir,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+            progress_callback=self._progress_callback,
+        )
+        export.export()
+
+    def _dump_to_parquet(self, course_id, output_dir):
+        """
+        Create Parquet files for submission/assessment data in a directory.
+
+        Args:
+            course_id (unicode): The ID of the course to dump data from.
+            output_dir (unicode): The absolute path to the directory in which to create Parquet files.
+
         Returns:
             None
         """
         output_streams = {
-            name: open(os.path.join(csv_dir, rel_path), 'w')  # pylint: disable=consider-using-with
-            for name, rel_path in self.OUTPUT_CSV_PATHS.items()
+            name: open(os.path.join(output_dir, rel_path), 'wb')  # pylint: disable=consider-using-with
+            for name, rel_path in self.OUTPUT_PARQUET_PATHS.items()
         }
-        csv_writer = CsvWriter(output_streams, self._progress_callback)
-        csv_writer.write_to_csv(course_id)
+        try:
+            ParquetWriter(output_streams, self._progress_callback).write_to_csv(course_id)
+        finally:
+            for output_stream in output_streams.values():
+                output_stream.close()
 
-    def _create_archive(self, dir_path):
+    def _create_archive(self, dir_path, output_paths=None):
         """
         Create an archive of a directory.
 
         Args:
             dir_path (unicode): The absolute path to the directory containing the CSV files.
+            output_paths (dict): Relative paths of the files to archive, keyed by model.
+                Defaults to the CSV files.
 
         Returns:
             unicode: Absolute path to the archive.
@@ -119,7 +236,7 @@ class Command(BaseCommand):
         )
         tarball_path = os.path.join(dir_path, tarball_name)
         with tarfile.open(tarball_path, "w:gz") as tar:
-            for rel_path in self.OUTPUT_CSV_PATHS.values():
+            for rel_path in (output_paths or self.OUTPUT_CSV_PATHS).values():
                 tar.add(os.path.join(dir_path, rel_path), arcname=rel_path)
         return tarball_path
 
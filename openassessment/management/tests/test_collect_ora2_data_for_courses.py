@@ -0,0 +1,96 @@
+""" Test the collect_ora2_data_for_courses management command """
+
+import csv
+import json
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from openassessment.test_utils import CacheResetTest
+
+
+@patch('openassessment.management.commands.collect_ora2_data_for_courses.OraAggregateData.collect_ora2_data')
+class CollectOra2DataForCoursesTest(CacheResetTest):
+    """ Test collect_ora2_data_for_courses output and error conditions """
+
+    HEADER = ["submission_uuid", "feedback"]
+
+    def setUp(self):
+        super().setUp()
+        self.output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.output_dir)
+
+    def _collect_ora2_data(self, course_id):
+        """ Fake data with one row per course, failing for the 'broken' course """
+        if course_id == 'broken':
+            raise ValueError('Oh no')
+        return self.HEADER, [[f"{course_id}-uuid", "𝓨𝓸𝓾"]]
+
+    def _read_manifest(self):
+        with open(os.path.join(self.output_dir, 'manifest.json'), encoding='utf-8') as manifest_file:
+            return json.load(manifest_file)['courses']
+
+    def test_one_file_per_course(self, mock_data):
+        mock_data.side_effect = self._collect_ora2_data
+
+        call_command('collect_ora2_data_for_courses', 'edX/Demo/1', 'course-v1:edX+Demo+2', output_dir=self.output_dir)
+
+        manifest = self._read_manifest()
+        self.assertEqual([course['course_id'] for course in manifest], ['edX/Demo/1', 'course-v1:edX+Demo+2'])
+        self.assertEqual(
+            [course['file_name'] for course in manifest],
+            ['edX-Demo-1-ora2.csv', 'course-v1:edX+Demo+2-ora2.csv']
+        )
+        for course in manifest:
+            self.assertEqual(course['rows'], 1)
+            self.assertIsNone(course['error'])
+            with open(os.path.join(self.output_dir, course['file_name']), encoding='utf-8', newline='') as csv_file:
+                self.assertEqual(
+                    list(csv.reader(csv_file)),
+                    [self.HEADER, [f"{course['course_id']}-uuid", "𝓨𝓸𝓾"]]
+                )
+
+    def test_course_ids_file(self, mock_data):
+        mock_data.side_effect = self._collect_ora2_data
+        course_ids_path = os.path.join(self.output_dir, 'courses.txt')
+        with open(course_ids_path, 'w', encoding='utf-8') as course_ids_file:
+            course_ids_file.write("# Courses to export\nedX/Demo/1\n\nedX/Demo/2\nedX/Demo/1\n")
+
+        call_command('collect_ora2_data_for_courses', course_ids_file=course_ids_path, output_dir=self.output_dir)
+
+        self.assertEqual([course['course_id'] for course in self._read_manifest()], ['edX/Demo/1', 'edX/Demo/2'])
+
+    def test_failures_are_summarized(self, mock_data):
+        mock_data.side_effect = self._collect_ora2_data
+
+        with self.assertRaisesRegex(CommandError, '1 of 3 courses'):
+            call_command('collect_ora2_data_for_courses', 'edX/Demo/1', 'broken', 'edX/Demo/2',
+                         output_dir=self.output_dir)
+
+        # The other courses are still exported
+        manifest = self._read_manifest()
+        self.assertEqual([course['error'] for course in manifest], [None, "ValueError('Oh no')", None])
+        self.assertTrue(os.path.exists(os.path.join(self.output_dir, 'edX-Demo-2-ora2.csv')))
+
+    @patch('openassessment.management.commands.collect_ora2_data_for_courses.connections')
+    @patch('openassessment.management.commands.collect_ora2_data_for_courses.ProcessPoolExecutor', ThreadPoolExecutor)
+    def test_workers(self, mock_connections, mock_data):
+        mock_data.side_effect = self._collect_ora2_data
+        course_ids = [f"edX/Demo/{index}" for index in range(5)]
+
+        call_command('collect_ora2_data_for_courses', *course_ids, output_dir=self.output_dir, workers=3)
+
+        mock_connections.close_all.assert_called_once_with()
+        manifest = self._read_manifest()
+        self.assertEqual([course['course_id'] for course in manifest], course_ids)
+        self.assertEqual(sum(course['rows'] for course in manifest), 5)
+
+    def test_no_course_ids(self, mock_data):
+        with self.assertRaises(CommandError):
+            call_command('collect_ora2_data_for_courses', output_dir=self.output_dir)
+        mock_data.assert_not_called()
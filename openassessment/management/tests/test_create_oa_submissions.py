@@ -1,16 +1,28 @@
 """
 Tests for the management command that creates dummy submissions.
 """
+from collections import Counter
+from unittest import mock
 
-from django.test import TestCase
+from django.core.management.base import CommandError
 
 from submissions import api as sub_api
+from submissions.models import Submission
 from openassessment.assessment.api import peer as peer_api
 from openassessment.assessment.api import self as self_api
+from openassessment.assessment.models import (
+    Assessment,
+    AssessmentPart,
+    PeerWorkflow,
+    PeerWorkflowItem,
+    StaffWorkflow,
+)
 from openassessment.management.commands import create_oa_submissions
+from openassessment.test_utils import CacheResetTest
+from openassessment.workflow.models import AssessmentWorkflow, AssessmentWorkflowStep
 
 
-class CreateSubmissionsTest(TestCase):
+class CreateSubmissionsTest(CacheResetTest):
     """ Test the submissions of open assessments. """
 
     def test_create_submissions(self):
@@ -48,3 +60,60 @@ class CreateSubmissionsTest(TestCase):
             # Verify that the assessment exists and has content
             self.assertIsNot(assessment, None)
             self.assertGreater(assessment['points_possible'], 0)
+
+    def test_create_submissions_in_bulk(self):
+        """ Bulk creation leaves the same state as creation through the APIs. """
+        for item_id, bulk in (('api_item', False), ('bulk_item', True)):
+            cmd = create_oa_submissions.Command(**{'self_assessment_required': True})
+            with mock.patch('builtins.print') as mock_print:
+                cmd.handle("test_course", item_id, "7", 50, bulk=bulk, batch_size=3)
+            self.assertEqual(len(cmd.student_items), 7)
+
+        # 4 submissions with 3 peer assessments each, and 7 self assessments
+        mock_print.assert_called_with("19 assessments being completed for 7 submissions")
+
+        self.assertEqual(
+            _item_state("test_course", "bulk_item"),
+            _item_state("test_course", "api_item"),
+        )
+
+    def test_create_submissions_in_processes_sqlite(self):
+        """ The batches can't be created in several processes with SQLite. """
+        cmd = create_oa_submissions.Command()
+        with self.assertRaisesMessage(CommandError, 'requires a database server'):
+            cmd.handle("test_course", "test_item", "5", 100, bulk=True, processes=2)
+
+
+def _item_state(course_id, item_id):
+    """ Summarize the submissions, workflows and assessments of an item, without their ids and times. """
+    submissions = Submission.objects.filter(student_item__course_id=course_id, student_item__item_id=item_id)
+    submission_uuids = [str(uuid) for uuid in submissions.values_list('uuid', flat=True)]
+    workflows = AssessmentWorkflow.objects.filter(submission_uuid__in=submission_uuids)
+    assessments = Assessment.objects.filter(submission_uuid__in=submission_uuids)
+    return {
+        'scorer_attempts': sorted(
+            submissions.filter(student_item__student_id__startswith='test_')
+            .values_list('student_item__student_id', 'attempt_number')
+        ),
+        'submissions': submissions.count(),
+        'workflows': Counter(workflows.values_list('status', flat=True)),
+        'steps': Counter(
+            (step.name, step.order_num, step.skipped, bool(step.submitter_completed_at),
+             bool(step.assessment_completed_at))
+            for step in AssessmentWorkflowStep.objects.filter(workflow__in=workflows)
+        ),
+        'peer_workflows': Counter(
+            (workflow.completed_graded_by_count, bool(workflow.grading_completed_at), bool(workflow.completed_at))
+            for workflow in PeerWorkflow.objects.filter(submission_uuid__in=submission_uuids)
+        ),
+        'peer_workflow_items': Counter(
+            (bool(item.assessment_id), item.scored, bool(item.started_at))
+            for item in PeerWorkflowItem.objects.filter(submission_uuid__in=submission_uuids)
+        ),
+        'assessments': Counter(
+            (assessment.score_type, assessment.points_earned, bool(assessment.feedback))
+            for assessment in assessments
+        ),
+        'assessment_parts': AssessmentPart.objects.filter(assessment__in=assessments).count(),
+        'staff_workflows': StaffWorkflow.objects.filter(submission_uuid__in=submission_uuids).count(),
+    }
@@ -1,4 +1,5 @@
 """ Tests for the create_oa_submissions_from_file management command """
+from collections import Counter
 from os.path import join
 from contextlib import contextmanager
 import tempfile
@@ -9,12 +10,16 @@ from django.core.management import call_command
 from django.core.management.base import CommandError
 from django.test import TestCase
 from submissions import api as sub_api
+from submissions.models import Score, ScoreAnnotation, ScoreSummary, Submission
 
 from openassessment.assessment.api import staff as staff_api
+from openassessment.assessment.models import Assessment, AssessmentPart, StaffWorkflow
 from openassessment.staffgrader.models.submission_lock import SubmissionGradingLock
 from openassessment.workflow import api as workflow_api
 from openassessment.management.commands.create_oa_submissions_from_file import Command, SUPERUSER_USERNAME
+from openassessment.test_utils import CacheResetTest
 from openassessment.tests.factories import UserFactory
+from openassessment.workflow.models import AssessmentWorkflow, AssessmentWorkflowStep
 
 USERNAME_1 = 'user1'
 USERNAME_2 = 'user2'
@@ -111,7 +116,7 @@ USERNAME_TO_ANONYMOUS_ID = {
 }
 
 
-class CreateSubmissionsFromFileTest(TestCase):
+class CreateSubmissionsFromFileTest(CacheResetTest):
     """ Tests for create_oa_submissions_from_file """
 
     def setUp(self):
@@ -259,6 +264,37 @@ class CreateSubmissionsFromFileTest(TestCase):
         assert user_2_assessment is None
         assert SubmissionGradingLock.get_submission_lock(user_2_submission['uuid']) is None
 
+    def test_submit_ora_test_data_in_bulk(self):
+        """ Bulk creation leaves the same state as the submit step """
+        usernames = [f'learner{num}' for num in range(7)]
+        self.cmd.username_to_anonymous_user_id = dict(
+            USERNAME_TO_ANONYMOUS_ID, **{username: anonymous_user_id(username) for username in usernames}
+        )
+        submissions = [
+            dict(
+                SUBMISSION_CONFIG_1 if num % 2 else SUBMISSION_CONFIG_2,
+                username=username,
+                lockOwner=STAFF_USER_1 if num % 3 else None,
+            )
+            for num, username in enumerate(usernames)
+        ]
+        bulk_block_kwargs = dict(MOCK_BLOCK_KWARGS)
+        bulk_block_kwargs.update(display_name='ORA 2', location='block-v1@testX+bulk')
+        bulk_block = Mock(**bulk_block_kwargs)
+        self.cmd.display_name_to_block['ORA 2'] = bulk_block
+
+        self.cmd.submit_ora_test_data(COURSE_ID, [{'displayName': DISPLAY_NAME_1, 'submissions': submissions}])
+        self.cmd.submit_ora_test_data_in_bulk(
+            COURSE_ID, [{'displayName': 'ORA 2', 'submissions': submissions}], batch_size=3
+        )
+
+        assert _item_state(bulk_block.location) == _item_state(self.mock_block.location)
+        for num, username in enumerate(usernames):
+            submission = sub_api.get_submissions(student_item(username, bulk_block.location))[0]
+            assert submission['answer']['parts'][0]['text'].startswith(username + '\n')
+            lock = SubmissionGradingLock.get_submission_lock(submission['uuid'])
+            assert (lock.owner_id if lock else None) == (anonymous_user_id(STAFF_USER_1) if num % 3 else None)
+
     def test_reset_ora_test_data(self):
         """ Test for behavior of the reset step"""
         self.cmd.reset_ora_test_data(COURSE_ID, CONFIG_1)
@@ -273,6 +309,47 @@ class CreateSubmissionsFromFileTest(TestCase):
             )
 
 
+def _item_state(item_id):
+    """ Summarize the submissions, workflows, locks, assessments and scores of an item, without ids and times """
+    submissions = Submission.objects.filter(student_item__course_id=COURSE_ID, student_item__item_id=item_id)
+    submission_uuids = [str(uuid) for uuid in submissions.values_list('uuid', flat=True)]
+    workflows = AssessmentWorkflow.objects.filter(submission_uuid__in=submission_uuids)
+    assessments = Assessment.objects.filter(submission_uuid__in=submission_uuids)
+    scores = Score.objects.filter(student_item__course_id=COURSE_ID, student_item__item_id=item_id)
+    return {
+        'attempts': Counter(submissions.values_list('attempt_number', flat=True)),
+        'workflows': Counter(workflows.values_list('status', flat=True)),
+        'steps': Counter(
+            (step.name, step.order_num, step.skipped, bool(step.submitter_completed_at),
+             bool(step.assessment_completed_at))
+            for step in AssessmentWorkflowStep.objects.filter(workflow__in=workflows)
+        ),
+        'staff_workflows': Counter(
+            (workflow.scorer_id, bool(workflow.grading_completed_at), bool(workflow.assessment))
+            for workflow in StaffWorkflow.objects.filter(submission_uuid__in=submission_uuids)
+        ),
+        'locks': Counter(
+            SubmissionGradingLock.objects.filter(submission_uuid__in=submission_uuids)
+            .values_list('owner_id', flat=True)
+        ),
+        'assessments': Counter(
+            (assessment.score_type, assessment.scorer_id, assessment.points_earned, assessment.feedback)
+            for assessment in assessments
+        ),
+        'assessment_parts': Counter(
+            AssessmentPart.objects.filter(assessment__in=assessments).values_list('feedback', flat=True)
+        ),
+        'scores': Counter(
+            (score.points_earned, score.points_possible, score.reset, bool(score.submission_id))
+            for score in scores
+        ),
+        'score_summaries': ScoreSummary.objects.filter(latest__in=scores).count(),
+        'score_annotations': Counter(
+            ScoreAnnotation.objects.filter(score__in=scores).values_list('annotation_type', 'creator', 'reason')
+        ),
+    }
+
+
 class CreateSubmissionsFromFileCallCommandTest(TestCase):
 
     def setUp(self):
@@ -330,6 +407,11 @@ class CreateSubmissionsFromFileCallCommandTest(TestCase):
         self.assert_submission_created(USERNAME_1, STAFF_USER_2, STAFF_USER_1)
         self.assert_submission_created(USERNAME_2, None, None)
 
+    def test_submit_bulk(self):
+        call_command('create_oa_submissions_from_file', COURSE_ID, 'filepath', '--submit', '--bulk')
+        self.assert_submission_created(USERNAME_1, STAFF_USER_2, STAFF_USER_1)
+        self.assert_submission_created(USERNAME_2, None, None)
+
     def test_reset(self):
         call_command('create_oa_submissions_from_file', COURSE_ID, 'filepath', '--reset')
         self.assert_reset_called(2)
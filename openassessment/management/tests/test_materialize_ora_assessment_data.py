@@ -0,0 +1,55 @@
+""" Test the materialize_ora_assessment_data management command """
+
+from io import StringIO
+from unittest.mock import Mock, patch
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import DatabaseError
+
+from opaque_keys.edx.keys import CourseKey
+
+from openassessment.test_utils import CacheResetTest
+
+COURSE_ID = 'course-v1:edX+Demo+2023'
+
+
+@patch('openassessment.management.commands.materialize_ora_assessment_data.modulestore')
+class MaterializeOraAssessmentDataTest(CacheResetTest):
+    """ Test materialize_ora_assessment_data arguments and output """
+
+    def _mock_block(self, rubrics, training_examples=0):
+        block = Mock()
+        block.materialize_assessment_data.return_value = {
+            'rubrics': rubrics,
+            'training_examples': training_examples,
+        }
+        return block
+
+    def test_materialize(self, mock_modulestore):
+        blocks = [self._mock_block(['hash-1']), self._mock_block(['hash-2', 'hash-3'], training_examples=2)]
+        failing_block = Mock()
+        failing_block.materialize_assessment_data.side_effect = DatabaseError
+        mock_modulestore.return_value.get_items.return_value = blocks + [failing_block]
+        out = StringIO()
+
+        call_command('materialize_ora_assessment_data', COURSE_ID, stdout=out)
+
+        mock_modulestore.return_value.get_items.assert_called_once_with(
+            CourseKey.from_string(COURSE_ID), qualifiers={'category': 'openassessment'}
+        )
+        for block in blocks:
+            block.materialize_assessment_data.assert_called_once_with()
+        self.assertIn(
+            "Materialized 3 rubrics and 2 training examples for 2 ORA blocks; 1 blocks failed", out.getvalue()
+        )
+
+    def test_invalid_course_id(self, mock_modulestore):
+        with self.assertRaises(CommandError):
+            call_command('materialize_ora_assessment_data', 'not a course id')
+        mock_modulestore.assert_not_called()
+
+    def test_no_modulestore(self, mock_modulestore):
+        mock_modulestore.side_effect = ModuleNotFoundError
+        with self.assertRaisesRegex(CommandError, "must be run from the LMS or Studio shell"):
+            call_command('materialize_ora_assessment_data', COURSE_ID)
@@ -0,0 +1,41 @@
+""" Test the process_workflow_updates management command """
+
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test.utils import override_settings
+
+from openassessment.test_utils import CacheResetTest
+from openassessment.workflow.models import PendingWorkflowUpdate
+
+
+@override_settings(ORA2_WORKFLOW_UPDATE_BACKEND='outbox', ORA2_WORKFLOW_UPDATE_COALESCE_SECONDS=0)
+@patch('openassessment.workflow.deferred.update_workflow')
+class ProcessWorkflowUpdatesTest(CacheResetTest):
+    """ Test process_workflow_updates batching and output """
+
+    def setUp(self):
+        super().setUp()
+        PendingWorkflowUpdate.objects.bulk_create([
+            PendingWorkflowUpdate(submission_uuid=f"uuid-{index}") for index in range(5)
+        ])
+
+    def test_process_all(self, mock_update):
+        out = StringIO()
+        call_command('process_workflow_updates', batch_size=2, stdout=out)
+
+        self.assertCountEqual(
+            [call_args.args[0] for call_args in mock_update.call_args_list],
+            [f"uuid-{index}" for index in range(5)]
+        )
+        self.assertFalse(PendingWorkflowUpdate.objects.exists())
+        self.assertIn("Updated 5 workflows in 3 batches (outbox backend); 0 updates pending", out.getvalue())
+
+    def test_max_batches(self, mock_update):
+        out = StringIO()
+        call_command('process_workflow_updates', batch_size=2, max_batches=1, stdout=out)
+
+        self.assertEqual(mock_update.call_count, 2)
+        self.assertEqual(PendingWorkflowUpdate.objects.count(), 3)
+        self.assertIn("Updated 2 workflows in 1 batches (outbox backend); 3 updates pending", out.getvalue())
@@ -0,0 +1,76 @@
+""" Test the reset_ora_student_state management command """
+
+import os
+import tempfile
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from openassessment.test_utils import CacheResetTest
+
+SUMMARY = {
+    'students': 2,
+    'submissions': 2,
+    'workflows_cancelled': 2,
+    'files_removed': 1,
+    'team_submissions': 0,
+}
+
+
+@patch('openassessment.management.commands.reset_ora_student_state.StudentStateReset')
+class ResetOraStudentStateTest(CacheResetTest):
+    """ Test reset_ora_student_state arguments and output """
+
+    def test_reset_students(self, mock_reset):
+        mock_reset.return_value.reset.return_value = SUMMARY
+        out = StringIO()
+
+        call_command(
+            'reset_ora_student_state', 'edX/Demo/1', 'item', 'Alice', 'Bob',
+            requesting_user_id='staff', workers=4, batch_size=10, stdout=out
+        )
+
+        mock_reset.assert_called_once()
+        self.assertEqual(mock_reset.call_args.args, ('edX/Demo/1', 'item', 'staff'))
+        self.assertEqual(mock_reset.call_args.kwargs['max_workers'], 4)
+        self.assertEqual(mock_reset.call_args.kwargs['batch_size'], 10)
+        mock_reset.return_value.reset.assert_called_once_with(['Alice', 'Bob'])
+        self.assertIn("Reset 2 learners", out.getvalue())
+
+    def test_student_ids_file(self, mock_reset):
+        mock_reset.return_value.reset.return_value = SUMMARY
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as student_ids_file:
+            student_ids_file.write("# Learners to reset\nAlice\n\nBob\n")
+        self.addCleanup(os.remove, student_ids_file.name)
+
+        call_command(
+            'reset_ora_student_state', 'edX/Demo/1', 'item', 'Carol',
+            student_ids_file=student_ids_file.name, requesting_user_id='staff', stdout=StringIO()
+        )
+
+        mock_reset.return_value.reset.assert_called_once_with(['Carol', 'Alice', 'Bob'])
+
+    def test_all_students(self, mock_reset):
+        mock_reset.return_value.reset.return_value = SUMMARY
+
+        call_command(
+            'reset_ora_student_state', 'edX/Demo/1', 'item', all_students=True,
+            requesting_user_id='staff', stdout=StringIO()
+        )
+
+        mock_reset.return_value.reset.assert_called_once_with(None)
+
+    def test_no_students(self, mock_reset):
+        with self.assertRaises(CommandError):
+            call_command('reset_ora_student_state', 'edX/Demo/1', 'item', requesting_user_id='staff')
+        mock_reset.assert_not_called()
+
+    def test_students_and_all(self, mock_reset):
+        with self.assertRaises(CommandError):
+            call_command(
+                'reset_ora_student_state', 'edX/Demo/1', 'item', 'Alice',
+                all_students=True, requesting_user_id='staff'
+            )
+        mock_reset.assert_not_called()
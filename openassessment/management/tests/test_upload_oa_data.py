@@ -3,7 +3,9 @@ Tests for management command that uploads submission/assessment data.
 """
 
 
+import os
 import tarfile
+import tempfile
 from io import BytesIO
 from urllib.parse import urlparse
 
@@ -83,3 +85,49 @@ class UploadDataTest(CacheResetTest):
             ["s3.eu-west-1.amazonaws.com", "s3.amazonaws.com"]
         )
         self.assertIn(f"/{self.BUCKET_NAME}", parsed_url.path)
+
+    @moto.mock_s3
+    def test_upload_parquet(self):
+        conn = boto3.client("s3")
+        conn.create_bucket(Bucket=self.BUCKET_NAME)
+
+        for index in range(5):
+            student_item = {
+                'student_id': f"test_user_{index}",
+                'course_id': self.COURSE_ID,
+                'item_id': 'test_item',
+                'item_type': 'openassessment',
+            }
+            submission = sub_api.create_submission(student_item, f"test submission {index}")
+            workflow_api.create_workflow(submission['uuid'], ['peer', 'self'])
+
+        cmd = upload_oa_data.Command()
+        cmd.handle(self.COURSE_ID, self.BUCKET_NAME, format='parquet')
+
+        # Expect that the archive contains a Parquet file for each table
+        self.assertEqual(len(cmd.history), 1)
+        contents = BytesIO(conn.get_object(
+            Bucket=self.BUCKET_NAME,
+            Key=cmd.history[0]['key']
+        )["Body"].read())
+        with tarfile.open(mode="r:gz", fileobj=contents) as tar:
+            file_names = [member.name for member in tar.getmembers()]
+        for csv_name in self.CSV_NAMES:
+            self.assertIn(csv_name.replace('.csv', '.parquet'), file_names)
+
+    @moto.mock_s3
+    def test_upload_keeps_work_dir(self):
+        conn = boto3.client("s3")
+        conn.create_bucket(Bucket=self.BUCKET_NAME)
+
+        with tempfile.TemporaryDirectory() as work_dir:
+            # Files of the user in the work directory are not removed by the clean up
+            user_file_path = os.path.join(work_dir, 'notes.txt')
+            with open(user_file_path, 'w') as user_file:
+                user_file.write('keep me')
+
+            cmd = upload_oa_data.Command()
+            cmd.handle(self.COURSE_ID, self.BUCKET_NAME, work_dir=work_dir)
+
+            self.assertEqual(len(cmd.history), 1)
+            self.assertEqual(os.listdir(work_dir), ['notes.txt'])
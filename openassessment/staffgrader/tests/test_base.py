@@ -19,9 +19,9 @@ class StaffGraderMixinTestBase(XBlockHandlerTestCase):
         self.maxDiff = None
 
     @contextmanager
-    def _mock_get_url_by_file_key(self, xblock):
-        """ Mock the submission_mixin._get_url_by_file_key method since it relies on the backend. """
-        with patch.object(xblock.__class__, '_get_url_by_file_key') as mocked_get:
+    def _mock_get_download_url(self):
+        """ Mock the file upload api get_download_url function since it relies on the backend. """
+        with patch('openassessment.fileupload.api.get_download_url') as mocked_get:
             mocked_get.side_effect = lambda file_key: f"www.file_url.com/{file_key}"
             yield mocked_get
 
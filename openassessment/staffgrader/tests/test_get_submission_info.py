@@ -119,7 +119,7 @@ class GetSubmissionInfoTests(StaffGraderMixinTestBase):
         submission, _ = self._create_student_and_submission(student_id, test_answer)
 
         self.set_staff_user(xblock, 'Bob')
-        with self._mock_get_url_by_file_key(xblock):
+        with self._mock_get_download_url():
             response = self.request(xblock, {'submission_uuid': submission['uuid']})
 
         expected_submission_info = {
@@ -0,0 +1,201 @@
+"""
+Reset the state of many learners for an ORA problem at once, e.g. when
+instructors reset a whole problem or cohort.
+
+This does what `StaffAreaMixin.clear_student_state` does for one learner,
+in batches of learners: the workflows of a batch are cancelled with a few
+bulk queries, and their files are removed with the multi-object delete of
+the storage backend, instead of one call per submission and file.
+"""
+from concurrent.futures import ThreadPoolExecutor
+import logging
+from threading import Lock
+
+from django.db import connections
+from submissions import api as sub_api, team_api as team_sub_api
+from submissions.models import StudentItem, Submission
+
+from openassessment.fileupload.api import delete_shared_files_for_team, remove_files
+from openassessment.workflow import api as workflow_api
+from openassessment.workflow import team_api as team_workflow_api
+from openassessment.workflow.errors import AssessmentWorkflowInternalError
+
+logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
+
+
+class StudentStateReset:
+    """
+    Reset the state of many learners for an ORA problem.
+
+    For each learner, the workflow of their submissions is cancelled (removing them
+    from the grading pools), their files are removed from the storage, and their
+    score is reset and submissions orphaned, so that they can submit again. For team
+    assignments, the same is done for the team submissions of the learners, as a
+    whole team.
+    """
+
+    BATCH_SIZE = 500
+    CANCELLATION_COMMENTS = "Student state cleared"
+    TEAM_CANCELLATION_COMMENTS = "Student and team state cleared"
+
+    def __init__(
+        self, course_id, item_id, requesting_user_id, batch_size=None, max_workers=1, progress_callback=None
+    ):
+        """
+        Args:
+            course_id (unicode): The ID of the course.
+            item_id (unicode): The ID of the ORA block.
+            requesting_user_id (unicode): The anonymous ID of the user resetting the state.
+
+        Keyword Arguments:
+            batch_size (int): Number of learners reset together.
+            max_workers (int): Number of batches reset in parallel.
+            progress_callback (callable): Called after each batch with the number of
+                learners reset so far and the total number of learners.
+        """
+        self.course_id = course_id
+        self.item_id = item_id
+        self.requesting_user_id = requesting_user_id
+        self.batch_size = max(batch_size or self.BATCH_SIZE, 1)
+        self.max_workers = max(max_workers, 1)
+        self._progress_callback = progress_callback
+        self._lock = Lock()
+        self._summary = {}
+        self._total = 0
+
+    def reset(self, student_ids=None):
+        """
+        Reset the state of the given learners.
+
+        Keyword Arguments:
+            student_ids (list of unicode): The anonymous IDs of the learners.
+                Defaults to every learner who has submitted a response.
+
+        Returns:
+            dict with the number of 'students', 'submissions', 'workflows_cancelled',
+            'files_removed' and 'team_submissions' which were reset.
+        """
+        if student_ids is None:
+            student_ids = list(
+                StudentItem.objects.filter(
+                    course_id=self.course_id, item_id=self.item_id
+                ).values_list('student_id', flat=True)
+            )
+        # Drop duplicates, keeping the order in which the learners were given
+        student_ids = list(dict.fromkeys(student_ids))
+        batches = [
+            student_ids[start:start + self.batch_size]
+            for start in range(0, len(student_ids), self.batch_size)
+        ]
+
+        self._summary = {
+            'students': 0,
+            'submissions': 0,
+            'workflows_cancelled': 0,
+            'files_removed': 0,
+            'team_submissions': 0,
+        }
+        self._total = len(student_ids)
+        if self.max_workers == 1 or len(batches) <= 1:
+            for batch in batches:
+                self._reset_batch(batch)
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                # Consume the results so that errors in the workers are raised here
+                list(executor.map(self._reset_batch_in_thread, batches))
+        return dict(self._summary)
+
+    def _reset_batch_in_thread(self, student_ids):
+        """
+        Reset a batch from a worker thread, releasing the thread's database connections afterwards.
+        """
+        try:
+            self._reset_batch(student_ids)
+        finally:
+            connections.close_all()
+
+    def _reset_batch(self, student_ids):
+        """
+        Reset the state of a batch of learners.
+        """
+        submissions = list(
+            Submission.objects.filter(
+                student_item__course_id=self.course_id,
+                student_item__item_id=self.item_id,
+                student_item__student_id__in=student_ids,
+            ).select_related('student_item', 'team_submission')
+        )
+
+        individual_submissions = [submission for submission in submissions if submission.team_submission is None]
+        team_submissions = {
+            submission.team_submission.uuid: submission.team_submission
+            for submission in submissions if submission.team_submission is not None
+        }
+
+        # Remove the submissions from the grading pools
+        cancelled_uuids = workflow_api.cancel_workflows(
+            [str(submission.uuid) for submission in individual_submissions],
+            self.CANCELLATION_COMMENTS,
+            self.requesting_user_id,
+        )
+
+        # Delete the files from the backend
+        file_keys = [
+            key
+            for submission in individual_submissions
+            if isinstance(submission.answer, dict)
+            for key in submission.answer.get('file_keys', [])
+        ]
+        if file_keys:
+            remove_files(file_keys)
+
+        # Tell the submissions API to orphan the submissions to prevent them from being accessed
+        team_student_ids = set()
+        for team_submission_uuid, team_submission in team_submissions.items():
+            team_student_ids.update(self._reset_team(str(team_submission_uuid), team_submission.team_id))
+        for student_id in student_ids:
+            if student_id not in team_student_ids:
+                sub_api.reset_score(student_id, self.course_id, self.item_id, clear_state=True)
+
+        with self._lock:
+            self._summary['students'] += len(student_ids)
+            self._summary['submissions'] += len(individual_submissions)
+            self._summary['workflows_cancelled'] += len(cancelled_uuids)
+            self._summary['files_removed'] += len(file_keys)
+            self._summary['team_submissions'] += len(team_submissions)
+            students_reset = self._summary['students']
+        logger.info(
+            "Reset the state of %d of %d learners for course %s item %s",
+            students_reset, self._total, self.course_id, self.item_id
+        )
+        if self._progress_callback is not None:
+            self._progress_callback(students_reset, self._total)
+
+    def _reset_team(self, team_submission_uuid, team_id):
+        """
+        Reset the state of a team, as `StaffAreaMixin.clear_team_state` does.
+
+        Returns:
+            list of unicode: The anonymous IDs of the members of the team, whose score was reset.
+        """
+        try:
+            team_workflow_api.cancel_workflow(
+                team_submission_uuid, self.TEAM_CANCELLATION_COMMENTS, self.requesting_user_id
+            )
+        except AssessmentWorkflowInternalError:
+            # Already logged: the team state is reset anyway, as when staff reset a single learner
+            pass
+        delete_shared_files_for_team(self.course_id, self.item_id, team_id)
+        student_ids = team_sub_api.get_team_submission_student_ids(team_submission_uuid)
+        team_sub_api.reset_scores(team_submission_uuid, clear_state=True)
+        return student_ids
+
+
+def reset_student_states(course_id, item_id, requesting_user_id, student_ids=None, **kwargs):
+    """
+    Reset the state of many learners for an ORA problem (see `StudentStateReset`).
+
+    Returns:
+        dict: A summary of what was reset.
+    """
+    return StudentStateReset(course_id, item_id, requesting_user_id, **kwargs).reset(student_ids)
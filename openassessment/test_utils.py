@@ -9,7 +9,19 @@ from django.test import TestCase, TransactionTestCase
 
 def _clear_all_caches():
     """Clear the default cache and any custom caches."""
+    # pylint: disable=import-outside-toplevel
+    from openassessment.assessment.api.student_training import clear_training_set_cache
+    from openassessment.instrumentation import clear_sinks
+    from openassessment.workflow.deferred import clear_update_backends
+    from openassessment.xblock.compiled_config import clear_compiled_configs
+    from openassessment.xblock.config_mixin import clear_feature_flag_cache
+
     cache.clear()
+    clear_training_set_cache()
+    clear_compiled_configs()
+    clear_update_backends()
+    clear_feature_flag_cache()
+    clear_sinks()
 
 
 class CacheResetTest(TestCase):
@@ -8,19 +8,25 @@ from copy import deepcopy
 from io import StringIO, BytesIO, TextIOWrapper
 import json
 import os.path
+import shutil
+import tempfile
 import zipfile
 from unittest.mock import call, Mock, patch
 
 import ddt
 from freezegun import freeze_time
+import pyarrow
+import pyarrow.parquet
 
 from django.core.management import call_command
+from django.db import DatabaseError
 from django.test import TestCase
 
 from submissions import api as sub_api, team_api as team_sub_api
 import openassessment.assessment.api.peer as peer_api
 from openassessment.data import (
-    CsvWriter, OraAggregateData, OraDownloadData, SubmissionFileUpload, OraSubmissionAnswerFactory,
+    ChunkedCsvExport, CsvWriter, ParquetWriter, OraAggregateData, OraDownloadData, SubmissionFileUpload,
+    OraSubmissionAnswerFactory,
     VersionNotFoundException, ZippedListSubmissionAnswer, OraSubmissionAnswer, ZIPPED_LIST_SUBMISSION_VERSIONS,
     TextOnlySubmissionAnswer, FileMissingException, map_anonymized_ids_to_usernames
 )
@@ -303,6 +309,127 @@ class CsvWriterTest(TransactionCacheResetTest):
         call_command('loaddata', fixture_path)
 
 
+class ParquetWriterTest(TransactionCacheResetTest):
+    """
+    Test for writing openassessment data to Parquet.
+    """
+    COURSE_ID = "edX/Enchantment_101/April_1"
+
+    def setUp(self):
+        super().setUp()
+        call_command(
+            'loaddata',
+            os.path.join(os.path.dirname(__file__), 'data', 'db_fixtures', 'feedback_on_assessment.json')
+        )
+
+    def _write(self, writer_class, stream_class):
+        output_streams = {model: stream_class() for model in CsvWriter.MODELS}
+        writer_class(output_streams).write_to_csv(self.COURSE_ID)
+        return output_streams
+
+    def test_write_to_parquet(self):
+        csv_streams = self._write(CsvWriter, StringIO)
+        parquet_streams = self._write(ParquetWriter, BytesIO)
+
+        for model in CsvWriter.MODELS:
+            table = pyarrow.parquet.read_table(BytesIO(parquet_streams[model].getvalue()))
+            self.assertEqual(table.column_names, CsvWriter.HEADERS[model])
+
+            # The values are the same as in the CSV files, but typed
+            csv_rows = list(csv.reader(StringIO(csv_streams[model].getvalue())))[1:]
+            parquet_rows = [
+                [str(row[column]) for column in table.column_names]
+                for row in table.to_pylist()
+            ]
+            self.assertCountEqual(parquet_rows, csv_rows)
+            self.assertGreater(len(parquet_rows), 0, msg=model)
+
+        assessment_table = pyarrow.parquet.read_table(BytesIO(parquet_streams['assessment'].getvalue()))
+        self.assertEqual(assessment_table.schema.field('points_possible').type, pyarrow.int64())
+        self.assertEqual(assessment_table.schema.field('scored_at').type, pyarrow.timestamp('us', tz='UTC'))
+
+    @patch.object(ParquetWriter, 'ROW_GROUP_SIZE', 1)
+    def test_row_groups(self):
+        parquet_streams = self._write(ParquetWriter, BytesIO)
+        parquet_file = pyarrow.parquet.ParquetFile(BytesIO(parquet_streams['submission'].getvalue()))
+        self.assertGreater(parquet_file.num_row_groups, 1)
+        self.assertEqual(parquet_file.num_row_groups, parquet_file.metadata.num_rows)
+
+
+class ChunkedCsvExportTest(TransactionCacheResetTest):
+    """
+    Test for exporting openassessment data to CSV in resumable chunks.
+    """
+    COURSE_ID = 'test_course'
+
+    def setUp(self):
+        super().setUp()
+        self.work_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.work_dir)
+
+        for index in range(5):
+            student_item = {
+                'student_id': f"test_user_{index}",
+                'course_id': self.COURSE_ID,
+                'item_id': 'test_item',
+                'item_type': 'openassessment',
+            }
+            submission = sub_api.create_submission(student_item, f"test submission {index}")
+            workflow_api.create_workflow(submission['uuid'], ['peer', 'self'])
+
+    def _expected_csv(self, model):
+        output_streams = {model: StringIO()}
+        CsvWriter(output_streams).write_to_csv(self.COURSE_ID)
+        return sorted(csv.reader(StringIO(output_streams[model].getvalue())))
+
+    def _exported_csv(self, output_paths, model):
+        with open(output_paths[model], encoding='utf-8', newline='') as output_file:
+            return sorted(csv.reader(output_file))
+
+    def test_export(self):
+        output_paths = ChunkedCsvExport(self.COURSE_ID, self.work_dir, chunk_size=2).export()
+
+        with open(os.path.join(self.work_dir, ChunkedCsvExport.CHECKPOINT_FILE_NAME)) as checkpoint_file:
+            checkpoint = json.load(checkpoint_file)
+        self.assertEqual(len(checkpoint['chunks']), 3)
+        self.assertEqual(checkpoint['completed'], [0, 1, 2])
+
+        for model in CsvWriter.MODELS:
+            self.assertEqual(self._exported_csv(output_paths, model), self._expected_csv(model))
+
+    def test_export_no_workflows(self):
+        output_paths = ChunkedCsvExport('other_course', self.work_dir).export()
+        for model in CsvWriter.MODELS:
+            self.assertEqual(self._exported_csv(output_paths, model), [CsvWriter.HEADERS[model]])
+
+    def test_export_resumes(self):
+        write_to_csv = CsvWriter.write_to_csv
+        chunks_written = []
+
+        def interrupted_write_to_csv(writer, course_id, workflow_id_range=None, write_headers=True):
+            chunks_written.append(workflow_id_range)
+            if len(chunks_written) == 2:
+                raise DatabaseError("Connection lost")
+            write_to_csv(writer, course_id, workflow_id_range=workflow_id_range, write_headers=write_headers)
+
+        with patch.object(CsvWriter, 'write_to_csv', interrupted_write_to_csv):
+            with self.assertRaises(DatabaseError):
+                ChunkedCsvExport(self.COURSE_ID, self.work_dir, chunk_size=2).export()
+
+            # The first chunk is complete, so only the remaining chunks are written again
+            output_paths = ChunkedCsvExport(self.COURSE_ID, self.work_dir, chunk_size=2).export()
+
+        self.assertEqual(len(chunks_written), 4)
+        self.assertEqual(chunks_written[1], chunks_written[2])
+        for model in CsvWriter.MODELS:
+            self.assertEqual(self._exported_csv(output_paths, model), self._expected_csv(model))
+
+    def test_export_parallel(self):
+        output_paths = ChunkedCsvExport(self.COURSE_ID, self.work_dir, chunk_size=1, max_workers=3).export()
+        for model in CsvWriter.MODELS:
+            self.assertEqual(self._exported_csv(output_paths, model), self._expected_csv(model))
+
+
 @ddt.ddt
 @patch.dict('django.conf.settings.FEATURES', {'ENABLE_ORA_USERNAMES_ON_DATA_EXPORT': True})
 class TestOraAggregateData(TransactionCacheResetTest):
@@ -797,6 +924,7 @@ class TestOraAggregateDataIntegration(TransactionCacheResetTest):
 
     def test_collect_ora2_summary(self):
         headers, data = OraAggregateData.collect_ora2_summary(COURSE_ID)
+        data = list(data)
 
         self.assertEqual(headers, [
             'block_name',
@@ -861,6 +989,30 @@ class TestOraAggregateDataIntegration(TransactionCacheResetTest):
             2,
         ])
 
+    def test_collect_ora2_summary_query_count(self):
+        # Loading more workflows should not need any additional queries
+        _, data = OraAggregateData.collect_ora2_summary(COURSE_ID)
+        with self.assertNumQueries(5):
+            self.assertEqual(len(list(data)), 2)
+
+        for student_number in range(3):
+            self._create_submission(dict(
+                student_id=self._other_student(student_number),
+                course_id=COURSE_ID,
+                item_id=ITEM_ID,
+                item_type="openassessment"
+            ))
+        _, data = OraAggregateData.collect_ora2_summary(COURSE_ID)
+        with self.assertNumQueries(5):
+            self.assertEqual(len(list(data)), 5)
+
+    @patch.object(OraAggregateData, 'SUMMARY_QUERY_INTERVAL', 1)
+    def test_collect_ora2_summary_batches(self):
+        _, batched_data = OraAggregateData.collect_ora2_summary(COURSE_ID)
+        with patch.object(OraAggregateData, 'SUMMARY_QUERY_INTERVAL', 100):
+            _, data = OraAggregateData.collect_ora2_summary(COURSE_ID)
+            self.assertEqual(list(batched_data), list(data))
+
     def test_collect_ora2_responses(self):
         item_id2 = self._other_item(2)
         item_id3 = self._other_item(3)
@@ -1353,6 +1505,24 @@ class TestOraDownloadDataIntegration(TransactionCacheResetTest):
         collected_ora_files_data = list(OraDownloadData.collect_ora2_submission_files(COURSE_ID))
         assert collected_ora_files_data == self.submission_files_data
 
+    @patch(
+        'openassessment.data.OraDownloadData._map_ora_usage_keys_to_path_info',
+        Mock(return_value={ITEM_ID: ITEM_PATH_INFO})
+    )
+    @patch.object(OraDownloadData, 'SUBMISSIONS_BATCH_SIZE', 3)
+    def test_collect_ora2_submission_files__batches(self):
+        """
+        Test that `collect_ora2_submission_files` looks up student identifiers
+        one batch of submissions at a time, without changing the collected data.
+        """
+        self._override_default_answers()
+        with patch('openassessment.data.OraDownloadData._map_student_ids_to_path_ids') as mock_map_student_ids:
+            mock_map_student_ids.return_value = USERNAME_MAPPING
+            collected_ora_files_data = list(OraDownloadData.collect_ora2_submission_files(COURSE_ID))
+
+        assert collected_ora_files_data == self.submission_files_data
+        assert [len(args[0]) for args, _ in mock_map_student_ids.call_args_list] == [3, 1]
+
     @patch(
         'openassessment.data.OraDownloadData._map_ora_usage_keys_to_path_info',
         Mock(return_value={ITEM_ID: ITEM_PATH_INFO})
@@ -0,0 +1,79 @@
+"""
+Tests for the time it takes to import the XBlock and the assessment APIs,
+and for the modules they load.
+
+Each module is imported in a new Python process, once Django is set up, as
+the LMS does when it loads the XBlock. The benchmarks report the import times
+against the same budgets (`python -m benchmarks imports`).
+"""
+import json
+import os
+import subprocess
+import sys
+from unittest import TestCase
+
+import ddt
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Seconds allowed to import each module. Importing the XBlock takes about 0.15s,
+# and each API a few milliseconds, so the budgets leave room for slow test machines.
+IMPORT_TIME_BUDGETS = {
+    'openassessment.xblock.openassessmentblock': 1.0,
+    'openassessment.assessment.api.peer': 0.5,
+    'openassessment.assessment.api.self': 0.5,
+    'openassessment.assessment.api.staff': 0.5,
+    'openassessment.assessment.api.student_training': 0.5,
+    'openassessment.workflow.api': 0.5,
+}
+
+# Dependencies which are only needed by some configurations,
+# and must not be loaded by importing the XBlock or the APIs
+LAZY_DEPENDENCIES = ['boto3', 'botocore', 'google.cloud.storage', 'swiftclient']
+
+IMPORT_SCRIPT = """
+import importlib, json, sys, time
+import django
+django.setup()
+start = time.perf_counter()
+importlib.import_module(sys.argv[1])
+print(json.dumps({
+    'seconds': time.perf_counter() - start,
+    'modules': sorted(sys.modules),
+}))
+"""
+
+
+def import_module_in_subprocess(module_name):
+    """
+    Import a module in a new Python process.
+
+    Returns:
+        dict with keys 'seconds' (the time it took to import the module)
+        and 'modules' (the names of all modules loaded by the process).
+    """
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE='settings.test')
+    output = subprocess.check_output(
+        [sys.executable, '-c', IMPORT_SCRIPT, module_name],
+        cwd=REPO_ROOT, env=env, stderr=subprocess.DEVNULL,
+    )
+    return json.loads(output.decode('utf-8').strip().splitlines()[-1])
+
+
+@ddt.ddt
+class ImportTimeTest(TestCase):
+    """
+    Fail if importing the XBlock or the assessment APIs becomes slower than its budget,
+    or loads an optional dependency.
+    """
+
+    @ddt.data(*sorted(IMPORT_TIME_BUDGETS))
+    def test_import(self, module_name):
+        result = import_module_in_subprocess(module_name)
+        self.assertLess(
+            result['seconds'], IMPORT_TIME_BUDGETS[module_name],
+            f"Importing {module_name} took {result['seconds']:.3f}s"
+        )
+        self.assertIn(module_name, result['modules'])
+        for dependency in LAZY_DEPENDENCIES:
+            self.assertNotIn(dependency, result['modules'])
@@ -0,0 +1,107 @@
+"""
+Tests for the instrumentation of the XBlock handlers.
+"""
+from unittest.mock import Mock, patch
+
+from django.core.cache import cache, caches
+from django.test.utils import override_settings
+
+from openassessment import instrumentation
+from openassessment.assessment.models import Rubric
+from openassessment.fileupload import api as file_upload_api
+from openassessment.instrumentation import get_sink, instrument_handler
+from openassessment.test_utils import CacheResetTest
+from openassessment.xblock.test.base import XBlockHandlerTestCase, scenario
+
+
+def _handler():
+    """ A handler making a query, two cache lookups and a storage call. """
+    list(Rubric.objects.all())
+    cache.set('present', 1)
+    cache.get('present')
+    cache.get_many(['present', 'absent'])
+    file_upload_api.get_download_url('some/key')
+    return 'result'
+
+
+@override_settings(
+    ORA2_HANDLER_INSTRUMENTATION_SAMPLE_RATE=1,
+    ORA2_HANDLER_INSTRUMENTATION_SINK='memory',
+    ORA2_FILEUPLOAD_BACKEND='filesystem',
+)
+@patch('openassessment.fileupload.backends.filesystem.Backend.get_download_url', Mock(return_value='url'))
+class InstrumentHandlerTest(CacheResetTest):
+    """
+    Tests for `instrument_handler`.
+    """
+
+    def test_instrument_handler(self):
+        self.assertEqual(instrument_handler('handler', _handler), 'result')
+
+        records = get_sink().records
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]['handler'], 'handler')
+        self.assertGreaterEqual(records[0]['queries'], 1)
+        self.assertEqual(records[0]['cache_hits'], 2)
+        self.assertEqual(records[0]['cache_misses'], 1)
+        self.assertEqual(records[0]['storage_calls'], 1)
+        self.assertGreater(records[0]['wall_time'], 0)
+        # The lookup methods of the cache are restored
+        self.assertNotIn('get', vars(caches['default']))
+
+    @override_settings(ORA2_HANDLER_INSTRUMENTATION_SAMPLE_RATE=0)
+    def test_disabled(self):
+        self.assertEqual(instrument_handler('handler', _handler), 'result')
+        self.assertEqual(get_sink().records, [])
+
+    @patch('openassessment.instrumentation.random.random', Mock(return_value=0.6))
+    @override_settings(ORA2_HANDLER_INSTRUMENTATION_SAMPLE_RATE=0.5)
+    def test_not_sampled(self):
+        instrument_handler('handler', _handler)
+        self.assertEqual(get_sink().records, [])
+
+    def test_nested_handlers(self):
+        instrument_handler('outer', instrument_handler, 'inner', _handler)
+
+        records = get_sink().records
+        self.assertEqual([record['handler'] for record in records], ['outer'])
+        self.assertEqual(records[0]['storage_calls'], 1)
+
+    def test_handler_error(self):
+        with self.assertRaises(ValueError):
+            instrument_handler('handler', Mock(side_effect=ValueError))
+        self.assertEqual(len(get_sink().records), 1)
+
+    @patch.object(instrumentation.MemorySink, 'emit', Mock(side_effect=Exception))
+    def test_sink_error(self):
+        with patch.object(instrumentation.logger, 'exception') as mock_log:
+            self.assertEqual(instrument_handler('handler', _handler), 'result')
+        mock_log.assert_called_once()
+
+    @override_settings(
+        ORA2_HANDLER_INSTRUMENTATION_SINK='statsd',
+        ORA2_HANDLER_INSTRUMENTATION_STATSD_ADDRESS=('statsd.example.com', 9125),
+    )
+    @patch('openassessment.instrumentation.socket.socket')
+    def test_statsd_sink(self, mock_socket):
+        instrument_handler('handler', _handler)
+
+        payload, address = mock_socket.return_value.sendto.call_args.args
+        self.assertEqual(address, ('statsd.example.com', 9125))
+        self.assertIn('ora2.handler.handler.storage_calls:1|c', payload.decode('utf-8').split('\n'))
+
+
+@override_settings(ORA2_HANDLER_INSTRUMENTATION_SAMPLE_RATE=1, ORA2_HANDLER_INSTRUMENTATION_SINK='memory')
+class InstrumentedBlockTest(XBlockHandlerTestCase):
+    """
+    Tests for the instrumentation of the handlers of `OpenAssessmentBlock`.
+    """
+
+    @scenario('data/basic_scenario.xml')
+    def test_handler_calls_are_measured(self, xblock):
+        with patch.object(type(xblock), 'render_leaderboard', create=True) as mock_handler:
+            mock_handler._is_xblock_handler = True  # pylint: disable=protected-access
+            xblock.handle('render_leaderboard', Mock())
+
+        mock_handler.assert_called_once()
+        self.assertEqual([record['handler'] for record in get_sink().records], ['render_leaderboard'])
@@ -0,0 +1,130 @@
+"""
+Tests for resetting the state of many learners at once.
+"""
+from unittest.mock import patch
+
+from submissions import api as sub_api, team_api as sub_team_api
+
+from openassessment.test_utils import CacheResetTest
+from openassessment.tests.factories import UserFactory
+from openassessment.student_state import StudentStateReset, reset_student_states
+from openassessment.workflow import api as workflow_api
+from openassessment.workflow import team_api as team_workflow_api
+
+COURSE_ID = 'edX/Demo/Reset'
+ITEM_ID = 'reset-item'
+
+
+@patch('openassessment.student_state.remove_files')
+class StudentStateResetTest(CacheResetTest):
+    """
+    Tests for `StudentStateReset`.
+    """
+
+    def _create_submission(self, student_id, file_keys=None):
+        """ Create a submission and its peer workflow for a learner. """
+        answer = {'text': f"{student_id}'s answer"}
+        if file_keys:
+            answer['file_keys'] = file_keys
+        submission = sub_api.create_submission(
+            {
+                'student_id': student_id,
+                'course_id': COURSE_ID,
+                'item_id': ITEM_ID,
+                'item_type': 'openassessment',
+            },
+            answer,
+        )
+        workflow_api.create_workflow(submission['uuid'], ['peer'])
+        return submission
+
+    def _assert_reset(self, student_id, submission_uuid):
+        self.assertTrue(workflow_api.is_workflow_cancelled(submission_uuid))
+        self.assertEqual(
+            sub_api.get_submissions({
+                'student_id': student_id,
+                'course_id': COURSE_ID,
+                'item_id': ITEM_ID,
+                'item_type': 'openassessment',
+            }),
+            []
+        )
+
+    def test_reset_students(self, mock_remove_files):
+        submissions = {
+            student_id: self._create_submission(student_id, file_keys=[f'{student_id}-1', f'{student_id}-2'])
+            for student_id in ['Alice', 'Bob', 'Carol']
+        }
+        progress = []
+
+        summary = StudentStateReset(
+            COURSE_ID, ITEM_ID, 'staff', batch_size=2, progress_callback=lambda *args: progress.append(args)
+        ).reset(['Alice', 'Bob', 'Alice', 'Carol'])
+
+        self.assertEqual(summary, {
+            'students': 3,
+            'submissions': 3,
+            'workflows_cancelled': 3,
+            'files_removed': 6,
+            'team_submissions': 0,
+        })
+        self.assertEqual(progress, [(2, 3), (3, 3)])
+        # The files are removed with one call per batch
+        self.assertEqual(mock_remove_files.call_count, 2)
+        self.assertCountEqual(mock_remove_files.call_args_list[0].args[0], ['Alice-1', 'Alice-2', 'Bob-1', 'Bob-2'])
+        for student_id, submission in submissions.items():
+            self._assert_reset(student_id, submission['uuid'])
+
+    def test_reset_all_students(self, mock_remove_files):
+        submissions = {student_id: self._create_submission(student_id) for student_id in ['Alice', 'Bob']}
+        other_submission = self._create_submission('Alice')
+        sub_api.reset_score('Alice', COURSE_ID, ITEM_ID, clear_state=True)
+        submissions['Alice'] = self._create_submission('Alice')
+
+        summary = reset_student_states(COURSE_ID, ITEM_ID, 'staff')
+
+        self.assertEqual(summary['students'], 2)
+        self.assertEqual(summary['submissions'], 2)
+        mock_remove_files.assert_not_called()
+        for student_id, submission in submissions.items():
+            self._assert_reset(student_id, submission['uuid'])
+        # Submissions which were already reset are left unchanged
+        self.assertFalse(workflow_api.is_workflow_cancelled(other_submission['uuid']))
+
+    def test_reset_with_workers(self, mock_remove_files):  # pylint: disable=unused-argument
+        with patch.object(StudentStateReset, '_reset_batch') as mock_reset_batch:
+            StudentStateReset(COURSE_ID, ITEM_ID, 'staff', batch_size=2, max_workers=3).reset(
+                ['Alice', 'Bob', 'Carol', 'Dan', 'Eve']
+            )
+        self.assertCountEqual(
+            [call_args.args[0] for call_args in mock_reset_batch.call_args_list],
+            [['Alice', 'Bob'], ['Carol', 'Dan'], ['Eve']]
+        )
+
+    @patch('openassessment.student_state.delete_shared_files_for_team')
+    def test_reset_team(self, mock_delete_shared_files, mock_remove_files):
+        users = [UserFactory.create() for _ in range(3)]
+        student_ids = [f'anonymous_user_id_for_{user.username}' for user in users]
+        team_submission = sub_team_api.create_submission_for_team(
+            COURSE_ID, ITEM_ID, 'team-rocket', users[0].id, student_ids, 'our answer'
+        )
+        team_workflow_api.create_workflow(team_submission['team_submission_uuid'])
+
+        summary = StudentStateReset(COURSE_ID, ITEM_ID, 'staff').reset(student_ids[:2])
+
+        self.assertEqual(summary['team_submissions'], 1)
+        self.assertEqual(summary['submissions'], 0)
+        mock_remove_files.assert_not_called()
+        mock_delete_shared_files.assert_called_once_with(COURSE_ID, ITEM_ID, 'team-rocket')
+        self.assertTrue(team_workflow_api.is_workflow_cancelled(team_submission['team_submission_uuid']))
+        # The whole team is reset
+        for student_id in student_ids:
+            self.assertEqual(
+                sub_api.get_submissions({
+                    'student_id': student_id,
+                    'course_id': COURSE_ID,
+                    'item_id': ITEM_ID,
+                    'item_type': 'openassessment',
+                }),
+                []
+            )
@@ -407,6 +407,25 @@ def cancel_workflow(submission_uuid, comments, cancelled_by_id, assessment_requi
     AssessmentWorkflow.cancel_workflow(submission_uuid, comments, cancelled_by_id, assessment_requirements)
 
 
+def cancel_workflows(submission_uuids, comments, cancelled_by_id):
+    """
+    Cancel the workflows of many submissions at once, without recording
+    a score of zero, e.g. before resetting the state of many learners.
+
+    Args:
+        submission_uuids (list of str): The UUIDs of the workflows' submissions.
+        comments (str): The reason for cancellation.
+        cancelled_by_id (str): The ID of the user who cancelled the workflows.
+
+    Returns:
+        list of str: The UUIDs of the submissions whose workflow was cancelled.
+
+    Raises:
+        AssessmentWorkflowInternalError: An unexpected error occurred.
+    """
+    return AssessmentWorkflow.cancel_workflows(submission_uuids, comments, cancelled_by_id)
+
+
 def get_assessment_workflow_cancellation(submission_uuid):
     """
     Get cancellation information for an assessment workflow.
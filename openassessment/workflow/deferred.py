@@ -0,0 +1,318 @@
+"""
+Deferred updates of assessment workflows.
+
+When an assessment is complete, `assessment_complete_signal` asks for the
+workflow of the submission to be updated from its assessments. By default,
+the update runs right away, in the request of whoever sent the signal. The
+ORA2_WORKFLOW_UPDATE_BACKEND setting can defer it to a worker instead:
+
+* "sync" (default): update the workflow right away.
+* "celery": run the update in a Celery task.
+* "outbox": store the update in the PendingWorkflowUpdate table, to be processed
+  in batches by the `process_workflow_updates` management command.
+* "deferred": "celery" if Celery is installed, "outbox" otherwise.
+* "local": keep the updates in memory, to be processed by calling `process()`.
+  Only meant for tests.
+
+Deferred updates for the same submission are coalesced: an update requested
+while another one is pending for the submission is dropped, and a pending update
+is only processed once ORA2_WORKFLOW_UPDATE_COALESCE_SECONDS have passed since it
+was requested, so that a burst of assessments results in a single update.
+
+The "outbox" backend deletes an update once the workflow is updated. Updates
+left by a worker which stopped in the middle of a batch are processed again
+once ORA2_WORKFLOW_UPDATE_CLAIM_SECONDS have passed since they were claimed.
+"""
+import logging
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, connection, models, transaction
+from django.utils.timezone import now
+from edx_django_utils.monitoring import set_custom_attribute
+
+from openassessment.workflow.models import PendingWorkflowUpdate, update_workflow
+
+logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
+
+DEFAULT_COALESCE_SECONDS = 5
+DEFAULT_CLAIM_SECONDS = 300
+DEFAULT_BATCH_SIZE = 100
+CELERY_CACHE_KEY_PREFIX = 'openassessment.workflow.pending_update'
+
+
+def _coalesce_seconds():
+    """
+    Number of seconds a deferred update waits for duplicates before being processed.
+    """
+    return getattr(settings, 'ORA2_WORKFLOW_UPDATE_COALESCE_SECONDS', DEFAULT_COALESCE_SECONDS)
+
+
+def _claim_seconds():
+    """
+    Number of seconds after which an outbox update claimed by a worker can be claimed by another one.
+    """
+    return getattr(settings, 'ORA2_WORKFLOW_UPDATE_CLAIM_SECONDS', DEFAULT_CLAIM_SECONDS)
+
+
+def _record_queue_metrics(backend_name, depth, lag_seconds):
+    """
+    Report the depth of a queue of deferred updates, and the time the
+    oldest update spent in it, to the monitoring tools and the logs.
+    """
+    set_custom_attribute('ora2_workflow_update_backend', backend_name)
+    if depth is not None:
+        set_custom_attribute('ora2_workflow_update_queue_depth', depth)
+    if lag_seconds is not None:
+        set_custom_attribute('ora2_workflow_update_lag_seconds', round(lag_seconds, 3))
+    logger.info(
+        "Workflow update queue %s: depth %s, lag %s seconds", backend_name, depth, lag_seconds
+    )
+
+
+class SyncBackend:
+    """
+    Update the workflow right away.
+    """
+    name = 'sync'
+
+    def enqueue(self, submission_uuid):
+        update_workflow(submission_uuid)
+
+    def process(self, batch_size=None, coalesce_seconds=None):  # pylint: disable=unused-argument
+        return 0
+
+    def stats(self):
+        return {'depth': 0, 'lag': 0.0}
+
+
+class LocalBackend:
+    """
+    Keep the pending updates in memory, in this process, until `process` is called.
+    """
+    name = 'local'
+
+    def __init__(self):
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def enqueue(self, submission_uuid):
+        with self._lock:
+            self._pending.setdefault(submission_uuid, time.time())
+
+    def process(self, batch_size=None, coalesce_seconds=None):
+        """
+        Process the pending updates which were requested more than the coalescing
+        window ago, oldest first.
+
+        Returns:
+            int: The number of workflows updated.
+        """
+        if coalesce_seconds is None:
+            coalesce_seconds = _coalesce_seconds()
+        ready_before = time.time() - coalesce_seconds
+        with self._lock:
+            ready = sorted(
+                (enqueued_at, submission_uuid)
+                for submission_uuid, enqueued_at in self._pending.items()
+                if enqueued_at <= ready_before
+            )[:batch_size or DEFAULT_BATCH_SIZE]
+            for __, submission_uuid in ready:
+                del self._pending[submission_uuid]
+
+        if ready:
+            _record_queue_metrics(self.name, len(self._pending), time.time() - ready[0][0])
+        for __, submission_uuid in ready:
+            update_workflow(submission_uuid)
+        return len(ready)
+
+    def stats(self):
+        with self._lock:
+            oldest = min(self._pending.values(), default=None)
+            return {
+                'depth': len(self._pending),
+                'lag': time.time() - oldest if oldest is not None else 0.0,
+            }
+
+
+class OutboxBackend:
+    """
+    Store the pending updates in the PendingWorkflowUpdate table,
+    for the `process_workflow_updates` command to process them.
+    """
+    name = 'outbox'
+
+    def enqueue(self, submission_uuid):
+        try:
+            # The unique submission_uuid coalesces the updates requested while one is pending
+            PendingWorkflowUpdate.objects.bulk_create(
+                [PendingWorkflowUpdate(submission_uuid=submission_uuid)], ignore_conflicts=True
+            )
+            # A pending update being processed may have read the assessments before this
+            # one, so its claim is released for it to be processed again after the
+            # coalescing window. The row stays locked until the sender's transaction is
+            # committed, so a worker claiming it meanwhile waits for the assessments.
+            PendingWorkflowUpdate.objects.filter(submission_uuid=submission_uuid).update(
+                enqueued_at=models.Case(
+                    models.When(claimed_at__isnull=False, then=models.Value(now())),
+                    default=models.F('enqueued_at'),
+                    output_field=models.DateTimeField(),
+                ),
+                claimed_at=None,
+            )
+        except DatabaseError:
+            logger.exception(
+                "Could not defer the workflow update for submission UUID %s, updating it now", submission_uuid
+            )
+            update_workflow(submission_uuid)
+
+    def process(self, batch_size=None, coalesce_seconds=None):
+        """
+        Claim a batch of the pending updates which were requested more than the
+        coalescing window ago, oldest first, and process them.
+
+        Each update is deleted once its workflow is updated, unless it was requested
+        again meanwhile, so that an update is not lost if the worker stops in the
+        middle of the batch: it is claimed again once the claim expires.
+
+        Returns:
+            int: The number of workflows updated.
+        """
+        if coalesce_seconds is None:
+            coalesce_seconds = _coalesce_seconds()
+        claimed_at = now()
+        unclaimed = models.Q(claimed_at__isnull=True)
+        claim_expired = models.Q(claimed_at__lte=claimed_at - timedelta(seconds=_claim_seconds()))
+        with transaction.atomic():
+            ready = PendingWorkflowUpdate.objects.filter(
+                unclaimed | claim_expired,
+                enqueued_at__lte=claimed_at - timedelta(seconds=coalesce_seconds),
+            )
+            if connection.features.has_select_for_update_skip_locked:
+                # Let several workers claim different batches at the same time
+                ready = ready.select_for_update(skip_locked=True)
+            claimed = list(
+                ready.values_list('pk', 'submission_uuid', 'enqueued_at')[:batch_size or DEFAULT_BATCH_SIZE]
+            )
+            PendingWorkflowUpdate.objects.filter(pk__in=[pk for pk, __, __ in claimed]).update(claimed_at=claimed_at)
+
+        if claimed:
+            _record_queue_metrics(
+                self.name,
+                PendingWorkflowUpdate.objects.count() - len(claimed),
+                (now() - claimed[0][2]).total_seconds(),
+            )
+        for pk, submission_uuid, __ in claimed:
+            update_workflow(submission_uuid)
+            PendingWorkflowUpdate.objects.filter(pk=pk, claimed_at=claimed_at).delete()
+        return len(claimed)
+
+    def stats(self):
+        oldest = PendingWorkflowUpdate.objects.order_by('enqueued_at').values_list('enqueued_at', flat=True).first()
+        return {
+            'depth': PendingWorkflowUpdate.objects.count(),
+            'lag': (now() - oldest).total_seconds() if oldest is not None else 0.0,
+        }
+
+
+class CeleryBackend:
+    """
+    Run each update in a Celery task, delayed by the coalescing window.
+
+    Pending updates are tracked in the default Django cache, which drops
+    the updates requested while a task is pending for the submission.
+
+    Tasks are only sent once the sender's transaction is committed, so that
+    they do not run before the assessments are saved.
+    """
+    name = 'celery'
+
+    def enqueue(self, submission_uuid):
+        transaction.on_commit(lambda: self._send_task(submission_uuid))
+
+    def _send_task(self, submission_uuid):
+        """
+        Send the task updating the workflow, unless one is pending for the submission.
+        """
+        # Import is placed here so that Celery is only needed when this backend is used
+        from openassessment.workflow.tasks import update_workflow_task  # pylint: disable=import-outside-toplevel
+
+        coalesce_seconds = _coalesce_seconds()
+        enqueued_at = time.time()
+        # Keep the marker a little longer than the task's delay, so that it is still there when the task starts
+        if cache.add(_celery_cache_key(submission_uuid), enqueued_at, coalesce_seconds + 60):
+            update_workflow_task.apply_async(args=[submission_uuid, enqueued_at], countdown=coalesce_seconds)
+
+    def process(self, batch_size=None, coalesce_seconds=None):  # pylint: disable=unused-argument
+        # The Celery workers process the updates
+        return 0
+
+    def stats(self):
+        # The depth of the queue is only known to the Celery broker
+        return {'depth': None, 'lag': None}
+
+
+def _celery_cache_key(submission_uuid):
+    return f"{CELERY_CACHE_KEY_PREFIX}.{submission_uuid}"
+
+
+def run_celery_update(submission_uuid, enqueued_at):
+    """
+    Update a workflow from a Celery task of the "celery" backend.
+    """
+    cache.delete(_celery_cache_key(submission_uuid))
+    _record_queue_metrics(CeleryBackend.name, None, time.time() - enqueued_at)
+    update_workflow(submission_uuid)
+
+
+def _celery_installed():
+    try:
+        import celery  # pylint: disable=import-outside-toplevel, unused-import
+    except ImportError:
+        return False
+    return True
+
+
+WORKFLOW_UPDATE_BACKENDS = {
+    SyncBackend.name: SyncBackend,
+    LocalBackend.name: LocalBackend,
+    OutboxBackend.name: OutboxBackend,
+    CeleryBackend.name: CeleryBackend,
+}
+
+_backends = {}
+_backends_lock = threading.Lock()
+
+
+def get_update_backend():
+    """
+    Return the backend configured by the ORA2_WORKFLOW_UPDATE_BACKEND setting.
+
+    Backends are created once per process, so that the "local"
+    backend keeps its pending updates between calls.
+    """
+    # .. setting_name: ORA2_WORKFLOW_UPDATE_BACKEND
+    # .. setting_default: 'sync'
+    # .. setting_description: How workflows are updated when an assessment is complete.
+    #     The supported values are: 'sync', 'celery', 'outbox', 'deferred' and 'local'.
+    backend_setting = getattr(settings, 'ORA2_WORKFLOW_UPDATE_BACKEND', SyncBackend.name)
+    if backend_setting == 'deferred':
+        backend_setting = CeleryBackend.name if _celery_installed() else OutboxBackend.name
+    if backend_setting not in WORKFLOW_UPDATE_BACKENDS:
+        raise ValueError("Invalid ORA2_WORKFLOW_UPDATE_BACKEND setting value: %s" % backend_setting)
+
+    with _backends_lock:
+        if backend_setting not in _backends:
+            _backends[backend_setting] = WORKFLOW_UPDATE_BACKENDS[backend_setting]()
+        return _backends[backend_setting]
+
+
+def clear_update_backends():
+    """
+    Drop the backends and the updates pending in memory (for tests).
+    """
+    with _backends_lock:
+        _backends.clear()
@@ -0,0 +1,25 @@
+# Generated by Django 3.2.15 on 2026-10-19 08:50
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workflow', '0004_assessmentworkflowstep_skipped'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PendingWorkflowUpdate',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('submission_uuid', models.CharField(max_length=36, unique=True)),
+                ('enqueued_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+            ],
+            options={
+                'ordering': ['enqueued_at', 'id'],
+            },
+        ),
+    ]
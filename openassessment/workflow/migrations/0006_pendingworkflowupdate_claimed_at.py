@@ -0,0 +1,18 @@
+# Generated by Django 3.2.15 on 2026-10-19 09:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workflow', '0005_pendingworkflowupdate'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pendingworkflowupdate',
+            name='claimed_at',
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+    ]
@@ -11,12 +11,14 @@ need to then generate a matching migration for it using:
 """
 
 
+from collections import defaultdict
 import importlib
 import logging
 from uuid import uuid4
 
 from django.conf import settings
 from django.db import DatabaseError, models, transaction
+from django.db.models import prefetch_related_objects
 from django.dispatch import receiver
 from django.utils.timezone import now
 
@@ -24,6 +26,7 @@ from model_utils import Choices
 from model_utils.models import StatusModel, TimeStampedModel
 
 from submissions import api as sub_api, team_api as sub_team_api
+from submissions.models import TeamSubmission
 from openassessment.assessment.errors.base import AssessmentError
 from openassessment.assessment.signals import assessment_complete_signal
 
@@ -624,6 +627,75 @@ class AssessmentWorkflow(TimeStampedModel, StatusModel):
             logger.exception(error_message)
             raise AssessmentWorkflowInternalError(error_message) from ex
 
+    @classmethod
+    def cancel_workflows(cls, submission_uuids, comments, cancelled_by_id):
+        """
+        Cancel the workflows of many submissions at once, e.g. when the state of
+        many learners is cleared.
+
+        The cancellations are created with one insert, the step workflows are
+        cancelled with one update per step, and the workflows with one more.
+        Unlike `cancel_workflow`, no score of zero is recorded, since the scores
+        of the learners are reset afterwards. Workflows which are already
+        cancelled are left unchanged.
+
+        Args:
+            submission_uuids (list of str): The UUIDs of the workflows' submissions.
+            comments (str): The reason for cancellation.
+            cancelled_by_id (str): The ID of the user who cancelled the workflows.
+
+        Returns:
+            list of str: The UUIDs of the submissions whose workflow was cancelled.
+        """
+        try:
+            with transaction.atomic():
+                workflows = list(
+                    cls.objects.filter(
+                        submission_uuid__in=submission_uuids
+                    ).exclude(
+                        status=cls.STATUS.cancelled
+                    ).prefetch_related('steps')
+                )
+                if not workflows:
+                    return []
+
+                AssessmentWorkflowCancellation.objects.bulk_create([
+                    AssessmentWorkflowCancellation(
+                        workflow=workflow, comments=comments, cancelled_by_id=cancelled_by_id
+                    )
+                    for workflow in workflows
+                ])
+
+                # Cancel the related steps' workflows. As in `_get_steps`, a staff
+                # step is always available, to allow for staff overrides.
+                uuids_by_step_name = defaultdict(list)
+                for workflow in workflows:
+                    step_names = {step.name for step in workflow.steps.all()} | {cls.STATUS.staff}
+                    for step_name in step_names & set(cls.STEPS):
+                        uuids_by_step_name[step_name].append(workflow.identifying_uuid)
+                for step_name, uuids in uuids_by_step_name.items():
+                    step_api = AssessmentWorkflowStep(name=step_name).api()
+                    on_cancel_many_func = getattr(step_api, 'on_cancel_many', None)
+                    if on_cancel_many_func is not None:
+                        on_cancel_many_func(uuids)
+                    elif getattr(step_api, 'on_cancel', None) is not None:
+                        for uuid in uuids:
+                            step_api.on_cancel(uuid)
+
+                cancelled_at = now()
+                cls.objects.filter(pk__in=[workflow.pk for workflow in workflows]).update(
+                    status=cls.STATUS.cancelled, status_changed=cancelled_at, modified=cancelled_at
+                )
+        except DatabaseError as ex:
+            error_message = f"Error cancelling the assessment workflows of {len(submission_uuids)} submissions."
+            logger.exception(error_message)
+            raise AssessmentWorkflowInternalError(error_message) from ex
+
+        logger.info(
+            "Cancelled the assessment workflows of %d submissions", len(workflows)
+        )
+        return [workflow.submission_uuid for workflow in workflows]
+
     @classmethod
     def get_by_submission_uuid(cls, submission_uuid):
         """
@@ -726,13 +798,99 @@ class TeamAssessmentWorkflow(AssessmentWorkflow):
         team_staff_step = AssessmentWorkflowStep.objects.create(
             workflow=team_workflow, name=cls.TEAM_STAFF_STEP_NAME, order_num=0
         )
-        team_workflow.steps.add(team_staff_step)
 
         team_assessment_api = team_staff_step.api()
         team_assessment_api.on_init(team_submission_uuid)
 
         return team_workflow
 
+    @classmethod
+    @transaction.atomic
+    def start_workflows(cls, team_submission_uuids):
+        """
+        Start team workflows for many team submissions at once.
+
+        The team submissions are loaded, and the steps and team staff workflows
+        are created, in bulk rather than once per team submission.
+        Team submissions which already have a workflow are skipped.
+
+        Args:
+            team_submission_uuids (list): The UUIDs of the team submissions.
+
+        Returns:
+            list of the TeamAssessmentWorkflows that were created
+
+        Raises:
+            AssessmentWorkflowInternalError: a team submission doesn't exist
+                or has no individual submission.
+        """
+        existing_uuids = set(
+            cls.objects.filter(
+                team_submission_uuid__in=team_submission_uuids
+            ).values_list('team_submission_uuid', flat=True)
+        )
+        new_uuids = [
+            team_submission_uuid for team_submission_uuid in dict.fromkeys(team_submission_uuids)
+            if team_submission_uuid not in existing_uuids
+        ]
+        if not new_uuids:
+            return []
+
+        team_submissions = {
+            str(team_submission.uuid): team_submission
+            for team_submission in TeamSubmission.objects.filter(uuid__in=new_uuids).prefetch_related('submissions')
+        }
+
+        team_submission_dicts = []
+        for team_submission_uuid in new_uuids:
+            team_submission = team_submissions.get(team_submission_uuid)
+            if team_submission is None:
+                msg = f'No team submission found for team submission uuid {team_submission_uuid}'
+                logger.error(msg)
+                raise AssessmentWorkflowInternalError(msg)
+            submission_uuids = [str(submission.uuid) for submission in team_submission.submissions.all()]
+            if not submission_uuids:
+                msg = f'No individual submission found for team submisison uuid {team_submission_uuid}'
+                logger.error(msg)
+                raise AssessmentWorkflowInternalError(msg)
+            team_submission_dicts.append({
+                'team_submission_uuid': team_submission_uuid,
+                'submission_uuids': submission_uuids,
+                'course_id': team_submission.course_id,
+                'item_id': team_submission.item_id,
+            })
+
+        # Workflows use multi-table inheritance, so they can't be bulk created
+        team_workflows = [
+            cls.objects.create(
+                team_submission_uuid=team_submission['team_submission_uuid'],
+                submission_uuid=team_submission['submission_uuids'][0],
+                status=TeamAssessmentWorkflow.STATUS.waiting,
+                course_id=team_submission['course_id'],
+                item_id=team_submission['item_id']
+            )
+            for team_submission in team_submission_dicts
+        ]
+        team_staff_steps = AssessmentWorkflowStep.objects.bulk_create([
+            AssessmentWorkflowStep(workflow=team_workflow, name=cls.TEAM_STAFF_STEP_NAME, order_num=0)
+            for team_workflow in team_workflows
+        ])
+
+        team_assessment_api = team_staff_steps[0].api()
+        team_assessment_api.on_init_many(team_submission_dicts)
+
+        return team_workflows
+
+    @classmethod
+    def get_by_team_submission_uuids(cls, team_submission_uuids):
+        """
+        Given team submission uuids, return the associated workflows,
+        with their steps already loaded.
+        """
+        return cls.objects.filter(
+            team_submission_uuid__in=team_submission_uuids
+        ).prefetch_related('steps')
+
     @property
     def _team_staff_step(self):
         return self._get_steps()[0]
@@ -742,16 +900,22 @@ class TeamAssessmentWorkflow(AssessmentWorkflow):
         Simple helper function for retrieving all the steps in the given
         TeamAssessmentWorkflow. In this case, it's somewhat trivial, since a
         TeamAssessmentWorkflow can only ever have a single 'teams' step.
+
+        The steps are loaded once and then cached on the workflow, in the same way
+        as `prefetch_related('steps')` does (and `refresh_from_db()` clears the cache).
         """
+        if 'steps' not in getattr(self, '_prefetched_objects_cache', {}):
+            prefetch_related_objects([self], 'steps')
+        steps = list(self.steps.all())
 
-        if self.steps.count() != 1:
+        if len(steps) != 1:
             err_msg = 'Team Assessment Workflow {} should have exactly one single "teams" step: {}'.format(
                 self.uuid,
-                self.steps.all()
+                steps
             )
             logger.error(err_msg)
             raise AssessmentWorkflowInternalError(err_msg)
-        step = self.steps.first()  # pylint: disable=no-member
+        step = steps[0]
         if step.name != TeamAssessmentWorkflow.STATUS.teams:
             err_msg = 'Team Assessment Workflow {} has a "{}" step rather than a teams step'.format(
                 self.uuid,
@@ -961,6 +1125,10 @@ def update_workflow_async(sender, **kwargs):  # pylint: disable=unused-argument
     Register a receiver for the update workflow signal
     This allows asynchronous processes to update the workflow
 
+    The update is handed to the backend configured by the ORA2_WORKFLOW_UPDATE_BACKEND
+    setting, which either runs it right away (the default) or defers it to a
+    worker (see `openassessment.workflow.deferred`).
+
     Args:
         sender (object): Not used
 
@@ -977,6 +1145,26 @@ def update_workflow_async(sender, **kwargs):  # pylint: disable=unused-argument
         logger.error("Update workflow signal called without a submission UUID")
         return
 
+    # Import is placed here to avoid a circular import
+    from openassessment.workflow.deferred import get_update_backend  # pylint: disable=import-outside-toplevel
+    get_update_backend().enqueue(submission_uuid)
+
+
+def update_workflow(submission_uuid):
+    """
+    Update the workflow of a submission from its assessments.
+
+    Errors are logged rather than raised, since nothing can be done
+    about them by the sender of the update.
+
+    Args:
+        submission_uuid (str): The UUID of the submission associated
+            with the workflow being updated.
+
+    Returns:
+        None
+
+    """
     try:
         workflow = AssessmentWorkflow.objects.get(submission_uuid=submission_uuid)
         workflow.update_from_assessments(None)
@@ -997,6 +1185,36 @@ def update_workflow_async(sender, **kwargs):  # pylint: disable=unused-argument
         logger.exception(msg)
 
 
+class PendingWorkflowUpdate(models.Model):
+    """
+    An update of a workflow waiting to be processed, in the outbox of the
+    "outbox" deferred update backend.
+
+    There is at most one pending update per submission: updates requested
+    while one is pending are coalesced into it.
+
+    An update is claimed by a worker while it is processed, and deleted once
+    the workflow is updated. Updates claimed by a worker which stopped before
+    deleting them are claimed again once the claim expires.
+    """
+    submission_uuid = models.CharField(max_length=36, unique=True)
+    enqueued_at = models.DateTimeField(default=now, db_index=True)
+    claimed_at = models.DateTimeField(null=True, blank=True, db_index=True)
+
+    class Meta:
+        ordering = ["enqueued_at", "id"]
+        app_label = "workflow"
+
+    def __repr__(self):
+        return (
+            "PendingWorkflowUpdate(submission_uuid={0.submission_uuid}, enqueued_at={0.enqueued_at}, "
+            "claimed_at={0.claimed_at})"
+        ).format(self)
+
+    def __str__(self):
+        return repr(self)
+
+
 class AssessmentWorkflowCancellation(models.Model):
     """Model for tracking cancellations of assessment workflow.
 
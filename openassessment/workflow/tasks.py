@@ -0,0 +1,23 @@
+"""
+Celery tasks of the workflow app, used by the "celery" deferred update
+backend (see `openassessment.workflow.deferred`).
+
+This module is only imported when that backend is used,
+so that Celery is not needed otherwise.
+"""
+# Celery is an optional dependency, only installed where the "celery" backend is used
+from celery import shared_task  # pylint: disable=import-error
+
+from openassessment.workflow.deferred import run_celery_update
+
+
+@shared_task(name='openassessment.workflow.tasks.update_workflow_task', ignore_result=True)
+def update_workflow_task(submission_uuid, enqueued_at):
+    """
+    Update the workflow of a submission from its assessments.
+
+    Args:
+        submission_uuid (str): The UUID of the submission associated with the workflow.
+        enqueued_at (float): The time the update was requested, as a timestamp.
+    """
+    run_celery_update(submission_uuid, enqueued_at)
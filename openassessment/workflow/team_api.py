@@ -53,6 +53,35 @@ def create_workflow(team_submission_uuid):
         raise AssessmentWorkflowInternalError(err_msg) from ex
 
 
+def create_workflows(team_submission_uuids):
+    """
+    Like `create_workflow`, but for many team submissions at once, for example
+    when a course imports many team submissions.  Team submissions which already
+    have a workflow are skipped.
+
+    Returns:
+        list of the TeamAssessmentWorkflows that were created
+
+    Raises:
+        AssessmentWorkflowInternalError on error
+    """
+    try:
+        team_workflows = TeamAssessmentWorkflow.start_workflows(team_submission_uuids)
+        logger.info(
+            "Started %d team assessment workflows for %d team submissions",
+            len(team_workflows),
+            len(team_submission_uuids)
+        )
+        return team_workflows
+    except Exception as ex:
+        err_msg = (
+            "An unexpected error occurred while creating "
+            "the workflows for team submission UUIDs {uuids}"
+        ).format(uuids=team_submission_uuids)
+        logger.exception(err_msg)
+        raise AssessmentWorkflowInternalError(err_msg) from ex
+
+
 def get_workflow_for_submission(team_submission_uuid):
     """
     Pass through to update_from_assessments. Returns team assessment workflow information
@@ -89,6 +118,48 @@ def update_from_assessments(team_submission_uuid, override_submitter_requirement
     return _serialized_with_details(team_workflow)
 
 
+def update_workflows(team_submission_uuids, override_submitter_requirements=False):
+    """
+    Like `update_from_assessments`, but for many team submissions at once, for example
+    after staff bulk-grade team submissions.  The workflows and their steps are
+    loaded with a fixed number of queries.
+
+    Returns:
+        list of serialized workflows, in the order of `team_submission_uuids`.
+        Team submissions without a workflow are omitted.
+
+    Raises:
+        AssessmentWorkflowInternalError on error
+    """
+    try:
+        team_workflows = {
+            team_workflow.team_submission_uuid: team_workflow
+            for team_workflow in TeamAssessmentWorkflow.get_by_team_submission_uuids(team_submission_uuids)
+        }
+    except DatabaseError as exc:
+        err_msg = (
+            "Could not get team assessment workflows with team_submission_uuids {uuids} due to error: {exc}"
+        ).format(uuids=team_submission_uuids, exc=exc)
+        logger.exception(err_msg)
+        raise AssessmentWorkflowInternalError(err_msg) from exc
+
+    serialized_workflows = []
+    for team_submission_uuid in team_submission_uuids:
+        team_workflow = team_workflows.get(team_submission_uuid)
+        if team_workflow is None:
+            continue
+        try:
+            team_workflow.update_from_assessments(override_submitter_requirements)
+        except Exception as exc:
+            err_msg = "Could not update team assessment workflow: %s"
+            logger.exception(err_msg, exc)
+            raise AssessmentWorkflowInternalError(err_msg % exc) from exc
+        serialized_workflows.append(_serialized_with_details(team_workflow))
+
+    logger.info("Updated workflows for team submission UUIDs %s", team_submission_uuids)
+    return serialized_workflows
+
+
 def _serialized_with_details(team_workflow):
     data_dict = TeamAssessmentWorkflowSerializer(team_workflow).data
     data_dict['status_details'] = team_workflow.status_details()
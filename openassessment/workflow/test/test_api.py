@@ -423,6 +423,37 @@ class TestAssessmentWorkflowApi(CacheResetTest):
         # In case of 0 earned points the score would be None.
         self.assertEqual(workflow.score, None)
 
+    def test_cancel_many_workflows(self):
+        submissions = [
+            sub_api.create_submission(dict(ITEM_1, student_id=f"Student {index}"), ANSWER_1)
+            for index in range(3)
+        ]
+        for submission in submissions:
+            workflow_api.create_workflow(submission["uuid"], ["peer", "self"])
+        uuids = [submission["uuid"] for submission in submissions]
+        workflow_api.cancel_workflow(uuids[0], "Already cancelled", ITEM_2['student_id'], {})
+
+        cancelled_uuids = workflow_api.cancel_workflows(uuids, "Student state cleared", ITEM_2['student_id'])
+
+        # Workflows which were already cancelled are left unchanged
+        self.assertCountEqual(cancelled_uuids, uuids[1:])
+        for uuid in uuids:
+            self.assertTrue(workflow_api.is_workflow_cancelled(uuid))
+            self.assertIsNotNone(PeerWorkflow.objects.get(submission_uuid=uuid).cancelled_at)
+        self.assertEqual(
+            workflow_api.get_assessment_workflow_cancellation(uuids[0])['comments'], "Already cancelled"
+        )
+        self.assertEqual(
+            workflow_api.get_assessment_workflow_cancellation(uuids[1])['comments'], "Student state cleared"
+        )
+        self.assertEqual(workflow_api.cancel_workflows(uuids, "Again", ITEM_2['student_id']), [])
+
+    @patch.object(AssessmentWorkflow.objects, 'filter')
+    def test_cancel_many_workflows_database_error(self, mock_filter):
+        mock_filter.side_effect = DatabaseError("Oh no")
+        with self.assertRaises(AssessmentWorkflowInternalError):
+            workflow_api.cancel_workflows(["uuid"], "Student state cleared", ITEM_2['student_id'])
+
     def test_cancel_the_assessment_workflow_does_not_exist(self):
         # Create the submission and assessment workflow.
         submission = sub_api.create_submission(ITEM_1, ANSWER_1)
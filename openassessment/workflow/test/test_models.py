@@ -92,6 +92,21 @@ class TeamAssessmentTest(CacheResetTest):
         with self.assertRaises(AssessmentWorkflowInternalError):
             workflow._get_steps()  # pylint: disable=protected-access
 
+    def test_get_steps_cached(self):
+        with self.mock_submissions_api_get():
+            workflow = TeamAssessmentWorkflow.start_workflow(self.team_submission_uuid)
+
+        # The steps are only queried the first time
+        with self.assertNumQueries(1):
+            step = workflow._team_staff_step  # pylint: disable=protected-access
+        with self.assertNumQueries(0):
+            self.assertIs(workflow._team_staff_step, step)  # pylint: disable=protected-access
+
+        # or not at all when they were loaded with the workflow
+        workflow = TeamAssessmentWorkflow.get_by_team_submission_uuids([self.team_submission_uuid])[0]
+        with self.assertNumQueries(0):
+            self.assertEqual(workflow._team_staff_step, step)  # pylint: disable=protected-access
+
     def _update_from_assessments(self, workflow, submissions_api_fake_score, assessment_api_fake_score):
         self.mock_assessment_api.get_score.return_value = assessment_api_fake_score
         with mock.patch(
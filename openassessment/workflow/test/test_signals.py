@@ -1,16 +1,19 @@
 """
 Tests for Django signals and receivers defined by the workflow API.
 """
+import sys
 from unittest import mock
 
 import ddt
 from django.db import DatabaseError
+from django.test.utils import override_settings
 
 from submissions import api as sub_api
 from openassessment.assessment.signals import assessment_complete_signal
 from openassessment.test_utils import CacheResetTest
 from openassessment.workflow import api as workflow_api
-from openassessment.workflow.models import AssessmentWorkflow
+from openassessment.workflow.deferred import get_update_backend, run_celery_update
+from openassessment.workflow.models import AssessmentWorkflow, PendingWorkflowUpdate
 
 
 @ddt.ddt
@@ -65,3 +68,131 @@ class UpdateWorkflowSignalTest(CacheResetTest):
         # The receiver should catch and log the error
         mock_call.side_effect = error("OH NO!")
         assessment_complete_signal.send(sender=None, submission_uuid=self.submission_uuid)
+
+
+@ddt.ddt
+class DeferredWorkflowUpdateTest(CacheResetTest):
+    """
+    Test the deferred update backends of the update workflow signal.
+    """
+    STUDENT_ITEM = UpdateWorkflowSignalTest.STUDENT_ITEM
+
+    def setUp(self):
+        super().setUp()
+        self.submission_uuids = []
+        for index in range(3):
+            student_item = dict(self.STUDENT_ITEM, student_id=f"test student {index}")
+            submission = sub_api.create_submission(student_item, "test answer")
+            workflow_api.create_workflow(submission['uuid'], ['self'])
+            self.submission_uuids.append(submission['uuid'])
+
+    def _send_signals(self):
+        """ Send the signal twice for each submission. """
+        for submission_uuid in self.submission_uuids * 2:
+            assessment_complete_signal.send(sender=None, submission_uuid=submission_uuid)
+
+    @ddt.data('local', 'outbox')
+    def test_deferred_updates_are_coalesced(self, backend_name):
+        with override_settings(ORA2_WORKFLOW_UPDATE_BACKEND=backend_name):
+            backend = get_update_backend()
+            with mock.patch.object(AssessmentWorkflow, 'update_from_assessments') as mock_update:
+                self._send_signals()
+
+                # Nothing is updated in the sender's request
+                mock_update.assert_not_called()
+                self.assertEqual(backend.stats()['depth'], 3)
+
+                # Updates wait for duplicates during the coalescing window
+                self.assertEqual(backend.process(), 0)
+
+                # Then each workflow is updated once, in batches
+                self.assertEqual(backend.process(batch_size=2, coalesce_seconds=0), 2)
+                self.assertEqual(backend.process(batch_size=2, coalesce_seconds=0), 1)
+                self.assertEqual(backend.process(coalesce_seconds=0), 0)
+
+            self.assertEqual(mock_update.call_count, 3)
+            self.assertEqual(backend.stats(), {'depth': 0, 'lag': 0.0})
+
+    def test_outbox_updates_requested_while_processing(self):
+        with override_settings(ORA2_WORKFLOW_UPDATE_BACKEND='outbox'):
+            backend = get_update_backend()
+            assessment_complete_signal.send(sender=None, submission_uuid=self.submission_uuids[0])
+
+            def update_from_assessments(*args):  # pylint: disable=unused-argument
+                assessment_complete_signal.send(sender=None, submission_uuid=self.submission_uuids[0])
+
+            with mock.patch.object(AssessmentWorkflow, 'update_from_assessments', side_effect=update_from_assessments):
+                self.assertEqual(backend.process(coalesce_seconds=0), 1)
+
+            # The update requested while the workflow was being updated is not lost
+            self.assertEqual(list(PendingWorkflowUpdate.objects.values_list('submission_uuid', flat=True)), [
+                self.submission_uuids[0]
+            ])
+
+    def test_outbox_updates_left_by_a_stopped_worker(self):
+        class WorkerStopped(Exception):
+            pass
+
+        with override_settings(ORA2_WORKFLOW_UPDATE_BACKEND='outbox'):
+            backend = get_update_backend()
+            self._send_signals()
+
+            # The worker stops after updating the first workflow of the batch
+            with mock.patch(
+                'openassessment.workflow.deferred.update_workflow', side_effect=[None, WorkerStopped]
+            ):
+                with self.assertRaises(WorkerStopped):
+                    backend.process(coalesce_seconds=0)
+            self.assertEqual(
+                list(PendingWorkflowUpdate.objects.values_list('submission_uuid', flat=True)),
+                self.submission_uuids[1:],
+            )
+
+            # The other updates are processed again once their claim expires
+            with mock.patch('openassessment.workflow.deferred.update_workflow') as mock_update:
+                self.assertEqual(backend.process(coalesce_seconds=0), 0)
+                with override_settings(ORA2_WORKFLOW_UPDATE_CLAIM_SECONDS=0):
+                    self.assertEqual(backend.process(coalesce_seconds=0), 2)
+            self.assertEqual(
+                [call_args.args[0] for call_args in mock_update.call_args_list], self.submission_uuids[1:]
+            )
+            self.assertEqual(backend.stats()['depth'], 0)
+
+    @override_settings(ORA2_WORKFLOW_UPDATE_BACKEND='celery', ORA2_WORKFLOW_UPDATE_COALESCE_SECONDS=10)
+    def test_celery_updates_are_coalesced(self):
+        mock_tasks = mock.Mock()
+        apply_async = mock_tasks.update_workflow_task.apply_async
+        with mock.patch.dict(sys.modules, {'openassessment.workflow.tasks': mock_tasks}):
+            with self.captureOnCommitCallbacks(execute=True):
+                self._send_signals()
+
+                # The tasks are sent once the sender's transaction is committed
+                apply_async.assert_not_called()
+
+        self.assertEqual(apply_async.call_count, 3)
+        self.assertEqual(
+            [call_args.kwargs['args'][0] for call_args in apply_async.call_args_list], self.submission_uuids
+        )
+        self.assertEqual(apply_async.call_args.kwargs['countdown'], 10)
+
+        # The task clears the pending update before updating the workflow
+        submission_uuid, enqueued_at = apply_async.call_args.kwargs['args']
+        with mock.patch.object(AssessmentWorkflow, 'update_from_assessments') as mock_update:
+            run_celery_update(submission_uuid, enqueued_at)
+        mock_update.assert_called_once_with(None)
+        with mock.patch.dict(sys.modules, {'openassessment.workflow.tasks': mock_tasks}):
+            with self.captureOnCommitCallbacks(execute=True):
+                assessment_complete_signal.send(sender=None, submission_uuid=submission_uuid)
+        self.assertEqual(apply_async.call_count, 4)
+
+    @ddt.data((True, 'celery'), (False, 'outbox'))
+    @ddt.unpack
+    @override_settings(ORA2_WORKFLOW_UPDATE_BACKEND='deferred')
+    def test_deferred_backend(self, celery_installed, expected_backend):
+        with mock.patch('openassessment.workflow.deferred._celery_installed', return_value=celery_installed):
+            self.assertEqual(get_update_backend().name, expected_backend)
+
+    @override_settings(ORA2_WORKFLOW_UPDATE_BACKEND='carrier-pigeon')
+    def test_invalid_backend(self):
+        with self.assertRaises(ValueError):
+            get_update_backend()
@@ -3,6 +3,8 @@ import uuid
 
 from submissions import team_api as sub_team_api
 
+from openassessment.assessment.models import TeamStaffWorkflow
+from openassessment.workflow.errors import AssessmentWorkflowInternalError
 from openassessment.workflow.models import TeamAssessmentWorkflow, AssessmentWorkflowStep
 from openassessment.test_utils import CacheResetTest
 from openassessment.workflow import team_api
@@ -19,7 +21,7 @@ class TestTeamAssessmentWorkflowApi(CacheResetTest):
     team_submission_uuid = None
     submission_uuids = []
 
-    def _create_submission(self):
+    def _create_submission(self, team_id='team-rocket'):
         """
         Create a test team submission through the submissions api
         """
@@ -29,7 +31,7 @@ class TestTeamAssessmentWorkflowApi(CacheResetTest):
         self.team_submission_dict = sub_team_api.create_submission_for_team(
             self.course_id,
             self.item_id,
-            'team-rocket',
+            team_id,
             self.users[0].id,
             anonymous_user_ids,
             'this-is-my-answer',
@@ -50,6 +52,62 @@ class TestTeamAssessmentWorkflowApi(CacheResetTest):
         step_names = [step.name for step in team_workflow.steps.all()]
         self.assertEqual(step_names, ['teams'])
 
+    def test_create_workflows(self):
+        team_submission_uuids = []
+        for team_id in ['team-rocket', 'team-magma', 'team-aqua']:
+            self._create_submission(team_id)
+            team_submission_uuids.append(self.team_submission_uuid)
+
+        # One of the team submissions already has a workflow, which is left unchanged
+        existing_workflow = team_api.create_workflow(team_submission_uuids[0])
+
+        team_workflows = team_api.create_workflows(team_submission_uuids)
+
+        self.assertEqual(
+            [team_workflow.team_submission_uuid for team_workflow in team_workflows],
+            team_submission_uuids[1:]
+        )
+        for team_workflow in team_workflows:
+            self.assertEqual(team_workflow.status, TeamAssessmentWorkflow.STATUS.waiting)
+            self.assertEqual(team_workflow.course_id, self.course_id)
+            step_names = [step.name for step in team_workflow.steps.all()]
+            self.assertEqual(step_names, ['teams'])
+        self.assertEqual(
+            TeamAssessmentWorkflow.get_by_team_submission_uuid(team_submission_uuids[0]).id,
+            existing_workflow.id
+        )
+        self.assertEqual(
+            TeamStaffWorkflow.objects.filter(team_submission_uuid__in=team_submission_uuids).count(),
+            3
+        )
+
+        # Creating them again does nothing
+        self.assertEqual(team_api.create_workflows(team_submission_uuids), [])
+
+    def test_create_workflows_no_team_submission(self):
+        self._create_submission()
+        with self.assertRaises(AssessmentWorkflowInternalError):
+            team_api.create_workflows([self.team_submission_uuid, str(uuid.uuid4())])
+
+        # No workflow is created
+        self.assertIsNone(TeamAssessmentWorkflow.get_by_team_submission_uuid(self.team_submission_uuid))
+
+    def test_update_workflows(self):
+        team_submission_uuids = []
+        for team_id in ['team-rocket', 'team-magma']:
+            self._create_submission(team_id)
+            team_submission_uuids.append(self.team_submission_uuid)
+        team_api.create_workflows(team_submission_uuids)
+
+        team_workflows = team_api.update_workflows(team_submission_uuids + ['no-workflow'])
+
+        self.assertEqual(
+            [team_workflow['team_submission_uuid'] for team_workflow in team_workflows],
+            team_submission_uuids
+        )
+        for team_workflow in team_workflows:
+            self.assertIn('teams', team_workflow['status_details'])
+
     def test_get_workflow(self):
         self._create_submission()
         team_api.create_workflow(self.team_submission_uuid)
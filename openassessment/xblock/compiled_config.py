@@ -0,0 +1,156 @@
+"""
+Configuration derived from the content fields of an ORA block.
+
+Rendering a single page reads the assessment steps, the prompts and the rubric
+of the block many times, and each read used to parse or copy the underlying
+fields again. The derived values are now compiled once per block definition
+and shared by every instance of the block in the process: the compiled
+configurations are cached by a hash of the fields they are derived from, so
+a change to the definition (e.g. in Studio) is picked up by a new compiled
+configuration.
+"""
+import copy
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+from openassessment.xblock.data_conversion import create_prompts_list, update_assessments_format
+
+# Number of compiled configurations kept in the process
+COMPILED_CONFIG_CACHE_SIZE = 512
+
+_COMPILED_CONFIGS = OrderedDict()
+_COMPILED_CONFIGS_LOCK = threading.Lock()
+
+
+class CompiledConfig:
+    """
+    The configuration of an ORA block, derived from its content fields.
+
+    Instances are immutable and shared between block instances, so the values
+    they hold must not be modified: copy them first (as is already done before
+    adding e.g. selected options to the rubric criteria).
+    """
+
+    __slots__ = (
+        'valid_assessments',
+        'assessments_by_name',
+        'prompts',
+        'rubric_criteria_with_labels',
+        'workflow_requirements',
+        'white_listed_file_types',
+    )
+
+    def __init__(self, assessment_types, rubric_assessments, prompt, rubric_criteria, white_listed_file_types):
+        """
+        Compile the configuration.
+
+        Args:
+            assessment_types (list): The names of the assessment types the block can use.
+            rubric_assessments (list): The `rubric_assessments` field of the block.
+            prompt (unicode): The `prompt` field of the block.
+            rubric_criteria (list): The `rubric_criteria` field of the block.
+            white_listed_file_types (list): The `white_listed_file_types` field of the block.
+        """
+        valid_assessments = update_assessments_format(copy.deepcopy([
+            asmnt for asmnt in rubric_assessments
+            if asmnt.get('name') in assessment_types
+        ]))
+        assessments_by_name = {}
+        for assessment in valid_assessments:
+            assessments_by_name.setdefault(assessment['name'], assessment)
+
+        set_attribute = super().__setattr__
+        set_attribute('valid_assessments', valid_assessments)
+        set_attribute('assessments_by_name', assessments_by_name)
+        set_attribute('prompts', create_prompts_list(prompt))
+        set_attribute('rubric_criteria_with_labels', _criteria_with_labels(rubric_criteria))
+        set_attribute('workflow_requirements', _workflow_requirements(assessments_by_name))
+        set_attribute('white_listed_file_types', frozenset(white_listed_file_types or ()))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+
+def get_compiled_config(assessment_types, rubric_assessments, prompt, rubric_criteria, white_listed_file_types):
+    """
+    Return the compiled configuration for the given fields, compiling it
+    if it isn't cached yet (see `CompiledConfig` for the arguments).
+
+    Returns:
+        CompiledConfig
+    """
+    fields = (assessment_types, rubric_assessments, prompt, rubric_criteria, white_listed_file_types)
+    key = hashlib.sha1(
+        json.dumps(fields, sort_keys=True, default=str).encode('utf-8')
+    ).hexdigest()
+
+    with _COMPILED_CONFIGS_LOCK:
+        compiled_config = _COMPILED_CONFIGS.get(key)
+        if compiled_config is not None:
+            _COMPILED_CONFIGS.move_to_end(key)
+            return compiled_config
+
+    compiled_config = CompiledConfig(*fields)
+    with _COMPILED_CONFIGS_LOCK:
+        _COMPILED_CONFIGS[key] = compiled_config
+        while len(_COMPILED_CONFIGS) > COMPILED_CONFIG_CACHE_SIZE:
+            _COMPILED_CONFIGS.popitem(last=False)
+    return compiled_config
+
+
+def clear_compiled_configs():
+    """
+    Forget all compiled configurations.
+    """
+    with _COMPILED_CONFIGS_LOCK:
+        _COMPILED_CONFIGS.clear()
+
+
+def _criteria_with_labels(rubric_criteria):
+    """
+    Backwards compatibility: criteria and options created before the "label"
+    field was added use their "name" as label.
+    """
+    criteria = copy.deepcopy(rubric_criteria)
+    for criterion in criteria:
+        if 'label' not in criterion:
+            criterion['label'] = criterion['name']
+        for option in criterion['options']:
+            if 'label' not in option:
+                option['label'] = option['name']
+    return criteria
+
+
+def _workflow_requirements(assessments_by_name):
+    """
+    The requirements of each assessment step, which the workflow
+    uses to decide whether the student can receive a score.
+    """
+    requirements = {}
+
+    peer_assessment_module = assessments_by_name.get('peer-assessment')
+    if peer_assessment_module:
+        requirements["peer"] = {
+            "must_grade": peer_assessment_module["must_grade"],
+            "must_be_graded_by": peer_assessment_module["must_be_graded_by"],
+            "enable_flexible_grading": peer_assessment_module.get("enable_flexible_grading", False)
+        }
+
+    training_module = assessments_by_name.get('student-training')
+    if training_module:
+        requirements["training"] = {
+            "num_required": len(training_module["examples"])
+        }
+
+    staff_assessment_module = assessments_by_name.get('staff-assessment')
+    if staff_assessment_module:
+        requirements["staff"] = {
+            "required": staff_assessment_module["required"]
+        }
+
+    return requirements
@@ -1,9 +1,16 @@
 """
 Mixin for determining configuration and feature-toggle state relevant to an ORA block.
+
+The state of all the ORA feature flags for a course is resolved together, the first
+time one of them is needed, and kept for the rest of the request. Set the
+ORA2_FEATURE_FLAG_CACHE_TIMEOUT setting to a number of seconds to also keep it in
+the process for that long, so that consecutive requests don't look up the flags again.
 """
+import time
 
 from django.conf import settings
 from django.utils.functional import cached_property
+from edx_django_utils.cache import RequestCache
 from edx_toggles.toggles import WaffleSwitch
 from openassessment.runtime_imports.classes import import_course_waffle_flag, import_waffle_flag
 
@@ -23,6 +30,24 @@ FEATURE_TOGGLES_BY_FLAG_NAME = {
     ENHANCED_STAFF_GRADER: 'ENABLE_ENHANCED_STAFF_GRADER'
 }
 
+FEATURE_FLAG_CACHE_NAMESPACE = 'openassessment.feature_flags'
+
+# Toggle objects, created once per process, keyed by toggle type and flag name
+_toggles = {}
+
+# Resolved flag states kept in the process when ORA2_FEATURE_FLAG_CACHE_TIMEOUT is set,
+# keyed by course key: (expiry time, {flag name: enabled})
+_process_flag_states = {}
+
+
+def clear_feature_flag_cache():
+    """
+    Forget the toggle objects and the resolved flag states (for tests).
+    """
+    _toggles.clear()
+    _process_flag_states.clear()
+    RequestCache(FEATURE_FLAG_CACHE_NAMESPACE).clear()
+
 
 class ConfigMixin:
     """
@@ -34,8 +59,11 @@ class ConfigMixin:
         Returns a ``WaffleSwitch`` object in WAFFLE_NAMESPACE
         with the given ``switch_name``.
         """
-        # pylint: disable=toggle-missing-annotation
-        return WaffleSwitch(f"{WAFFLE_NAMESPACE}.{switch_name}", module_name=__name__)
+        key = ('switch', switch_name)
+        if key not in _toggles:
+            # pylint: disable=toggle-missing-annotation
+            _toggles[key] = WaffleSwitch(f"{WAFFLE_NAMESPACE}.{switch_name}", module_name=__name__)
+        return _toggles[key]
 
     @staticmethod
     def _course_waffle_flag(flag_name):
@@ -43,9 +71,12 @@ class ConfigMixin:
         Returns a ``CourseWaffleFlag`` object in WAFFLE_NAMESPACE
         with the given ``flag_name``.
         """
-        CourseWaffleFlag = import_course_waffle_flag()  # pylint: disable=invalid-name
-        # pylint: disable=toggle-missing-annotation
-        return CourseWaffleFlag(f"{WAFFLE_NAMESPACE}.{flag_name}", module_name=__name__)
+        key = ('course_flag', flag_name)
+        if key not in _toggles:
+            CourseWaffleFlag = import_course_waffle_flag()  # pylint: disable=invalid-name
+            # pylint: disable=toggle-missing-annotation
+            _toggles[key] = CourseWaffleFlag(f"{WAFFLE_NAMESPACE}.{flag_name}", module_name=__name__)
+        return _toggles[key]
 
     @staticmethod
     def _waffle_flag(flag_name):
@@ -53,9 +84,12 @@ class ConfigMixin:
         Return a ``WaffleFlag`` object in WAFFLE_NAMESPACE
         with the given ``flag_name``.
         """
-        WaffleFlag = import_waffle_flag()  # pylint: disable=invalid-name
-        # pylint: disable=toggle-missing-annotation
-        return WaffleFlag(f"{WAFFLE_NAMESPACE}.{flag_name}", module_name=__name__)
+        key = ('flag', flag_name)
+        if key not in _toggles:
+            WaffleFlag = import_waffle_flag()  # pylint: disable=invalid-name
+            # pylint: disable=toggle-missing-annotation
+            _toggles[key] = WaffleFlag(f"{WAFFLE_NAMESPACE}.{flag_name}", module_name=__name__)
+        return _toggles[key]
 
     @staticmethod
     def _settings_toggle_enabled(toggle_name):
@@ -70,25 +104,66 @@ class ConfigMixin:
         # If the feature toggle is not defined in settings, this will return False
         return toggle_state is True
 
-    def is_feature_enabled(self, flag):
+    @classmethod
+    def _resolve_feature_flag(cls, flag, course_key):
         """
         Returns True if a CourseWaffleFlag, WaffleSwitch, or Django settings ``FEATURE``
-        is enabled for this block, False otherwise.
+        is enabled for ``flag`` in the course, False otherwise.
         """
-        if hasattr(self, 'location') and self._course_waffle_flag(flag).is_enabled(self.location.course_key):
+        if course_key is not None and cls._course_waffle_flag(flag).is_enabled(course_key):
             return True
 
-        if self._waffle_switch(flag).is_enabled():
+        if cls._waffle_switch(flag).is_enabled():
             return True
 
-        if self._waffle_flag(flag).is_enabled():
+        if cls._waffle_flag(flag).is_enabled():
             return True
 
-        if self._settings_toggle_enabled(FEATURE_TOGGLES_BY_FLAG_NAME.get(flag)):
+        if cls._settings_toggle_enabled(FEATURE_TOGGLES_BY_FLAG_NAME.get(flag)):
             return True
 
         return False
 
+    @classmethod
+    def resolve_feature_flags(cls, course_key=None):
+        """
+        Returns the state of all the ORA feature flags for a course, as a dict
+        of flag name to boolean.
+
+        The flags are looked up at most once per request and course, and at most once
+        per ORA2_FEATURE_FLAG_CACHE_TIMEOUT seconds in the process if that setting is set.
+        """
+        request_cache = RequestCache(FEATURE_FLAG_CACHE_NAMESPACE)
+        cache_key = str(course_key)
+        cached_response = request_cache.get_cached_response(cache_key)
+        if cached_response.is_found:
+            return cached_response.value
+
+        timeout = getattr(settings, 'ORA2_FEATURE_FLAG_CACHE_TIMEOUT', None)
+        expires_at, flag_states = _process_flag_states.get(cache_key, (0, None))
+        if not timeout or expires_at < time.monotonic():
+            flag_states = {
+                flag: cls._resolve_feature_flag(flag, course_key)
+                for flag in FEATURE_TOGGLES_BY_FLAG_NAME
+            }
+            if timeout:
+                _process_flag_states[cache_key] = (time.monotonic() + timeout, flag_states)
+
+        request_cache.set(cache_key, flag_states)
+        return flag_states
+
+    def is_feature_enabled(self, flag):
+        """
+        Returns True if a CourseWaffleFlag, WaffleSwitch, or Django settings ``FEATURE``
+        is enabled for this block, False otherwise.
+        """
+        course_key = self.location.course_key if hasattr(self, 'location') else None
+        flag_states = self.resolve_feature_flags(course_key)
+        if flag not in flag_states:
+            # Not one of the ORA flags, so it is resolved on its own
+            flag_states[flag] = self._resolve_feature_flag(flag, course_key)
+        return flag_states[flag]
+
     @cached_property
     def team_submissions_enabled(self):
         """
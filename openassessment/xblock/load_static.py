@@ -3,10 +3,15 @@ Helper class for loading generated file from webpack.
 """
 import json
 import logging
+import pkgutil
 
-from pkg_resources import resource_string
 from django.conf import settings
 
+try:
+    from importlib.resources import files as resource_files
+except ImportError:  # Python < 3.9
+    resource_files = None
+
 logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
 
 
@@ -21,12 +26,25 @@ def urljoin(*args):
     return begining_slash + joined_path + trailing_slash
 
 
+def _read_manifest():
+    """
+    Read the manifest of the generated files, which is part of this package.
+    """
+    if resource_files is None:
+        return pkgutil.get_data(__name__, 'static/dist/manifest.json')
+    return (resource_files(__package__) / 'static' / 'dist' / 'manifest.json').read_bytes()
+
+
 class LoadStatic:
     """
     Helper class for loading generated file from webpack.
+
+    The manifest is read once, and the URL of each file it lists is computed
+    when it is read, so getting a URL is a dictionary lookup.
     """
 
     _manifest = {}
+    _urls = {}
     _base_url = ''
     _is_loaded = False
 
@@ -42,13 +60,16 @@ class LoadStatic:
             logger.error('LMS_ROOT_URL is undefined')
 
         try:
-            json_data = resource_string(__name__, 'static/dist/manifest.json').decode("utf8")
+            json_data = _read_manifest().decode("utf8")
             LoadStatic._manifest = json.loads(json_data)
             LoadStatic._is_loaded = True
         except OSError:
             logger.error('Cannot find static/dist/manifest.json')
         finally:
             LoadStatic._base_url = urljoin(root_url, base_url)
+            LoadStatic._urls = {
+                key: urljoin(LoadStatic._base_url, url) for key, url in LoadStatic._manifest.items()
+            }
 
     @staticmethod
     def get_url(key):
@@ -57,5 +78,8 @@ class LoadStatic:
         """
         if not LoadStatic._is_loaded:
             LoadStatic.reload_manifest()
-        url = LoadStatic._manifest[key] if key in LoadStatic._manifest else key
-        return urljoin(LoadStatic._base_url, url)
+        url = LoadStatic._urls.get(key)
+        if url is None:
+            # Not a generated file, so it is served as is
+            url = LoadStatic._urls[key] = urljoin(LoadStatic._base_url, key)
+        return url
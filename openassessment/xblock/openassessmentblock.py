@@ -1,30 +1,29 @@
 """An XBlock where students can read a question and compose their response"""
 
-import copy
 import datetime as dt
 import json
 import logging
 import os
+import pkgutil
 import re
 
-import pkg_resources
 import pytz
 
 from django.conf import settings
-from django.template.loader import get_template
 
 from bleach.sanitizer import Cleaner
-from lazy import lazy
 from webob import Response
 from xblock.core import XBlock
 from xblock.exceptions import NoSuchServiceError
 from xblock.fields import Boolean, Integer, List, Scope, String
 from web_fragments.fragment import Fragment
 
+from openassessment.instrumentation import instrument_handler
 from openassessment.staffgrader.staff_grader_mixin import StaffGraderMixin
 from openassessment.workflow.errors import AssessmentWorkflowError
+from openassessment.xblock.compiled_config import CompiledConfig, get_compiled_config
 from openassessment.xblock.course_items_listing_mixin import CourseItemsListingMixin
-from openassessment.xblock.data_conversion import create_prompts_list, create_rubric_dict, update_assessments_format
+from openassessment.xblock.data_conversion import create_rubric_dict
 from openassessment.xblock.defaults import *  # pylint: disable=wildcard-import, unused-wildcard-import
 from openassessment.xblock.grade_mixin import GradeMixin
 from openassessment.xblock.leaderboard_mixin import LeaderboardMixin
@@ -47,6 +46,7 @@ from openassessment.xblock.validation import validator
 from openassessment.xblock.config_mixin import ConfigMixin
 from openassessment.xblock.workflow_mixin import WorkflowMixin
 from openassessment.xblock.team_workflow_mixin import TeamWorkflowMixin
+from openassessment.xblock.template_registry import template_registry
 from openassessment.xblock.openassesment_template_mixin import OpenAssessmentTemplatesMixin
 from openassessment.xblock.xml import parse_from_xml, serialize_content_to_xml
 from openassessment.xblock.editor_config import AVAILABLE_EDITORS
@@ -96,7 +96,7 @@ UI_MODELS = {
 
 def load(path):
     """Handy helper for getting resources from our kit."""
-    data = pkg_resources.resource_string(__name__, path)
+    data = pkgutil.get_data(__name__, path)
     return data.decode("utf8")
 
 
@@ -138,6 +138,9 @@ class OpenAssessmentBlock(MessageMixin,
         'staff-assessment',
     ]
 
+    # Share compiled configurations between block instances (see `compiled_config`)
+    CACHE_COMPILED_CONFIG = True
+
     public_dir = 'static'
 
     submission_start = String(
@@ -306,6 +309,11 @@ class OpenAssessmentBlock(MessageMixin,
         help="Should the rubric be visible to learners in the response section?"
     )
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # The content fields and their compiled configuration (see `compiled_config`)
+        self._compiled_config = ((), None)
+
     @property
     def course_id(self):
         return str(self.xmodule_runtime.course_id)  # pylint: disable=no-member
@@ -504,6 +512,7 @@ class OpenAssessmentBlock(MessageMixin,
         """
         Add all the JavaScript files from a directory to the specified fragment
         """
+        import pkg_resources  # pylint: disable=import-outside-toplevel
         if pkg_resources.resource_isdir(__name__, item):
             for child_item in pkg_resources.resource_listdir(__name__, item):
                 path = os.path.join(item, child_item)
@@ -546,7 +555,7 @@ class OpenAssessmentBlock(MessageMixin,
             "rubric_assessments": ui_models,
             "show_staff_area": self.is_course_staff and not self.in_studio_preview,
         }
-        template = get_template("openassessmentblock/oa_base.html")
+        template = template_registry.get_template("openassessmentblock/oa_base.html")
         return self._create_fragment(template, context_dict, initialize_js_func='OpenAssessmentBlock')
 
     def ora_blocks_listing_view(self, context=None):
@@ -577,7 +586,7 @@ class OpenAssessmentBlock(MessageMixin,
             "ora_item_view_enabled": ora_item_view_enabled
         }
 
-        template = get_template('openassessmentblock/instructor_dashboard/oa_listing.html')
+        template = template_registry.get_template('openassessmentblock/instructor_dashboard/oa_listing.html')
 
         min_postfix = '.min' if settings.DEBUG else ''
 
@@ -618,7 +627,9 @@ class OpenAssessmentBlock(MessageMixin,
                 self.get_staff_assessment_statistics_context(student_item["course_id"], student_item["item_id"])
             )
 
-        template = get_template('openassessmentblock/instructor_dashboard/oa_grade_available_responses.html')
+        template = template_registry.get_template(
+            'openassessmentblock/instructor_dashboard/oa_grade_available_responses.html'
+        )
 
         return self._create_fragment(template, context_dict, initialize_js_func='StaffAssessmentBlock')
 
@@ -648,7 +659,9 @@ class OpenAssessmentBlock(MessageMixin,
                 self, "waiting_step_data",
             )
 
-        template = get_template('openassessmentblock/instructor_dashboard/oa_waiting_step_details.html')
+        template = template_registry.get_template(
+            'openassessmentblock/instructor_dashboard/oa_waiting_step_details.html'
+        )
 
         return self._create_fragment(
             template,
@@ -922,7 +935,7 @@ class OpenAssessmentBlock(MessageMixin,
         Returns:
             list of dict
         """
-        return create_prompts_list(self.prompt)
+        return self.compiled_config.prompts
 
     @prompts.setter
     def prompts(self, value):
@@ -942,6 +955,51 @@ class OpenAssessmentBlock(MessageMixin,
         else:
             self.prompt = json.dumps(value)
 
+    @property
+    def compiled_config(self):
+        """
+        The configuration derived from the content fields of the block.
+
+        It is compiled once per block definition and shared by the block
+        instances of the process, and kept by this instance for as long as
+        the fields are not replaced (each handler call checks them again).
+
+        Returns:
+            CompiledConfig
+        """
+        fields = (
+            self.VALID_ASSESSMENT_TYPES_FOR_TEAMS if self.teams_enabled else self.VALID_ASSESSMENT_TYPES,
+            self.rubric_assessments,
+            self.prompt,
+            self.rubric_criteria,
+            self.white_listed_file_types,
+        )
+        if not self.CACHE_COMPILED_CONFIG:
+            return CompiledConfig(*fields)
+
+        compiled_fields, compiled_config = self._compiled_config
+        if len(fields) != len(compiled_fields) or any(
+            field is not compiled_field for field, compiled_field in zip(fields, compiled_fields)
+        ):
+            compiled_config = get_compiled_config(*fields)
+            self._compiled_config = (fields, compiled_config)
+        return compiled_config
+
+    def reset_compiled_config(self):
+        """
+        Look the compiled configuration up again on the next access,
+        e.g. after the content fields were modified in place.
+        """
+        self._compiled_config = ((), None)
+
+    def handle(self, handler_name, request, suffix=''):
+        """
+        Check the compiled configuration again for each request, and
+        measure the handler calls when the instrumentation is enabled.
+        """
+        self.reset_compiled_config()
+        return instrument_handler(handler_name, super().handle, handler_name, request, suffix)
+
     @property
     def valid_assessments(self):
         """
@@ -950,19 +1008,13 @@ class OpenAssessmentBlock(MessageMixin,
         assessment types are stored in the XBlock field (e.g. because
         we roll back code after releasing a feature).
 
+        The list is shared with other block instances, so it should NOT be modified.
+
         Returns:
             list
 
         """
-        assessment_types = self.VALID_ASSESSMENT_TYPES
-        if self.teams_enabled:
-            assessment_types = self.VALID_ASSESSMENT_TYPES_FOR_TEAMS
-
-        _valid_assessments = [
-            asmnt for asmnt in self.rubric_assessments
-            if asmnt.get('name') in assessment_types
-        ]
-        return update_assessments_format(copy.deepcopy(_valid_assessments))
+        return self.compiled_config.valid_assessments
 
     @property
     def assessment_steps(self):
@@ -983,7 +1035,7 @@ class OpenAssessmentBlock(MessageMixin,
             assessment_steps.append(assessment['name'])
         return assessment_steps
 
-    @lazy
+    @property
     def rubric_criteria_with_labels(self):
         """
         Backwards compatibility: We used to treat "name" as both a user-facing label
@@ -994,21 +1046,14 @@ class OpenAssessmentBlock(MessageMixin,
         (because they were created before this change),
         we create a new label that has the same value as "name".
 
-        The result of this call is cached, so it should NOT be used in a runtime
-        that can modify the XBlock settings (in the LMS, settings are read-only).
+        The criteria are shared with other block instances, so they should NOT be
+        modified: callers that add to them work on a copy.
 
         Returns:
             list of criteria dictionaries
 
         """
-        criteria = copy.deepcopy(self.rubric_criteria)
-        for criterion in criteria:
-            if 'label' not in criterion:
-                criterion['label'] = criterion['name']
-            for option in criterion['options']:
-                if 'label' not in option:
-                    option['label'] = option['name']
-        return criteria
+        return self.compiled_config.rubric_criteria_with_labels
 
     def render_assessment(self, path, context_dict=None):
         """Render an Assessment Module's HTML
@@ -1032,8 +1077,15 @@ class OpenAssessmentBlock(MessageMixin,
 
         context_dict['text_response_editor'] = self.text_response_editor
 
-        template = get_template(path)
-        return Response(template.render(context_dict), content_type='application/html', charset='UTF-8')
+        html = template_registry.render(path, context_dict, version=self.fragment_version)
+        return Response(html, content_type='application/html', charset='UTF-8')
+
+    @property
+    def fragment_version(self):
+        """
+        The version of the block definition, which keys its cached fragments.
+        """
+        return f"{self.get_xblock_id()}@{getattr(self, 'edited_on', None)}"
 
     def add_xml_to_node(self, node):
         """
@@ -1052,7 +1104,7 @@ class OpenAssessmentBlock(MessageMixin,
             Response: A response object with an HTML body.
         """
         context = {'error_msg': error_msg}
-        template = get_template('openassessmentblock/oa_error.html')
+        template = template_registry.get_template('openassessmentblock/oa_error.html')
         return Response(template.render(context), content_type='application/html', charset='UTF-8')
 
     def is_closed(self, step=None, course_staff=None):
@@ -1218,10 +1270,7 @@ class OpenAssessmentBlock(MessageMixin,
                 "must_be_graded_by": 3,
             }
         """
-        for assessment in self.valid_assessments:
-            if assessment["name"] == mixin_name:
-                return assessment
-        return None
+        return self.compiled_config.assessments_by_name.get(mixin_name)
 
     def publish_assessment_event(self, event_name, assessment, **kwargs):
         """
@@ -12,7 +12,7 @@ from django.core.exceptions import ObjectDoesNotExist
 from xblock.core import XBlock
 from submissions.errors import SubmissionNotFoundError
 from openassessment.assessment.errors import PeerAssessmentInternalError
-from openassessment.fileupload.api import delete_shared_files_for_team, remove_file
+from openassessment.fileupload.api import delete_shared_files_for_team, remove_files
 from openassessment.workflow.errors import AssessmentWorkflowError, AssessmentWorkflowInternalError
 from openassessment.xblock.data_conversion import create_submission_dict
 from openassessment.xblock.resolve_dates import DISTANT_FUTURE, DISTANT_PAST
@@ -594,9 +594,8 @@ class StaffAreaMixin:
                 self._cancel_workflow(sub['uuid'], "Student state cleared", requesting_user_id=requesting_user_id)
 
                 # Delete files from the backend
-                if 'file_keys' in sub['answer']:
-                    for key in sub['answer']['file_keys']:
-                        remove_file(key)
+                if sub['answer'].get('file_keys'):
+                    remove_files(sub['answer']['file_keys'])
 
                 # Tell the submissions API to orphan the submission to prevent it from being accessed
                 submission_api.reset_score(
@@ -178,12 +178,7 @@ class StudentTrainingMixin:
             # This will contain the essay text, the rubric, and the options the instructor selected.
             examples = convert_training_examples_list_to_dict(training_module["examples"])
             example = student_training.get_training_example(
-                self.submission_uuid,
-                {
-                    'prompt': self.prompt,
-                    'criteria': self.rubric_criteria_with_labels
-                },
-                examples
+                self.submission_uuid, self.training_rubric_dict(), examples
             )
 
             training_essay_context, error_message = self._parse_example(example)
@@ -200,6 +195,18 @@ class StudentTrainingMixin:
 
         return template, context
 
+    def training_rubric_dict(self):
+        """
+        The rubric the training examples are assessed with.
+
+        Returns:
+            dict
+        """
+        return {
+            'prompt': self.prompt,
+            'criteria': self.rubric_criteria_with_labels
+        }
+
     @XBlock.json_handler
     def training_assess(self, data, suffix=''):  # pylint:disable=W0613
         """
@@ -12,16 +12,21 @@ from web_fragments.fragment import Fragment
 from xblock.core import XBlock
 from xblock.fields import List, Scope
 
-from django.template.loader import get_template
+from django.db import DatabaseError, transaction
 from django.utils.translation import gettext_lazy
 
-from openassessment.xblock.data_conversion import (create_rubric_dict, make_django_template_key,
-                                                   update_assessments_format)
+from openassessment.assessment.api import student_training
+from openassessment.assessment.models import InvalidRubricSelection
+from openassessment.assessment.serializers import (InvalidRubric, InvalidTrainingExample, RubricSerializer,
+                                                   rubric_from_dict)
+from openassessment.xblock.data_conversion import (convert_training_examples_list_to_dict, create_rubric_dict,
+                                                   make_django_template_key, update_assessments_format)
 from openassessment.xblock.defaults import DEFAULT_EDITOR_ASSESSMENTS_ORDER, DEFAULT_RUBRIC_FEEDBACK_TEXT
 from openassessment.xblock.editor_config import AVAILABLE_EDITORS
 from openassessment.xblock.load_static import LoadStatic
 from openassessment.xblock.resolve_dates import DateValidationError, InvalidDateFormat, parse_date_value, resolve_dates
 from openassessment.xblock.schema import EDITOR_UPDATE_SCHEMA
+from openassessment.xblock.template_registry import template_registry
 from openassessment.xblock.validation import validator
 
 logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
@@ -79,7 +84,7 @@ class StudioMixin:
         Returns:
             (Fragment): An HTML fragment for editing the configuration of this XBlock.
         """
-        rendered_template = get_template(
+        rendered_template = template_registry.get_template(
             self.STUDIO_EDITING_TEMPLATE
         ).render(self.editor_context())
         fragment = Fragment(rendered_template)
@@ -300,8 +305,58 @@ class StudioMixin:
         self.selected_teamset_id = data.get('selected_teamset_id', '')
         self.show_rubric_during_response = data.get('show_rubric_during_response', False)
 
+        # Create the rubric and training examples now rather than when the first learners assess,
+        # in a savepoint so that a database error does not break the transaction of the request
+        try:
+            with transaction.atomic():
+                self.materialize_assessment_data()
+        except (InvalidRubric, InvalidRubricSelection, InvalidTrainingExample, DatabaseError):
+            logger.exception("Could not materialize the rubric and training examples of %s", self.location)
+
         return {'success': True, 'msg': self._('Successfully updated OpenAssessment XBlock')}
 
+    def materialize_assessment_data(self):
+        """
+        Create the rubric and training example models used by the assessments of
+        this block, if they do not exist yet, and warm the caches keyed by their
+        content hashes.
+
+        Otherwise, they are created by the first learners who assess, and many
+        concurrent learners race to create the same rows when a deadline opens.
+
+        Returns:
+            dict with keys 'rubrics' (list of rubric content hashes) and
+            'training_examples' (int, the number of training examples)
+
+        Raises:
+            InvalidRubric
+            InvalidRubricSelection
+            InvalidTrainingExample
+            DatabaseError
+        """
+        rubric_dicts = [create_rubric_dict(self.prompts, self.rubric_criteria_with_labels)]
+        training_module = self.get_assessment_module('student-training')
+        if training_module:
+            rubric_dicts.append(self.training_rubric_dict())
+
+        content_hashes = []
+        for rubric_dict in rubric_dicts:
+            rubric = rubric_from_dict(rubric_dict)
+            RubricSerializer.serialized_from_cache(rubric)
+            content_hashes.append(rubric.content_hash)
+
+        num_examples = 0
+        if training_module:
+            training_set = student_training.get_training_set(
+                self.training_rubric_dict(),
+                convert_training_examples_list_to_dict(training_module['examples'])
+            )
+            if training_set.errors:
+                raise InvalidTrainingExample("; ".join(training_set.errors))
+            num_examples = len(training_set.examples)
+
+        return {'rubrics': content_hashes, 'training_examples': num_examples}
+
     @XBlock.json_handler
     def check_released(self, data, suffix=''):  # pylint: disable=unused-argument
         """
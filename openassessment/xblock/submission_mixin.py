@@ -9,8 +9,6 @@ from django.utils.functional import cached_property
 from xblock.core import XBlock
 from xblock.exceptions import NoSuchServiceError
 
-from submissions.team_api import get_team_submission
-
 from openassessment.fileupload import api as file_upload_api
 from openassessment.fileupload.exceptions import FileUploadError
 from openassessment.workflow.errors import AssessmentWorkflowError
@@ -363,6 +361,8 @@ class SubmissionMixin:
         )
 
         self.create_team_workflow(submission["team_submission_uuid"])
+        # The team now has a submission
+        self.reset_team_context()
         # Emit analytics event...
         self.runtime.publish(
             self,
@@ -520,7 +520,7 @@ class SubmissionMixin:
         elif self.file_upload_type == 'pdf-and-image' and content_type not in self.ALLOWED_FILE_MIME_TYPES:
             return False
 
-        elif self.file_upload_type == 'custom' and file_ext.lower() not in self.white_listed_file_types:
+        elif self.file_upload_type == 'custom' and file_ext.lower() not in self.compiled_config.white_listed_file_types:
             return False
 
         elif file_ext in self.FILE_EXT_BLACK_LIST:
@@ -643,8 +643,9 @@ class SubmissionMixin:
         urls = []
         raw_answer = submission.get('answer')
         answer = OraSubmissionAnswerFactory.parse_submission_raw_answer(raw_answer)
-        for file_upload in answer.get_file_uploads(missing_blank=True):
-            file_download_url = cls._get_url_by_file_key(file_upload.key)
+        file_uploads = answer.get_file_uploads(missing_blank=True)
+        file_download_urls = file_upload_api.get_download_urls([file_upload.key for file_upload in file_uploads])
+        for file_upload, file_download_url in zip(file_uploads, file_download_urls):
             if file_download_url:
                 urls.append(
                     file_upload_api.FileDescriptor(
@@ -683,9 +684,13 @@ class SubmissionMixin:
                 user_state.get('saved_files_names', '[]'),
                 log_error=True
             )
+            files_keys = [
+                file_upload_api.get_student_file_key(item_dict, index) for index in range(len(files_descriptions))
+            ]
+            download_urls = file_upload_api.get_download_urls(files_keys)
             for index, description in enumerate(files_descriptions):
-                file_key = file_upload_api.get_student_file_key(item_dict, index)
-                download_url = self._get_url_by_file_key(file_key)
+                file_key = files_keys[index]
+                download_url = download_urls[index]
                 if download_url:
                     file_name = files_names[index] if index < len(files_names) else ''
                     files_info.append(
@@ -715,16 +720,81 @@ class SubmissionMixin:
         Used for an extreme edge case, where the stored files indices are out of sync with
         the uploaded files, this is a last resort to get the download URLs of all the files
         that have been uploaded by a learner in an ORA block(and haven't been deleted from the storage).
-        Starting from 0 index to maximum file upload count possible, this checks if a file exists against
-        every index. If present, add the info, else repeat it for the next indices.
+        The files of the learner are listed with a single request to the storage. If the storage
+        backend can't list files, this checks, from 0 index to maximum file upload count possible,
+        if a file exists against every index.
 
         Arguments:
             username_or_email(str): username or email of the learner whose files' information is to be obtained.
         Returns:
             List of FileDescriptor dicts
         """
-        file_uploads = []
-        student_item_dict = self.get_student_item_dict_from_username_or_email(username_or_email)
+        return self.get_all_upload_urls_for_users([username_or_email])[username_or_email]
+
+    def get_all_upload_urls_for_users(self, usernames_or_emails):
+        """
+        Get the download URLs for all the files uploaded and still present of several learners
+        (see `get_all_upload_urls_for_user`), listing the files of the learners in parallel.
+
+        Arguments:
+            usernames_or_emails(list of str): usernames or emails of the learners.
+        Returns:
+            dict of username or email to list of FileDescriptor dicts
+        """
+        student_item_dicts = {
+            username_or_email: self.get_student_item_dict_from_username_or_email(username_or_email)
+            for username_or_email in usernames_or_emails
+        }
+        try:
+            stored_file_keys = file_upload_api.get_stored_file_keys_for_students(
+                list(student_item_dicts.values()), self.MAX_FILES_COUNT
+            )
+        except FileUploadError:
+            logger.exception("Could not list the files of %s, checking each file instead", usernames_or_emails)
+            stored_file_keys = {}
+
+        file_uploads = {}
+        for username_or_email, student_item_dict in student_item_dicts.items():
+            file_uploads[username_or_email] = []
+            file_keys = stored_file_keys.get(student_item_dict['student_id'])
+            for file_key, download_url in self._get_all_download_urls(student_item_dict, file_keys):
+                if download_url:
+                    logger.info(
+                        "Download URL exists for key %s in block %s for user %s",
+                        file_key,
+                        username_or_email,
+                        str(self.location)
+                    )
+                    file_uploads[username_or_email].append(
+                        file_upload_api.FileDescriptor(
+                            download_url=download_url,
+                            description='',
+                            name='',
+                            size=None,
+                            show_delete_button=False
+                        )._asdict()
+                    )
+
+        return file_uploads
+
+    def _get_all_download_urls(self, student_item_dict, file_keys=None):
+        """
+        Yield the key and download URL of each file of a learner, the URL being empty
+        if the file is missing or its URL can't be generated.
+
+        The files are the given keys of the files listed in the storage, or, if the
+        storage can't list files, every file index, checked one by one.
+        """
+        if file_keys is not None:
+            for file_key in file_keys:
+                download_url = ''
+                try:
+                    download_url = file_upload_api.generate_download_url(file_key)
+                except FileUploadError:
+                    logger.exception("Could not generate the download URL of %s", file_key)
+                yield file_key, download_url
+            return
+
         for index in range(self.MAX_FILES_COUNT):
             file_key = file_upload_api.get_student_file_key(student_item_dict, index)
             download_url = ''
@@ -732,27 +802,7 @@ class SubmissionMixin:
                 download_url = file_upload_api.get_download_url(file_key)
             except FileUploadError:
                 pass
-
-            if download_url:
-                logger.info(
-                    "Download URL exists for key %s in block %s for user %s",
-                    file_key,
-                    username_or_email,
-                    str(self.location)
-                )
-                file_uploads.append(
-                    file_upload_api.FileDescriptor(
-                        download_url=download_url,
-                        description='',
-                        name='',
-                        size=None,
-                        show_delete_button=False
-                    )._asdict()
-                )
-            else:
-                continue
-
-        return file_uploads
+            yield file_key, download_url
 
     @staticmethod
     def get_user_submission(submission_uuid):
@@ -910,7 +960,11 @@ class SubmissionMixin:
             if not workflow:
                 team_id_for_current_submission = self.get_team_info().get('team_id', None)
             else:
-                team_submission = get_team_submission(workflow['team_submission_uuid'])
+                team_submission = self.team_context.team_submission
+                if not team_submission or team_submission['team_submission_uuid'] != workflow['team_submission_uuid']:
+                    # Import is placed here to avoid model import at project startup.
+                    from submissions import team_api
+                    team_submission = team_api.get_team_submission(workflow['team_submission_uuid'])
                 team_id_for_current_submission = team_submission['team_id']
 
             # If it's a team assignment, the user hasn't submitted and is not on a team, the assignment is unavailable.
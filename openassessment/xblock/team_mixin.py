@@ -18,6 +18,91 @@ from openassessment.xblock.data_conversion import list_to_conversational_format
 logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
 
 
+class TeamContext:
+    """
+    The team information of the current user, shared by the team-aware mixins
+    while handling a request.
+
+    Each value is looked up the first time it is needed and then kept, so that
+    rendering a page calls the teams service and the team submissions API
+    once rather than once per mixin. A new context is used for each handler
+    call, and after the user's team submission is created.
+    """
+
+    def __init__(self, block):
+        self._block = block
+        self._team_has_submission = {}
+
+    @cached_property
+    def team(self):
+        """
+        The user's CourseTeam, or None (see `TeamMixin.team`).
+        """
+        return self._block.team
+
+    @cached_property
+    def usernames(self):
+        """
+        The usernames of the members of the user's team.
+        """
+        return [user.username for user in self.team.users.all()]
+
+    @cached_property
+    def anonymous_user_ids(self):
+        """
+        The anonymous user ids of the members of the user's team.
+        """
+        user = self._block.get_real_user(self._block.get_anonymous_user_id_from_xmodule_runtime())
+        return self._block.teams_service.get_anonymous_user_ids_for_team(user, self.team)
+
+    @cached_property
+    def team_submission(self):
+        """
+        The team submission of the user, for this block and any of the user's teams, or None.
+        """
+        try:
+            return get_team_submission_for_student(self._block.get_student_item_dict())
+        except TeamSubmissionNotFoundError:
+            return None
+
+    @cached_property
+    def team_info(self):
+        """
+        The team information of `TeamMixin.get_team_info`, for a user who is on a team.
+        """
+        previous_team_name = None
+        if self.team_submission and self.team.team_id != self.team_submission['team_id']:
+            previous_team_name = self._block.teams_service.get_team_by_team_id(
+                self.team_submission['team_id']
+            ).name
+
+        return {
+            'team_id': self.team.team_id,
+            'team_name': self.team.name,
+            'team_usernames': self.usernames,
+            'team_url': self._block.teams_service.get_team_detail_url(self.team),
+            'previous_team_name': previous_team_name,
+        }
+
+    def team_has_submission(self, team_id):
+        """
+        Whether the given team has a submission for this block.
+        """
+        if team_id not in self._team_has_submission:
+            student_item_dict = self._block.get_student_item_dict()
+            try:
+                get_team_submission_for_team(
+                    student_item_dict['course_id'],
+                    student_item_dict['item_id'],
+                    team_id
+                )
+                # If there's no submission, we will raise a TeamSubmissionNotFoundError
+                self._team_has_submission[team_id] = True
+            except TeamSubmissionNotFoundError:
+                self._team_has_submission[team_id] = False
+        return self._team_has_submission[team_id]
+
+
 class TeamMixin:
     """Team Mixin introducing all teams-related functionality."""
 
@@ -28,6 +113,29 @@ class TeamMixin:
         'team_id': 'TEAM_ID',
     }
 
+    @property
+    def team_context(self):
+        """
+        The `TeamContext` of the current user, for the current request.
+        """
+        team_context = getattr(self, '_team_context', None)
+        if team_context is None:
+            team_context = self._team_context = TeamContext(self)
+        return team_context
+
+    def reset_team_context(self):
+        """
+        Forget the team information looked up so far, e.g. after a team submission is created.
+        """
+        self._team_context = None
+
+    def handle(self, handler_name, request, suffix=''):
+        """
+        Handle each request with a new team context.
+        """
+        self.reset_team_context()
+        return super().handle(handler_name, request, suffix)
+
     def is_team_assignment(self):
         # pylint: disable=no-member
         return self.teams_enabled and self.team_submissions_enabled
@@ -156,24 +264,7 @@ class TeamMixin:
         if self.in_studio_preview:
             return self.STAFF_OR_PREVIEW_INFO
         elif self.has_team():
-            student_item_dict = self.get_student_item_dict()
-            previous_team_name = None
-            try:
-                students_team_submission = get_team_submission_for_student(student_item_dict)
-                if self.team.team_id != students_team_submission['team_id']:
-                    previous_team_name = self.teams_service.get_team_by_team_id(
-                        students_team_submission['team_id']
-                    ).name
-            except TeamSubmissionNotFoundError:
-                pass
-
-            return {
-                'team_id': self.team.team_id,
-                'team_name': self.team.name,
-                'team_usernames': [user.username for user in self.team.users.all()],
-                'team_url': self.teams_service.get_team_detail_url(self.team),
-                'previous_team_name': previous_team_name,
-            }
+            return self.team_context.team_info
         elif self.is_course_staff:
             return self.STAFF_OR_PREVIEW_INFO
         else:
@@ -181,10 +272,7 @@ class TeamMixin:
 
     def get_anonymous_user_ids_for_team(self):
         if self.has_team():
-            anonymous_user_id = self.get_anonymous_user_id_from_xmodule_runtime()
-            user = self.get_real_user(anonymous_user_id)
-
-            return self.teams_service.get_anonymous_user_ids_for_team(user, self.team)
+            return self.team_context.anonymous_user_ids
         return None
 
     def get_team_submission_uuid_from_individual_submission_uuid(self, individual_submission_uuid):
@@ -195,14 +283,4 @@ class TeamMixin:
         return team_submission['team_submission_uuid']
 
     def does_team_have_submission(self, team_id):
-        try:
-            student_item_dict = self.get_student_item_dict()
-            get_team_submission_for_team(
-                student_item_dict['course_id'],
-                student_item_dict['item_id'],
-                team_id
-            )
-            # If there's no submission, we will raise a TeamSubmissionNotFoundError
-            return True
-        except TeamSubmissionNotFoundError:
-            return False
+        return self.team_context.team_has_submission(team_id)
@@ -5,8 +5,7 @@ Handle OpenAssessment XBlock requests around team functionality to the Workflow
 import logging
 
 from xblock.core import XBlock
-from submissions import team_api as team_sub_api
-from submissions.errors import TeamSubmissionNotFoundError, TeamSubmissionInternalError
+from submissions.errors import TeamSubmissionInternalError
 from openassessment.workflow import team_api as team_workflow_api
 from openassessment.workflow.models import AssessmentWorkflowCancellation
 
@@ -78,12 +77,11 @@ class TeamWorkflowMixin:
         Returns: team submission uuid if one exists, or
                  None if none exists or there was an error looking it up
         """
-        student_item_dict = self.get_student_item_dict()
         try:
-            team_submission = team_sub_api.get_team_submission_for_student(student_item_dict)
-        except (TeamSubmissionNotFoundError, TeamSubmissionInternalError):
+            team_submission = self.team_context.team_submission
+        except TeamSubmissionInternalError:
             return None
-        return team_submission['team_submission_uuid']
+        return team_submission['team_submission_uuid'] if team_submission else None
 
     def get_team_workflow_status_counts(self):
         """
@@ -0,0 +1,162 @@
+"""
+Registry of the compiled templates of the ORA block, and cache of the
+fragments rendered from templates that don't depend on the learner.
+
+By default, templates are looked up by the template engine for every render,
+so that the template loaders can resolve them per request (e.g. the overrides
+of the comprehensive theme of a site). Set ORA2_COMPILED_TEMPLATES to True to
+load and compile the templates under "openassessmentblock/" once per process,
+the first time one of them is needed, on deployments where the ORA templates
+are not overridden by site.
+
+Fragments that only depend on the configuration of the block and on the
+locale (e.g. the unavailable, closed and waiting states of a step) can also be
+cached. This is opt-in: set ORA2_FRAGMENT_CACHE_TIMEOUT to the number of seconds
+a rendered fragment is kept in the default Django cache. Rendered fragments are
+keyed by the version of the block, the template, the locale and a hash of the
+render context, so a fragment is only reused for an identical context. As with
+compiled templates, don't cache fragments if their templates are overridden by site.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+
+from django.conf import settings
+from django.core.cache import cache
+from django.template.loader import get_template as load_template
+from django.utils.translation import get_language
+
+logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
+
+TEMPLATES_ROOT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'templates')
+TEMPLATES_DIR = 'openassessmentblock'
+
+# Templates whose output only depends on the block configuration and the locale
+CACHEABLE_TEMPLATES = frozenset([
+    'openassessmentblock/grade/oa_grade_waiting.html',
+    'openassessmentblock/leaderboard/oa_leaderboard_waiting.html',
+    'openassessmentblock/message/oa_message_closed.html',
+    'openassessmentblock/message/oa_message_unavailable.html',
+    'openassessmentblock/peer/oa_peer_closed.html',
+    'openassessmentblock/peer/oa_peer_unavailable.html',
+    'openassessmentblock/peer/oa_peer_waiting.html',
+    'openassessmentblock/response/oa_response_closed.html',
+    'openassessmentblock/response/oa_response_unavailable.html',
+    'openassessmentblock/self/oa_self_closed.html',
+    'openassessmentblock/self/oa_self_unavailable.html',
+    'openassessmentblock/student_training/student_training_closed.html',
+    'openassessmentblock/student_training/student_training_unavailable.html',
+])
+
+FRAGMENT_CACHE_KEY_PREFIX = 'openassessment.fragment'
+
+
+class TemplateRegistry:
+    """
+    The compiled templates of the ORA block, and the statistics of the fragment cache.
+    """
+
+    def __init__(self):
+        self._templates = {}
+        self._preloaded = False
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def preload(self):
+        """
+        Load and compile all templates under "openassessmentblock/".
+        """
+        with self._lock:
+            if self._preloaded:
+                return
+            for dir_path, __, file_names in os.walk(os.path.join(TEMPLATES_ROOT, TEMPLATES_DIR)):
+                for file_name in file_names:
+                    if not file_name.endswith('.html'):
+                        continue
+                    path = os.path.relpath(os.path.join(dir_path, file_name), TEMPLATES_ROOT).replace(os.sep, '/')
+                    self._templates.setdefault(path, load_template(path))
+            self._preloaded = True
+            logger.debug("Compiled %d ORA templates", len(self._templates))
+
+    def get_template(self, path):
+        """
+        Return the compiled template at the given path.
+        """
+        if not getattr(settings, 'ORA2_COMPILED_TEMPLATES', False):
+            return load_template(path)
+        if not self._preloaded:
+            self.preload()
+        template = self._templates.get(path)
+        if template is None:
+            # Not one of the ORA templates, so it is compiled on first use
+            template = self._templates[path] = load_template(path)
+        return template
+
+    def render(self, path, context, version=None):
+        """
+        Render the template at the given path, using the fragment cache
+        if it is enabled and the template doesn't depend on the learner.
+
+        Args:
+            path (str): The path of the template.
+            context (dict): The render context.
+
+        Keyword Arguments:
+            version (str): The version of the block definition the context was built from.
+
+        Returns:
+            unicode
+        """
+        template = self.get_template(path)
+        timeout = getattr(settings, 'ORA2_FRAGMENT_CACHE_TIMEOUT', None)
+        if not timeout or path not in CACHEABLE_TEMPLATES:
+            return template.render(context)
+
+        cache_key = fragment_cache_key(path, context, version)
+        html = cache.get(cache_key)
+        if html is None:
+            self.misses += 1
+            html = template.render(context)
+            cache.set(cache_key, html, timeout)
+        else:
+            self.hits += 1
+        return html
+
+    def stats(self):
+        """
+        Statistics of the fragment cache in this process (approximate
+        when several threads render at the same time).
+
+        Returns:
+            dict with keys 'hits', 'misses' and 'hit_rate'
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+    def reset_stats(self):
+        """
+        Reset the statistics of the fragment cache.
+        """
+        self.hits = 0
+        self.misses = 0
+
+
+def fragment_cache_key(path, context, version=None):
+    """
+    Cache key of a fragment, from the block version, the template path,
+    the active locale and a hash of the render context.
+    """
+    fragment_hash = hashlib.sha1(
+        json.dumps([version, path, context], sort_keys=True, default=str).encode('utf-8')
+    ).hexdigest()
+    return f"{FRAGMENT_CACHE_KEY_PREFIX}.{get_language()}.{fragment_hash}"
+
+
+template_registry = TemplateRegistry()  # pylint: disable=invalid-name
@@ -0,0 +1,93 @@
+"""
+Tests for the compiled configuration of the ORA block.
+"""
+from unittest import mock
+
+from openassessment.xblock import compiled_config
+from openassessment.xblock.compiled_config import CompiledConfig, get_compiled_config
+
+from .base import XBlockHandlerTestCase, scenario
+
+
+class TestCompiledConfig(XBlockHandlerTestCase):
+    """
+    Tests for `CompiledConfig` and `OpenAssessmentBlock.compiled_config`.
+    """
+
+    @scenario('data/basic_scenario.xml')
+    def test_shared_between_blocks(self, xblock):
+        other_xblock = self.load_scenario('data/basic_scenario.xml')
+
+        self.assertIs(xblock.compiled_config, other_xblock.compiled_config)
+        self.assertIs(xblock.valid_assessments, other_xblock.valid_assessments)
+        self.assertIs(xblock.rubric_criteria_with_labels, other_xblock.rubric_criteria_with_labels)
+
+    @scenario('data/basic_scenario.xml')
+    def test_compiled_once(self, xblock):
+        with mock.patch.object(
+            compiled_config, 'CompiledConfig', wraps=CompiledConfig
+        ) as mock_compiled_config:
+            for _ in range(3):
+                self.runtime.render(xblock, 'student_view')
+                xblock.workflow_requirements()
+        mock_compiled_config.assert_called_once()
+
+    @scenario('data/basic_scenario.xml')
+    def test_recompiled_when_fields_change(self, xblock):
+        config = xblock.compiled_config
+        self.assertIsNotNone(xblock.get_assessment_module('self-assessment'))
+
+        xblock.rubric_assessments = [
+            assessment for assessment in xblock.rubric_assessments
+            if assessment['name'] != 'self-assessment'
+        ]
+
+        self.assertIsNot(config, xblock.compiled_config)
+        self.assertIsNone(xblock.get_assessment_module('self-assessment'))
+        self.assertNotIn('self-assessment', xblock.assessment_steps)
+
+    @scenario('data/basic_scenario.xml')
+    def test_in_place_changes_seen_by_next_request(self, xblock):
+        self.assertIsNotNone(xblock.compiled_config)
+        xblock.rubric_criteria[0]['label'] = 'Changed label'
+        self.assertNotEqual('Changed label', xblock.rubric_criteria_with_labels[0]['label'])
+
+        xblock.reset_compiled_config()
+        self.assertEqual('Changed label', xblock.rubric_criteria_with_labels[0]['label'])
+
+    @scenario('data/basic_scenario.xml')
+    def test_not_cached(self, xblock):
+        xblock.CACHE_COMPILED_CONFIG = False
+        self.assertIsNot(xblock.compiled_config, xblock.compiled_config)
+        self.assertEqual(xblock.compiled_config.valid_assessments, xblock.valid_assessments)
+
+    def test_keyed_by_content(self):
+        fields = (['peer-assessment'], [{'name': 'peer-assessment', 'must_grade': 1, 'must_be_graded_by': 1}],
+                  'Prompt', [{'name': 'Criterion', 'options': [{'name': 'Option'}]}], ['pdf'])
+        config = get_compiled_config(*fields)
+        self.assertIs(config, get_compiled_config(*fields))
+        self.assertIsNot(config, get_compiled_config(*fields[:2], 'Other prompt', *fields[3:]))
+
+        self.assertEqual([{'description': 'Prompt'}], config.prompts)
+        self.assertEqual('Option', config.rubric_criteria_with_labels[0]['options'][0]['label'])
+        self.assertEqual(frozenset(['pdf']), config.white_listed_file_types)
+        self.assertEqual(
+            {'peer': {'must_grade': 1, 'must_be_graded_by': 1, 'enable_flexible_grading': False}},
+            config.workflow_requirements
+        )
+
+    def test_cache_size(self):
+        with mock.patch.object(compiled_config, 'COMPILED_CONFIG_CACHE_SIZE', 2):
+            first = get_compiled_config([], [], 'First', [], [])
+            get_compiled_config([], [], 'Second', [], [])
+            get_compiled_config([], [], 'Third', [], [])
+            self.assertIsNot(first, get_compiled_config([], [], 'First', [], []))
+
+    def test_immutable(self):
+        config = CompiledConfig([], [], 'Prompt', [], [])
+        with self.assertRaises(AttributeError):
+            config.prompts = []
+        with self.assertRaises(AttributeError):
+            config.other = 'value'
+        with self.assertRaises(AttributeError):
+            del config.prompts
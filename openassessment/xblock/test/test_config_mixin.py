@@ -7,10 +7,13 @@ from unittest import mock
 
 import ddt
 from django.test import TestCase
+from edx_django_utils.cache import RequestCache
 
 from openassessment.xblock.config_mixin import (
     ConfigMixin,
+    clear_feature_flag_cache,
     ALL_FILES_URLS,
+    FEATURE_FLAG_CACHE_NAMESPACE,
     FEATURE_TOGGLES_BY_FLAG_NAME,
     TEAM_SUBMISSIONS,
     USER_STATE_UPLOAD_DATA,
@@ -31,6 +34,11 @@ class ConfigMixinTest(TestCase):
     """
     Tests for configuration/feature-gating of ORA XBlocks.
     """
+    def setUp(self):
+        super().setUp()
+        clear_feature_flag_cache()
+        self.addCleanup(clear_feature_flag_cache)
+
     @ddt.data(
         *list(itertools.product([True, False], repeat=3))
     )
@@ -171,7 +179,9 @@ class ConfigMixinTest(TestCase):
                 with self.settings(FEATURES={settings_feature_key: settings_input}):
                     self.assertEqual(expected_output, getattr(my_block, feature_property, None))
                 mock_flag_instance = MockCourseWaffleFlag.return_value
-                mock_flag_instance.is_enabled.assert_called_once_with(my_block.location.course_key)
+                # All the ORA flags are resolved together
+                self.assertEqual(mock_flag_instance.is_enabled.call_count, len(FEATURE_TOGGLES_BY_FLAG_NAME))
+                mock_flag_instance.is_enabled.assert_called_with(my_block.location.course_key)
 
         with mock.patch(
             'openassessment.xblock.config_mixin.import_waffle_flag', autospec=True
@@ -183,4 +193,42 @@ class ConfigMixinTest(TestCase):
 
         if not waffle_flag_input:
             mock_switch_instance = MockWaffleSwitch.return_value
-            mock_switch_instance.is_enabled.assert_called_once_with()
+            self.assertEqual(mock_switch_instance.is_enabled.call_count, len(FEATURE_TOGGLES_BY_FLAG_NAME))
+            mock_switch_instance.is_enabled.assert_called_with()
+
+    @mock.patch('openassessment.xblock.config_mixin.import_course_waffle_flag', autospec=True)
+    @mock.patch('openassessment.xblock.config_mixin.WaffleSwitch', autospec=True)
+    def test_flags_resolved_once_per_request(self, mock_waffle_switch, mock_course_waffle_flag):
+        mock_course_waffle_flag.return_value.return_value.is_enabled.return_value = False
+        mock_waffle_switch.return_value.is_enabled.return_value = False
+
+        first_block, second_block = MockBlock(), MockBlock()
+        with self.settings(FEATURES={FEATURE_TOGGLES_BY_FLAG_NAME[TEAM_SUBMISSIONS]: True}):
+            self.assertTrue(first_block.team_submissions_enabled)
+            self.assertFalse(first_block.is_rubric_reuse_enabled)
+            self.assertTrue(second_block.team_submissions_enabled)
+
+        # The toggle objects are created once, and each flag is looked up once
+        self.assertEqual(mock_waffle_switch.call_count, len(FEATURE_TOGGLES_BY_FLAG_NAME))
+        self.assertEqual(mock_waffle_switch.return_value.is_enabled.call_count, len(FEATURE_TOGGLES_BY_FLAG_NAME))
+
+        # The next request looks the flags up again
+        RequestCache(FEATURE_FLAG_CACHE_NAMESPACE).clear()
+        self.assertFalse(MockBlock().team_submissions_enabled)
+
+    @ddt.data((None, 2), (60, 1))
+    @ddt.unpack
+    @mock.patch('openassessment.xblock.config_mixin.import_course_waffle_flag', autospec=True)
+    @mock.patch('openassessment.xblock.config_mixin.WaffleSwitch', autospec=True)
+    def test_process_cache_timeout(self, timeout, lookups, mock_waffle_switch, mock_course_waffle_flag):
+        mock_course_waffle_flag.return_value.return_value.is_enabled.return_value = False
+        mock_waffle_switch.return_value.is_enabled.return_value = False
+
+        with self.settings(ORA2_FEATURE_FLAG_CACHE_TIMEOUT=timeout):
+            for _ in range(2):
+                MockBlock().is_feature_enabled(TEAM_SUBMISSIONS)
+                RequestCache(FEATURE_FLAG_CACHE_NAMESPACE).clear()
+
+        self.assertEqual(
+            mock_waffle_switch.return_value.is_enabled.call_count, lookups * len(FEATURE_TOGGLES_BY_FLAG_NAME)
+        )
@@ -48,24 +48,24 @@ class TestLoadStatic(TestCase):
         self.assertEqual(LoadStatic.get_url(key_url),
                          urljoin(self.default_base_url, key_url))
 
-    @patch('pkg_resources.resource_string')
-    def test_get_url_file_not_found(self, resource_string):
+    @patch('openassessment.xblock.load_static._read_manifest')
+    def test_get_url_file_not_found(self, read_manifest):
         key_url = 'some_url.js'
-        resource_string.side_effect = IOError()
+        read_manifest.side_effect = IOError()
         self.assertEqual(LoadStatic.get_url(key_url), urljoin(
             self.default_base_url, 'some_url.js'))
 
     @override_settings(LMS_ROOT_URL='localhost/')
-    @patch('pkg_resources.resource_string')
-    def test_get_url_file_not_found_with_root_url(self, resource_string):
+    @patch('openassessment.xblock.load_static._read_manifest')
+    def test_get_url_file_not_found_with_root_url(self, read_manifest):
         key_url = 'some_url.js'
-        resource_string.side_effect = IOError()
+        read_manifest.side_effect = IOError()
         self.assertEqual(LoadStatic.get_url(key_url), urljoin(
             'localhost/', self.default_base_url, 'some_url.js'))
 
-    @patch('pkg_resources.resource_string')
-    def test_get_url_with_manifest(self, resource_string):
-        resource_string.return_value = None
+    @patch('openassessment.xblock.load_static._read_manifest')
+    def test_get_url_with_manifest(self, read_manifest):
+        read_manifest.return_value = b'{}'
         key_url = 'some_url.js'
         with patch('json.loads') as jsondata:
             jsondata.return_value = {
@@ -75,9 +75,9 @@ class TestLoadStatic(TestCase):
                 self.default_base_url, 'some_url.hashchunk.js'))
 
     @override_settings(LMS_ROOT_URL='localhost/')
-    @patch('pkg_resources.resource_string')
-    def test_get_url_with_manifest_and_root_url(self, resource_string):
-        resource_string.return_value = None
+    @patch('openassessment.xblock.load_static._read_manifest')
+    def test_get_url_with_manifest_and_root_url(self, read_manifest):
+        read_manifest.return_value = b'{}'
         key_url = 'some_url.js'
         with patch('json.loads') as jsondata:
             jsondata.return_value = {
@@ -85,3 +85,17 @@ class TestLoadStatic(TestCase):
             }
             self.assertEqual(LoadStatic.get_url(key_url), urljoin(
                 'localhost/', self.default_base_url, 'some_url.hashchunk.js'))
+
+    def test_get_url_from_package_manifest(self):
+        url = LoadStatic.get_url('openassessment-lms.js')
+        self.assertTrue(url.startswith(self.default_base_url))
+        self.assertNotEqual(url, urljoin(self.default_base_url, 'openassessment-lms.js'))
+
+    @patch('openassessment.xblock.load_static._read_manifest')
+    def test_manifest_read_once(self, read_manifest):
+        read_manifest.return_value = b'{"some_url.js": "some_url.hashchunk.js"}'
+        for _ in range(3):
+            self.assertEqual(
+                LoadStatic.get_url('some_url.js'), urljoin(self.default_base_url, 'some_url.hashchunk.js')
+            )
+        read_manifest.assert_called_once_with()
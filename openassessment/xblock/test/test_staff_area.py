@@ -947,7 +947,7 @@ class TestCourseStaff(XBlockHandlerTestCase):
         resp = xblock.render_student_info(request)
         self.assertIn("response was not found", resp.body.decode('utf-8').lower())
 
-    @patch('openassessment.xblock.staff_area_mixin.remove_file')
+    @patch('openassessment.xblock.staff_area_mixin.remove_files')
     @scenario('data/self_only_scenario.xml', user_id='Bob')
     def test_staff_delete_student_state_with_files(self, xblock, remove_file_patch):
         # Given we are course staff...
@@ -984,7 +984,7 @@ class TestCourseStaff(XBlockHandlerTestCase):
         xblock.clear_student_state('Bob', 'test_course', xblock.scope_ids.usage_id, bob_item['student_id'])
 
         # Verify that the files were removed
-        remove_file_patch.assert_has_calls([call(key) for key in SAVED_FILES_NAMES])
+        remove_file_patch.assert_called_once_with(SAVED_FILES_NAMES)
 
     @scenario('data/team_submission.xml', user_id='Bob')
     def test_staff_delete_student_state_for_team_assessment(self, xblock):
@@ -1363,6 +1363,7 @@ class TestCourseStaff(XBlockHandlerTestCase):
 
     @log_capture()
     @patch("openassessment.fileupload.api.get_download_url")
+    @patch("openassessment.fileupload.api.get_stored_file_keys", Mock(return_value=None))
     @patch('openassessment.xblock.config_mixin.ConfigMixin.is_fetch_all_urls_waffle_enabled')
     @patch('openassessment.xblock.config_mixin.ConfigMixin.user_state_upload_data_enabled')
     @scenario('data/file_upload_missing_scenario.xml', user_id='Bob')
@@ -1412,6 +1413,66 @@ class TestCourseStaff(XBlockHandlerTestCase):
             FILE_URL,
         )
 
+    @patch("openassessment.fileupload.api.get_download_url")
+    @patch("openassessment.fileupload.api.generate_download_url")
+    @patch("openassessment.fileupload.api.get_stored_file_keys")
+    @scenario('data/file_upload_missing_scenario.xml', user_id='Bob')
+    def test_all_upload_urls_listed_from_storage(self, xblock, stored_keys, generate_url, download_url):
+        """
+        Verify the files of a learner are listed with a single request when the storage backend can list files.
+        """
+        self._setup_xblock_and_create_submission(xblock)
+        stored_keys.return_value = ['key', 'key/3']
+        generate_url.side_effect = lambda key: f'{FILE_URL}/{key}'
+
+        staff_urls = xblock.get_all_upload_urls_for_user('Bob')
+
+        stored_keys.assert_called_once_with(
+            xblock.get_student_item_dict_from_username_or_email('Bob'), xblock.MAX_FILES_COUNT
+        )
+        self.assertEqual([url['download_url'] for url in staff_urls], [f'{FILE_URL}/key', f'{FILE_URL}/key/3'])
+        download_url.assert_not_called()
+
+    @patch("openassessment.fileupload.api.generate_download_url")
+    @patch("openassessment.fileupload.api.get_stored_file_keys")
+    @scenario('data/file_upload_missing_scenario.xml', user_id='Bob')
+    def test_all_upload_urls_skip_unsigned_files(self, xblock, stored_keys, generate_url):
+        """
+        Verify a file whose download URL can't be generated is skipped.
+        """
+        self._setup_xblock_and_create_submission(xblock)
+        stored_keys.return_value = ['key', 'key/3']
+        generate_url.side_effect = [FileUploadInternalError('Signing failed'), f'{FILE_URL}/key/3']
+
+        staff_urls = xblock.get_all_upload_urls_for_user('Bob')
+
+        self.assertEqual([url['download_url'] for url in staff_urls], [f'{FILE_URL}/key/3'])
+
+    @patch("openassessment.fileupload.api.generate_download_url")
+    @patch("openassessment.fileupload.api.get_stored_file_keys")
+    @scenario('data/file_upload_missing_scenario.xml', user_id='Bob')
+    def test_all_upload_urls_for_users(self, xblock, stored_keys, generate_url):
+        """
+        Verify the files of several learners are listed in a single call.
+        """
+        self._setup_xblock_and_create_submission(xblock)
+        xblock.get_student_item_dict_from_username_or_email = lambda username: {
+            'student_id': f'anonymous-{username}', 'course_id': 'course', 'item_id': 'item'
+        }
+        stored_keys.side_effect = lambda student_item_dict, max_files_count: {
+            'anonymous-Bob': ['bob', 'bob/1'],
+            'anonymous-Tim': [],
+        }[student_item_dict['student_id']]
+        generate_url.side_effect = lambda key: f'{FILE_URL}/{key}'
+
+        staff_urls = xblock.get_all_upload_urls_for_users(['Bob', 'Tim'])
+
+        self.assertEqual(stored_keys.call_count, 2)
+        self.assertEqual(
+            {username: [url['download_url'] for url in urls] for username, urls in staff_urls.items()},
+            {'Bob': [f'{FILE_URL}/bob', f'{FILE_URL}/bob/1'], 'Tim': []}
+        )
+
     def _verify_staff_assessment_rendering(self, xblock, template_path, context, *expected_strings):
         """
         The file upload template has a hard dependency on the length of the file description tuple,
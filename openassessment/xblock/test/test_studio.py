@@ -10,7 +10,12 @@ from unittest.mock import MagicMock, patch, Mock, PropertyMock
 from ddt import ddt, file_data
 import pytz
 
+from django.core.cache import cache
+from django.db import DatabaseError
+
+from openassessment.assessment.models import Rubric, TrainingExample
 from openassessment.xblock.config_mixin import ConfigMixin
+from openassessment.xblock.data_conversion import create_rubric_dict
 from .base import XBlockHandlerTestCase, scenario
 
 
@@ -221,6 +226,44 @@ class StudioViewTest(XBlockHandlerTestCase):
         self.assertTrue(xblock.teams_enabled)
         self.assertEqual(ts_id, xblock.selected_teamset_id)
 
+    @scenario('data/basic_scenario.xml')
+    def test_update_editor_context_materializes_rubric(self, xblock):
+        xblock.runtime.modulestore = MagicMock()
+        xblock.runtime.modulestore.has_published_version.return_value = False
+        resp = self.request(
+            xblock, 'update_editor_context', json.dumps(self.UPDATE_EDITOR_DATA), response_format='json'
+        )
+        self.assertTrue(resp['success'], msg=resp.get('msg'))
+
+        rubric_dict = create_rubric_dict(xblock.prompts, xblock.rubric_criteria_with_labels)
+        content_hash = Rubric.content_hash_from_dict(rubric_dict)
+        self.assertTrue(Rubric.objects.filter(content_hash=content_hash).exists())
+        self.assertIsNotNone(cache.get(f"RubricSerializer.serialized_from_cache.{content_hash}"))
+
+    @scenario('data/basic_scenario.xml')
+    def test_update_editor_context_materialize_error(self, xblock):
+        xblock.runtime.modulestore = MagicMock()
+        xblock.runtime.modulestore.has_published_version.return_value = False
+        with patch.object(xblock, 'materialize_assessment_data', side_effect=DatabaseError):
+            resp = self.request(
+                xblock, 'update_editor_context', json.dumps(self.UPDATE_EDITOR_DATA), response_format='json'
+            )
+        # The rubric is created by the first learners who assess instead
+        self.assertTrue(resp['success'], msg=resp.get('msg'))
+
+    @scenario('data/student_training.xml')
+    def test_materialize_assessment_data(self, xblock):
+        materialized = xblock.materialize_assessment_data()
+
+        self.assertEqual(len(materialized['rubrics']), 2)
+        self.assertEqual(Rubric.objects.filter(content_hash__in=materialized['rubrics']).count(), 2)
+        self.assertEqual(materialized['training_examples'], 2)
+        self.assertEqual(TrainingExample.objects.count(), 2)
+
+        # Materializing again finds the existing models
+        self.assertEqual(xblock.materialize_assessment_data(), materialized)
+        self.assertEqual(TrainingExample.objects.count(), 2)
+
     @file_data('data/invalid_update_xblock.json')
     @scenario('data/basic_scenario.xml')
     def test_update_context_invalid_request_data(self, xblock, data):
@@ -1679,9 +1679,14 @@ class SubmissionRenderTest(SubmissionXBlockHandlerTestCase):
 
         # Assert that the xblock will render Red Five's existing submission rather that
         # no submission (because TestTeam does not yet have a submission)
-        path, context = xblock.submission_path_and_context()
+        team_workflow_info = xblock.get_team_workflow_info()
+        with patch.object(xblock, 'get_team_workflow_info', return_value=team_workflow_info), \
+                patch('submissions.team_api.get_team_submission') as mock_get_team_submission:
+            path, context = xblock.submission_path_and_context()
         self.assertEqual(path, 'openassessmentblock/response/oa_response_submitted.html')
         self.assertEqual(context['student_submission'], create_submission_dict(individual_submission, xblock.prompts))
+        # The team submission is read from the team context of the request
+        mock_get_team_submission.assert_not_called()
 
     @scenario('data/team_submission.xml', user_id="Red Five")
     def test_leave_team_with_submission(self, xblock):
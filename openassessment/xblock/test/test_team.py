@@ -10,6 +10,7 @@ import ddt
 
 from django.core.exceptions import ObjectDoesNotExist
 from xblock.exceptions import NoSuchServiceError
+from submissions.errors import TeamSubmissionNotFoundError
 from openassessment.xblock.team_mixin import TeamMixin
 
 TEAMSET_ID = 'teamset-1-id'
@@ -264,3 +265,47 @@ class TeamMixinTest(TestCase):
         msg = "One of team_submission_uuid or individual_submission_uuid must be provided"
         with self.assertRaises(TypeError, msg=msg):
             block.add_team_submission_context({})
+
+    @patch('openassessment.xblock.team_mixin.get_team_submission_for_student')
+    def test_team_context_is_reused(self, mock_student_submission):
+        block = MockBlock()
+        mock_student_submission.return_value = {'team_id': MOCK_TEAM_ID_2}
+
+        team_info = block.get_team_info()
+        self.assertEqual(block.get_team_info(), team_info)
+        mock_student_submission.assert_called_once()
+
+        # A new context looks the information up again
+        block.reset_team_context()
+        mock_student_submission.side_effect = TeamSubmissionNotFoundError
+        self.assertIsNone(block.get_team_info()['previous_team_name'])
+        self.assertEqual(mock_student_submission.call_count, 2)
+
+    @patch('openassessment.xblock.team_mixin.get_team_submission_for_team')
+    def test_does_team_have_submission(self, mock_team_submission):
+        block = MockBlock()
+        block.get_student_item_dict = mock.Mock(return_value={'course_id': 'course', 'item_id': 'item'})
+        mock_team_submission.side_effect = [MOCK_TEAM_SUBMISSION, TeamSubmissionNotFoundError]
+
+        self.assertTrue(block.does_team_have_submission(MOCK_TEAM_ID))
+        self.assertTrue(block.does_team_have_submission(MOCK_TEAM_ID))
+        self.assertFalse(block.does_team_have_submission(MOCK_TEAM_ID_2))
+        self.assertEqual(mock_team_submission.call_count, 2)
+
+    def test_handle_resets_team_context(self):
+        class BaseBlock:
+            """ Stand-in for XBlock.handle """
+            handled_with = None
+            team_context = None  # Overridden by the team mixin
+
+            def handle(self, handler_name, request, suffix=''):  # pylint: disable=unused-argument
+                self.handled_with = self.team_context
+                return handler_name
+
+        class Block(MockBlock, BaseBlock):
+            pass
+
+        block = Block()
+        team_context = block.team_context
+        self.assertEqual(block.handle('render_submission', None), 'render_submission')
+        self.assertIsNot(block.handled_with, team_context)
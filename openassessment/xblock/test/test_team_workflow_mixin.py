@@ -7,6 +7,7 @@ from copy import copy
 from unittest import TestCase
 from unittest.mock import patch, Mock
 from submissions.errors import TeamSubmissionNotFoundError
+from openassessment.xblock.team_mixin import TeamContext
 from openassessment.xblock.team_workflow_mixin import TeamWorkflowMixin
 
 
@@ -42,6 +43,10 @@ class TestBlock(TeamWorkflowMixin):
     def get_student_item_dict(self):
         return STUDENT_ITEM_DICT
 
+    @property
+    def team_context(self):
+        return TeamContext(self)
+
     _has_team = True
 
     def has_team(self):
@@ -84,7 +89,7 @@ class TestTeamWorkflowMixin(TestCase):
         self.test_block.get_team_workflow_status_counts()
         api_mock.get_status_counts.assert_called()
 
-    @patch('openassessment.xblock.team_workflow_mixin.team_sub_api.get_team_submission_for_student')
+    @patch('openassessment.xblock.team_mixin.get_team_submission_for_student')
     def test_get_team_submission_uuid(self, mock_get_team_sub_for_student):
         team_submission_uuid = 'this-is-the-uuid'
         mock_get_team_sub_for_student.return_value = {'team_submission_uuid': team_submission_uuid}
@@ -92,7 +97,7 @@ class TestTeamWorkflowMixin(TestCase):
         self.assertEqual(self.test_block.get_team_submission_uuid(), team_submission_uuid)
         mock_get_team_sub_for_student.assert_called_with(STUDENT_ITEM_DICT)
 
-    @patch('openassessment.xblock.team_workflow_mixin.team_sub_api.get_team_submission_for_student')
+    @patch('openassessment.xblock.team_mixin.get_team_submission_for_student')
     def test_get_team_submission_uuid_no_team(self, mock_get_team_sub_for_student):
         mock_get_team_sub_for_student.side_effect = TeamSubmissionNotFoundError()
         self.assertIsNone(self.test_block.get_team_submission_uuid())
@@ -0,0 +1,108 @@
+"""
+Tests for the template registry and the fragment cache.
+"""
+import json
+import os
+from unittest import mock
+
+from django.test.utils import override_settings
+from django.utils import translation
+
+from openassessment.test_utils import CacheResetTest
+from openassessment.xblock import template_registry as template_registry_module
+from openassessment.xblock.template_registry import TEMPLATES_DIR, TEMPLATES_ROOT, TemplateRegistry
+
+from .base import XBlockHandlerTestCase, scenario
+
+UNAVAILABLE_TEMPLATE = 'openassessmentblock/peer/oa_peer_unavailable.html'
+
+
+class TestTemplateRegistry(CacheResetTest):
+    """
+    Tests for `TemplateRegistry`.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.registry = TemplateRegistry()
+
+    def test_templates_looked_up_by_default(self):
+        with mock.patch.object(
+            template_registry_module, 'load_template', wraps=template_registry_module.load_template
+        ) as mock_load_template:
+            self.registry.get_template(UNAVAILABLE_TEMPLATE)
+            self.registry.get_template(UNAVAILABLE_TEMPLATE)
+
+        # The template loaders resolve the template for every render, e.g. for the theme of the site
+        self.assertEqual(
+            [mock.call(UNAVAILABLE_TEMPLATE), mock.call(UNAVAILABLE_TEMPLATE)], mock_load_template.call_args_list
+        )
+
+    @override_settings(ORA2_COMPILED_TEMPLATES=True)
+    def test_preload(self):
+        template_count = sum(
+            len([file_name for file_name in file_names if file_name.endswith('.html')])
+            for __, __, file_names in os.walk(os.path.join(TEMPLATES_ROOT, TEMPLATES_DIR))
+        )
+
+        with mock.patch.object(
+            template_registry_module, 'load_template', wraps=template_registry_module.load_template
+        ) as mock_load_template:
+            self.registry.get_template('openassessmentblock/oa_error.html')
+            self.registry.get_template(UNAVAILABLE_TEMPLATE)
+            self.registry.preload()
+
+        # Every template is compiled once, the first time one is needed
+        self.assertEqual(template_count, mock_load_template.call_count)
+
+    @override_settings(ORA2_COMPILED_TEMPLATES=True)
+    def test_template_outside_registry(self):
+        self.registry.preload()
+        with mock.patch.object(template_registry_module, 'load_template') as mock_load_template:
+            template = self.registry.get_template('other/template.html')
+            self.assertIs(template, self.registry.get_template('other/template.html'))
+        mock_load_template.assert_called_once_with('other/template.html')
+
+    def test_fragment_cache_disabled_by_default(self):
+        for _ in range(2):
+            self.registry.render(UNAVAILABLE_TEMPLATE, {})
+        self.assertEqual({'hits': 0, 'misses': 0, 'hit_rate': 0.0}, self.registry.stats())
+
+    @override_settings(ORA2_FRAGMENT_CACHE_TIMEOUT=60)
+    def test_fragment_cache(self):
+        html = self.registry.render(UNAVAILABLE_TEMPLATE, {'xblock_id': 'block'}, version='v1')
+        self.assertEqual(html, self.registry.render(UNAVAILABLE_TEMPLATE, {'xblock_id': 'block'}, version='v1'))
+        self.assertEqual({'hits': 1, 'misses': 1, 'hit_rate': 0.5}, self.registry.stats())
+
+        # Any change of context, version or locale is a different fragment
+        self.registry.render(UNAVAILABLE_TEMPLATE, {'xblock_id': 'other'}, version='v1')
+        self.registry.render(UNAVAILABLE_TEMPLATE, {'xblock_id': 'block'}, version='v2')
+        with translation.override('fr'):
+            self.registry.render(UNAVAILABLE_TEMPLATE, {'xblock_id': 'block'}, version='v1')
+        self.assertEqual({'hits': 1, 'misses': 4, 'hit_rate': 0.2}, self.registry.stats())
+
+        self.registry.reset_stats()
+        self.assertEqual({'hits': 0, 'misses': 0, 'hit_rate': 0.0}, self.registry.stats())
+
+    @override_settings(ORA2_FRAGMENT_CACHE_TIMEOUT=60)
+    def test_learner_templates_not_cached(self):
+        for _ in range(2):
+            self.registry.render('openassessmentblock/oa_error.html', {'error_msg': 'Error'})
+        self.assertEqual({'hits': 0, 'misses': 0, 'hit_rate': 0.0}, self.registry.stats())
+
+
+class TestFragmentCache(XBlockHandlerTestCase):
+    """
+    Tests for the fragment cache of the ORA block.
+    """
+
+    @override_settings(ORA2_FRAGMENT_CACHE_TIMEOUT=60)
+    @scenario('data/peer_only_scenario.xml', user_id='Bob')
+    def test_cached_unavailable_step(self, xblock):
+        registry = TemplateRegistry()
+        with mock.patch('openassessment.xblock.openassessmentblock.template_registry', registry):
+            first = self.request(xblock, 'render_peer_assessment', json.dumps({}))
+            second = self.request(xblock, 'render_peer_assessment', json.dumps({}))
+
+        self.assertEqual(first, second)
+        self.assertEqual({'hits': 1, 'misses': 1, 'hit_rate': 0.5}, registry.stats())
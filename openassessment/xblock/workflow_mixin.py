@@ -60,33 +60,13 @@ class WorkflowMixin:
         Retrieve the requirements from each assessment module
         so the workflow can decide whether the student can receive a score.
 
+        The requirements are shared with other block instances, so they should NOT be modified.
+
         Returns:
             dict
 
         """
-        requirements = {}
-
-        peer_assessment_module = self.get_assessment_module('peer-assessment')
-        if peer_assessment_module:
-            requirements["peer"] = {
-                "must_grade": peer_assessment_module["must_grade"],
-                "must_be_graded_by": peer_assessment_module["must_be_graded_by"],
-                "enable_flexible_grading": peer_assessment_module.get("enable_flexible_grading", False)
-            }
-
-        training_module = self.get_assessment_module('student-training')
-        if training_module:
-            requirements["training"] = {
-                "num_required": len(training_module["examples"])
-            }
-
-        staff_assessment_module = self.get_assessment_module('staff-assessment')
-        if staff_assessment_module:
-            requirements["staff"] = {
-                "required": staff_assessment_module["required"]
-            }
-
-        return requirements
+        return self.compiled_config.workflow_requirements
 
     def update_workflow_status(self, submission_uuid=None):
         """